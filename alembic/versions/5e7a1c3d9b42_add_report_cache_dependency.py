@@ -0,0 +1,50 @@
+"""add_report_cache_dependency
+
+Revision ID: 5e7a1c3d9b42
+Revises: 9c2ca740117a
+Create Date: 2026-10-16 09:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e7a1c3d9b42"
+down_revision: Union[str, Sequence[str], None] = "9c2ca740117a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "report_cache_dependency",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cache_table", sa.String(length=64), nullable=False),
+        sa.Column("cache_id", sa.Integer(), nullable=False),
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.String(length=64), nullable=False),
+        sa.Column("school_year", sa.String(length=4), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("report_cache_dependency", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_cache_dependency_entity", ["entity_type", "entity_id"], unique=False
+        )
+        batch_op.create_index(
+            "idx_cache_dependency_cache", ["cache_table", "cache_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("report_cache_dependency", schema=None) as batch_op:
+        batch_op.drop_index("idx_cache_dependency_cache")
+        batch_op.drop_index("idx_cache_dependency_entity")
+
+    op.drop_table("report_cache_dependency")
@@ -0,0 +1,83 @@
+"""add_virtual_session_aggregate_store
+
+Revision ID: 7b3d2e9f4a61
+Revises: 5e7a1c3d9b42
+Create Date: 2026-10-16 14:03:27.551902
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3d2e9f4a61"
+down_revision: Union[str, Sequence[str], None] = "5e7a1c3d9b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "virtual_session_aggregate",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("virtual_year", sa.String(length=9), nullable=False),
+        sa.Column("district_name", sa.String(length=255), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("experience_count", sa.Integer(), nullable=False),
+        sa.Column("key_counts", sa.JSON(), nullable=False),
+        sa.Column("monthly_counts", sa.JSON(), nullable=False),
+        sa.Column("filter_counts", sa.JSON(), nullable=True),
+        sa.Column("built_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_updated", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "virtual_year", "district_name", name="uq_virtual_session_aggregate"
+        ),
+    )
+    with op.batch_alter_table("virtual_session_aggregate", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_virtual_session_aggregate_virtual_year"),
+            ["virtual_year"],
+            unique=False,
+        )
+
+    op.create_table(
+        "virtual_session_event_rows",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("virtual_year", sa.String(length=9), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("start_date", sa.DateTime(), nullable=True),
+        sa.Column("rows", sa.JSON(), nullable=False),
+        sa.Column("filter_keys", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id"),
+    )
+    with op.batch_alter_table("virtual_session_event_rows", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_virtual_session_event_rows_virtual_year"),
+            ["virtual_year"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "idx_virtual_event_rows_year_date",
+            ["virtual_year", "start_date"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("virtual_session_event_rows", schema=None) as batch_op:
+        batch_op.drop_index("idx_virtual_event_rows_year_date")
+        batch_op.drop_index(batch_op.f("ix_virtual_session_event_rows_virtual_year"))
+
+    op.drop_table("virtual_session_event_rows")
+
+    with op.batch_alter_table("virtual_session_aggregate", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_virtual_session_aggregate_virtual_year"))
+
+    op.drop_table("virtual_session_aggregate")
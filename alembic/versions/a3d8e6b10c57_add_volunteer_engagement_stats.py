@@ -0,0 +1,195 @@
+"""add_volunteer_engagement_stats
+
+Revision ID: a3d8e6b10c57
+Revises: f2c7a9d41e86
+Create Date: 2026-10-17 18:05:41.207316
+
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d8e6b10c57"
+down_revision: Union[str, Sequence[str], None] = "f2c7a9d41e86"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Same as models.volunteer.ATTENDED_STATUSES
+ATTENDED_STATUSES = ("Attended", "Completed", "Successfully Completed")
+
+contact = sa.table(
+    "contact", sa.column("id", sa.Integer), sa.column("last_email_date", sa.Date)
+)
+volunteer = sa.table("volunteer", sa.column("id", sa.Integer))
+event = sa.table(
+    "event",
+    sa.column("id", sa.Integer),
+    sa.column("type", sa.String),
+    sa.column("start_date", sa.DateTime),
+)
+participation = sa.table(
+    "event_participation",
+    sa.column("id", sa.Integer),
+    sa.column("volunteer_id", sa.Integer),
+    sa.column("event_id", sa.Integer),
+    sa.column("status", sa.String),
+)
+history = sa.table(
+    "history",
+    sa.column("contact_id", sa.Integer),
+    sa.column("activity_date", sa.DateTime),
+    sa.column("activity_type", sa.String),
+    sa.column("history_type", sa.String),
+    sa.column("summary", sa.Text),
+    sa.column("is_deleted", sa.Boolean),
+)
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _backfill(bind, stats_table):
+    """Aggregate one stats row per volunteer, as refresh_engagement_stats does."""
+    now = datetime.now(timezone.utc)
+    rows = {
+        volunteer_id: {
+            "volunteer_id": volunteer_id,
+            "attended_count": 0,
+            "participation_count": 0,
+            "event_type_counts": {},
+            "first_volunteer_date": None,
+            "last_volunteer_date": None,
+            "last_email_date": last_email_date,
+            "updated_at": now,
+        }
+        for volunteer_id, last_email_date in bind.execute(
+            sa.select(volunteer.c.id, contact.c.last_email_date).join(
+                contact, contact.c.id == volunteer.c.id
+            )
+        )
+    }
+    if not rows:
+        return
+
+    attended = participation.c.status.in_(ATTENDED_STATUSES)
+    by_type = bind.execute(
+        sa.select(
+            participation.c.volunteer_id,
+            event.c.type,
+            sa.func.count(participation.c.id),
+            sa.func.sum(sa.case((attended, 1), else_=0)),
+            sa.func.min(sa.case((attended, event.c.start_date))),
+            sa.func.max(sa.case((attended, event.c.start_date))),
+        )
+        .join(event, event.c.id == participation.c.event_id)
+        .group_by(participation.c.volunteer_id, event.c.type)
+    )
+    for volunteer_id, event_type, count, attended_count, first, last in by_type:
+        row = rows.get(volunteer_id)
+        if row is None:
+            continue
+        row["participation_count"] += count
+        row["attended_count"] += attended_count or 0
+        if event_type is not None:
+            # The column stores EventType names; their values are lowercase
+            row["event_type_counts"][event_type.lower()] = count
+        if first and (
+            row["first_volunteer_date"] is None or first < row["first_volunteer_date"]
+        ):
+            row["first_volunteer_date"] = first
+        if last and (
+            row["last_volunteer_date"] is None or last > row["last_volunteer_date"]
+        ):
+            row["last_volunteer_date"] = last
+
+    email_history = bind.execute(
+        sa.select(history.c.contact_id, sa.func.max(history.c.activity_date))
+        .where(
+            sa.or_(history.c.is_deleted == sa.false(), history.c.is_deleted.is_(None)),
+            sa.or_(
+                sa.and_(
+                    history.c.history_type == "activity",
+                    history.c.activity_type == "Email",
+                ),
+                sa.and_(
+                    history.c.history_type == "note",
+                    history.c.summary.ilike("%email:%"),
+                ),
+            ),
+        )
+        .group_by(history.c.contact_id)
+    )
+    for contact_id, activity_date in email_history:
+        row = rows.get(contact_id)
+        activity_date = _as_date(activity_date)
+        if (
+            row is not None
+            and activity_date
+            and (
+                row["last_email_date"] is None or activity_date > row["last_email_date"]
+            )
+        ):
+            row["last_email_date"] = activity_date
+
+    batch = []
+    for row in rows.values():
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            op.bulk_insert(stats_table, batch)
+            batch = []
+    if batch:
+        op.bulk_insert(stats_table, batch)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    stats_table = op.create_table(
+        "volunteer_engagement_stats",
+        sa.Column("volunteer_id", sa.Integer(), nullable=False),
+        sa.Column("attended_count", sa.Integer(), nullable=False),
+        sa.Column("participation_count", sa.Integer(), nullable=False),
+        sa.Column("event_type_counts", sa.JSON(), nullable=False),
+        sa.Column("first_volunteer_date", sa.DateTime(), nullable=True),
+        sa.Column("last_volunteer_date", sa.DateTime(), nullable=True),
+        sa.Column("last_email_date", sa.Date(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["volunteer_id"], ["volunteer.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("volunteer_id"),
+    )
+    op.create_index(
+        op.f("ix_volunteer_engagement_stats_attended_count"),
+        "volunteer_engagement_stats",
+        ["attended_count"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_volunteer_engagement_stats_last_volunteer_date"),
+        "volunteer_engagement_stats",
+        ["last_volunteer_date"],
+        unique=False,
+    )
+
+    _backfill(op.get_bind(), stats_table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_volunteer_engagement_stats_last_volunteer_date"),
+        table_name="volunteer_engagement_stats",
+    )
+    op.drop_index(
+        op.f("ix_volunteer_engagement_stats_attended_count"),
+        table_name="volunteer_engagement_stats",
+    )
+    op.drop_table("volunteer_engagement_stats")
@@ -0,0 +1,58 @@
+"""add_public_event_api_change_tracking
+
+Revision ID: b7e1c4d92f30
+Revises: a3d8e6b10c57
+Create Date: 2026-10-17 19:12:08.551904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e1c4d92f30"
+down_revision: Union[str, Sequence[str], None] = "a3d8e6b10c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("tenant", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "event_change_counter",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+                comment="Incremented whenever one of the tenant's events changes",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "events_changed_at",
+                sa.DateTime(timezone=True),
+                nullable=True,
+                comment="When one of the tenant's events last changed",
+            )
+        )
+
+    with op.batch_alter_table("event", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_event_tenant_status_start",
+            ["tenant_id", "status", "start_date", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("event", schema=None) as batch_op:
+        batch_op.drop_index("idx_event_tenant_status_start")
+
+    with op.batch_alter_table("tenant", schema=None) as batch_op:
+        batch_op.drop_column("events_changed_at")
+        batch_op.drop_column("event_change_counter")
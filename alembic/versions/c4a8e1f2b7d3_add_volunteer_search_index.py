@@ -0,0 +1,223 @@
+"""add_volunteer_search_index
+
+Revision ID: c4a8e1f2b7d3
+Revises: 7b3d2e9f4a61
+Create Date: 2026-10-17 09:12:44.318206
+
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a8e1f2b7d3"
+down_revision: Union[str, Sequence[str], None] = "7b3d2e9f4a61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "name, work, skills, events, status"
+NEW_VALUES = "new.name, new.work, new.skills, new.events, new.status"
+OLD_VALUES = "old.name, old.work, old.skills, old.events, old.status"
+
+SQLITE_FTS = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS volunteer_search_fts USING fts5("
+    f"{COLUMNS}, content='volunteer_search_document', "
+    "content_rowid='volunteer_id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS volunteer_search_document_ai "
+    "AFTER INSERT ON volunteer_search_document BEGIN "
+    f"INSERT INTO volunteer_search_fts(rowid, {COLUMNS}) "
+    f"VALUES (new.volunteer_id, {NEW_VALUES}); END",
+    "CREATE TRIGGER IF NOT EXISTS volunteer_search_document_ad "
+    "AFTER DELETE ON volunteer_search_document BEGIN "
+    f"INSERT INTO volunteer_search_fts(volunteer_search_fts, rowid, {COLUMNS}) "
+    f"VALUES ('delete', old.volunteer_id, {OLD_VALUES}); END",
+    "CREATE TRIGGER IF NOT EXISTS volunteer_search_document_au "
+    "AFTER UPDATE ON volunteer_search_document BEGIN "
+    f"INSERT INTO volunteer_search_fts(volunteer_search_fts, rowid, {COLUMNS}) "
+    f"VALUES ('delete', old.volunteer_id, {OLD_VALUES}); "
+    f"INSERT INTO volunteer_search_fts(rowid, {COLUMNS}) "
+    f"VALUES (new.volunteer_id, {NEW_VALUES}); END",
+]
+
+POSTGRES_FTS = (
+    "CREATE INDEX IF NOT EXISTS ix_volunteer_search_document_fts "
+    "ON volunteer_search_document USING gin (("
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(work, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(skills, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(events, '')), 'D') || "
+    "setweight(to_tsvector('simple', coalesce(status, '')), 'D')))"
+)
+
+
+def _sqlite_has_fts5(bind) -> bool:
+    options = {row[0] for row in bind.exec_driver_sql("PRAGMA compile_options")}
+    return "ENABLE_FTS5" in options
+
+
+BATCH_SIZE = 500
+
+contact = sa.table(
+    "contact",
+    sa.column("id", sa.Integer),
+    sa.column("first_name", sa.String),
+    sa.column("middle_name", sa.String),
+    sa.column("last_name", sa.String),
+)
+volunteer = sa.table(
+    "volunteer",
+    sa.column("id", sa.Integer),
+    sa.column("organization_name", sa.String),
+    sa.column("title", sa.String),
+    sa.column("department", sa.String),
+    sa.column("industry", sa.String),
+    sa.column("local_status", sa.String),
+)
+organization = sa.table(
+    "organization", sa.column("id", sa.Integer), sa.column("name", sa.String)
+)
+volunteer_organization = sa.table(
+    "volunteer_organization",
+    sa.column("volunteer_id", sa.Integer),
+    sa.column("organization_id", sa.Integer),
+    sa.column("role", sa.String),
+)
+skill = sa.table("skill", sa.column("id", sa.Integer), sa.column("name", sa.String))
+volunteer_skill = sa.table(
+    "volunteer_skills",
+    sa.column("volunteer_id", sa.Integer),
+    sa.column("skill_id", sa.Integer),
+)
+event = sa.table(
+    "event",
+    sa.column("id", sa.Integer),
+    sa.column("title", sa.String),
+    sa.column("type", sa.String),
+)
+participation = sa.table(
+    "event_participation",
+    sa.column("volunteer_id", sa.Integer),
+    sa.column("event_id", sa.Integer),
+)
+
+
+def _join_text(values):
+    seen = []
+    for value in values:
+        if value and value not in seen:
+            seen.append(value)
+    return " ".join(seen) or None
+
+
+def _documents(bind, volunteer_ids, now):
+    # Same fields as services.volunteer_search_service._build_documents; enum
+    # columns already hold the member names the service indexes
+    documents = {}
+    for row in bind.execute(
+        sa.select(
+            volunteer.c.id,
+            contact.c.first_name,
+            contact.c.middle_name,
+            contact.c.last_name,
+            volunteer.c.organization_name,
+            volunteer.c.title,
+            volunteer.c.department,
+            volunteer.c.industry,
+            volunteer.c.local_status,
+        )
+        .join(contact, contact.c.id == volunteer.c.id)
+        .where(volunteer.c.id.in_(volunteer_ids))
+    ):
+        documents[row.id] = {
+            "name": [row.first_name, row.middle_name, row.last_name],
+            "work": [row.organization_name, row.title, row.department, row.industry],
+            "skills": [],
+            "events": [],
+            "status": [row.local_status],
+        }
+
+    for volunteer_id, name, role in bind.execute(
+        sa.select(
+            volunteer_organization.c.volunteer_id,
+            organization.c.name,
+            volunteer_organization.c.role,
+        )
+        .join(
+            organization,
+            organization.c.id == volunteer_organization.c.organization_id,
+        )
+        .where(volunteer_organization.c.volunteer_id.in_(volunteer_ids))
+    ):
+        documents[volunteer_id]["work"].extend([name, role])
+
+    for volunteer_id, name in bind.execute(
+        sa.select(volunteer_skill.c.volunteer_id, skill.c.name)
+        .join(skill, skill.c.id == volunteer_skill.c.skill_id)
+        .where(volunteer_skill.c.volunteer_id.in_(volunteer_ids))
+    ):
+        documents[volunteer_id]["skills"].append(name)
+
+    for volunteer_id, title, event_type in bind.execute(
+        sa.select(participation.c.volunteer_id, event.c.title, event.c.type)
+        .join(event, event.c.id == participation.c.event_id)
+        .where(participation.c.volunteer_id.in_(volunteer_ids))
+        .distinct()
+    ):
+        documents[volunteer_id]["events"].extend([title, event_type])
+
+    return [
+        {
+            "volunteer_id": volunteer_id,
+            **{name: _join_text(values) for name, values in document.items()},
+            "updated_at": now,
+        }
+        for volunteer_id, document in documents.items()
+    ]
+
+
+def _backfill(bind, document_table):
+    """Index every existing volunteer (after the FTS triggers exist)."""
+    now = datetime.now(timezone.utc)
+    volunteer_ids = [row[0] for row in bind.execute(sa.select(volunteer.c.id))]
+    for start in range(0, len(volunteer_ids), BATCH_SIZE):
+        rows = _documents(bind, volunteer_ids[start : start + BATCH_SIZE], now)
+        if rows:
+            op.bulk_insert(document_table, rows)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    document_table = op.create_table(
+        "volunteer_search_document",
+        sa.Column("volunteer_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=True),
+        sa.Column("work", sa.Text(), nullable=True),
+        sa.Column("skills", sa.Text(), nullable=True),
+        sa.Column("events", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["volunteer_id"], ["volunteer.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("volunteer_id"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite" and _sqlite_has_fts5(bind):
+        for statement in SQLITE_FTS:
+            op.execute(statement)
+    elif bind.dialect.name == "postgresql":
+        op.execute(POSTGRES_FTS)
+
+    _backfill(bind, document_table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS volunteer_search_fts")
+    op.drop_table("volunteer_search_document")
@@ -0,0 +1,120 @@
+"""add_event_educator_links
+
+Revision ID: e5b19d7c3a42
+Revises: c4a8e1f2b7d3
+Create Date: 2026-10-17 14:05:31.902117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b19d7c3a42"
+down_revision: Union[str, Sequence[str], None] = "c4a8e1f2b7d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _normalize(name):
+    # Same rules as services.teacher_matching_service.normalize_name
+    return (
+        name.lower()
+        .strip()
+        .replace("-", " ")
+        .replace(".", "")
+        .replace(",", "")
+        .replace("'", "")
+    )
+
+
+def _backfill(bind, link_table):
+    """Derive one link row per distinct educator name of every event."""
+    registered = {}
+    for event_id, teacher_id, first, middle, last in bind.execute(
+        sa.text(
+            "SELECT et.event_id, et.teacher_id, c.first_name, c.middle_name, "
+            "c.last_name FROM event_teacher et JOIN contact c ON c.id = et.teacher_id"
+        )
+    ):
+        full_names = [f"{first} {last}"]
+        if middle:
+            full_names.append(f"{first} {middle} {last}")
+        for full_name in full_names:
+            registered.setdefault((event_id, _normalize(full_name)), teacher_id)
+
+    rows = []
+    events = bind.execute(
+        sa.text("SELECT id, educators FROM event WHERE educators IS NOT NULL")
+    )
+    for event_id, educators in events:
+        seen = set()
+        for name in educators.split(";"):
+            name = name.strip()
+            normalized = _normalize(name)
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            rows.append(
+                {
+                    "event_id": event_id,
+                    "name": name,
+                    "normalized_name": normalized,
+                    "teacher_id": registered.get((event_id, normalized)),
+                }
+            )
+            if len(rows) >= BATCH_SIZE:
+                op.bulk_insert(link_table, rows)
+                rows = []
+    if rows:
+        op.bulk_insert(link_table, rows)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    link_table = op.create_table(
+        "event_educator",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("normalized_name", sa.Text(), nullable=False),
+        sa.Column("teacher_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["event_id"], ["event.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["teacher_id"], ["teacher.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "event_id", "normalized_name", name="uq_event_educator_event_name"
+        ),
+    )
+    op.create_index(
+        op.f("ix_event_educator_event_id"), "event_educator", ["event_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_event_educator_normalized_name"),
+        "event_educator",
+        ["normalized_name"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_event_educator_teacher_id"),
+        "event_educator",
+        ["teacher_id"],
+        unique=False,
+    )
+
+    _backfill(op.get_bind(), link_table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_event_educator_teacher_id"), table_name="event_educator")
+    op.drop_index(
+        op.f("ix_event_educator_normalized_name"), table_name="event_educator"
+    )
+    op.drop_index(op.f("ix_event_educator_event_id"), table_name="event_educator")
+    op.drop_table("event_educator")
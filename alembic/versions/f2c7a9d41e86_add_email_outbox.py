@@ -0,0 +1,66 @@
+"""add_email_outbox
+
+Revision ID: f2c7a9d41e86
+Revises: e5b19d7c3a42
+Create Date: 2026-10-17 16:22:08.415390
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a9d41e86"
+down_revision: Union[str, Sequence[str], None] = "e5b19d7c3a42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("purpose", sa.String(length=50), nullable=False),
+        sa.Column("recipient", sa.String(length=255), nullable=False),
+        sa.Column("recipient_name", sa.String(length=255), nullable=True),
+        sa.Column("sender_email", sa.String(length=255), nullable=True),
+        sa.Column("sender_name", sa.String(length=255), nullable=True),
+        sa.Column("subject", sa.Text(), nullable=False),
+        sa.Column("html_body", sa.Text(), nullable=False),
+        sa.Column("text_body", sa.Text(), nullable=False),
+        sa.Column("attachments", sa.JSON(), nullable=True),
+        sa.Column("status", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("claim_token", sa.String(length=32), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("provider_message_id", sa.String(length=255), nullable=True),
+        sa.Column("enqueued_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_email_outbox_due",
+        "email_outbox",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_email_outbox_purpose"), "email_outbox", ["purpose"], unique=False
+    )
+    op.create_index(
+        op.f("ix_email_outbox_sent_at"), "email_outbox", ["sent_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_email_outbox_sent_at"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_purpose"), table_name="email_outbox")
+    op.drop_index("idx_email_outbox_due", table_name="email_outbox")
+    op.drop_table("email_outbox")
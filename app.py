@@ -88,6 +88,36 @@ def create_app(config_class=None):
     # ------------------------------------------------------------------
     db.init_app(app)
 
+    # Dependency-tracked invalidation of report cache rows (after_flush hook)
+    from services.cache_dependency_service import register_cache_invalidation_hooks
+
+    register_cache_invalidation_hooks()
+
+    # Keep volunteer full-text search documents in sync (after_flush hook)
+    from services.volunteer_search_service import register_search_index_hooks
+
+    register_search_index_hooks()
+
+    # Keep normalized educator links in sync with Event.educators (after_flush hook)
+    from services.educator_link_service import register_educator_link_hooks
+
+    register_educator_link_hooks()
+
+    # Queue volunteers for incremental local status runs (after_flush hook)
+    from services.local_status_service import register_local_status_hooks
+
+    register_local_status_hooks()
+
+    # Keep materialized volunteer engagement stats current (after_flush hook)
+    from services.volunteer_engagement_service import register_engagement_stats_hooks
+
+    register_engagement_stats_hooks()
+
+    # Track tenant event changes for public API caching (after_flush hook)
+    from services.public_event_api_service import register_public_event_api_hooks
+
+    register_public_event_api_hooks()
+
     login_manager = LoginManager()
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
@@ -137,6 +167,20 @@ def create_app(config_class=None):
 
     init_rate_limiter(app)
 
+    # ------------------------------------------------------------------
+    # SQL query profiler (opt-in via QUERY_PROFILER_ENABLED)
+    # ------------------------------------------------------------------
+    from utils.query_profiler import init_query_profiler
+
+    init_query_profiler(app)
+
+    # ------------------------------------------------------------------
+    # Email outbox worker (EMAIL_OUTBOX_WORKER; off under testing)
+    # ------------------------------------------------------------------
+    from services.email_outbox_service import init_outbox_worker
+
+    init_outbox_worker(app)
+
     # ------------------------------------------------------------------
     # Error handlers
     # ------------------------------------------------------------------
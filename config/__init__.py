@@ -101,11 +101,62 @@ class Config:
         os.environ.get("SESSION_LIFETIME_SECONDS", 60 * 60 * 8)
     )
 
+    # Serve cached virtual session rows through the columnar (pandas) backend
+    VIRTUAL_SESSION_COLUMNAR = (
+        os.environ.get("VIRTUAL_SESSION_COLUMNAR", "false").lower() == "true"
+    )
+
+    # Seconds the in-process Pathful import lookup cache is refreshed
+    # incrementally before a full rebuild; 0 rebuilds it on every import
+    PATHFUL_LOOKUP_CACHE_MAX_AGE = int(
+        os.environ.get("PATHFUL_LOOKUP_CACHE_MAX_AGE", 60 * 60)
+    )
+
+    # Deliver transactional email (magic links, signup confirmations) from
+    # a background outbox worker thread started with the app
+    EMAIL_OUTBOX_WORKER = (
+        os.environ.get("EMAIL_OUTBOX_WORKER", "true").lower() == "true"
+    )
+
+    # Storage codec for large report cache payloads (utils/cache_codec.py):
+    # "columnar-zlib" or "json", with optional per-table overrides given as
+    # "table=codec,table=codec"
+    REPORT_CACHE_CODEC = os.environ.get("REPORT_CACHE_CODEC", "columnar-zlib")
+    REPORT_CACHE_CODECS = dict(
+        item.strip().split("=", 1)
+        for item in os.environ.get("REPORT_CACHE_CODECS", "").split(",")
+        if "=" in item
+    )
+
+    # Profile SQL per request (statement counts, database time, repeated
+    # statement fingerprints) for /management/queries and the log
+    QUERY_PROFILER_ENABLED = (
+        os.environ.get("QUERY_PROFILER_ENABLED", "false").lower() == "true"
+    )
+    # Log requests that run at least this many statements...
+    QUERY_PROFILER_LOG_THRESHOLD = int(
+        os.environ.get("QUERY_PROFILER_LOG_THRESHOLD", 50)
+    )
+    # ...or one statement fingerprint at least this many times (likely N+1)
+    QUERY_PROFILER_REPEAT_THRESHOLD = int(
+        os.environ.get("QUERY_PROFILER_REPEAT_THRESHOLD", 5)
+    )
+
     # Salesforce configuration
     SF_USERNAME = os.environ.get("SF_USERNAME")
     SF_PASSWORD = os.environ.get("SF_PASSWORD")
     SF_SECURITY_TOKEN = os.environ.get("SF_SECURITY_TOKEN")
     SF_DOMAIN = os.environ.get("SF_DOMAIN", "login")
+    # Stream event/volunteer import queries page by page instead of loading
+    # the full result set (bounded memory for full syncs)
+    SF_IMPORT_STREAMING = (
+        os.environ.get("SF_IMPORT_STREAMING", "false").lower() == "true"
+    )
+    # Write participation imports with batched INSERT ... ON CONFLICT upserts
+    # instead of one ORM object per row (SQLite and PostgreSQL only)
+    SF_IMPORT_BULK_UPSERT = (
+        os.environ.get("SF_IMPORT_BULK_UPSERT", "false").lower() == "true"
+    )
 
 
 class DevelopmentConfig(Config):
@@ -140,6 +191,7 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     WTF_CSRF_ENABLED = False  # Disable CSRF for testing
     RATELIMIT_ENABLED = False  # Disable rate limiter for testing (TD-013 retro)
+    EMAIL_OUTBOX_WORKER = False  # Tests drain the outbox explicitly
 
 
 # Default configuration
@@ -49,6 +49,8 @@ CACHE_CONFIG = {
     "cache_default_timeout": int(
         os.environ.get("VALIDATION_CACHE_TTL", 3600)
     ),  # 1 hour default
+    # Optional JSON file persisting Salesforce query results between runs
+    "salesforce_persist_path": os.environ.get("VALIDATION_CACHE_PERSIST_PATH"),
 }
 
 # Validation schedules
@@ -122,6 +124,14 @@ PERFORMANCE_CONFIG = {
         os.environ.get("VALIDATION_MAX_RUNTIME", 3600)
     ),  # 1 hour max
     "max_memory_usage": int(os.environ.get("VALIDATION_MAX_MEMORY_USAGE", 512)),  # MB
+    # Run a run's validators concurrently (they mostly wait on Salesforce I/O)
+    "parallel_validators": os.environ.get(
+        "VALIDATION_PARALLEL_VALIDATORS", "true"
+    ).lower()
+    == "true",
+    "max_parallel_validators": int(
+        os.environ.get("VALIDATION_MAX_PARALLEL_VALIDATORS", 4)
+    ),
     "enable_performance_monitoring": os.environ.get(
         "VALIDATION_ENABLE_PERFORMANCE_MONITORING", "true"
     ).lower()
@@ -59,8 +59,8 @@ from .data_quality_flag import DataQualityFlag, DataQualityIssueType
 from .district_model import District
 from .district_participation import DistrictParticipation
 from .district_volunteer import DistrictVolunteer
-from .email import EmailDeliveryAttempt, EmailMessage, EmailTemplate
-from .event import Event, EventTeacher
+from .email import EmailDeliveryAttempt, EmailMessage, EmailOutbox, EmailTemplate
+from .event import Event, EventEducator, EventTeacher
 from .event_flag import EventFlag, FlagType
 from .google_sheet import GoogleSheet
 from .history import History
@@ -92,6 +92,8 @@ from .validation import (
     ValidationRun,
 )
 from .volunteer import Volunteer
+from .volunteer_engagement import VolunteerEngagementStats
+from .volunteer_search import VolunteerSearchDocument
 
 # Export the things you want to make available when importing from models
 __all__ = [
@@ -102,9 +104,12 @@ __all__ = [
     "SecurityLevel",
     "TenantRole",
     "Volunteer",
+    "VolunteerEngagementStats",
+    "VolunteerSearchDocument",
     "GoogleSheet",
     "AuditLog",
     "Event",
+    "EventEducator",
     "EventTeacher",
     "Organization",
     "Contact",
@@ -131,6 +136,7 @@ __all__ = [
     "EmailTemplate",
     "EmailMessage",
     "EmailDeliveryAttempt",
+    "EmailOutbox",
     "Tenant",
     "DistrictVolunteer",
     "DistrictParticipation",
@@ -165,6 +171,21 @@ def eagerload_event_bundle(query):
     )
 
 
+def eagerload_virtual_session_bundle(query):
+    """Apply eager loading for virtual session report rows (teachers, presenters)."""
+    from .event import Event, EventTeacher
+    from .organization import VolunteerOrganization
+    from .volunteer import Volunteer
+
+    return eagerload_event_bundle(query).options(
+        selectinload(Event.teacher_registrations).selectinload(EventTeacher.teacher),
+        selectinload(Event.volunteers)
+        .selectinload(Volunteer.volunteer_organizations)
+        .selectinload(VolunteerOrganization.organization),
+        selectinload(Event.volunteers).selectinload(Volunteer.organizations),
+    )
+
+
 def eagerload_organization_bundle(query):
     """Apply standard eager loading for Organization detail pages."""
     from .organization import Organization
@@ -184,4 +205,5 @@ def eagerload_volunteer_bundle(query):
         selectinload(Volunteer.skills),
         selectinload(Volunteer.volunteer_organizations),
         selectinload(Volunteer.pathful_profile),
+        selectinload(Volunteer.engagement_stats),
     )
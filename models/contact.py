@@ -92,6 +92,27 @@ from models.contact_enums import (  # noqa: F401 — re-exported for backward co
     SuffixEnum,
 )
 
+# Zip code prefixes used for local status calculation
+KC_METRO_ZIP_PREFIXES = ("640", "641", "660", "661", "664", "665", "666")
+REGION_ZIP_PREFIXES = ("644", "645", "646", "670", "671", "672", "673", "674")
+
+
+def local_status_for_zip(zip_code):
+    """
+    Classify a zip code as local (KC metro), partial (region) or non-local.
+
+    Returns:
+        LocalStatusEnum or None: None when the zip code is empty
+    """
+    if not zip_code:
+        return None
+    zip_prefix = zip_code[:3]
+    if zip_prefix in KC_METRO_ZIP_PREFIXES:
+        return LocalStatusEnum.local
+    if zip_prefix in REGION_ZIP_PREFIXES:
+        return LocalStatusEnum.partial
+    return LocalStatusEnum.non_local
+
 
 # Base Contact Models
 class Contact(db.Model):
@@ -418,22 +439,6 @@ class Contact(db.Model):
             LocalStatusEnum or None: Local status if determinable from address
         """
         try:
-            # Define KC metro and regional zip code prefixes
-            kc_metro_prefixes = ("640", "641", "660", "661", "664", "665", "666")
-            region_prefixes = ("644", "645", "646", "670", "671", "672", "673", "674")
-
-            def check_address_status(address):
-                """Helper function to check status based on zip code prefix"""
-                if not address or not address.zip_code:
-                    return None
-
-                zip_prefix = address.zip_code[:3]
-                if zip_prefix in kc_metro_prefixes:
-                    return LocalStatusEnum.local
-                if zip_prefix in region_prefixes:
-                    return LocalStatusEnum.partial
-                return LocalStatusEnum.non_local
-
             # First check if there's a primary address
             primary_addr = next((addr for addr in self.addresses if addr.primary), None)
             if primary_addr:
@@ -441,7 +446,7 @@ class Contact(db.Model):
                 if not primary_addr.zip_code:
                     return LocalStatusEnum.partial
                 # If primary has zip, use it
-                return check_address_status(primary_addr)
+                return local_status_for_zip(primary_addr.zip_code)
 
             # If no primary address, try personal address
             personal_addr = next(
@@ -453,7 +458,7 @@ class Contact(db.Model):
                 None,
             )
             if personal_addr and personal_addr.zip_code:
-                return check_address_status(personal_addr)
+                return local_status_for_zip(personal_addr.zip_code)
 
             return None
 
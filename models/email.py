@@ -18,6 +18,7 @@ Database Tables:
 - email_templates: Versioned email templates (HTML + text)
 - email_messages: Outbox records for email intents
 - email_delivery_attempts: Individual delivery attempts to the provider
+- email_outbox: Transactional emails queued by request handlers
 
 Email Lifecycle:
 - DRAFT: Message created but not queued
@@ -443,3 +444,71 @@ class BatchEmailJob(db.Model):
             ),
             "cancel_reason": self.cancel_reason,
         }
+
+
+class OutboxStatus(IntEnum):
+    """Status enum for transactional outbox entries."""
+
+    PENDING = 0  # Waiting for (re)delivery
+    SENDING = 1  # Claimed by the outbox worker
+    SENT = 2  # Accepted by the provider
+    FAILED = 3  # Gave up after the maximum number of attempts
+    SKIPPED = 4  # Not delivered (delivery disabled, no provider, blocked)
+
+
+class EmailOutbox(db.Model):
+    """
+    Durable outbox for transactional email sent from request handlers.
+
+    Public handlers (magic links, event signup confirmations) enqueue a
+    fully rendered email and return immediately; the background outbox
+    worker (services/email_outbox_service.py) delivers pending entries in
+    batches, retrying failures with exponential backoff.
+
+    Database Table:
+        email_outbox - One row per transactional email
+    """
+
+    __tablename__ = "email_outbox"
+
+    id = db.Column(Integer, primary_key=True)
+    purpose = db.Column(String(50), nullable=False, index=True)
+
+    # Envelope
+    recipient = db.Column(String(255), nullable=False)
+    recipient_name = db.Column(String(255), nullable=True)
+    sender_email = db.Column(String(255), nullable=True)  # Defaults to MAIL_FROM
+    sender_name = db.Column(String(255), nullable=True)
+
+    # Rendered content
+    subject = db.Column(Text, nullable=False)
+    html_body = db.Column(Text, nullable=False)
+    text_body = db.Column(Text, nullable=False)
+    attachments = db.Column(
+        JSON, nullable=True
+    )  # [{"filename", "content_type", "content_b64"}]
+
+    # Delivery state
+    status = db.Column(Integer, default=OutboxStatus.PENDING, nullable=False)
+    attempts = db.Column(Integer, default=0, nullable=False)
+    next_attempt_at = db.Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    claim_token = db.Column(String(32), nullable=True)
+    claimed_at = db.Column(DateTime(timezone=True), nullable=True)
+    last_error = db.Column(Text, nullable=True)
+    provider_message_id = db.Column(String(255), nullable=True)
+
+    # Timing
+    enqueued_at = db.Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    sent_at = db.Column(DateTime(timezone=True), nullable=True, index=True)
+
+    __table_args__ = (db.Index("idx_email_outbox_due", "status", "next_attempt_at"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmailOutbox {self.id} {self.purpose} "
+            f"{OutboxStatus(self.status).name}>"
+        )
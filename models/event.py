@@ -364,6 +364,10 @@ class Event(db.Model):
         db.Index("idx_event_status_date_type", "status", "start_date", "type"),
         # Improve calendar queries filtered by school and start date
         db.Index("idx_event_school_start", "school", "start_date"),
+        # Public event API: per-tenant published lists paged by (start_date, id)
+        db.Index(
+            "idx_event_tenant_status_start", "tenant_id", "status", "start_date", "id"
+        ),
         # Non-negative checks for counters and duration
         db.CheckConstraint(
             "duration IS NULL OR duration >= 0", name="ck_event_duration_nonneg"
@@ -1063,6 +1067,50 @@ class EventTeacher(db.Model):
     teacher = db.relationship("Teacher", back_populates="event_registrations")
 
 
+class EventEducator(db.Model):
+    """
+    One educator name from Event.educators, normalized for indexed lookups.
+
+    Derived from the semicolon-separated Event.educators text by
+    services/educator_link_service.py whenever that text changes, so reads
+    can filter and group by educator instead of splitting the text of every
+    event. Never edit rows directly.
+
+    Columns:
+        - name: Educator name as written in Event.educators
+        - normalized_name: normalize_name(name) from teacher_matching_service
+        - teacher_id: Teacher registered for the event (EventTeacher) whose
+          name normalizes to the same value, if any
+    """
+
+    __tablename__ = "event_educator"
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(
+        db.Integer,
+        db.ForeignKey("event.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    name = db.Column(db.Text, nullable=False)
+    normalized_name = db.Column(db.Text, nullable=False, index=True)
+    teacher_id = db.Column(
+        db.Integer,
+        db.ForeignKey("teacher.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "event_id", "normalized_name", name="uq_event_educator_event_name"
+        ),
+    )
+
+    def __repr__(self):
+        return f"<EventEducator event={self.event_id} name='{self.name}'>"
+
+
 class EventStudentParticipation(db.Model):
     """
     Event Student Participation Model
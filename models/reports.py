@@ -21,6 +21,9 @@ Database Tables:
 - organization_reports: Cached reports for organizations
 - organization_summary_cache: Summary data for all organizations
 - organization_detail_cache: Detailed data for individual organizations
+- report_cache_dependency: Source entities each cache row was built from
+- virtual_session_aggregate: Incrementally maintained virtual session counts
+- virtual_session_event_rows: Per-event virtual session report rows
 
 Report Types:
 - District Year-End Reports: Annual summary reports for districts
@@ -31,6 +34,8 @@ Report Types:
 
 Data Storage:
 - JSON fields for flexible data structures
+- Large row-list payloads use CachePayload columns, which store them through
+  a compact per-table codec (utils/cache_codec.py)
 - School year organization for academic calendar alignment
 - Host filter support for multi-host environments
 - Timestamp tracking for cache management
@@ -64,6 +69,7 @@ Usage Examples:
 from datetime import datetime, timezone
 
 from models import db  # Import db from models instead of creating new instance
+from utils.cache_codec import CachePayload
 
 
 class DistrictYearEndReport(db.Model):
@@ -109,7 +115,7 @@ class DistrictYearEndReport(db.Model):
     school_year = db.Column(db.String(4), nullable=False, index=True)  # Added index
     host_filter = db.Column(db.String(20), default="all", nullable=False, index=True)
     report_data = db.Column(db.JSON, nullable=False)
-    events_data = db.Column(db.JSON, nullable=True)
+    events_data = db.Column(CachePayload("district_year_end_reports"), nullable=True)
     last_updated = db.Column(
         db.DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -369,7 +375,9 @@ class VirtualSessionReportCache(db.Model):
     date_to = db.Column(db.Date, nullable=True)
 
     # Cached report data as JSON
-    session_data = db.Column(db.JSON, nullable=False)  # All session records
+    session_data = db.Column(
+        CachePayload("virtual_session_report_cache"), nullable=False
+    )  # All session records
     district_summaries = db.Column(db.JSON, nullable=True)  # District breakdown
     overall_summary = db.Column(db.JSON, nullable=True)  # Overall statistics
     filter_options = db.Column(db.JSON, nullable=True)  # Available filter options
@@ -415,8 +423,10 @@ class RecentVolunteersReportCache(db.Model):
     )  # comma-joined, sorted
     title_filter = db.Column(db.String(255), nullable=True, index=True)
 
-    # Cached JSON payload
-    report_data = db.Column(db.JSON, nullable=False)
+    # Cached payload (dates stored natively by the table's codec)
+    report_data = db.Column(
+        CachePayload("recent_volunteers_report_cache"), nullable=False
+    )
 
     last_updated = db.Column(
         db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
@@ -483,7 +493,9 @@ class VirtualSessionDistrictCache(db.Model):
     date_to = db.Column(db.Date, nullable=True)
 
     # Cached district report data as JSON
-    session_data = db.Column(db.JSON, nullable=False)  # District session records
+    session_data = db.Column(
+        CachePayload("virtual_session_district_cache"), nullable=False
+    )  # District session records
     monthly_stats = db.Column(db.JSON, nullable=True)  # Monthly breakdown
     school_breakdown = db.Column(db.JSON, nullable=True)  # School statistics
     teacher_breakdown = db.Column(db.JSON, nullable=True)  # Teacher statistics
@@ -581,6 +593,137 @@ class DIAEventsReportCache(db.Model):
         return f"<DIAEventsReportCache updated={self.last_updated}>"
 
 
+class ReportCacheDependency(db.Model):
+    """
+    Model recording which source entities a cached report row was built from.
+
+    Each row links one cache row (identified by its table name and primary
+    key) to one entity. The after_flush hooks in
+    services/cache_dependency_service.py match changed events and
+    participations against these rows so that only the affected cache rows
+    are invalidated, instead of wiping every cache for the school year.
+
+    Database Table:
+        report_cache_dependency - Cache row to source entity links
+
+    Entity Types:
+        - event: A specific event id (school_year is NULL)
+        - district: A district id, scoped to school_year
+        - organization: An organization id, scoped to school_year
+        - school_year: Any event in the school year (year-wide aggregates)
+
+    Performance Features:
+        - Composite index on entity_type and entity_id for invalidation lookups
+        - Composite index on cache_table and cache_id for re-registration
+    """
+
+    __tablename__ = "report_cache_dependency"
+
+    id = db.Column(db.Integer, primary_key=True)
+    cache_table = db.Column(db.String(64), nullable=False)
+    cache_id = db.Column(db.Integer, nullable=False)
+    entity_type = db.Column(db.String(20), nullable=False)
+    entity_id = db.Column(db.String(64), nullable=False)
+    school_year = db.Column(db.String(4), nullable=True)
+    created_at = db.Column(
+        db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        db.Index("idx_cache_dependency_entity", "entity_type", "entity_id"),
+        db.Index("idx_cache_dependency_cache", "cache_table", "cache_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ReportCacheDependency {self.cache_table}#{self.cache_id} "
+            f"{self.entity_type}={self.entity_id} sy={self.school_year}>"
+        )
+
+
+class VirtualSessionAggregate(db.Model):
+    """
+    Model for incrementally maintained virtual session summary aggregates.
+
+    One row per (virtual_year, district_name) plus an overall row keyed by
+    services.virtual_aggregate_service.OVERALL_DISTRICT. Distinct counts are
+    stored as reference-counted key maps so a single event can be subtracted
+    and re-added without rescanning the year.
+
+    Database Table:
+        virtual_session_aggregate - Per-district virtual session aggregates
+
+    Data Structure:
+        - row_count: Session rows attributed to the district (any status)
+        - experience_count: Completed session rows
+        - key_counts: {summary key set: {json-encoded key: refcount}}
+        - monthly_counts: {"YYYY-MM": completed session rows}
+        - filter_counts: Filter option refcounts (overall row only)
+        - built_at: Time of the last full rebuild (overall row only)
+    """
+
+    __tablename__ = "virtual_session_aggregate"
+
+    id = db.Column(db.Integer, primary_key=True)
+    virtual_year = db.Column(
+        db.String(9), nullable=False, index=True
+    )  # e.g., '2024-2025'
+    district_name = db.Column(db.String(255), nullable=False)
+
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+    experience_count = db.Column(db.Integer, nullable=False, default=0)
+    key_counts = db.Column(db.JSON, nullable=False)
+    monthly_counts = db.Column(db.JSON, nullable=False)
+    filter_counts = db.Column(db.JSON, nullable=True)
+
+    built_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    last_updated = db.Column(
+        db.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "virtual_year", "district_name", name="uq_virtual_session_aggregate"
+        ),
+    )
+
+    def __repr__(self):
+        return f"<VirtualSessionAggregate {self.virtual_year} {self.district_name}>"
+
+
+class VirtualSessionEventRows(db.Model):
+    """
+    Model storing the report rows each virtual session event contributes.
+
+    Used by the aggregate store to subtract an event's previous contribution
+    when it is edited, re-imported or deleted, and to assemble the full-year
+    session table without recomputing it from the event tables. event_id has
+    no foreign key so rows of deleted events remain available for subtraction.
+
+    Database Table:
+        virtual_session_event_rows - Per-event virtual session report rows
+    """
+
+    __tablename__ = "virtual_session_event_rows"
+
+    id = db.Column(db.Integer, primary_key=True)
+    virtual_year = db.Column(db.String(9), nullable=False, index=True)
+    event_id = db.Column(db.Integer, nullable=False, unique=True)
+    start_date = db.Column(db.DateTime, nullable=True)
+
+    rows = db.Column(db.JSON, nullable=False)  # Unfiltered session records
+    filter_keys = db.Column(db.JSON, nullable=False)  # Filter option values
+
+    __table_args__ = (
+        db.Index("idx_virtual_event_rows_year_date", "virtual_year", "start_date"),
+    )
+
+    def __repr__(self):
+        return f"<VirtualSessionEventRows {self.virtual_year} event={self.event_id}>"
+
+
 class DistrictManualInput(db.Model):
     """
     Model for storing manually entered district-level data for Year-End reports.
@@ -76,6 +76,8 @@ class Tenant(db.Model):
         api_key_hash: Hashed API key for public event API
         api_key_created_at: When API key was last generated
         allowed_origins: CORS origins (comma-separated)
+        event_change_counter: Bumped on every change to the tenant's events
+        events_changed_at: When the tenant's events last changed
         created_at: Creation timestamp
         updated_at: Last update timestamp
         created_by: FK to User who created tenant
@@ -137,6 +139,20 @@ class Tenant(db.Model):
         db.Text, nullable=True, comment="Comma-separated list of allowed CORS origins"
     )
 
+    # Public event API change tracking (bumped by an after_flush hook)
+    event_change_counter = db.Column(
+        db.Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Incremented whenever one of the tenant's events changes",
+    )
+    events_changed_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=True,
+        comment="When one of the tenant's events last changed",
+    )
+
     # Audit fields
     created_at = db.Column(
         db.DateTime(timezone=True),
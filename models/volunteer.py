@@ -68,6 +68,9 @@ from models.volunteer_enums import (  # noqa: F401 — re-exported for backward
     VolunteerStatus,
 )
 
+# Participation statuses that count as having attended the event
+ATTENDED_STATUSES = ("Attended", "Completed", "Successfully Completed")
+
 # ConnectorData model removed (TD-034 Phase 3)
 # Connector data is now sourced from PathfulUserProfile
 
@@ -214,13 +217,19 @@ class Volunteer(Contact):
         overlaps="volunteer_organizations",  # Handles overlap with the association proxy
     )
 
+    # Materialized participation aggregates (services/volunteer_engagement_service.py)
+    engagement_stats = relationship(
+        "VolunteerEngagementStats", uselist=False, viewonly=True
+    )
+
     @property
     def total_times_volunteered(self):
         """
         Calculates the total number of times this volunteer has volunteered.
 
         This property combines actual event participations with manual adjustments
-        to provide an accurate count of volunteer activity.
+        to provide an accurate count of volunteer activity. The participation count
+        comes from the materialized engagement stats row when one exists.
 
         Returns:
             int: Total count of volunteer sessions including manual adjustments
@@ -229,17 +238,15 @@ class Volunteer(Contact):
             This avoids double counting by not adding times_volunteered field
             which may contain outdated data from Salesforce imports.
         """
-        from sqlalchemy import or_
-
-        # Get count of participations with all relevant statuses
-        participation_count = EventParticipation.query.filter(
-            EventParticipation.volunteer_id == self.id,
-            or_(
-                EventParticipation.status == "Attended",
-                EventParticipation.status == "Completed",
-                EventParticipation.status == "Successfully Completed",
-            ),
-        ).count()
+        stats = self.engagement_stats
+        if stats is not None:
+            participation_count = stats.attended_count
+        else:
+            # Not materialized yet: count participations with attended statuses
+            participation_count = EventParticipation.query.filter(
+                EventParticipation.volunteer_id == self.id,
+                EventParticipation.status.in_(ATTENDED_STATUSES),
+            ).count()
 
         # Add only the manual adjustment (don't add times_volunteered to avoid double counting)
         return participation_count + self.additional_volunteer_count
@@ -278,9 +285,7 @@ class Volunteer(Contact):
             in_person_participation = (
                 EventParticipation.query.filter(
                     EventParticipation.volunteer_id == self.id,
-                    EventParticipation.status.in_(
-                        ["Attended", "Completed", "Successfully Completed"]
-                    ),
+                    EventParticipation.status.in_(ATTENDED_STATUSES),
                 )
                 .join(Event, EventParticipation.event_id == Event.id)
                 .filter(
@@ -0,0 +1,59 @@
+"""
+Volunteer Engagement Statistics Model
+=====================================
+
+Materialized per-volunteer participation statistics, maintained by
+services/volunteer_engagement_service.py.
+
+Listing, sorting and scoring volunteers used to count EventParticipation
+rows (per volunteer or with full GROUP BY scans) on every request. One row
+per volunteer now holds those aggregates, so readers join a single row per
+volunteer instead.
+
+Rows are written by the engagement service (ORM flush hooks, import
+pipelines and rebuilds), never edited directly.
+
+Database Table:
+    volunteer_engagement_stats - Participation aggregates per volunteer
+"""
+
+from datetime import datetime, timezone
+
+from models import db
+
+
+class VolunteerEngagementStats(db.Model):
+    """
+    Participation aggregates for one volunteer.
+
+    Columns:
+        - attended_count: Participations with an attended status
+        - participation_count: Participations in any status
+        - event_type_counts: {event type value: participations in any status}
+        - first_volunteer_date / last_volunteer_date: Start of the first and
+          latest attended event
+        - last_email_date: Latest of Contact.last_email_date and email
+          activity in History
+    """
+
+    __tablename__ = "volunteer_engagement_stats"
+
+    volunteer_id = db.Column(
+        db.Integer,
+        db.ForeignKey("volunteer.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    attended_count = db.Column(db.Integer, nullable=False, default=0, index=True)
+    participation_count = db.Column(db.Integer, nullable=False, default=0)
+    event_type_counts = db.Column(db.JSON, nullable=False, default=dict)
+    first_volunteer_date = db.Column(db.DateTime)
+    last_volunteer_date = db.Column(db.DateTime, index=True)
+    last_email_date = db.Column(db.Date)
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self):
+        return f"<VolunteerEngagementStats volunteer={self.volunteer_id}>"
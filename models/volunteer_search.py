@@ -0,0 +1,131 @@
+"""
+Volunteer Search Document Model
+===============================
+
+Denormalized search text for each volunteer, backing the full-text volunteer
+search in services/volunteer_search_service.py.
+
+One row per volunteer holds the searchable text gathered from the volunteer,
+their organizations, skills and event participations. The database-specific
+full-text structure is built over this table:
+
+- SQLite: an FTS5 external-content table (volunteer_search_fts) kept in sync
+  with this table by triggers
+- PostgreSQL: a GIN index over a weighted tsvector of the text columns
+
+Rows are written by the search service (ORM flush hooks and rebuilds), never
+edited directly.
+
+Database Table:
+    volunteer_search_document - Searchable text per volunteer
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DDL, event
+
+from models import db
+
+# Full-text columns, in FTS5 column order
+SEARCH_COLUMNS = ("name", "work", "skills", "events", "status")
+
+FTS_TABLE = "volunteer_search_fts"
+
+# Weighted tsvector over the text columns (PostgreSQL). The GIN index and the
+# search query must use this exact expression for the index to be used.
+PG_DOCUMENT_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(work, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(skills, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(events, '')), 'D') || "
+    "setweight(to_tsvector('simple', coalesce(status, '')), 'D')"
+)
+
+
+class VolunteerSearchDocument(db.Model):
+    """
+    Searchable text for one volunteer.
+
+    Columns:
+        - name: First, middle and last name
+        - work: Workplace, title, department, industry, organization names
+          and organization roles
+        - skills: Skill names
+        - events: Titles and types of events participated in
+        - status: Local status
+    """
+
+    __tablename__ = "volunteer_search_document"
+
+    volunteer_id = db.Column(
+        db.Integer,
+        db.ForeignKey("volunteer.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    name = db.Column(db.Text)
+    work = db.Column(db.Text)
+    skills = db.Column(db.Text)
+    events = db.Column(db.Text)
+    status = db.Column(db.String(50))
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self):
+        return f"<VolunteerSearchDocument volunteer={self.volunteer_id}>"
+
+
+def _sqlite_has_fts5(ddl, target, bind, **kw):
+    if bind.dialect.name != "sqlite":
+        return False
+    options = {row[0] for row in bind.exec_driver_sql("PRAGMA compile_options")}
+    return "ENABLE_FTS5" in options
+
+
+_fts_columns = ", ".join(SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{name}" for name in SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{name}" for name in SEARCH_COLUMNS)
+
+# External-content FTS5 table and the triggers that keep it in sync
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"{_fts_columns}, content='volunteer_search_document', "
+    "content_rowid='volunteer_id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS volunteer_search_document_ai "
+    "AFTER INSERT ON volunteer_search_document BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_fts_columns}) "
+    f"VALUES (new.volunteer_id, {_new_values}); END",
+    "CREATE TRIGGER IF NOT EXISTS volunteer_search_document_ad "
+    "AFTER DELETE ON volunteer_search_document BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_fts_columns}) "
+    f"VALUES ('delete', old.volunteer_id, {_old_values}); END",
+    "CREATE TRIGGER IF NOT EXISTS volunteer_search_document_au "
+    "AFTER UPDATE ON volunteer_search_document BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_fts_columns}) "
+    f"VALUES ('delete', old.volunteer_id, {_old_values}); "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_fts_columns}) "
+    f"VALUES (new.volunteer_id, {_new_values}); END",
+]
+
+POSTGRES_FTS_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_volunteer_search_document_fts "
+    f"ON volunteer_search_document USING gin (({PG_DOCUMENT_VECTOR}))",
+]
+
+_table = VolunteerSearchDocument.__table__
+for _statement in SQLITE_FTS_DDL:
+    event.listen(
+        _table, "after_create", DDL(_statement).execute_if(callable_=_sqlite_has_fts5)
+    )
+for _statement in POSTGRES_FTS_DDL:
+    event.listen(
+        _table, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+event.listen(
+    _table,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"),
+)
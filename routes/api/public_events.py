@@ -13,6 +13,14 @@ Requirements:
 - FR-API-107: JSON envelope with success, data, pagination
 - FR-API-108: Event objects with required fields
 
+Polling support (services/public_event_api_service.py):
+- Cursor pagination: pass ``cursor`` (empty for the first page) and follow
+  ``pagination.next_cursor``; pages are read by (start_date, id) keyset
+  without a COUNT. ``page`` keeps working and also returns next_cursor.
+- List responses carry ETag and Last-Modified and answer If-None-Match /
+  If-Modified-Since with 304. They are cached in-process until one of the
+  tenant's events changes.
+
 Usage:
     GET /api/v1/district/kansas-city-usd/events
     Headers: X-API-Key: your-tenant-api-key
@@ -21,11 +29,20 @@ Usage:
 from datetime import datetime, timezone
 from functools import wraps
 
-from flask import Blueprint, g, jsonify, request
+from flask import Blueprint, Response, g, jsonify, request
 from flask_cors import cross_origin
-
-from models.event import Event, EventStatus
-from models.tenant import Tenant
+from sqlalchemy import and_, func, or_, select
+
+from models import db
+from models.event import Event, EventStatus, event_volunteers
+from services.public_event_api_service import (
+    decode_cursor,
+    encode_cursor,
+    event_feed_version,
+    get_cached_feed,
+    resolve_api_tenant,
+    store_feed,
+)
 from utils.rate_limiter import get_api_key_or_ip, limiter
 
 # Create public API blueprint
@@ -37,7 +54,7 @@ def require_api_key(f):
     Decorator to require valid API key (FR-API-103).
 
     Validates X-API-Key header against tenant's stored key hash.
-    Sets g.tenant for the request.
+    Sets g.api_tenant (id and slug) for the request.
     """
 
     @wraps(f)
@@ -59,10 +76,10 @@ def require_api_key(f):
                 401,
             )
 
-        # Find tenant by slug
-        tenant = Tenant.query.filter_by(slug=tenant_slug, is_active=True).first()
+        # Find tenant by slug and validate API key (cached briefly)
+        tenant, error = resolve_api_tenant(tenant_slug, api_key)
 
-        if not tenant:
+        if error == "TENANT_NOT_FOUND":
             return (
                 jsonify(
                     {
@@ -76,8 +93,7 @@ def require_api_key(f):
                 404,
             )
 
-        # Validate API key
-        if not tenant.validate_api_key(api_key):
+        if error:
             return (
                 jsonify(
                     {
@@ -105,13 +121,20 @@ def get_cors_origins(tenant):
     return origins if origins else ["*"]
 
 
-def build_event_response(event):
+def build_event_response(event, volunteer_count=None):
     """
     Build event object for API response (FR-API-108).
 
     Includes: id, title, description, event_type, date, times,
     location, volunteers_needed, signup_url
+
+    Args:
+        event: Event to serialize
+        volunteer_count: Registered volunteers, if already counted
+            (defaults to Event.volunteer_count)
     """
+    if volunteer_count is None:
+        volunteer_count = event.volunteer_count
     return {
         "id": event.id,
         "title": event.title,
@@ -125,15 +148,123 @@ def build_event_response(event):
         "end_datetime": event.end_date.isoformat() if event.end_date else None,
         "location": event.location,
         "volunteers_needed": event.volunteers_needed or 0,
-        "volunteers_registered": event.volunteer_count or 0,
+        "volunteers_registered": volunteer_count or 0,
         "slots_available": max(
-            0, (event.volunteers_needed or 0) - (event.volunteer_count or 0)
+            0, (event.volunteers_needed or 0) - (volunteer_count or 0)
         ),
         "signup_url": event.registration_link,
         "status": event.status.value if event.status else None,
     }
 
 
+def _volunteer_counts(events):
+    """Registered volunteer counts for a page of events, in one query."""
+    event_ids = [event.id for event in events]
+    if not event_ids:
+        return {}
+    rows = db.session.execute(
+        select(event_volunteers.c.event_id, func.count())
+        .where(event_volunteers.c.event_id.in_(event_ids))
+        .group_by(event_volunteers.c.event_id)
+    )
+    return dict(rows.all())
+
+
+def _invalid_cursor_response():
+    return (
+        jsonify(
+            {
+                "success": False,
+                "error": {
+                    "code": "INVALID_CURSOR",
+                    "message": "cursor is not a valid pagination cursor",
+                },
+            }
+        ),
+        400,
+    )
+
+
+def _paginate_events(query, per_page):
+    """
+    Page through an event query, by cursor or by page number.
+
+    A ``cursor`` parameter (empty for the first page) selects keyset
+    pagination on (start_date, id) without a COUNT; otherwise ``page``
+    selects an offset page with totals.
+
+    Returns:
+        tuple: (events, pagination dict)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = query.order_by(Event.start_date.asc(), Event.id.asc())
+
+    if "cursor" in request.args:
+        after = decode_cursor(request.args.get("cursor"))
+        query = query.filter(Event.start_date.isnot(None))
+        if after:
+            start, event_id = after
+            query = query.filter(
+                or_(
+                    Event.start_date > start,
+                    and_(Event.start_date == start, Event.id > event_id),
+                )
+            )
+        events = query.limit(per_page + 1).all()
+        has_next = len(events) > per_page
+        events = events[:per_page]
+        return events, {
+            "per_page": per_page,
+            "has_next": has_next,
+            "next_cursor": encode_cursor(events[-1]) if has_next else None,
+        }
+
+    page = request.args.get("page", 1, type=int)
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    events = pagination.items
+    next_cursor = None
+    if pagination.has_next and events and events[-1].start_date is not None:
+        next_cursor = encode_cursor(events[-1])
+    return events, {
+        "page": page,
+        "per_page": per_page,
+        "total_items": pagination.total,
+        "total_pages": pagination.pages,
+        "has_next": pagination.has_next,
+        "has_prev": pagination.has_prev,
+        "next_cursor": next_cursor,
+    }
+
+
+def _feed_response(tenant, endpoint, build):
+    """
+    Serve a list endpoint from the response cache, conditionally.
+
+    ``build()`` returns (payload, valid_until) and only runs when the
+    tenant's events changed since the cached response was built (or it
+    expired); a ValueError from it means a malformed cursor. Matching
+    If-None-Match / If-Modified-Since get a 304.
+    """
+    counter, changed_at = event_feed_version(tenant.id)
+    key = (tenant.id, endpoint, tuple(sorted(request.args.items(multi=True))))
+    entry = get_cached_feed(key, counter)
+    if entry is None:
+        try:
+            payload, valid_until = build()
+        except ValueError:
+            return _invalid_cursor_response()
+        entry = store_feed(key, counter, changed_at, payload, valid_until)
+
+    response = Response(entry.body, mimetype="application/json")
+    response.set_etag(entry.etag)
+    response.last_modified = entry.last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
 @public_api_bp.route("/<tenant_slug>/events", methods=["GET", "OPTIONS"])
 @limiter.limit(
     "60 per minute; 1000 per hour; 10000 per day", key_func=get_api_key_or_ip
@@ -145,79 +276,70 @@ def list_events(tenant_slug):
     List published events for a tenant (FR-API-101).
 
     Query Parameters:
-        page: Page number (default 1)
+        cursor: Keyset pagination cursor (empty for the first page)
+        page: Page number (default 1), when no cursor is given
         per_page: Items per page (default 20, max 100)
         from_date: Filter events from this date (YYYY-MM-DD)
         to_date: Filter events to this date (YYYY-MM-DD)
         event_type: Filter by event type
 
     Returns:
-        JSON with success, data, and pagination (FR-API-107)
+        JSON with success, data, and pagination (FR-API-107); 304 when the
+        client's ETag / Last-Modified is current
     """
     tenant = g.api_tenant
 
-    # Pagination params
-    page = request.args.get("page", 1, type=int)
-    per_page = min(request.args.get("per_page", 20, type=int), 100)
-
-    # Date filters
-    from_date = request.args.get("from_date")
-    to_date = request.args.get("to_date")
-    event_type = request.args.get("event_type")
-
-    # Base query - only published events for this tenant
-    query = Event.query.filter(
-        Event.tenant_id == tenant.id, Event.status == EventStatus.PUBLISHED
-    )
-
-    # Apply date filters
-    if from_date:
-        try:
-            from_dt = datetime.strptime(from_date, "%Y-%m-%d").replace(
-                tzinfo=timezone.utc
-            )
-            query = query.filter(Event.start_date >= from_dt)
-        except ValueError:
-            pass
-
-    if to_date:
-        try:
-            to_dt = datetime.strptime(to_date, "%Y-%m-%d").replace(
-                hour=23, minute=59, second=59, tzinfo=timezone.utc
-            )
-            query = query.filter(Event.start_date <= to_dt)
-        except ValueError:
-            pass
+    def build():
+        per_page = min(request.args.get("per_page", 20, type=int), 100)
 
-    # Apply event type filter
-    if event_type:
-        query = query.filter(Event.type == event_type)
+        # Date filters
+        from_date = request.args.get("from_date")
+        to_date = request.args.get("to_date")
+        event_type = request.args.get("event_type")
 
-    # Order by date
-    query = query.order_by(Event.start_date.asc())
-
-    # Paginate
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        # Base query - only published events for this tenant
+        query = Event.query.filter(
+            Event.tenant_id == tenant.id, Event.status == EventStatus.PUBLISHED
+        )
 
-    # Build response (FR-API-107)
-    return jsonify(
-        {
+        # Apply date filters
+        if from_date:
+            try:
+                from_dt = datetime.strptime(from_date, "%Y-%m-%d").replace(
+                    tzinfo=timezone.utc
+                )
+                query = query.filter(Event.start_date >= from_dt)
+            except ValueError:
+                pass
+
+        if to_date:
+            try:
+                to_dt = datetime.strptime(to_date, "%Y-%m-%d").replace(
+                    hour=23, minute=59, second=59, tzinfo=timezone.utc
+                )
+                query = query.filter(Event.start_date <= to_dt)
+            except ValueError:
+                pass
+
+        # Apply event type filter
+        if event_type:
+            query = query.filter(Event.type == event_type)
+
+        events, pagination = _paginate_events(query, per_page)
+        counts = _volunteer_counts(events)
+
+        # Build response (FR-API-107)
+        payload = {
             "success": True,
-            "data": [build_event_response(event) for event in pagination.items],
-            "pagination": {
-                "page": page,
-                "per_page": per_page,
-                "total_items": pagination.total,
-                "total_pages": pagination.pages,
-                "has_next": pagination.has_next,
-                "has_prev": pagination.has_prev,
-            },
-            "meta": {
-                "tenant": tenant.slug,
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-            },
+            "data": [
+                build_event_response(event, counts.get(event.id, 0)) for event in events
+            ],
+            "pagination": pagination,
+            "meta": {"tenant": tenant.slug},
         }
-    )
+        return payload, None
+
+    return _feed_response(tenant, "events", build)
 
 
 @public_api_bp.route("/<tenant_slug>/events/<event_id>", methods=["GET", "OPTIONS"])
@@ -278,39 +400,39 @@ def list_upcoming_events(tenant_slug):
     """
     List upcoming published events (convenience endpoint).
 
-    Returns only future events, ordered by date.
+    Returns only future events, ordered by date. Supports the same cursor /
+    page pagination and conditional requests as list_events.
     """
     tenant = g.api_tenant
 
-    # Pagination
-    page = request.args.get("page", 1, type=int)
-    per_page = min(request.args.get("per_page", 20, type=int), 100)
+    def build():
+        per_page = min(request.args.get("per_page", 20, type=int), 100)
 
-    # Query upcoming published events
-    now = datetime.now(timezone.utc)
-    query = Event.query.filter(
-        Event.tenant_id == tenant.id,
-        Event.status == EventStatus.PUBLISHED,
-        Event.start_date >= now,
-    ).order_by(Event.start_date.asc())
+        # Query upcoming published events
+        now = datetime.now(timezone.utc)
+        query = Event.query.filter(
+            Event.tenant_id == tenant.id,
+            Event.status == EventStatus.PUBLISHED,
+            Event.start_date >= now,
+        )
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        events, pagination = _paginate_events(query, per_page)
+        counts = _volunteer_counts(events)
 
-    return jsonify(
-        {
+        payload = {
             "success": True,
-            "data": [build_event_response(event) for event in pagination.items],
-            "pagination": {
-                "page": page,
-                "per_page": per_page,
-                "total_items": pagination.total,
-                "total_pages": pagination.pages,
-                "has_next": pagination.has_next,
-                "has_prev": pagination.has_prev,
-            },
-            "meta": {
-                "tenant": tenant.slug,
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-            },
+            "data": [
+                build_event_response(event, counts.get(event.id, 0)) for event in events
+            ],
+            "pagination": pagination,
+            "meta": {"tenant": tenant.slug},
         }
-    )
+        # The list changes once its first event starts
+        valid_until = None
+        if events:
+            valid_until = events[0].start_date
+            if valid_until.tzinfo is None:
+                valid_until = valid_until.replace(tzinfo=timezone.utc)
+        return payload, valid_until
+
+    return _feed_response(tenant, "upcoming", build)
@@ -444,9 +444,9 @@ def _send_magic_link_email(
     district_name: str,
 ):
     """
-    Send magic link email to teacher.
+    Queue the magic link email to a teacher for background delivery.
 
-    Uses Mailjet if configured, otherwise logs to console.
+    The link URL is also logged, so it is usable when delivery is disabled.
 
     Args:
         email: Teacher email address
@@ -462,50 +462,18 @@ def _send_magic_link_email(
 
     current_app.logger.info("Magic link URL for %s: %s", email, link_url)
 
-    # Try to send via Mailjet
+    # Queue for the background outbox worker; never block the request on
+    # the mail provider
     try:
-        from utils.email import (
-            check_recipient_allowlist,
-            get_email_allowlist,
-            get_mailjet_client,
-            is_email_delivery_enabled,
-        )
-
-        mailjet = get_mailjet_client()
-
-        if not mailjet:
-            current_app.logger.warning(
-                "Mailjet not configured. Magic link logged to console only."
-            )
-            return
-
-        if not is_email_delivery_enabled():
-            current_app.logger.warning(
-                "Email delivery disabled. Magic link logged to console only."
-            )
-            return
-
-        # Check allowlist in non-production
-        allowlist = get_email_allowlist()
-        if allowlist:
-            is_allowed, reason = check_recipient_allowlist(email, allowlist)
-            if not is_allowed:
-                current_app.logger.warning(
-                    f"Email blocked by allowlist: {email}. Reason: {reason}"
-                )
-                return
-
-        # Send email via Mailjet
-        data = {
-            "Messages": [
-                {
-                    "From": {
-                        "Email": os.environ.get("MAIL_FROM", "no-reply@ineedhelp.pro"),
-                        "Name": "PrepKC Virtual Sessions",
-                    },
-                    "To": [{"Email": email, "Name": teacher_name}],
-                    "Subject": f"Access Your Virtual Session Progress - {district_name}",
-                    "HTMLPart": f"""
+        from services.email_outbox_service import enqueue_email
+
+        enqueue_email(
+            recipient=email,
+            recipient_name=teacher_name,
+            sender_email=os.environ.get("MAIL_FROM", "no-reply@ineedhelp.pro"),
+            sender_name="PrepKC Virtual Sessions",
+            subject=f"Access Your Virtual Session Progress - {district_name}",
+            html_body=f"""
                     <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
                         <div style="background: linear-gradient(135deg, #1e3a5f 0%, #2d5a87 100%); padding: 30px; text-align: center;">
                             <h1 style="color: white; margin: 0;">Virtual Session Progress</h1>
@@ -537,7 +505,7 @@ def _send_magic_link_email(
                         </div>
                     </div>
                     """,
-                    "TextPart": f"""
+            text_body=f"""
 Hello {teacher_name},
 
 Click the link below to view your virtual session progress for {district_name}:
@@ -551,17 +519,12 @@ If you didn't request this link, you can safely ignore this email.
 ---
 PrepKC - Preparing Kansas City Youth for Success
                     """,
-                }
-            ]
-        }
-
-        result = mailjet.send.create(data=data)
-        if result.status_code == 200:
-            current_app.logger.info("Magic link email sent to %s", email)
-        else:
-            current_app.logger.error(
-                f"Mailjet error: {result.status_code} - {result.json()}"
-            )
+            purpose="magic_link",
+        )
+        current_app.logger.info("Magic link email queued for %s", email)
 
     except Exception as e:
-        current_app.logger.error("Error sending magic link email: %s", e, exc_info=True)
+        db.session.rollback()
+        current_app.logger.error(
+            "Error queueing magic link email: %s", e, exc_info=True
+        )
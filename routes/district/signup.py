@@ -249,24 +249,13 @@ def public_signup_success(slug, event_id):
 
 def _send_signup_confirmation_email(volunteer: Volunteer, event: Event, tenant: Tenant):
     """
-    Send signup confirmation email with calendar invite attachment.
+    Queue the signup confirmation email, with a calendar invite attachment,
+    for background delivery.
 
     FR-SELFSERV-405: Confirmation emails with calendar invites.
     """
     try:
-        from utils.email import get_mailjet_client, is_email_delivery_enabled
-
-        # Check if email delivery is enabled
-        if not is_email_delivery_enabled():
-            current_app.logger.info(
-                f"Email delivery disabled - skipping confirmation to {volunteer.primary_email}"
-            )
-            return
-
-        client = get_mailjet_client()
-        if not client:
-            current_app.logger.warning("Mailjet client not configured")
-            return
+        from services.email_outbox_service import enqueue_email
 
         # Generate calendar invite
         ics_content = generate_event_ics_from_model(event)
@@ -278,22 +267,13 @@ def _send_signup_confirmation_email(volunteer: Volunteer, event: Event, tenant:
             else "TBD"
         )
 
-        # Build email
-        data = {
-            "Messages": [
-                {
-                    "From": {
-                        "Email": "events@prepkc.org",
-                        "Name": tenant.name or "PrepKC",
-                    },
-                    "To": [
-                        {
-                            "Email": volunteer.primary_email,
-                            "Name": f"{volunteer.first_name} {volunteer.last_name}",
-                        }
-                    ],
-                    "Subject": f"You're signed up for {event.title}!",
-                    "TextPart": f"""
+        enqueue_email(
+            recipient=volunteer.primary_email,
+            recipient_name=f"{volunteer.first_name} {volunteer.last_name}",
+            sender_email="events@prepkc.org",
+            sender_name=tenant.name or "PrepKC",
+            subject=f"You're signed up for {event.title}!",
+            text_body=f"""
 Hi {volunteer.first_name},
 
 Thank you for signing up for {event.title}!
@@ -309,7 +289,7 @@ We look forward to seeing you there!
 Best regards,
 {tenant.name or 'PrepKC'}
 """,
-                    "HTMLPart": f"""
+            html_body=f"""
 <html>
 <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
     <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
@@ -333,29 +313,20 @@ Best regards,
 </body>
 </html>
 """,
-                    "Attachments": [
-                        {
-                            "ContentType": "text/calendar",
-                            "Filename": f"{event.title.replace(' ', '_')}.ics",
-                            "Base64Content": __import__("base64")
-                            .b64encode(ics_content.encode())
-                            .decode(),
-                        }
-                    ],
-                }
-            ]
-        }
-
-        result = client.send.create(data=data)
-        if result.status_code == 200:
-            current_app.logger.info(
-                f"Confirmation email sent to {volunteer.primary_email} for event {event.id}"
-            )
-        else:
-            current_app.logger.error(
-                f"Failed to send confirmation email: {result.status_code} - {result.json()}"
-            )
+            attachments=[
+                (
+                    f"{event.title.replace(' ', '_')}.ics",
+                    "text/calendar",
+                    ics_content.encode(),
+                )
+            ],
+            purpose="signup_confirmation",
+        )
+        current_app.logger.info(
+            f"Confirmation email queued for {volunteer.primary_email} for event {event.id}"
+        )
 
     except Exception as e:
-        current_app.logger.error("Error sending confirmation email: %s", e)
+        db.session.rollback()
+        current_app.logger.error("Error queueing confirmation email: %s", e)
         # Don't fail the signup if email fails
@@ -574,6 +574,7 @@ def teacher_detail(teacher_progress_id):
     from datetime import datetime, timezone
 
     from models.event import Event, EventStatus, EventTeacher, EventType
+    from services.educator_link_service import educator_names_for_events
     from services.teacher_matching_service import (
         build_teacher_alias_map,
         match_educator_to_teacher,
@@ -668,31 +669,36 @@ def teacher_detail(teacher_progress_id):
     # --- Path 2 (supplementary): Text matching for unmatched events ---
     _, alias_map = build_teacher_alias_map([tp])
 
-    events_query = Event.query.filter(
+    event_filters = [
         Event.type == EventType.VIRTUAL_SESSION,
         Event.status != EventStatus.DRAFT,
-    )
+    ]
     if district_names:
-        events_query = events_query.filter(Event.district_partner.in_(district_names))
-    events = events_query.order_by(Event.start_date.desc()).all()
+        event_filters.append(Event.district_partner.in_(district_names))
 
-    for event in events:
-        if event.id in matched_event_ids:
+    # Match each distinct educator name once, via the educator link table
+    name_matches = {}
+    text_event_ids = set()
+    for event_id, educator_name in educator_names_for_events(*event_filters):
+        if event_id in matched_event_ids:
             continue  # Already found via EventTeacher
-        if not event.educators:
-            continue
-
-        educator_names = [n.strip() for n in event.educators.split(";") if n.strip()]
-        matched = any(
-            match_educator_to_teacher(name, alias_map) == tp.id
-            for name in educator_names
+        if educator_name not in name_matches:
+            name_matches[educator_name] = (
+                match_educator_to_teacher(educator_name, alias_map) == tp.id
+            )
+        if name_matches[educator_name]:
+            text_event_ids.add(event_id)
+
+    if text_event_ids:
+        events = (
+            Event.query.filter(Event.id.in_(text_event_ids))
+            .order_by(Event.start_date.desc())
+            .all()
         )
-        if not matched:
-            continue
-
-        matched_event_ids.add(event.id)
-        session_data = _build_session_data(event)
-        _classify_session(session_data, event)
+        for event in events:
+            matched_event_ids.add(event.id)
+            session_data = _build_session_data(event)
+            _classify_session(session_data, event)
 
     # ── Merge attendance overrides into session lists ──────────────────
     add_overrides = AttendanceOverride.query.filter_by(
@@ -11,6 +11,7 @@ Modules:
     import_data: File import, Salesforce import, school/district management
     bug_reports: Bug report listing, resolution, deletion
     cache_management: Cache status and scheduler (pre-existing)
+    query_profiler: Per-endpoint SQL statement counts and N+1 detection
 """
 
 # Re-export update_school_levels for backward compat
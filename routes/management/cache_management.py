@@ -11,6 +11,8 @@ Key Features:
 - Real-time cache status monitoring
 - Scheduler start/stop controls
 - Cache statistics and health monitoring
+- Per-cache hit/miss/invalidation counters from the dependency registry
+- Payload codec, read latency and stored bytes for large cache columns
 - Admin-only access controls
 
 Routes:
@@ -26,6 +28,8 @@ from flask import Blueprint, flash, jsonify, redirect, render_template, request,
 from flask_login import current_user, login_required
 
 from routes.decorators import admin_required, handle_route_errors
+from services.cache_dependency_service import get_cache_metrics
+from utils.cache_codec import get_payload_metrics
 from utils.cache_refresh_scheduler import (
     get_cache_status,
     refresh_all_caches,
@@ -54,7 +58,11 @@ def cache_status():
     }
 
     return render_template(
-        "management/cache_status.html", status=formatted_status, title="Cache Status"
+        "management/cache_status.html",
+        status=formatted_status,
+        cache_metrics=get_cache_metrics(),
+        payload_metrics=get_payload_metrics(),
+        title="Cache Status",
     )
 
 
@@ -122,6 +130,8 @@ def stop_scheduler():
 def api_cache_status():
     """API endpoint for cache status (for AJAX updates)."""
     status = get_cache_status()
+    status["cache_metrics"] = get_cache_metrics()
+    status["payload_metrics"] = get_payload_metrics()
     return jsonify({"success": True, "data": status})
 
 
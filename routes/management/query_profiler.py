@@ -0,0 +1,46 @@
+"""
+Query Profiler Routes
+=====================
+
+Admin page for the per-request SQL profiler in utils/query_profiler.py.
+Shows per-endpoint statement counts, database time and the statement
+fingerprints repeated within a single request (likely N+1 queries).
+
+Profiling is opt-in: set QUERY_PROFILER_ENABLED=true to collect data.
+
+Routes:
+- /management/queries - Per-endpoint query statistics
+- /management/queries/reset - Clear the collected statistics
+"""
+
+from flask import Blueprint, current_app, flash, redirect, render_template, url_for
+from flask_login import login_required
+
+from routes.decorators import admin_required
+from utils.query_profiler import get_query_stats, reset_query_stats
+
+query_profiler_bp = Blueprint("query_profiler", __name__)
+
+
+@query_profiler_bp.route("/management/queries")
+@login_required
+@admin_required
+def query_stats():
+    """Display per-endpoint query statistics."""
+    return render_template(
+        "management/query_profiler.html",
+        enabled=current_app.config.get("QUERY_PROFILER_ENABLED", False),
+        repeat_threshold=current_app.config.get("QUERY_PROFILER_REPEAT_THRESHOLD"),
+        endpoints=get_query_stats(),
+        title="Query Profiler",
+    )
+
+
+@query_profiler_bp.route("/management/queries/reset", methods=["POST"])
+@login_required
+@admin_required
+def reset_stats():
+    """Clear the collected query statistics."""
+    reset_query_stats()
+    flash("Query statistics cleared.", "success")
+    return redirect(url_for("query_profiler.query_stats"))
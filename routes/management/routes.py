@@ -55,6 +55,7 @@ from routes.reports.recent_volunteers import (
 )
 from routes.reports.virtual_session import invalidate_virtual_session_caches
 from services.user_service import update_user_fields
+from services.virtual_aggregate_service import invalidate_virtual_aggregates
 
 management_bp = Blueprint("management", __name__)
 
@@ -295,6 +296,7 @@ def refresh_all_caches():
 
     if scope in ("all", "virtual"):
         invalidate_virtual_session_caches()  # all years
+        invalidate_virtual_aggregates()
         summary["invalidated"].append("virtual_session_caches")
 
     if scope in ("all", "org"):
@@ -4,6 +4,7 @@ District Year-End computation functions.
 Extracted from district_year_end.py as part of TD-020.
 Contains:
   - generate_schools_by_level_data: school grouping for reports
+  - build_district_matchers / SchoolTextMatcher: event text → district/school
   - cache_district_stats_with_events: caching logic
   - calculate_enhanced_district_stats: detailed stat breakdowns
   - convert_school_year_format / convert_academic_year_format: format helpers
@@ -11,6 +12,7 @@ Contains:
 
 import logging
 import math
+from collections import defaultdict
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,46 @@ from routes.reports.common import (
     get_district_student_count_for_event,
     get_school_year_date_range,
 )
+from services.cache_dependency_service import register_cache_dependencies
+from utils.text_matcher import KeywordMatcher
+
+
+class SchoolTextMatcher:
+    """
+    Finds the school an event's free text refers to.
+
+    Tries whole school names first, then any school-name word longer than
+    three letters; among several hits the earliest school in *schools*
+    wins. Both passes are single scans of the text (KeywordMatcher).
+    """
+
+    def __init__(self, schools):
+        # Later schools with the same name replace earlier ones
+        by_name = {}
+        for school in schools:
+            if school.name:
+                by_name[school.name.lower()] = school
+        self._named_schools = list(by_name.values())
+        self._names = KeywordMatcher()
+        for position, name in enumerate(by_name):
+            self._names.add(name, position)
+
+        self._schools = list(schools)
+        self._words = KeywordMatcher()
+        for position, school in enumerate(self._schools):
+            for part in (school.name or "").lower().split():
+                if len(part) > 3:  # Only match meaningful parts
+                    self._words.add(part, position)
+
+    def match(self, text):
+        """School whose name (or a significant name word) occurs in *text*."""
+        hits = self._names.matches(text)
+        if hits:
+            return self._named_schools[min(hits)]
+        hits = self._words.matches(text)
+        if hits:
+            return self._schools[min(hits)]
+        return None
 
 
 def generate_schools_by_level_data(district, events):
@@ -61,8 +103,8 @@ def generate_schools_by_level_data(district, events):
     # Create a mapping of school_id to school for quick lookup
     school_map = {school.id: school for school in district_schools}
 
-    # Also create a mapping by school name for events that reference schools by name
-    school_name_map = {school.name.lower(): school for school in district_schools}
+    # Match events that reference schools by name in their text
+    school_matcher = SchoolTextMatcher(district_schools)
 
     # Initialize school data for ALL schools in the district (ensures all schools are shown)
     school_events = {}
@@ -95,47 +137,11 @@ def generate_schools_by_level_data(district, events):
         # If not found, try to match by event title or location
         if not school:
             event_text = f"{event.title} {getattr(event, 'location', '')}".lower()
-
-            # Try exact school name matches first
-            for school_name, school_obj in school_name_map.items():
-                if school_name in event_text:
-                    school = school_obj
-                    break
-
-            # If no exact match, try partial matching with common school name patterns
-            if not school:
-                for school_obj in district_schools:
-                    school_name_parts = school_obj.name.lower().split()
-                    # Check if any significant part of the school name appears in the event
-                    for part in school_name_parts:
-                        if (
-                            len(part) > 3 and part in event_text
-                        ):  # Only check meaningful parts
-                            school = school_obj
-                            break
-                    if school:
-                        break
+            school = school_matcher.match(event_text)
 
         # If still not found, try to match by district partner field (if available)
         if not school and hasattr(event, "district_partner") and event.district_partner:
-            event_text = event.district_partner.lower()
-
-            # Try exact school name matches first
-            for school_name, school_obj in school_name_map.items():
-                if school_name in event_text:
-                    school = school_obj
-                    break
-
-            # If no exact match, try partial matching
-            if not school:
-                for school_obj in district_schools:
-                    school_name_parts = school_obj.name.lower().split()
-                    for part in school_name_parts:
-                        if len(part) > 3 and part in event_text:
-                            school = school_obj
-                            break
-                    if school:
-                        break
+            school = school_matcher.match(event.district_partner.lower())
 
         # If we found a school and it's in our district, add the event to that school
         if school and school.id in school_events:
@@ -232,11 +238,49 @@ def generate_schools_by_level_data(district, events):
     return schools_by_level
 
 
-def refresh_district_cache(school_year, host_filter="all"):
+def build_district_matchers(active_districts, schools_by_district):
+    """
+    Build the text matchers that assign events to districts.
+
+    Args:
+        active_districts: (District, DISTRICT_MAPPING entry) pairs
+        schools_by_district: district id -> School list
+
+    Returns:
+        (district_terms, school_terms): KeywordMatchers of lowercased
+        district names and aliases (DISTRICT_MAPPING and DistrictAlias rows),
+        and of school names, each mapping to the district id
+    """
+    from models.district_model import DistrictAlias
+
+    district_ids = [d.id for d, _ in active_districts]
+    db_aliases = defaultdict(list)
+    if district_ids:
+        for alias in DistrictAlias.query.filter(
+            DistrictAlias.district_id.in_(district_ids)
+        ):
+            db_aliases[alias.district_id].append(alias.alias)
+
+    district_terms = KeywordMatcher()
+    school_terms = KeywordMatcher()
+    for d, mapping in active_districts:
+        district_terms.add(d.name.lower(), d.id)
+        for alias in list(mapping.get("aliases", [])) + db_aliases[d.id]:
+            district_terms.add(alias.lower(), d.id)
+        for school in schools_by_district[d.id]:
+            school_terms.add((school.name or "").lower(), d.id)
+    return district_terms, school_terms
+
+
+def refresh_district_cache(school_year, host_filter="all", district_ids=None):
     """
     Single-pass district cache refresh.
     Replaces the old generate + cache two-step pattern.
     Fetches all events for the year once and partitions them in-memory.
+
+    With district_ids, only those districts' rows are regenerated; the year's
+    events are still partitioned across every district so shared events are
+    attributed the same way as in a full refresh.
     """
     import time
 
@@ -262,8 +306,6 @@ def refresh_district_cache(school_year, host_filter="all"):
     )
 
     # 2. Pre-fetch active district IDs and schools
-    from collections import defaultdict
-
     all_districts = District.query.order_by(District.name).all()
     active_districts = []
     for sf_id, mapping in DISTRICT_MAPPING.items():
@@ -284,42 +326,22 @@ def refresh_district_cache(school_year, host_filter="all"):
     for school in all_schools:
         schools_by_district[school.district_id].append(school)
 
+    # One automaton per refresh for district names and aliases (matched
+    # against the district partner text and linked district names) and one
+    # for school names (matched against the district partner text only)
+    district_terms, school_terms = build_district_matchers(
+        active_districts, schools_by_district
+    )
+
     # Pre-load event districts to avoid lazy load queries in loop
     event_districts_map = {e.id: [d.name.lower() for d in e.districts] for e in events}
 
     for event in events:
-        matched_districts = set()
         event_partner_lower = (event.district_partner or "").lower()
-        event_districts_lower = event_districts_map[event.id]
-
-        for d, mapping in active_districts:
-            d_name_lower = d.name.lower()
-
-            # Check primary name
-            if d_name_lower in event_partner_lower or any(
-                d_name_lower in edn for edn in event_districts_lower
-            ):
-                matched_districts.add(d.id)
-                continue
-
-            # Check aliases
-            matched = False
-            for alias in mapping.get("aliases", []):
-                alias_lower = alias.lower()
-                if alias_lower in event_partner_lower or any(
-                    alias_lower in edn for edn in event_districts_lower
-                ):
-                    matched_districts.add(d.id)
-                    matched = True
-                    break
-            if matched:
-                continue
-
-            # Check schools
-            for school in schools_by_district[d.id]:
-                if school.name.lower() in event_partner_lower:
-                    matched_districts.add(d.id)
-                    break
+        matched_districts = district_terms.matches(event_partner_lower)
+        matched_districts |= school_terms.matches(event_partner_lower)
+        for event_district_name in event_districts_map[event.id]:
+            matched_districts |= district_terms.matches(event_district_name)
 
         # Add event to matched districts
         for d_id in matched_districts:
@@ -330,6 +352,27 @@ def refresh_district_cache(school_year, host_filter="all"):
         time.time() - t1,
     )
 
+    # Identify shared events (appear in >1 district's partition)
+    event_district_count = defaultdict(int)
+    for d_id, e_list in district_events.items():
+        for e in e_list:
+            event_district_count[e.id] += 1
+    preloaded_shared_events = {
+        e_id for e_id, count in event_district_count.items() if count > 1
+    }
+
+    if district_ids is not None:
+        # Report rows store district_id as text
+        district_ids = {str(district_id) for district_id in district_ids}
+        active_districts = [
+            (d, mapping) for d, mapping in active_districts if str(d.id) in district_ids
+        ]
+        events = list(
+            {
+                e.id: e for d, _ in active_districts for e in district_events[d.id]
+            }.values()
+        )
+
     # 4. Pre-load participation data
     t2 = time.time()
     event_ids = [e.id for e in events]
@@ -429,15 +472,6 @@ def refresh_district_cache(school_year, host_filter="all"):
     )
     preloaded_attendance = {e_id: total for e_id, total in attendance_rows}
 
-    # Identify shared events (appear in >1 district's partition)
-    event_district_count = defaultdict(int)
-    for d_id, e_list in district_events.items():
-        for e in e_list:
-            event_district_count[e.id] += 1
-    preloaded_shared_events = {
-        e_id for e_id, count in event_district_count.items() if count > 1
-    }
-
     logger.info(
         "[refresh_district_cache] Participation data loaded in %.2fs", time.time() - t2
     )
@@ -583,14 +617,23 @@ def refresh_district_cache(school_year, host_filter="all"):
             # Generate schools_by_level directly
             schools_by_level = {"High": [], "Middle": [], "Elementary": [], "Other": []}
 
+            # Positions of this district's events per school id and school
+            # name, so each school's events come from a lookup, not a scan
+            events_by_school_id = defaultdict(list)
+            events_by_school_name = defaultdict(list)
+            for position, e in enumerate(d_events):
+                events_by_school_id[getattr(e, "school_id", None)].append(position)
+                events_by_school_name[getattr(e, "school", None)].append(position)
+
             # Group schools with stats
             for school in district.schools:
                 # Find events that occurred at this school
                 s_events = [
-                    e
-                    for e in d_events
-                    if getattr(e, "school_id", None) == school.id
-                    or getattr(e, "school", None) == school.name
+                    d_events[position]
+                    for position in sorted(
+                        set(events_by_school_id.get(school.id, ()))
+                        | set(events_by_school_name.get(school.name, ()))
+                    )
                 ]
                 s_total_students = 0
                 for e in s_events:
@@ -717,6 +760,12 @@ def refresh_district_cache(school_year, host_filter="all"):
             report.report_data = report_data
             report.events_data = events_data
             report.last_updated = datetime.now()
+            register_cache_dependencies(
+                report,
+                school_year=school_year,
+                event_ids=[e.id for e in d_events],
+                district_ids=[district.id],
+            )
 
             computed.append(district.name)
             logger.info(
@@ -5,25 +5,14 @@ Extracted from district_year_end.py as part of TD-020.
 Contains the blueprint creation and load_routes() with 14 nested route handlers.
 """
 
-import io
 import logging
 import math
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-import pandas as pd
 import pytz
-from flask import (
-    Blueprint,
-    flash,
-    jsonify,
-    redirect,
-    render_template,
-    request,
-    send_file,
-    url_for,
-)
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
 
 from models import db
@@ -50,6 +39,8 @@ from routes.reports.common import (
     get_district_student_count_for_event,
     get_school_year_date_range,
 )
+from services.cache_dependency_service import is_invalidated, record_cache_lookup
+from utils.spreadsheet_export import Column, Sheet, export_response
 
 # Import from sibling computation module
 from .computation import (
@@ -154,17 +145,29 @@ def load_routes(bp):
         district_stats = {
             report.district.name: report.report_data for report in cached_reports
         }
-
-        if not district_stats:
-            # Cache is empty — trigger a fast single-pass refresh instead of the
-            # slow legacy generate_district_stats path, which blocks for minutes.
+        # Rows invalidated by a dependency change keep their old numbers
+        # until regenerated, so treat any of them as a miss as well.
+        stale_district_ids = [
+            report.district.id for report in cached_reports if is_invalidated(report)
+        ]
+        cache_hit = bool(district_stats) and not stale_district_ids
+        record_cache_lookup(DistrictYearEndReport.__tablename__, hit=cache_hit)
+
+        if not cache_hit:
+            # Cache is empty or stale — trigger a fast single-pass refresh instead
+            # of the slow legacy generate_district_stats path, which blocks for minutes.
+            # Only invalidated districts are regenerated when the rest are current.
             logger.info(
                 "[district_year_end] Cache miss for %s/%s — triggering refresh_district_cache",
                 school_year,
                 host_filter,
             )
             try:
-                refresh_district_cache(school_year, host_filter=host_filter)
+                refresh_district_cache(
+                    school_year,
+                    host_filter=host_filter,
+                    district_ids=(stale_district_ids if district_stats else None),
+                )
                 # Re-query after refresh
                 cached_reports = DistrictYearEndReport.query.filter_by(
                     school_year=school_year, host_filter=host_filter
@@ -174,8 +177,8 @@ def load_routes(bp):
                     for report in cached_reports
                 }
             except Exception as e:
+                # Keep serving any stale rows rather than an empty page
                 logger.error("[district_year_end] Cache refresh failed: %s", e)
-                district_stats = {}
 
         # Filter district stats based on user scope
         if current_user.scope_type == "district" and current_user.allowed_districts:
@@ -674,144 +677,104 @@ def load_routes(bp):
             stats = cached_report.report_data or {}
             events_data = cached_report.events_data
 
-        # Create Excel file
-        output = io.BytesIO()
-        writer = pd.ExcelWriter(output, engine="xlsxwriter")
-        workbook = writer.book
-
-        # Add some formatting
-        header_format = workbook.add_format(
-            {"bold": True, "bg_color": "#467599", "font_color": "white", "border": 1}
-        )
-
-        # Summary Sheet
-        summary_data = {
-            "Metric": [
-                "Total Events",
-                "Total Students Reached",
-                "Unique Students",
-                "Total Volunteers",
-                "Unique Volunteers",
-                "Total Volunteer Hours",
-                "Schools Reached",
-                "Career Clusters",
-            ],
-            "Value": [
-                stats.get("total_events", 0),
-                stats.get("total_students", 0),
-                stats.get("unique_student_count", 0),
-                stats.get("total_volunteers", 0),
-                stats.get("unique_volunteer_count", 0),
-                stats.get("total_volunteer_hours", 0),
-                stats.get("schools_reached", 0),
-                stats.get("career_clusters", 0),
-            ],
-        }
-
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name="Summary", index=False)
-
-        # Format summary sheet
-        worksheet = writer.sheets["Summary"]
-        worksheet.set_column("A:A", 25)
-        worksheet.set_column("B:B", 15)
-        worksheet.conditional_format(
-            "A1:B9", {"type": "no_blanks", "format": header_format}
-        )
+        sheets = [
+            Sheet(
+                "Summary",
+                [Column("Metric", 25), Column("Value", 15)],
+                [
+                    ("Total Events", stats.get("total_events", 0)),
+                    ("Total Students Reached", stats.get("total_students", 0)),
+                    ("Unique Students", stats.get("unique_student_count", 0)),
+                    ("Total Volunteers", stats.get("total_volunteers", 0)),
+                    ("Unique Volunteers", stats.get("unique_volunteer_count", 0)),
+                    ("Total Volunteer Hours", stats.get("total_volunteer_hours", 0)),
+                    ("Schools Reached", stats.get("schools_reached", 0)),
+                    ("Career Clusters", stats.get("career_clusters", 0)),
+                ],
+            )
+        ]
 
         # Event Types Sheet
         if stats.get("event_types"):
-            event_types_data = {
-                "Event Type": list(stats["event_types"].keys()),
-                "Count": list(stats["event_types"].values()),
-            }
-            event_types_df = pd.DataFrame(event_types_data)
-            event_types_df.to_excel(writer, sheet_name="Event Types", index=False)
-
-            # Format event types sheet
-            worksheet = writer.sheets["Event Types"]
-            worksheet.set_column("A:A", 30)
-            worksheet.set_column("B:B", 15)
-            worksheet.conditional_format(
-                "A1:B1", {"type": "no_blanks", "format": header_format}
+            sheets.append(
+                Sheet(
+                    "Event Types",
+                    [Column("Event Type", 30), Column("Count", 15)],
+                    stats["event_types"].items(),
+                )
             )
 
         # Monthly Breakdown Sheet
         if stats.get("monthly_breakdown"):
-            monthly_data = []
-            for month, data in stats["monthly_breakdown"].items():
-                monthly_data.append(
-                    {
-                        "Month": month,
-                        "Events": data.get("events", 0),
-                        "Students": data.get("students", 0),
-                        "Unique Students": data.get("unique_student_count", 0),
-                        "Volunteers": data.get("volunteers", 0),
-                        "Unique Volunteers": data.get("unique_volunteer_count", 0),
-                        "Volunteer Hours": data.get("volunteer_hours", 0),
-                    }
+            sheets.append(
+                Sheet(
+                    "Monthly Breakdown",
+                    [
+                        Column("Month", 20),
+                        Column("Events", 15),
+                        Column("Students", 15),
+                        Column("Unique Students", 15),
+                        Column("Volunteers", 15),
+                        Column("Unique Volunteers", 15),
+                        Column("Volunteer Hours", 15),
+                    ],
+                    (
+                        (
+                            month,
+                            data.get("events", 0),
+                            data.get("students", 0),
+                            data.get("unique_student_count", 0),
+                            data.get("volunteers", 0),
+                            data.get("unique_volunteer_count", 0),
+                            data.get("volunteer_hours", 0),
+                        )
+                        for month, data in stats["monthly_breakdown"].items()
+                    ),
                 )
-
-            monthly_df = pd.DataFrame(monthly_data)
-            monthly_df.to_excel(writer, sheet_name="Monthly Breakdown", index=False)
-
-            # Format monthly breakdown sheet
-            worksheet = writer.sheets["Monthly Breakdown"]
-            worksheet.set_column("A:A", 20)
-            worksheet.set_column("B:G", 15)
-            worksheet.conditional_format(
-                "A1:G1", {"type": "no_blanks", "format": header_format}
             )
 
-        # Events Detail Sheet
+        # Events Detail Sheet (exported as CSV when one is requested)
+        csv_sheet = 0
         if events_data and events_data.get("events_by_month"):
-            events_detail = []
-            for month, data in events_data["events_by_month"].items():
-                for event in data["events"]:
-                    events_detail.append(
-                        {
-                            "Month": month,
-                            "Date": event["date"],
-                            "Time": event["time"],
-                            "Event Title": event["title"],
-                            "Type": event["type"],
-                            "Location": event["location"],
-                            "Students": event["student_count"],
-                            "Volunteers": event["volunteer_count"],
-                            "Volunteer Hours": event["volunteer_hours"],
-                        }
-                    )
-
-            events_df = pd.DataFrame(events_detail)
-            events_df.to_excel(writer, sheet_name="Events Detail", index=False)
-
-            # Format events detail sheet
-            worksheet = writer.sheets["Events Detail"]
-            worksheet.set_column("A:A", 20)  # Month
-            worksheet.set_column("B:B", 12)  # Date
-            worksheet.set_column("C:C", 12)  # Time
-            worksheet.set_column("D:D", 40)  # Event Title
-            worksheet.set_column("E:E", 20)  # Type
-            worksheet.set_column("F:F", 30)  # Location
-            worksheet.set_column("G:I", 15)  # Numbers
-            worksheet.conditional_format(
-                "A1:I1", {"type": "no_blanks", "format": header_format}
+            csv_sheet = len(sheets)
+            sheets.append(
+                Sheet(
+                    "Events Detail",
+                    [
+                        Column("Month", 20),
+                        Column("Date", 12),
+                        Column("Time", 12),
+                        Column("Event Title", 40),
+                        Column("Type", 20),
+                        Column("Location", 30),
+                        Column("Students", 15),
+                        Column("Volunteers", 15),
+                        Column("Volunteer Hours", 15),
+                    ],
+                    (
+                        (
+                            month,
+                            event["date"],
+                            event["time"],
+                            event["title"],
+                            event["type"],
+                            event["location"],
+                            event["student_count"],
+                            event["volunteer_count"],
+                            event["volunteer_hours"],
+                        )
+                        for month, data in events_data["events_by_month"].items()
+                        for event in data["events"]
+                    ),
+                )
             )
 
-        writer.close()
-        output.seek(0)
-
         # Create filename
         filename = (
             f"{district_name.replace(' ', '_')}_{school_year}_Year_End_Report.xlsx"
         )
 
-        return send_file(
-            output,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            download_name=filename,
-            as_attachment=True,
-        )
+        return export_response(sheets, filename, csv_sheet=csv_sheet)
 
     @bp.route("/reports/district/year-end/detail/<district_name>/filtered-stats")
     @login_required
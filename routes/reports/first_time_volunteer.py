@@ -13,6 +13,10 @@ from models.organization import Organization, VolunteerOrganization
 from models.reports import FirstTimeVolunteerReportCache
 from models.volunteer import EventParticipation, Volunteer
 from routes.reports.common import get_current_school_year, get_school_year_date_range
+from services.cache_dependency_service import (
+    record_cache_lookup,
+    register_cache_dependencies,
+)
 
 # Create blueprint
 first_time_volunteer_bp = Blueprint("first_time_volunteer", __name__)
@@ -32,6 +36,10 @@ def load_routes(bp):
         cache = FirstTimeVolunteerReportCache.query.filter_by(
             school_year=school_year
         ).first()
+        if not refresh:
+            record_cache_lookup(
+                FirstTimeVolunteerReportCache.__tablename__, hit=bool(cache)
+            )
         if cache and not refresh:
             report = cache.report_data
             last_updated = cache.last_updated
@@ -165,6 +173,9 @@ def load_routes(bp):
                 cache.report_data = report
                 cache.last_updated = datetime.now()
             try:
+                register_cache_dependencies(
+                    cache, school_year=school_year, year_wide=True
+                )
                 db.session.commit()
             except IntegrityError:
                 db.session.rollback()
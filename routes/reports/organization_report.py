@@ -16,12 +16,17 @@ from models.school_model import School
 from models.teacher import Teacher
 from models.volunteer import EventParticipation, Volunteer
 from routes.reports.common import get_current_school_year, get_school_year_date_range
+from services.cache_dependency_service import (
+    record_cache_lookup,
+    register_cache_dependencies,
+)
 
 # Create blueprint
 organization_report_bp = Blueprint("organization_report", __name__)
 
 
 from utils.services.org_membership_filter import membership_date_filter
+from utils.spreadsheet_export import Column, Sheet, export_response, stream_query
 
 
 def load_routes(bp):
@@ -69,6 +74,10 @@ def load_routes(bp):
             cached_summary = OrganizationSummaryCache.query.filter_by(
                 school_year=school_year
             ).first()
+            record_cache_lookup(
+                OrganizationSummaryCache.__tablename__,
+                hit=bool(cached_summary and cached_summary.organizations_data),
+            )
             if cached_summary and cached_summary.organizations_data:
                 org_data = cached_summary.organizations_data or []
 
@@ -271,6 +280,9 @@ def load_routes(bp):
                     db.session.add(cache)
                 else:
                     cache.organizations_data = org_data
+                register_cache_dependencies(
+                    cache, school_year=school_year, year_wide=True
+                )
                 db.session.commit()
             except Exception:
                 db.session.rollback()
@@ -473,106 +485,71 @@ def load_routes(bp):
                 )
             )
 
-        org_stats = org_stats.group_by(Organization.id).all()
-
-        # Format organization data for Excel
-        org_data = []
-        for org, sessions, hours, volunteers in org_stats:
-            org_data.append(
-                {
-                    "Organization": org.name,
-                    "Unique Sessions": sessions,
-                    "Total Hours": round(hours or 0, 2),
-                    "Unique Volunteers": volunteers,
-                }
-            )
-
-        # Format the data for Excel
-        # org_data is already calculated above with the new field
-
-        # Sort in Python
-        def get_sort_key(org):
-            if sort == "name":
-                return org["Organization"].lower() if org["Organization"] else ""
-            elif sort == "unique_sessions":
-                return org["Unique Sessions"]
-            elif sort == "total_hours":
-                return org["Total Hours"]
-            elif sort == "unique_volunteers":
-                return org["Unique Volunteers"]
-            return org["Total Hours"]
-
-        org_data.sort(key=get_sort_key, reverse=(order == "desc"))
-
-        # Create Excel file
-        output = io.BytesIO()
-        writer = pd.ExcelWriter(output, engine="xlsxwriter")
-        workbook = writer.book
-
-        # Add formatting
-        header_format = workbook.add_format(
-            {"bold": True, "bg_color": "#467599", "font_color": "white", "border": 1}
-        )
-
-        # Create DataFrame and write to Excel
-        df = pd.DataFrame(org_data)
-        df.to_excel(writer, sheet_name="Organization Report", index=False)
-
-        # Format worksheet
-        worksheet = writer.sheets["Organization Report"]
-        worksheet.set_column("A:A", 40)  # Organization
-        worksheet.set_column("B:B", 20)  # Unique Sessions
-        worksheet.set_column("C:C", 15)  # Total Hours
-        worksheet.set_column("D:D", 20)  # Unique Volunteers
-
-        # Apply header formatting
-        worksheet.conditional_format(
-            "A1:D1", {"type": "no_blanks", "format": header_format}
+        # Sort in SQL so rows can be streamed straight into the sheet
+        sort_columns = {
+            "name": db.func.lower(Organization.name),
+            "unique_sessions": db.literal_column("unique_sessions"),
+            "total_hours": db.literal_column("total_hours"),
+            "unique_volunteers": db.literal_column("unique_volunteers"),
+        }
+        sort_column = sort_columns.get(sort, sort_columns["total_hours"])
+        org_stats = org_stats.group_by(Organization.id).order_by(
+            sort_column.desc() if order == "desc" else sort_column.asc(),
+            Organization.id,
         )
 
-        # Add summary statistics
-        total_organizations = len(org_data)
-        total_sessions = sum(org["Unique Sessions"] for org in org_data)
-        total_hours = sum(org["Total Hours"] for org in org_data)
-        total_volunteers = sum(org["Unique Volunteers"] for org in org_data)
-
-        # Add summary section
-        summary_row = total_organizations + 3
-        worksheet.write(summary_row, 0, "Summary Statistics", header_format)
-        worksheet.write(summary_row + 1, 0, "Total Organizations")
-        worksheet.write(summary_row + 1, 1, total_organizations)
-        worksheet.write(summary_row + 2, 0, "Total Sessions")
-        worksheet.write(summary_row + 2, 1, total_sessions)
-        worksheet.write(summary_row + 3, 0, "Total Hours")
-        worksheet.write(summary_row + 3, 1, total_hours)
-        worksheet.write(summary_row + 4, 0, "Total Volunteers")
-        worksheet.write(summary_row + 4, 1, total_volunteers)
-        worksheet.write(summary_row + 5, 0, "School Year")
-        worksheet.write(
-            summary_row + 5,
-            1,
-            (
-                "All Time"
-                if school_year == "all_time"
-                else f"{school_year[:2]}-{school_year[2:]} School Year"
-            ),
-        )
-        worksheet.write(summary_row + 6, 0, "Filter")
-        worksheet.write(
-            summary_row + 6,
-            1,
-            "PREPKC Events Only" if host_filter == "prepkc" else "All Events",
-        )
-        worksheet.write(summary_row + 7, 0, "Membership Dates")
-        worksheet.write(
-            summary_row + 7,
-            1,
-            "Include Unverified Members" if mode == "full" else "Verified Members Only",
+        totals = {"organizations": 0, "sessions": 0, "hours": 0, "volunteers": 0}
+
+        def rows():
+            for org, sessions, hours, volunteers in stream_query(org_stats):
+                hours = round(hours or 0, 2)
+                totals["organizations"] += 1
+                totals["sessions"] += sessions
+                totals["hours"] += hours
+                totals["volunteers"] += volunteers
+                yield (org.name, sessions, hours, volunteers)
+
+        def summary():
+            return [
+                ("Summary Statistics",),
+                ("Total Organizations", totals["organizations"]),
+                ("Total Sessions", totals["sessions"]),
+                ("Total Hours", totals["hours"]),
+                ("Total Volunteers", totals["volunteers"]),
+                (
+                    "School Year",
+                    (
+                        "All Time"
+                        if school_year == "all_time"
+                        else f"{school_year[:2]}-{school_year[2:]} School Year"
+                    ),
+                ),
+                (
+                    "Filter",
+                    "PREPKC Events Only" if host_filter == "prepkc" else "All Events",
+                ),
+                (
+                    "Membership Dates",
+                    (
+                        "Include Unverified Members"
+                        if mode == "full"
+                        else "Verified Members Only"
+                    ),
+                ),
+            ]
+
+        sheet = Sheet(
+            "Organization Report",
+            [
+                Column("Organization", 40),
+                Column("Unique Sessions", 20),
+                Column("Total Hours", 15),
+                Column("Unique Volunteers", 20),
+            ],
+            rows(),
+            trailer=summary,
         )
 
-        writer.close()
-        output.seek(0)
-
         # Create filename
         filter_suffix = "_PREPKC" if host_filter == "prepkc" else ""
         year_label = (
@@ -582,12 +559,7 @@ def load_routes(bp):
         )
         filename = f"Organization_Report_{year_label}{filter_suffix}.xlsx"
 
-        return send_file(
-            output,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            download_name=filename,
-            as_attachment=True,
-        )
+        return export_response([sheet], filename)
 
     @bp.route("/reports/organization/report/detail/<int:org_id>/excel")
     @login_required
@@ -17,12 +17,10 @@ Performance Improvements:
 - Database load: ~90% reduction
 """
 
-import io
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from time import perf_counter
 
-import pandas as pd
-from flask import Blueprint, current_app, render_template, request, send_file
+from flask import Blueprint, current_app, render_template, request
 from flask_login import login_required
 from sqlalchemy import and_, func
 
@@ -32,6 +30,12 @@ from models.organization import Organization, VolunteerOrganization
 from models.reports import RecentVolunteersReportCache
 from models.volunteer import EventParticipation, Volunteer
 from routes.reports.common import get_school_year_date_range
+from services.cache_dependency_service import (
+    record_cache_lookup,
+    register_cache_dependencies,
+    school_year_for_date,
+)
+from utils.spreadsheet_export import Column, Sheet, export_response
 
 # Local blueprint (registered by parent package)
 recent_volunteers_bp = Blueprint("recent_volunteers", __name__)
@@ -123,43 +127,16 @@ def _get_primary_org_name(volunteer: Volunteer) -> str | None:
 def _serialize_for_cache(
     active_volunteers: list[dict], first_time_in_range: list[dict]
 ) -> dict:
-    def ser_dt(value):
-        if not value:
-            return None
-        if isinstance(value, datetime):
-            return value.isoformat()
-        try:
-            return value.isoformat()
-        except Exception:
-            return str(value)
-
-    active_serialized: list[dict] = []
-    for rec in active_volunteers:
-        new_rec = dict(rec)
-        new_rec["last_event_date"] = ser_dt(rec.get("last_event_date"))
-        events = []
-        for e in rec.get("events", []) or []:
-            e_new = dict(e)
-            e_new["date"] = ser_dt(e.get("date"))
-            events.append(e_new)
-        new_rec["events"] = events
-        active_serialized.append(new_rec)
-
-    first_serialized: list[dict] = []
-    for rec in first_time_in_range:
+    # Dates stay date/datetime objects: the cache column's codec stores them
+    # natively (or as ISO strings with the plain JSON codec)
+    def copy_record(rec):
         new_rec = dict(rec)
-        new_rec["first_volunteer_date"] = ser_dt(rec.get("first_volunteer_date"))
-        events = []
-        for e in rec.get("events", []) or []:
-            e_new = dict(e)
-            e_new["date"] = ser_dt(e.get("date"))
-            events.append(e_new)
-        new_rec["events"] = events
-        first_serialized.append(new_rec)
+        new_rec["events"] = [dict(e) for e in rec.get("events", []) or []]
+        return new_rec
 
     return {
-        "active_volunteers": active_serialized,
-        "first_time_in_range": first_serialized,
+        "active_volunteers": [copy_record(rec) for rec in active_volunteers],
+        "first_time_in_range": [copy_record(rec) for rec in first_time_in_range],
     }
 
 
@@ -167,6 +144,10 @@ def _deserialize_from_cache(payload: dict) -> tuple[list[dict], list[dict]]:
     def parse_dt(value):
         if not value:
             return None
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
         try:
             # If pure date like 'YYYY-MM-DD', coerce to midnight UTC
             if isinstance(value, str) and "T" not in value:
@@ -515,6 +496,19 @@ def _paginate(items: list[dict], page: int, per_page: int):
     return items[start_idx:end_idx], total, total_pages
 
 
+def _register_cache_scope(cache, school_year, start_date, end_date) -> None:
+    """Register a recent-volunteers cache row as depending on its school year.
+
+    Date-range rows are only tracked when the range sits inside one school
+    year; wider ranges keep the plain TTL behavior.
+    """
+    if not school_year and start_date and end_date:
+        start_year = school_year_for_date(start_date)
+        if start_year == school_year_for_date(end_date):
+            school_year = start_year
+    register_cache_dependencies(cache, school_year=school_year, year_wide=True)
+
+
 def load_routes(bp: Blueprint):
     def _is_cache_valid(cache_record, max_age_hours: int = 24) -> bool:
         if not cache_record or not getattr(cache_record, "last_updated", None):
@@ -595,6 +589,7 @@ def load_routes(bp: Blueprint):
         )
 
         if cache and not refresh and _is_cache_valid(cache):
+            record_cache_lookup(RecentVolunteersReportCache.__tablename__, hit=True)
             payload = cache.report_data or {}
             active_volunteers, first_time_in_range = _deserialize_from_cache(payload)
             log_info(
@@ -612,6 +607,10 @@ def load_routes(bp: Blueprint):
                 title_filter=title_contains or None,
             ).first()
 
+            record_cache_lookup(
+                RecentVolunteersReportCache.__tablename__,
+                hit=bool(base_cache and _is_cache_valid(base_cache)),
+            )
             if base_cache and _is_cache_valid(base_cache):
                 log_info("Using base cache and deriving filtered view in-memory")
                 base_active, base_first = _deserialize_from_cache(
@@ -666,6 +665,9 @@ def load_routes(bp: Blueprint):
                         else:
                             typed_cache.report_data = typed_payload
                             typed_cache.last_updated = datetime.now(timezone.utc)
+                        _register_cache_scope(
+                            typed_cache, school_year, start_date, end_date
+                        )
                         db.session.commit()
                         log_info(
                             f"Derived typed cache saved in {(perf_counter()-cache_save_start)*1000:.1f} ms"
@@ -727,6 +729,9 @@ def load_routes(bp: Blueprint):
                     else:
                         existing_base.report_data = base_payload
                         existing_base.last_updated = datetime.now(timezone.utc)
+                    _register_cache_scope(
+                        existing_base, school_year, start_date, end_date
+                    )
                     db.session.commit()
                     log_info(
                         f"Base cache saved in {(perf_counter()-cache_save_start)*1000:.1f} ms"
@@ -877,101 +882,72 @@ def load_routes(bp: Blueprint):
             )
             first_time_in_range = _query_first_time_in_range(start_date, end_date)
 
-        # Build DataFrames
-        active_rows = []
-        for v in active_volunteers:
-            last_date_str = (
-                v["last_event_date"].strftime("%m/%d/%y")
-                if v.get("last_event_date")
-                else ""
-            )
-            titles = [e["title"] for e in v["events"] if e.get("title")]
-            active_rows.append(
-                {
-                    "Name": v["name"],
-                    "Email": v.get("email") or "",
-                    "Organization": v.get("organization") or "",
-                    "Events (Count)": v.get("event_count") or 0,
-                    "Total Hours": round(float(v.get("total_hours") or 0.0), 1),
-                    "Last Event": last_date_str,
-                    "Last Event Type": v.get("last_event_type") or "",
-                    "Event Titles": "; ".join(sorted(set(titles))),
-                }
-            )
-
-        first_time_rows = []
-        for r in first_time_in_range:
-            first_str = (
-                r["first_volunteer_date"].strftime("%m/%d/%y")
-                if r.get("first_volunteer_date")
-                else ""
-            )
-            titles = [e["title"] for e in r["events"] if e.get("title")]
-            first_time_rows.append(
-                {
-                    "Name": r["name"],
-                    "First Volunteer Date": first_str,
-                    "Events Count": r.get("total_events") or 0,
-                    "Total Hours": round(float(r.get("total_hours") or 0.0), 1),
-                    "Organization": r.get("organization") or "",
-                    "Event Titles": "; ".join(sorted(set(titles))),
-                }
-            )
+        def active_rows():
+            for v in active_volunteers:
+                titles = [e["title"] for e in v["events"] if e.get("title")]
+                yield (
+                    v["name"],
+                    v.get("email") or "",
+                    v.get("organization") or "",
+                    v.get("event_count") or 0,
+                    round(float(v.get("total_hours") or 0.0), 1),
+                    (
+                        v["last_event_date"].strftime("%m/%d/%y")
+                        if v.get("last_event_date")
+                        else ""
+                    ),
+                    v.get("last_event_type") or "",
+                    "; ".join(sorted(set(titles))),
+                )
 
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-            if active_rows:
-                df_active = pd.DataFrame(active_rows)
-                df_active.to_excel(writer, index=False, sheet_name="Active Volunteers")
-                ws = writer.sheets["Active Volunteers"]
-                ws.set_column("A:A", 28)
-                ws.set_column("B:B", 34)
-                ws.set_column("C:C", 28)
-                ws.set_column("D:D", 14)
-                ws.set_column("E:E", 14)
-                ws.set_column("F:F", 14)
-                ws.set_column("G:G", 18)
-                ws.set_column("H:H", 60)
-
-            if first_time_rows:
-                df_first = pd.DataFrame(first_time_rows)
-                df_first.to_excel(writer, index=False, sheet_name="First-Time In Range")
-                ws2 = writer.sheets["First-Time In Range"]
-                ws2.set_column("A:A", 28)
-                ws2.set_column("B:B", 18)
-                ws2.set_column("C:C", 14)
-                ws2.set_column("D:D", 14)
-                ws2.set_column("E:E", 28)
-                ws2.set_column("F:F", 60)
-
-        output.seek(0)
-
-        # Attempt to use cache for export as well
-        event_types_key = ",".join(sorted([t.value for t in selected_types]))
-        cache = RecentVolunteersReportCache.query.filter_by(
-            school_year=school_year or None,
-            date_from=(start_date.date() if (start_date and not school_year) else None),
-            date_to=(end_date.date() if (end_date and not school_year) else None),
-            event_types=event_types_key,
-            title_filter=title_contains or None,
-        ).first()
+        def first_time_rows():
+            for r in first_time_in_range:
+                titles = [e["title"] for e in r["events"] if e.get("title")]
+                yield (
+                    r["name"],
+                    (
+                        r["first_volunteer_date"].strftime("%m/%d/%y")
+                        if r.get("first_volunteer_date")
+                        else ""
+                    ),
+                    r.get("total_events") or 0,
+                    round(float(r.get("total_hours") or 0.0), 1),
+                    r.get("organization") or "",
+                    "; ".join(sorted(set(titles))),
+                )
 
-        if cache and cache.report_data:
-            payload = cache.report_data
-            active_from_cache, first_from_cache = _deserialize_from_cache(payload)
-            if active_from_cache:
-                active_volunteers = active_from_cache
-            if first_from_cache:
-                first_time_in_range = first_from_cache
+        sheets = [
+            Sheet(
+                "Active Volunteers",
+                [
+                    Column("Name", 28),
+                    Column("Email", 34),
+                    Column("Organization", 28),
+                    Column("Events (Count)", 14),
+                    Column("Total Hours", 14),
+                    Column("Last Event", 14),
+                    Column("Last Event Type", 18),
+                    Column("Event Titles", 60),
+                ],
+                active_rows(),
+            ),
+            Sheet(
+                "First-Time In Range",
+                [
+                    Column("Name", 28),
+                    Column("First Volunteer Date", 18),
+                    Column("Events Count", 14),
+                    Column("Total Hours", 14),
+                    Column("Organization", 28),
+                    Column("Event Titles", 60),
+                ],
+                first_time_rows(),
+            ),
+        ]
 
         if school_year:
             filename = f"Recent_Volunteers_{school_year[:2]}-{school_year[2:]}.xlsx"
         else:
             filename = f"Recent_Volunteers_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.xlsx"
 
-        return send_file(
-            output,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            download_name=filename,
-            as_attachment=True,
-        )
+        return export_response(sheets, filename)
@@ -12,18 +12,47 @@ from models.contact import LocalStatusEnum
 from models.event import Event, EventType
 from models.organization import Organization, VolunteerOrganization
 from models.reports import RecruitmentCandidatesCache
-from models.volunteer import EventParticipation, Skill, Volunteer, VolunteerSkill
+from models.volunteer import EventParticipation, Skill, Volunteer
+from models.volunteer_engagement import VolunteerEngagementStats
+from services.cache_dependency_service import (
+    record_cache_lookup,
+    register_cache_dependencies,
+)
 from services.recruitment_scoring_service import (
     derive_keywords,
     derive_type_keywords,
     local_boost,
     recency_boost,
 )
+from services.volunteer_search_service import (
+    MATCH_ALL,
+    MATCH_ANY,
+    volunteer_search_subquery,
+)
 
 # Create blueprint
 recruitment_bp = Blueprint("recruitment", __name__)
 
 
+def _apply_volunteer_search(query, search_query, search_mode):
+    """
+    Restrict a Volunteer query to full-text search matches.
+
+    Wide mode matches any term, narrow mode every term, each as a word
+    prefix across name, work, organizations, skills, events and local
+    status (see services/volunteer_search_service.py).
+
+    Returns:
+        tuple: (query, matches subquery or None)
+    """
+    if not search_query:
+        return query, None
+    matches = volunteer_search_subquery(
+        search_query, match=MATCH_ANY if search_mode == "wide" else MATCH_ALL
+    )
+    return query.join(matches, matches.c.volunteer_id == Volunteer.id), matches
+
+
 def load_routes(bp):
     @bp.route("/reports/recruitment")
     @login_required
@@ -212,65 +241,10 @@ def load_routes(bp):
             "connector_only", type=bool
         )  # Filter for connector profiles only
 
-        # Base query joining necessary tables
-        query = (
-            eagerload_volunteer_bundle(Volunteer.query)
-            .outerjoin(VolunteerOrganization)
-            .outerjoin(Organization)
-            .outerjoin(VolunteerSkill)
-            .outerjoin(Skill)
-            .outerjoin(EventParticipation)
-            .outerjoin(Event)
+        query, matches = _apply_volunteer_search(
+            eagerload_volunteer_bundle(Volunteer.query), search_query, search_mode
         )
 
-        # Apply search if provided
-        if search_query:
-            # Split search query into terms and remove empty strings
-            search_terms = [
-                term.strip() for term in search_query.split() if term.strip()
-            ]
-
-            if search_mode == "wide":
-                # OR mode: Match any term across all fields
-                search_conditions = []
-                for term in search_terms:
-                    search_conditions.append(
-                        db.or_(
-                            Volunteer.first_name.ilike(f"%{term}%"),
-                            Volunteer.last_name.ilike(f"%{term}%"),
-                            Organization.name.ilike(f"%{term}%"),
-                            Skill.name.ilike(f"%{term}%"),
-                            Event.title.ilike(f"%{term}%"),
-                            # Enhanced search fields
-                            Volunteer.title.ilike(f"%{term}%"),
-                            Volunteer.industry.ilike(f"%{term}%"),
-                            db.cast(Volunteer.local_status, db.String).ilike(
-                                f"%{term}%"
-                            ),
-                            db.cast(Event.type, db.String).ilike(f"%{term}%"),
-                        )
-                    )
-                query = query.filter(db.or_(*search_conditions))
-            else:
-                # Narrow mode: Must match all terms
-                for term in search_terms:
-                    query = query.filter(
-                        db.or_(
-                            Volunteer.first_name.ilike(f"%{term}%"),
-                            Volunteer.last_name.ilike(f"%{term}%"),
-                            Organization.name.ilike(f"%{term}%"),
-                            Skill.name.ilike(f"%{term}%"),
-                            Event.title.ilike(f"%{term}%"),
-                            # Enhanced search fields
-                            Volunteer.title.ilike(f"%{term}%"),
-                            Volunteer.industry.ilike(f"%{term}%"),
-                            db.cast(Volunteer.local_status, db.String).ilike(
-                                f"%{term}%"
-                            ),
-                            db.cast(Event.type, db.String).ilike(f"%{term}%"),
-                        )
-                    )
-
         # Apply connector filter if requested
         if connector_only:
             from models.pathful_import import PathfulUserProfile
@@ -290,10 +264,13 @@ def load_routes(bp):
                     db.desc(Volunteer.first_name), db.desc(Volunteer.last_name)
                 )
         elif sort_by == "organization":
+            query = query.outerjoin(VolunteerOrganization).outerjoin(Organization)
             if order == "asc":
                 query = query.order_by(Organization.name)
             else:
                 query = query.order_by(db.desc(Organization.name))
+        elif sort_by == "relevance" and matches is not None:
+            query = query.order_by(matches.c.rank, Volunteer.id)
         elif sort_by == "last_email":
             if order == "asc":
                 query = query.order_by(Volunteer.last_non_internal_email_date)
@@ -305,27 +282,13 @@ def load_routes(bp):
             else:
                 query = query.order_by(db.desc(Volunteer.last_volunteer_date))
         elif sort_by == "times_volunteered":
-            subquery = (
-                db.session.query(
-                    EventParticipation.volunteer_id,
-                    db.func.count(EventParticipation.id).label("volunteer_count"),
-                )
-                .filter(
-                    EventParticipation.status.in_(
-                        ["Attended", "Completed", "Successfully Completed"]
-                    )
-                )
-                .group_by(EventParticipation.volunteer_id)
-                .subquery()
+            attended_count = db.func.coalesce(
+                VolunteerEngagementStats.attended_count, 0
             )
-
             query = query.outerjoin(
-                subquery, Volunteer.id == subquery.c.volunteer_id
-            ).order_by(
-                db.desc(subquery.c.volunteer_count)
-                if order == "desc"
-                else subquery.c.volunteer_count
-            )
+                VolunteerEngagementStats,
+                VolunteerEngagementStats.volunteer_id == Volunteer.id,
+            ).order_by(db.desc(attended_count) if order == "desc" else attended_count)
 
         # Add pagination
         pagination = query.distinct().paginate(
@@ -359,58 +322,10 @@ def load_routes(bp):
         connector_only = request.args.get("connector_only", type=bool)
 
         # Build the same query as the HTML search route
-        query = (
-            eagerload_volunteer_bundle(Volunteer.query)
-            .outerjoin(VolunteerOrganization)
-            .outerjoin(Organization)
-            .outerjoin(VolunteerSkill)
-            .outerjoin(Skill)
-            .outerjoin(EventParticipation)
-            .outerjoin(Event)
+        query, matches = _apply_volunteer_search(
+            eagerload_volunteer_bundle(Volunteer.query), search_query, search_mode
         )
 
-        if search_query:
-            search_terms = [
-                term.strip() for term in search_query.split() if term.strip()
-            ]
-
-            if search_mode == "wide":
-                search_conditions = []
-                for term in search_terms:
-                    search_conditions.append(
-                        db.or_(
-                            Volunteer.first_name.ilike(f"%{term}%"),
-                            Volunteer.last_name.ilike(f"%{term}%"),
-                            Organization.name.ilike(f"%{term}%"),
-                            Skill.name.ilike(f"%{term}%"),
-                            Event.title.ilike(f"%{term}%"),
-                            Volunteer.title.ilike(f"%{term}%"),
-                            Volunteer.industry.ilike(f"%{term}%"),
-                            db.cast(Volunteer.local_status, db.String).ilike(
-                                f"%{term}%"
-                            ),
-                            db.cast(Event.type, db.String).ilike(f"%{term}%"),
-                        )
-                    )
-                query = query.filter(db.or_(*search_conditions))
-            else:
-                for term in search_terms:
-                    query = query.filter(
-                        db.or_(
-                            Volunteer.first_name.ilike(f"%{term}%"),
-                            Volunteer.last_name.ilike(f"%{term}%"),
-                            Organization.name.ilike(f"%{term}%"),
-                            Skill.name.ilike(f"%{term}%"),
-                            Event.title.ilike(f"%{term}%"),
-                            Volunteer.title.ilike(f"%{term}%"),
-                            Volunteer.industry.ilike(f"%{term}%"),
-                            db.cast(Volunteer.local_status, db.String).ilike(
-                                f"%{term}%"
-                            ),
-                            db.cast(Event.type, db.String).ilike(f"%{term}%"),
-                        )
-                    )
-
         if connector_only:
             from models.pathful_import import PathfulUserProfile
 
@@ -429,10 +344,13 @@ def load_routes(bp):
                     db.desc(Volunteer.first_name), db.desc(Volunteer.last_name)
                 )
         elif sort_by == "organization":
+            query = query.outerjoin(VolunteerOrganization).outerjoin(Organization)
             if order == "asc":
                 query = query.order_by(Organization.name)
             else:
                 query = query.order_by(db.desc(Organization.name))
+        elif sort_by == "relevance" and matches is not None:
+            query = query.order_by(matches.c.rank, Volunteer.id)
         elif sort_by == "last_email":
             if order == "asc":
                 query = query.order_by(Volunteer.last_non_internal_email_date)
@@ -579,6 +497,9 @@ def load_routes(bp):
                 ).first()
             except Exception:
                 cached_row = None
+            record_cache_lookup(
+                RecruitmentCandidatesCache.__tablename__, hit=bool(cached_row)
+            )
 
         # Initialize keyword variables
         kw_data = {}
@@ -650,20 +571,15 @@ def load_routes(bp):
         # Governance filters: exclude do-not-contact and email opt-outs
         base_query = Volunteer.query
 
-        # Build a prefilter when keywords exist to reduce candidate pool size
+        # Build a prefilter when keywords exist to reduce candidate pool size;
+        # best full-text matches on work and skills come first
         if kw:
-            ors = []
-            for term in kw:
-                like = f"%{term}%"
-                ors.append(
-                    or_(
-                        Volunteer.title.ilike(like),
-                        Volunteer.department.ilike(like),
-                        Volunteer.industry.ilike(like),
-                        Volunteer.skills.any(Skill.name.ilike(like)),
-                    )
-                )
-            base_query = base_query.filter(or_(*ors))
+            matches = volunteer_search_subquery(
+                sorted(kw), match=MATCH_ANY, columns=("work", "skills")
+            )
+            base_query = base_query.join(
+                matches, matches.c.volunteer_id == Volunteer.id
+            ).order_by(matches.c.rank, Volunteer.id)
 
         # Apply governance and status filters
         try:
@@ -690,32 +606,19 @@ def load_routes(bp):
 
         volunteers = eagerload_volunteer_bundle(base_query).limit(2000).all()
 
-        # Precompute past participation by event type for scoring
+        # Past participation by event type and overall, from the materialized
+        # engagement stats loaded with each candidate
+        engagement = {
+            v.id: v.engagement_stats for v in volunteers if v.engagement_stats
+        }
+        event_type_key = event.type.value if event.type else None
         same_type_counts = {
-            row[0]: row[1]
-            for row in (
-                db.session.query(
-                    EventParticipation.volunteer_id,
-                    db.func.count(EventParticipation.id),
-                )
-                .join(Event, Event.id == EventParticipation.event_id)
-                .filter(Event.type == event.type)
-                .group_by(EventParticipation.volunteer_id)
-                .all()
-            )
+            volunteer_id: stats.event_type_counts.get(event_type_key, 0)
+            for volunteer_id, stats in engagement.items()
         }
-
-        # Precompute overall participation frequency for all events
         total_participation_counts = {
-            row[0]: row[1]
-            for row in (
-                db.session.query(
-                    EventParticipation.volunteer_id,
-                    db.func.count(EventParticipation.id),
-                )
-                .group_by(EventParticipation.volunteer_id)
-                .all()
-            )
+            volunteer_id: stats.participation_count
+            for volunteer_id, stats in engagement.items()
         }
 
         def score_and_reasons(v: Volunteer) -> tuple[float, list[str], str]:
@@ -854,11 +757,11 @@ def load_routes(bp):
                 existing.candidates_data = candidates
                 existing.last_updated = datetime.now(timezone.utc)
             else:
-                db.session.add(
-                    RecruitmentCandidatesCache(
-                        event_id=event_id, candidates_data=candidates
-                    )
+                existing = RecruitmentCandidatesCache(
+                    event_id=event_id, candidates_data=candidates
                 )
+                db.session.add(existing)
+            register_cache_dependencies(existing, event_ids=[event_id])
             db.session.commit()
         except Exception:
             db.session.rollback()
@@ -32,6 +32,7 @@ from services.virtual_computation_service import (
 )
 from services.virtual_computation_service import (
     is_teacher_attended,
+    load_event_schools,
     resolve_teacher_district,
 )
 
@@ -50,23 +51,12 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
         Tuple of (session_data, district_summaries, overall_summary, filter_options)
     """
     # Base query for virtual session events
-    from sqlalchemy.orm import selectinload
+    from models import eagerload_virtual_session_bundle
 
-    from models import eagerload_event_bundle
-    from models.organization import VolunteerOrganization
-
-    base_query = (
-        eagerload_event_bundle(Event.query)
-        .options(
-            selectinload(Event.volunteers)
-            .selectinload(Volunteer.volunteer_organizations)
-            .selectinload(VolunteerOrganization.organization)
-        )
-        .filter(
-            Event.type == EventType.VIRTUAL_SESSION,
-            Event.start_date >= date_from,
-            Event.start_date <= date_to,
-        )
+    base_query = eagerload_virtual_session_bundle(Event.query).filter(
+        Event.type == EventType.VIRTUAL_SESSION,
+        Event.start_date >= date_from,
+        Event.start_date <= date_to,
     )
 
     # Apply database-level filters
@@ -81,6 +71,9 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
     # Get all events
     events = base_query.order_by(Event.start_date.desc()).all()
 
+    # Resolve every teacher's school (and district) in one query
+    schools = load_event_schools(events)
+
     # First pass: collect all districts, schools, career clusters, and statuses from raw events
     all_districts = set()
     all_schools = set()
@@ -104,7 +97,7 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
         for teacher_reg in event.teacher_registrations:
             teacher = teacher_reg.teacher
             if teacher and teacher.school_id:
-                school = School.query.get(teacher.school_id)
+                school = schools.get(teacher.school_id)
                 if school:
                     all_schools.add(school.name)
                     # Also add the school's district if available
@@ -134,7 +127,7 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
                         school_name = school.name
                         school_level = getattr(school, "level", "")
                     elif teacher.school_id:
-                        school = School.query.get(teacher.school_id)
+                        school = schools.get(teacher.school_id)
                         if school:
                             school_name = school.name
                             school_level = getattr(school, "level", "")
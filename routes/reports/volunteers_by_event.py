@@ -1,8 +1,6 @@
-import io
 from datetime import date, datetime, timedelta, timezone
 
-import pandas as pd
-from flask import Blueprint, render_template, request, send_file
+from flask import Blueprint, render_template, request
 from flask_login import login_required
 from sqlalchemy import func
 
@@ -12,6 +10,7 @@ from models.event import Event, EventStatus, EventType
 from models.history import History
 from models.organization import Organization, VolunteerOrganization
 from models.volunteer import EventParticipation, Skill, Volunteer, VolunteerSkill
+from utils.spreadsheet_export import Column, Sheet, export_response
 
 # Blueprint is provided by parent reports package via load_routes
 volunteers_by_event_bp = Blueprint("volunteers_by_event", __name__)
@@ -924,59 +923,48 @@ def load_routes(bp: Blueprint):
         )
         volunteers = result["volunteers"]
 
-        # Build rows for Excel
-        rows = []
-        for v in volunteers:
-            last_date = (
-                v["last_event_date"].strftime("%m/%d/%y")
-                if v["last_event_date"]
-                else ""
-            )
-            last_email_date = (
-                v["last_email_date"].strftime("%m/%d/%y")
-                if v["last_email_date"]
-                else ""
-            )
-            # Combine past and future events for Excel
-            past_titles = [e["title"] for e in v["events"] if e.get("title")]
-            future_titles = [
-                e["title"] for e in v.get("future_events", []) if e.get("title")
-            ]
-
-            all_titles = past_titles + future_titles
-            future_count = v.get("future_events_count", 0)
-
-            # Combine last volunteered date with future events info
-            last_volunteered_display = last_date
-            if future_count > 0:
-                last_volunteered_display += f" ({future_count} upcoming)"
-
-            rows.append(
-                {
-                    "Name": v["name"],
-                    "Email": v["email"],
-                    "Organization": v.get("organization") or "",
-                    "Skills": v.get("skills") or "",
-                    "Last Volunteered Date": last_volunteered_display,
-                    "Last Email": last_email_date,
-                    "Past Events": v.get("total_volunteer_count", 0),
-                }
-            )
+        def rows():
+            for v in volunteers:
+                last_date = (
+                    v["last_event_date"].strftime("%m/%d/%y")
+                    if v["last_event_date"]
+                    else ""
+                )
+                last_email_date = (
+                    v["last_email_date"].strftime("%m/%d/%y")
+                    if v["last_email_date"]
+                    else ""
+                )
+                # Combine last volunteered date with future events info
+                future_count = v.get("future_events_count", 0)
+                last_volunteered_display = last_date
+                if future_count > 0:
+                    last_volunteered_display += f" ({future_count} upcoming)"
+
+                yield (
+                    v["name"],
+                    v["email"],
+                    v.get("organization") or "",
+                    v.get("skills") or "",
+                    last_volunteered_display,
+                    last_email_date,
+                    v.get("total_volunteer_count", 0),
+                )
 
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-            df = pd.DataFrame(rows)
-            df.to_excel(writer, index=False, sheet_name="Volunteers")
-            ws = writer.sheets["Volunteers"]
-            ws.set_column("A:A", 28)  # Name
-            ws.set_column("B:B", 36)  # Email
-            ws.set_column("C:C", 26)  # Organization
-            ws.set_column("D:D", 40)  # Skills
-            ws.set_column("E:E", 20)  # Last Volunteered Date (with upcoming info)
-            ws.set_column("F:F", 12)  # Last Email
-            ws.set_column("G:G", 12)  # Past Events
-
-        output.seek(0)
+        sheet = Sheet(
+            "Volunteers",
+            [
+                Column("Name", 28),
+                Column("Email", 36),
+                Column("Organization", 26),
+                Column("Skills", 40),
+                # Last volunteered date, with upcoming info
+                Column("Last Volunteered Date", 20),
+                Column("Last Email", 12),
+                Column("Past Events", 12),
+            ],
+            rows(),
+        )
 
         # Filename
         type_suffix = (
@@ -989,9 +977,4 @@ def load_routes(bp: Blueprint):
         else:
             filename = f"Volunteers_By_Event{type_suffix}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.xlsx"
 
-        return send_file(
-            output,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            download_name=filename,
-            as_attachment=True,
-        )
+        return export_response([sheet], filename)
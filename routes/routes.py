@@ -66,6 +66,7 @@ from routes.events.routes import events_bp
 from routes.history.routes import history_bp
 from routes.management import management_bp
 from routes.management.cache_management import cache_management_bp
+from routes.management.query_profiler import query_profiler_bp
 from routes.organizations.routes import organizations_bp
 from routes.quality import quality_bp
 from routes.reports import report_bp
@@ -129,6 +130,7 @@ def init_routes(app):
     app.register_blueprint(attendance)
     app.register_blueprint(management_bp)
     app.register_blueprint(cache_management_bp)
+    app.register_blueprint(query_profiler_bp)
     app.register_blueprint(calendar_bp)
     app.register_blueprint(tenants_bp)
     app.register_blueprint(tenant_users_bp)  # Tenant user management
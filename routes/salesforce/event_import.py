@@ -16,7 +16,7 @@ to keep routes as thin HTTP handlers.
 import json
 from datetime import datetime, timezone
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from flask_login import login_required
 from simple_salesforce.exceptions import SalesforceAuthenticationFailed
 
@@ -35,8 +35,11 @@ from routes.utils import (
     parse_date,
     parse_event_skills,
 )
-from services.salesforce import get_salesforce_client, safe_query_all
+from services.salesforce import QueryStream, get_salesforce_client, safe_query_all
+from services.salesforce.bulk_upsert import supports_bulk_upsert
 from services.salesforce.processors.event import (
+    bulk_process_participation_rows,
+    bulk_process_student_participation_rows,
     process_event_row,
     process_participation_row,
     process_student_participation_row,
@@ -56,6 +59,28 @@ sf_event_import_bp = Blueprint("sf_event_import", __name__)
 # are now imported from services.salesforce.processors.event above.
 
 
+def _query_records(sf, query):
+    """
+    Run an import query, streaming it page by page if SF_IMPORT_STREAMING is set.
+
+    Streamed records are fetched as the loop consumes them, so only one page
+    is in memory while rows are processed and committed.
+
+    Returns:
+        Tuple of (iterable of records, total record count)
+    """
+    if current_app.config.get("SF_IMPORT_STREAMING"):
+        records = QueryStream(sf, query)
+        return records, records.total_size
+    records = safe_query_all(sf, query).get("records", [])
+    return records, len(records)
+
+
+def _use_bulk_upsert():
+    """Whether participation rows go through the bulk upsert write path."""
+    return current_app.config.get("SF_IMPORT_BULK_UPSERT") and supports_bulk_upsert()
+
+
 @sf_event_import_bp.route("/events/import-from-salesforce", methods=["POST"])
 @login_required
 @global_users_only
@@ -119,9 +144,7 @@ def import_events_from_salesforce():
 
     events_query += " ORDER BY Start_Date_and_Time__c DESC"
 
-    events_result = safe_query_all(sf, events_query)
-    events_rows = events_result.get("records", [])
-    total_events = len(events_rows)
+    events_rows, total_events = _query_records(sf, events_query)
 
     print(f"Found {total_events} events in Salesforce")
 
@@ -179,8 +202,7 @@ def import_events_from_salesforce():
     if is_delta and watermark:
         participants_query += delta_helper.build_date_filter(watermark)
 
-    participants_result = safe_query_all(sf, participants_query)
-    participant_rows = participants_result.get("records", [])
+    participant_rows, total_participants = _query_records(sf, participants_query)
 
     print("Pre-loading volunteer and event caches for participant import...")
     from services.salesforce.utils import build_participation_caches
@@ -199,25 +221,38 @@ def import_events_from_salesforce():
 
     participant_success = 0
     participant_error = 0
-    for i, row in enumerate(participant_rows):
-        participant_success, participant_error = process_participation_row(
-            row,
-            participant_success,
-            participant_error,
+    if _use_bulk_upsert():
+        participant_success, participant_error = bulk_process_participation_rows(
+            participant_rows,
             errors,
             volunteers_cache=volunteers_cache,
             events_cache=events_cache,
             ep_sf_ids_cache=ep_sf_ids_cache,
         )
+    else:
+        for i, row in enumerate(participant_rows):
+            participant_success, participant_error = process_participation_row(
+                row,
+                participant_success,
+                participant_error,
+                errors,
+                volunteers_cache=volunteers_cache,
+                events_cache=events_cache,
+                ep_sf_ids_cache=ep_sf_ids_cache,
+            )
 
-        # Batch commit every 100 records for resumability
-        if (i + 1) % 100 == 0:
-            try:
-                db.session.commit()
-                print(f"  -> Committed volunteer participations batch {(i+1) // 100}")
-            except Exception as batch_e:
-                db.session.rollback()
-                print(f"  -> Volunteer participations batch commit failed: {batch_e}")
+            # Batch commit every 100 records for resumability
+            if (i + 1) % 100 == 0:
+                try:
+                    db.session.commit()
+                    print(
+                        f"  -> Committed volunteer participations batch {(i+1) // 100}"
+                    )
+                except Exception as batch_e:
+                    db.session.rollback()
+                    print(
+                        f"  -> Volunteer participations batch commit failed: {batch_e}"
+                    )
 
     db.session.commit()
 
@@ -238,7 +273,7 @@ def import_events_from_salesforce():
     print(f"{'='*60}")
     print(f"Events: {success_count}/{total_events} processed successfully")
     print(
-        f"Participants: {participant_success}/{len(participant_rows)} processed successfully"
+        f"Participants: {participant_success}/{total_participants} processed successfully"
     )
     print(f"Total errors: {error_count + participant_error}")
     print(f"{'='*60}")
@@ -292,7 +327,7 @@ def import_events_from_salesforce():
             "events_skipped": skipped_count,
             "participants_processed": participant_success,
             "total_events_from_salesforce": total_events,
-            "total_participants_from_salesforce": len(participant_rows),
+            "total_participants_from_salesforce": total_participants,
             "errors": actual_errors[:50],
             "skipped_events": skipped_events[:50],
         }
@@ -365,12 +400,9 @@ def sync_student_participants():
 
     participants_query += " ORDER BY Session__c, Name"
 
-    participants_result = safe_query_all(sf, participants_query)
-    participant_rows = participants_result.get("records", [])
-
-    print(f"Found {len(participant_rows)} student participation records in Salesforce.")
+    participant_rows, total_count = _query_records(sf, participants_query)
 
-    total_count = len(participant_rows)
+    print(f"Found {total_count} student participation records in Salesforce.")
 
     # OPTIMIZED: Pre-load lightweight ID-only caches (reduces memory usage)
     # Instead of loading full ORM objects, we only load the IDs we need for lookups
@@ -414,31 +446,45 @@ def sync_student_participants():
         f"{len(participations_by_sf_id)} participation SF IDs, {len(participations_by_pair)} pairs"
     )
 
-    for i, row in enumerate(participant_rows):
-        success_count, error_count = process_student_participation_row(
-            row,
-            success_count,
-            error_count,
+    if _use_bulk_upsert():
+        success_count, error_count = bulk_process_student_participation_rows(
+            participant_rows,
             errors,
             events_cache=events_cache,
             students_cache=students_cache,
             participations_by_sf_id=participations_by_sf_id,
             participations_by_pair=participations_by_pair,
         )
+    else:
+        for i, row in enumerate(participant_rows):
+            success_count, error_count = process_student_participation_row(
+                row,
+                success_count,
+                error_count,
+                errors,
+                events_cache=events_cache,
+                students_cache=students_cache,
+                participations_by_sf_id=participations_by_sf_id,
+                participations_by_pair=participations_by_pair,
+            )
 
-        # Batch commit every 100 records for resumability
-        if (i + 1) % 100 == 0:
-            try:
-                db.session.commit()
-                # Progress logging with percentage for large imports
-                if total_count >= 500:
-                    pct = (i + 1) * 100 // total_count
-                    print(f"  -> Batch {(i+1) // 100}: {i+1}/{total_count} ({pct}%)")
-                else:
-                    print(f"  -> Committed student participations batch {(i+1) // 100}")
-            except Exception as batch_e:
-                db.session.rollback()
-                print(f"  -> Batch commit failed: {batch_e}")
+            # Batch commit every 100 records for resumability
+            if (i + 1) % 100 == 0:
+                try:
+                    db.session.commit()
+                    # Progress logging with percentage for large imports
+                    if total_count >= 500:
+                        pct = (i + 1) * 100 // total_count
+                        print(
+                            f"  -> Batch {(i+1) // 100}: {i+1}/{total_count} ({pct}%)"
+                        )
+                    else:
+                        print(
+                            f"  -> Committed student participations batch {(i+1) // 100}"
+                        )
+                except Exception as batch_e:
+                    db.session.rollback()
+                    print(f"  -> Batch commit failed: {batch_e}")
 
     # Final commit for remaining records
     db.session.commit()
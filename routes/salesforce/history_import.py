@@ -190,7 +190,7 @@ def import_history_from_salesforce():
                 ids_str = ",".join([f"'{i}'" for i in chunk])
                 case_query = f"SELECT Id, ContactId FROM Case WHERE Id IN ({ids_str})"
                 try:
-                    case_res = sf.query_all(case_query)
+                    case_res = safe_query_all(sf, case_query)
                     for c_rec in case_res.get("records", []):
                         if c_rec.get("ContactId"):
                             case_to_contact_cache[c_rec["Id"]] = c_rec["ContactId"]
@@ -211,7 +211,7 @@ def import_history_from_salesforce():
                 ids_str = ",".join([f"'{i}'" for i in chunk])
                 acc_query = f"SELECT AccountId, Id, Email FROM Contact WHERE AccountId IN ({ids_str}) AND (Contact_Type__c = 'Volunteer' OR Contact_Type__c = '' OR Contact_Type__c = 'Teacher')"
                 try:
-                    acc_res = sf.query_all(acc_query)
+                    acc_res = safe_query_all(sf, acc_query)
                     for acc_rec in acc_res.get("records", []):
                         acc_id = acc_rec.get("AccountId")
                         if acc_id not in account_to_contacts_cache:
@@ -586,7 +586,7 @@ def sync_unaffiliated_events():
                 """
 
                 try:
-                    participants_result = sf.query_all(participants_query)
+                    participants_result = safe_query_all(sf, participants_query)
                     participant_rows = participants_result.get("records", [])
 
                     for row in participant_rows:
@@ -637,7 +637,7 @@ def sync_unaffiliated_events():
                 """
 
                 try:
-                    student_result = sf.query_all(student_query)
+                    student_result = safe_query_all(sf, student_query)
                     student_rows = student_result.get("records", [])
 
                     for row in student_rows:
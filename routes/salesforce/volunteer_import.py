@@ -12,7 +12,7 @@ Routes:
 import json
 from datetime import datetime
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from flask_login import current_user, login_required
 from simple_salesforce import SalesforceAuthenticationFailed
 
@@ -31,6 +31,7 @@ from routes.decorators import global_users_only
 from routes.name_utils import is_all_caps_name, smart_title_case
 from routes.utils import parse_date, parse_skills
 from services.salesforce import (
+    QueryStream,
     get_salesforce_client,
     map_age_group,
     map_education_level,
@@ -118,10 +119,15 @@ def import_from_salesforce():
         # Connect to Salesforce using centralized client with retry
         sf = get_salesforce_client()
 
-        # Execute the query with automatic retry
-        result = safe_query_all(sf, salesforce_query)
-        sf_rows = result.get("records", [])
-        total_records = len(sf_rows)
+        # Execute the query with automatic retry. In streaming mode rows are
+        # fetched page by page as the loop below consumes them.
+        if current_app.config.get("SF_IMPORT_STREAMING"):
+            sf_rows = QueryStream(sf, salesforce_query)
+            total_records = sf_rows.total_size
+        else:
+            result = safe_query_all(sf, salesforce_query)
+            sf_rows = result.get("records", [])
+            total_records = len(sf_rows)
 
         print(
             f"Found {total_records} records to process{' (delta)' if is_delta else ''}"
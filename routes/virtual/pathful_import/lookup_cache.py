@@ -0,0 +1,604 @@
+"""
+Persistent lookup cache for Pathful imports.
+
+build_import_caches used to load every TeacherProgress, Volunteer, School,
+District, Event, EventTeacher, Teacher, Organization and VolunteerOrganization
+row as a full ORM object on every import. This module keeps only the match
+keys and ids, in process, between imports:
+
+  - each source table is loaded once as plain column tuples
+  - later imports refresh it incrementally: rows changed since the
+    ``updated_at`` watermark, rows with ids above the last seen id, and rows
+    written through the ORM in this process since the last refresh are
+    re-indexed; a row count mismatch (deletes) reloads that one source
+  - small reference tables (schools, districts, aliases) are reloaded in
+    full each time, and everything is rebuilt after
+    PATHFUL_LOOKUP_CACHE_MAX_AGE seconds to pick up edits made by other
+    processes to tables without ``updated_at``
+
+Each import gets LazyLookup views holding ids; the ORM object is only loaded
+(``session.get``) when a row actually matches a key. Writes to a view during
+an import stay local to that import's views.
+
+Usage:
+    from routes.virtual.pathful_import.lookup_cache import get_lookup_cache
+
+    caches = get_lookup_cache().views(cutoff_date)
+    teacher = caches["teacher_by_email"].get("jane@school.org")
+"""
+
+import threading
+import time
+import weakref
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import Integer
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect, tuple_
+from sqlalchemy.orm import Session
+
+from models import db
+from models.contact import Email as ContactEmail
+from models.district_model import District, DistrictAlias
+from models.event import Event, EventTeacher, EventType
+from models.organization import Organization, OrganizationAlias, VolunteerOrganization
+from models.school_model import School
+from models.teacher import Teacher
+from models.teacher_progress import TeacherProgress
+from models.volunteer import Volunteer
+from services.teacher_matching_service import normalize_name
+
+# Index resolution policies for keys shared by several rows
+LAST = "last"  # highest row id wins (matches the old dict-overwrite order)
+UNIQUE = "unique"  # None collision marker when rows point at different ids
+
+# Rows per ``IN`` list when reloading rows touched in this process
+_RELOAD_CHUNK_SIZE = 500
+
+
+class _Source:
+    """A table (or join) feeding one or more lookup indexes."""
+
+    def __init__(self, name, model, columns, pk, updated_at=None, full=False):
+        self.name = name
+        self.model = model
+        self.columns = columns
+        self.pk = pk
+        self.updated_at = updated_at
+        self.full = full
+
+    def query(self, session):
+        query = session.query(*self.pk, *self.columns)
+        if self.updated_at is not None:
+            query = query.add_columns(self.updated_at.label("updated_at"))
+        if self.model is ContactEmail:
+            query = query.join(Volunteer, Volunteer.id == ContactEmail.contact_id)
+        return query
+
+    def row_id(self, row):
+        return row[0] if len(self.pk) == 1 else tuple(row[: len(self.pk)])
+
+    @property
+    def incremental_ids(self):
+        """Whether new rows can be found by an id above the last seen id."""
+        return len(self.pk) == 1 and isinstance(self.pk[0].type, Integer)
+
+
+SOURCES = [
+    _Source(
+        "teacher_progress",
+        TeacherProgress,
+        [TeacherProgress.pathful_user_id, TeacherProgress.email, TeacherProgress.name],
+        [TeacherProgress.id],
+        updated_at=TeacherProgress.updated_at,
+    ),
+    _Source(
+        "volunteers",
+        Volunteer,
+        [Volunteer.pathful_user_id, Volunteer.first_name, Volunteer.last_name],
+        [Volunteer.id],
+    ),
+    _Source(
+        "volunteer_emails",
+        ContactEmail,
+        [ContactEmail.email, ContactEmail.contact_id],
+        [ContactEmail.id],
+    ),
+    _Source("schools", School, [School.name], [School.id], full=True),
+    _Source("districts", District, [District.name], [District.id], full=True),
+    _Source(
+        "district_aliases",
+        DistrictAlias,
+        [DistrictAlias.alias, DistrictAlias.district_id],
+        [DistrictAlias.id],
+        full=True,
+    ),
+    _Source(
+        "events",
+        Event,
+        [Event.pathful_session_id, Event.title, Event.start_date, Event.type],
+        [Event.id],
+        updated_at=Event.updated_at,
+    ),
+    _Source(
+        "event_teachers",
+        EventTeacher,
+        [],
+        [EventTeacher.event_id, EventTeacher.teacher_id],
+        updated_at=EventTeacher.updated_at,
+    ),
+    _Source(
+        "teachers",
+        Teacher,
+        [Teacher.cached_email, Teacher.first_name, Teacher.last_name, Teacher.active],
+        [Teacher.id],
+        updated_at=Teacher.updated_at,
+    ),
+    _Source(
+        "organizations",
+        Organization,
+        [Organization.name],
+        [Organization.id],
+        updated_at=Organization.updated_at,
+    ),
+    _Source(
+        "organization_aliases",
+        OrganizationAlias,
+        [OrganizationAlias.name, OrganizationAlias.organization_id],
+        [OrganizationAlias.id],
+        full=True,
+    ),
+    _Source(
+        "volunteer_organizations",
+        VolunteerOrganization,
+        [],
+        [VolunteerOrganization.volunteer_id, VolunteerOrganization.organization_id],
+        updated_at=VolunteerOrganization.updated_at,
+    ),
+]
+SOURCES_BY_NAME = {source.name: source for source in SOURCES}
+
+
+# ── Index key functions ───────────────────────────────────────────────
+# Each returns the (key, target id) pairs a source row contributes.
+
+
+def _lower_key(field):
+    def keys(row):
+        value = getattr(row, field)
+        return [(value.lower(), row.id)] if value else []
+
+    return keys
+
+
+def _raw_key(field):
+    def keys(row):
+        value = getattr(row, field)
+        return [(value, row.id)] if value else []
+
+    return keys
+
+
+def _volunteer_name_keys(row):
+    if row.first_name and row.last_name:
+        return [((row.first_name.lower(), row.last_name.lower()), row.id)]
+    return []
+
+
+def _volunteer_email_keys(row):
+    return [(row.email.lower(), row.contact_id)] if row.email else []
+
+
+def _district_alias_keys(row):
+    return [(row.alias.lower(), row.district_id)]
+
+
+def _organization_alias_keys(row):
+    return [(row.name.lower(), row.organization_id)]
+
+
+def _event_session_keys(row):
+    if row.type == EventType.VIRTUAL_SESSION and row.pathful_session_id:
+        return [(row.pathful_session_id, row.id)]
+    return []
+
+
+def _event_title_date_keys(row):
+    if row.type == EventType.VIRTUAL_SESSION and row.title and row.start_date:
+        return [((row.title.lower().strip(), row.start_date.date()), row.id)]
+    return []
+
+
+def _pair_keys(row):
+    return [((row[0], row[1]), None)]
+
+
+def _teacher_email_keys(row):
+    if row.active and row.cached_email:
+        return [(row.cached_email.lower(), row.id)]
+    return []
+
+
+def _teacher_name_keys(row):
+    if not row.active:
+        return []
+    norm_first = normalize_name(row.first_name or "")
+    norm_last = normalize_name(row.last_name or "")
+    keys = []
+    norm_name = f"{norm_first} {norm_last}".strip()
+    if norm_name:
+        keys.append((norm_name, row.id))
+    # Also index by first-word + first-word-of-last for multi-part surname
+    # matching (e.g., "catalina velarde" for Teacher "Catalina Velarde Duarte")
+    if norm_first and norm_last and " " in norm_last:
+        keys.append((f"{norm_first} {norm_last.split()[0]}", row.id))
+    return keys
+
+
+# index name -> (source name, policy, key function)
+INDEXES = {
+    "teacher_by_pathful_id": ("teacher_progress", LAST, _raw_key("pathful_user_id")),
+    "teacher_by_email": ("teacher_progress", LAST, _lower_key("email")),
+    "teacher_by_name": ("teacher_progress", UNIQUE, _lower_key("name")),
+    "volunteer_by_pathful_id": ("volunteers", LAST, _raw_key("pathful_user_id")),
+    "volunteer_by_name": ("volunteers", UNIQUE, _volunteer_name_keys),
+    "volunteer_by_email": ("volunteer_emails", UNIQUE, _volunteer_email_keys),
+    "school_by_name": ("schools", LAST, _lower_key("name")),
+    "district_names": ("districts", LAST, _lower_key("name")),
+    "district_aliases": ("district_aliases", LAST, _district_alias_keys),
+    "event_by_session_id": ("events", LAST, _event_session_keys),
+    "event_by_title_date": ("events", LAST, _event_title_date_keys),
+    "event_teacher_set": ("event_teachers", LAST, _pair_keys),
+    "teacher_record_by_email": ("teachers", UNIQUE, _teacher_email_keys),
+    "teacher_record_by_name": ("teachers", UNIQUE, _teacher_name_keys),
+    "organization_names": ("organizations", LAST, _lower_key("name")),
+    "organization_aliases": ("organization_aliases", LAST, _organization_alias_keys),
+    "vol_org_set": ("volunteer_organizations", LAST, _pair_keys),
+}
+
+
+def _resolve(entries, policy):
+    """Target id for a key from its [(row id, target id), ...] entries."""
+    if policy == LAST:
+        return max(entries, key=lambda entry: entry[0])[1]
+    targets = {target for _, target in entries}
+    return targets.pop() if len(targets) == 1 else None
+
+
+def _naive(value):
+    return value.replace(tzinfo=None) if isinstance(value, datetime) else value
+
+
+class LazyLookup:
+    """
+    Dict-like view of one index for a single import.
+
+    Values are ids (or None collision markers) and are hydrated to ORM
+    objects only on lookup. Objects assigned during the import are kept
+    as-is and never leak into the shared cache.
+    """
+
+    def __init__(self, model, ids):
+        self.model = model
+        self._ids = ids
+        self._objects = {}
+
+    def __contains__(self, key):
+        return key in self._objects or key in self._ids
+
+    def __len__(self):
+        return len(self._ids.keys() | self._objects.keys())
+
+    def __iter__(self):
+        return iter(self._ids.keys() | self._objects.keys())
+
+    def __getitem__(self, key):
+        if key in self._objects:
+            return self._objects[key]
+        target = self._ids[key]
+        return None if target is None else db.session.get(self.model, target)
+
+    def __setitem__(self, key, obj):
+        self._objects[key] = obj
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, default=None):
+        value = self.get(key, default)
+        self._objects.pop(key, None)
+        self._ids.pop(key, None)
+        return value
+
+
+class PathfulLookupCache:
+    """Key -> id indexes over the Pathful matching tables for one database."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._touched_lock = threading.Lock()
+        self._touched = {name: set() for name in SOURCES_BY_NAME}
+        self.built_at = None
+        self._reset()
+
+    def _reset(self):
+        # index -> key -> [(row id, target id), ...]
+        self._entries = {name: {} for name in INDEXES}
+        # index -> key -> resolved target id (None marks a collision)
+        self._resolved = {name: {} for name in INDEXES}
+        # source -> row id -> [(index, key), ...]
+        self._row_keys = {name: {} for name in SOURCES_BY_NAME}
+        self._watermarks = {}
+        self._max_ids = {}
+        self._event_starts = {}
+        self.stats = {"full_loads": 0, "rows_loaded": 0}
+
+    # ── Refresh ──
+
+    def refresh(self, max_age):
+        """Bring the indexes up to date with the database."""
+        with self._lock:
+            stale = (
+                self.built_at is None
+                or max_age <= 0
+                or time.monotonic() - self.built_at > max_age
+            )
+            if stale:
+                self._reset()
+                with self._touched_lock:
+                    for touched in self._touched.values():
+                        touched.clear()
+                for source in SOURCES:
+                    self._load_source(source)
+                self.built_at = time.monotonic()
+                return
+
+            for source in SOURCES:
+                if source.full:
+                    self._load_source(source)
+                else:
+                    self._refresh_source(source)
+
+    def _load_source(self, source):
+        """(Re)load every row of a source."""
+        for row_id in list(self._row_keys[source.name]):
+            self._remove_row(source, row_id)
+        self._watermarks.pop(source.name, None)
+        self._max_ids.pop(source.name, None)
+        self._apply_rows(source, source.query(db.session).all())
+        self.stats["full_loads"] += 1
+
+    def _refresh_source(self, source):
+        """Re-index rows changed since the last refresh."""
+        query = source.query(db.session)
+        rows = []
+        watermark = self._watermarks.get(source.name)
+        if watermark is not None:
+            rows.extend(query.filter(source.updated_at >= watermark).all())
+        max_id = self._max_ids.get(source.name)
+        if max_id is not None:
+            rows.extend(query.filter(source.pk[0] > max_id).all())
+
+        with self._touched_lock:
+            touched = self._touched[source.name]
+            self._touched[source.name] = set()
+        touched = list(touched)
+        for start in range(0, len(touched), _RELOAD_CHUNK_SIZE):
+            chunk = touched[start : start + _RELOAD_CHUNK_SIZE]
+            pk = source.pk[0] if len(source.pk) == 1 else tuple_(*source.pk)
+            reloaded = query.filter(pk.in_(chunk)).all()
+            found = {source.row_id(row) for row in reloaded}
+            for row_id in chunk:
+                if row_id not in found:
+                    self._remove_row(source, row_id)
+            rows.extend(reloaded)
+
+        self._apply_rows(source, rows)
+
+        # Deletes are not visible to watermarks: reload on a count mismatch
+        if query.order_by(None).count() != len(self._row_keys[source.name]):
+            self._load_source(source)
+
+    def _apply_rows(self, source, rows):
+        watermark = self._watermarks.get(source.name)
+        max_id = self._max_ids.get(source.name)
+        for row in rows:
+            row_id = source.row_id(row)
+            self._remove_row(source, row_id)
+            keys = []
+            for index_name, (source_name, _, key_fn) in INDEXES.items():
+                if source_name != source.name:
+                    continue
+                for key, target in key_fn(row):
+                    self._entries[index_name].setdefault(key, []).append(
+                        (row_id, target)
+                    )
+                    keys.append((index_name, key))
+            for index_name, key in set(keys):
+                self._resolve_key(index_name, key)
+            self._row_keys[source.name][row_id] = keys
+
+            if source.model is Event:
+                self._event_starts[row_id] = _naive(row.start_date)
+            if source.updated_at is not None and row.updated_at is not None:
+                if watermark is None or row.updated_at > watermark:
+                    watermark = row.updated_at
+            if source.incremental_ids and (max_id is None or row_id > max_id):
+                max_id = row_id
+        self.stats["rows_loaded"] += len(rows)
+
+        if source.updated_at is not None and watermark is not None:
+            self._watermarks[source.name] = watermark
+        if source.incremental_ids:
+            self._max_ids[source.name] = max_id if max_id is not None else 0
+
+    def _remove_row(self, source, row_id):
+        keys = self._row_keys[source.name].pop(row_id, None)
+        if not keys:
+            return
+        for index_name, key in set(keys):
+            entries = self._entries[index_name].get(key, [])
+            entries[:] = [entry for entry in entries if entry[0] != row_id]
+            if not entries:
+                self._entries[index_name].pop(key, None)
+            self._resolve_key(index_name, key)
+        if source.model is Event:
+            self._event_starts.pop(row_id, None)
+
+    def _resolve_key(self, index_name, key):
+        entries = self._entries[index_name].get(key)
+        if entries:
+            policy = INDEXES[index_name][1]
+            self._resolved[index_name][key] = _resolve(entries, policy)
+        else:
+            self._resolved[index_name].pop(key, None)
+
+    def mark_touched(self, source_name, row_id):
+        """Queue a row written in this process for re-indexing."""
+        with self._touched_lock:
+            self._touched[source_name].add(row_id)
+
+    # ── Views ──
+
+    def views(self, cutoff_date=None):
+        """
+        Per-import lookup views, in the shape build_import_caches returns.
+
+        Args:
+            cutoff_date: Only index virtual sessions starting on or after
+                this date in the event lookups
+        """
+        with self._lock:
+            resolved = self._resolved
+            if cutoff_date:
+                cutoff = _naive(cutoff_date)
+                event_views = {
+                    name: self._events_since(name, cutoff)
+                    for name in ("event_by_session_id", "event_by_title_date")
+                }
+            else:
+                event_views = {
+                    name: dict(resolved[name])
+                    for name in ("event_by_session_id", "event_by_title_date")
+                }
+
+            return {
+                "teacher_by_pathful_id": LazyLookup(
+                    TeacherProgress, dict(resolved["teacher_by_pathful_id"])
+                ),
+                "teacher_by_email": LazyLookup(
+                    TeacherProgress, dict(resolved["teacher_by_email"])
+                ),
+                "teacher_by_name": LazyLookup(
+                    TeacherProgress, dict(resolved["teacher_by_name"])
+                ),
+                "volunteer_by_pathful_id": LazyLookup(
+                    Volunteer, dict(resolved["volunteer_by_pathful_id"])
+                ),
+                "volunteer_by_email": LazyLookup(
+                    Volunteer, dict(resolved["volunteer_by_email"])
+                ),
+                "volunteer_by_name": LazyLookup(
+                    Volunteer, dict(resolved["volunteer_by_name"])
+                ),
+                "school_by_name": LazyLookup(School, dict(resolved["school_by_name"])),
+                # Aliases override names so lookups resolve different spellings
+                "district_by_name": LazyLookup(
+                    District,
+                    {**resolved["district_names"], **resolved["district_aliases"]},
+                ),
+                "event_by_session_id": LazyLookup(
+                    Event, event_views["event_by_session_id"]
+                ),
+                "event_by_title_date": LazyLookup(
+                    Event, event_views["event_by_title_date"]
+                ),
+                "event_teacher_set": set(resolved["event_teacher_set"]),
+                "teacher_record_by_email": LazyLookup(
+                    Teacher, dict(resolved["teacher_record_by_email"])
+                ),
+                "teacher_record_by_name": LazyLookup(
+                    Teacher, dict(resolved["teacher_record_by_name"])
+                ),
+                "organization_by_name": LazyLookup(
+                    Organization,
+                    {
+                        **resolved["organization_names"],
+                        **resolved["organization_aliases"],
+                    },
+                ),
+                "vol_org_set": set(resolved["vol_org_set"]),
+            }
+
+    def _events_since(self, index_name, cutoff):
+        starts = self._event_starts
+        policy = INDEXES[index_name][1]
+        view = {}
+        for key, entries in self._entries[index_name].items():
+            in_window = [
+                entry
+                for entry in entries
+                if starts.get(entry[0]) is not None and starts[entry[0]] >= cutoff
+            ]
+            if in_window:
+                view[key] = _resolve(in_window, policy)
+        return view
+
+
+# ── Process-wide registry ─────────────────────────────────────────────
+
+_caches = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_lookup_cache():
+    """
+    Get the refreshed lookup cache for the current app's database.
+
+    The cache lives for the lifetime of the process (one per engine) and is
+    refreshed incrementally on each call.
+    """
+    _register_write_tracking()
+    engine = db.engine
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = _caches[engine] = PathfulLookupCache()
+    cache.refresh(current_app.config.get("PATHFUL_LOOKUP_CACHE_MAX_AGE", 3600))
+    return cache
+
+
+def clear_lookup_caches():
+    """Drop every process-wide lookup cache."""
+    with _caches_lock:
+        _caches.clear()
+
+
+def _track_flushed_rows(session, flush_context):
+    """Queue rows of the cached tables written by this flush for re-indexing."""
+    if not _caches:
+        return
+    try:
+        cache = _caches.get(session.get_bind())
+    except Exception:
+        return
+    if cache is None:
+        return
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        for source in SOURCES:
+            if source.full or not isinstance(obj, source.model):
+                continue
+            identity = inspect(obj).mapper.primary_key_from_instance(obj)
+            if any(value is None for value in identity):
+                continue
+            cache.mark_touched(
+                source.name, identity[0] if len(identity) == 1 else tuple(identity)
+            )
+
+
+def _register_write_tracking():
+    """Track ORM writes to the cached tables on every Session (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _track_flushed_rows):
+        sa_event.listen(Session, "after_flush", _track_flushed_rows)
@@ -18,179 +18,45 @@ from models.school_model import School
 from models.teacher_progress import TeacherProgress
 from models.volunteer import Volunteer
 
+from .lookup_cache import get_lookup_cache
 from .parsing import parse_name, safe_int, safe_str
 
 
 def build_import_caches(cutoff_date=None):
     """
-    Pre-load all lookup data into dicts to avoid per-row DB queries.
+    Get lookup caches for matching Pathful rows without per-row DB queries.
+
+    Entity lookups come from the process-wide lookup cache (keys and ids
+    only, refreshed incrementally between imports); ORM objects are loaded
+    only for keys a row actually matches. See lookup_cache.py.
 
     Returns:
         dict of caches keyed by name
     """
-    from models.contact import Email as ContactEmail
-
     print("Building import caches...")
 
-    # Teacher caches (TeacherProgress)
-    all_teachers = TeacherProgress.query.all()
-    teacher_by_pathful_id = {}
-    teacher_by_email = {}
-    teacher_by_name = {}
-    for t in all_teachers:
-        if t.pathful_user_id:
-            teacher_by_pathful_id[t.pathful_user_id] = t
-        if t.email:
-            teacher_by_email[t.email.lower()] = t
-        if t.name:
-            name_key = t.name.lower()
-            if name_key in teacher_by_name:
-                teacher_by_name[name_key] = None  # Collision
-            else:
-                teacher_by_name[name_key] = t
+    lookup_cache = get_lookup_cache()
+    caches = lookup_cache.views(cutoff_date)
     print(
-        f"  Teachers: {len(all_teachers)} ({len(teacher_by_pathful_id)} by pathful_id, {len(teacher_by_email)} by email)"
+        f"  Teachers: {len(caches['teacher_by_pathful_id'])} by pathful_id, "
+        f"{len(caches['teacher_by_email'])} by email"
     )
-
-    # Volunteer caches
-    all_volunteers = Volunteer.query.all()
-    volunteer_by_pathful_id = {}
-    volunteer_by_name = {}
-    for v in all_volunteers:
-        if v.pathful_user_id:
-            volunteer_by_pathful_id[v.pathful_user_id] = v
-        if v.first_name and v.last_name:
-            name_key = (v.first_name.lower(), v.last_name.lower())
-            if name_key in volunteer_by_name:
-                volunteer_by_name[name_key] = None  # Collision marker!
-            else:
-                volunteer_by_name[name_key] = v
-
-    # Volunteer email cache (requires joining Email table)
-    volunteer_by_email = {}
-    volunteer_emails = (
-        db.session.query(ContactEmail.email, ContactEmail.contact_id)
-        .join(Volunteer, Volunteer.id == ContactEmail.contact_id)
-        .all()
+    print(
+        f"  Volunteers: {len(caches['volunteer_by_pathful_id'])} by pathful_id, "
+        f"{len(caches['volunteer_by_email'])} by email"
     )
-    vol_id_map = {v.id: v for v in all_volunteers}
-    for email_addr, contact_id in volunteer_emails:
-        if email_addr and contact_id in vol_id_map:
-            key = email_addr.lower()
-            # B1: Collision detection — shared email (family account, department inbox)
-            # → None marker so lookup falls through to name match instead of
-            # silently matching the wrong volunteer.
-            if key in volunteer_by_email:
-                volunteer_by_email[key] = None
-            else:
-                volunteer_by_email[key] = vol_id_map[contact_id]
     print(
-        f"  Volunteers: {len(all_volunteers)} ({len(volunteer_by_pathful_id)} by pathful_id, {len(volunteer_by_email)} by email)"
+        f"  Events: {len(caches['event_by_session_id'])} by session_id, "
+        f"{len(caches['event_teacher_set'])} EventTeacher links"
     )
-
-    # School cache
-    all_schools = School.query.all()
-    school_by_name = {s.name.lower(): s for s in all_schools if s.name}
-    print(f"  Schools: {len(all_schools)}")
-
-    # District cache (includes aliases for Pathful name resolution)
-    from models.district_model import DistrictAlias
-
-    all_districts = District.query.all()
-    district_by_name = {d.name.lower(): d for d in all_districts if d.name}
-    # Also index all aliases so cache lookup resolves different spellings
-    all_aliases = DistrictAlias.query.all()
-    for alias in all_aliases:
-        district_by_name[alias.alias.lower()] = alias.district
-    print(f"  Districts: {len(all_districts)} ({len(all_aliases)} aliases)")
-
-    # Event caches
-    event_filter = [Event.type == EventType.VIRTUAL_SESSION]
-    if cutoff_date:
-        event_filter.append(Event.start_date >= cutoff_date)
-    all_events = Event.query.filter(*event_filter).all()
-    event_by_session_id = {}
-    event_by_title_date = {}
-    for e in all_events:
-        if e.pathful_session_id:
-            event_by_session_id[e.pathful_session_id] = e
-        if e.title and e.start_date:
-            event_by_title_date[(e.title.lower().strip(), e.start_date.date())] = e
-    print(f"  Events: {len(all_events)} ({len(event_by_session_id)} by session_id)")
-
-    # EventTeacher existence cache — avoids per-row SELECT in ensure_event_teacher
-    from models.event import EventTeacher
-
-    if cutoff_date:
-        event_ids_in_window = {e.id for e in all_events}
-        all_et = EventTeacher.query.filter(
-            EventTeacher.event_id.in_(event_ids_in_window)
-        ).all()
-    else:
-        all_et = EventTeacher.query.all()
-    event_teacher_set = {(et.event_id, et.teacher_id) for et in all_et}
-    print(f"  EventTeacher links: {len(event_teacher_set)}")
-
-    # Teacher model caches — avoids loading ALL teachers in find_or_create_teacher
-    from models.teacher import Teacher
-    from services.teacher_matching_service import normalize_name
-
-    all_teacher_records = Teacher.query.filter(Teacher.active == True).all()
-    teacher_record_by_email = {}
-    teacher_record_by_name = {}
-    for t in all_teacher_records:
-        if t.cached_email:
-            key = t.cached_email.lower()
-            # B1: Collision detection — shared email → None marker so lookup
-            # falls through to name match rather than matching the wrong teacher.
-            if key in teacher_record_by_email:
-                teacher_record_by_email[key] = None
-            else:
-                teacher_record_by_email[key] = t
-        norm_first = normalize_name(t.first_name or "")
-        norm_last = normalize_name(t.last_name or "")
-        norm_name = f"{norm_first} {norm_last}".strip()
-        if norm_name:
-            # A1: Collision detection — two teachers with identical normalized
-            # names → None marker so lookup skips rather than matching the
-            # wrong teacher. Mirrors the TeacherProgress teacher_by_name pattern.
-            if norm_name in teacher_record_by_name:
-                teacher_record_by_name[norm_name] = None
-            else:
-                teacher_record_by_name[norm_name] = t
-        # Also index by first-word + first-word-of-last for multi-part surname
-        # matching (e.g., "catalina velarde" for Teacher "Catalina Velarde Duarte")
-        if norm_first and norm_last and " " in norm_last:
-            first_word_of_last = norm_last.split()[0]
-            short_key = f"{norm_first} {first_word_of_last}"
-            # setdefault is already safe (first one wins), but mark collision
-            # explicitly so the entry is never None when it shouldn't be.
-            if (
-                short_key in teacher_record_by_name
-                and teacher_record_by_name[short_key] is not t
-            ):
-                teacher_record_by_name[short_key] = None
-            else:
-                teacher_record_by_name.setdefault(short_key, t)
     print(
-        f"  Teacher records: {len(all_teacher_records)} ({len(teacher_record_by_email)} by email, {len(teacher_record_by_name)} by name)"
+        f"  Teacher records: {len(caches['teacher_record_by_email'])} by email, "
+        f"{len(caches['teacher_record_by_name'])} by name"
+    )
+    print(
+        f"  Lookup cache: {lookup_cache.stats['rows_loaded']} rows loaded, "
+        f"{lookup_cache.stats['full_loads']} table loads since last rebuild"
     )
-
-    # Organization cache (includes aliases for Epic 19 resolution)
-    from models.organization import Organization, OrganizationAlias
-
-    all_orgs = Organization.query.all()
-    organization_by_name = {o.name.lower(): o for o in all_orgs if o.name}
-    all_org_aliases = OrganizationAlias.query.all()
-    for alias in all_org_aliases:
-        organization_by_name[alias.name.lower()] = alias.organization
-    print(f"  Organizations: {len(all_orgs)} ({len(all_org_aliases)} aliases)")
-
-    from models.organization import VolunteerOrganization
-
-    vol_orgs = VolunteerOrganization.query.all()
-    vol_org_set = {(vo.volunteer_id, vo.organization_id) for vo in vol_orgs}
-    print(f"  VolunteerOrganization links: {len(vol_org_set)}")
 
     # Undated session queue cache — for dedup and auto-resolve fast path
     from models.pathful_import import ResolutionStatus, UnmatchedType
@@ -209,24 +75,8 @@ def build_import_caches(cutoff_date=None):
 
     print("Caches built.\n")
 
-    return {
-        "teacher_by_pathful_id": teacher_by_pathful_id,
-        "teacher_by_email": teacher_by_email,
-        "teacher_by_name": teacher_by_name,
-        "volunteer_by_pathful_id": volunteer_by_pathful_id,
-        "volunteer_by_email": volunteer_by_email,
-        "volunteer_by_name": volunteer_by_name,
-        "school_by_name": school_by_name,
-        "district_by_name": district_by_name,
-        "event_by_session_id": event_by_session_id,
-        "event_by_title_date": event_by_title_date,
-        "event_teacher_set": event_teacher_set,
-        "teacher_record_by_email": teacher_record_by_email,
-        "teacher_record_by_name": teacher_record_by_name,
-        "organization_by_name": organization_by_name,
-        "undated_by_session_id": undated_by_session_id,
-        "vol_org_set": vol_org_set,
-    }
+    caches["undated_by_session_id"] = undated_by_session_id
+    return caches
 
 
 def upsert_district(district_name, caches=None):
@@ -773,11 +623,16 @@ def _ensure_volunteer_org_link(
         ).first()
 
         if not already_unmatched:
-            from services.organization_service import find_org_near_match
+            from services.organization_service import (
+                find_org_near_match,
+                get_organization_name_index,
+            )
 
             # Build enriched raw_data: start from the import row, add near-match hint
             enriched_raw = raw_data.copy() if isinstance(raw_data, dict) else {}
-            near_org = find_org_near_match(organization_name)
+            near_org = find_org_near_match(
+                organization_name, name_index=get_organization_name_index(caches)
+            )
             if near_org:
                 enriched_raw["_near_org_match_id"] = near_org.id
 
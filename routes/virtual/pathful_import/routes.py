@@ -193,10 +193,31 @@ def load_pathful_routes():
             import_log.mark_complete()
             db.session.commit()
 
+            from services.virtual_aggregate_service import (
+                apply_virtual_session_deltas_or_drop,
+                virtual_year_for_date,
+            )
+
+            # A failed delta drops the imported years' aggregate store, and
+            # the current year's store is then dropped below as well
+            deltas_applied = apply_virtual_session_deltas_or_drop(
+                [evt.id for evt in processed_events.values()],
+                {
+                    virtual_year_for_date(evt.start_date)
+                    for evt in processed_events.values()
+                },
+            )
+            if not deltas_applied:
+                current_app.logger.warning(
+                    "Virtual aggregate update failed; store dropped for rebuild"
+                )
+
             try:
                 from utils.cache_refresh_scheduler import invalidate_report_caches
 
-                invalidate_report_caches(reason="pathful_import")
+                invalidate_report_caches(
+                    reason="pathful_import", keep_virtual_aggregates=deltas_applied
+                )
                 current_app.logger.info(
                     "Report caches invalidated after Pathful import"
                 )
@@ -34,6 +34,7 @@ from services.academic_year_service import get_school_year_dates  # noqa: F401
 from services.cache_service import (
     get_virtual_session_cache,
     get_virtual_session_district_cache,
+    get_virtual_session_district_summaries,
     invalidate_virtual_session_caches,
     save_virtual_session_cache,
     save_virtual_session_district_cache,
@@ -41,7 +42,9 @@ from services.cache_service import (
 from services.virtual_computation_service import (
     apply_runtime_filters,
     apply_sorting_and_pagination,
+    build_event_session_rows,
     calculate_summaries_from_sessions,
+    collect_event_filter_keys,
 )
 from services.virtual_computation_service import (
     district_name_matches as _district_name_matches,
@@ -52,6 +55,7 @@ from services.virtual_computation_service import (
 )
 from services.virtual_computation_service import (
     is_teacher_attended,
+    load_event_schools,
     resolve_teacher_district,
 )
 
@@ -70,23 +74,12 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
         Tuple of (session_data, district_summaries, overall_summary, filter_options)
     """
     # Base query for virtual session events
-    from sqlalchemy.orm import selectinload
+    from models import eagerload_virtual_session_bundle
 
-    from models import eagerload_event_bundle
-    from models.organization import VolunteerOrganization
-
-    base_query = (
-        eagerload_event_bundle(Event.query)
-        .options(
-            selectinload(Event.volunteers)
-            .selectinload(Volunteer.volunteer_organizations)
-            .selectinload(VolunteerOrganization.organization)
-        )
-        .filter(
-            Event.type == EventType.VIRTUAL_SESSION,
-            Event.start_date >= date_from,
-            Event.start_date <= date_to,
-        )
+    base_query = eagerload_virtual_session_bundle(Event.query).filter(
+        Event.type == EventType.VIRTUAL_SESSION,
+        Event.start_date >= date_from,
+        Event.start_date <= date_to,
     )
 
     # Apply database-level filters
@@ -101,6 +94,9 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
     # Get all events
     events = base_query.order_by(Event.start_date.desc()).all()
 
+    # Resolve every teacher's school (and district) in one query
+    schools = load_event_schools(events)
+
     # First pass: collect all districts, schools, career clusters, and statuses from raw events
     all_districts = set()
     all_schools = set()
@@ -108,237 +104,30 @@ def compute_virtual_session_data(virtual_year, date_from, date_to, filters):
     all_statuses = set()
 
     for event in events:
-        # Collect districts from events
-        if event.districts:
-            all_districts.add(event.districts[0].name)
-        elif event.district_partner:
-            all_districts.add(event.district_partner)
-
-        # Collect career clusters and statuses
-        if event.series:
-            all_career_clusters.add(event.series)
-        if event.status:
-            all_statuses.add(event.status.value)
-
-        # Collect schools and their districts from teacher registrations
-        for teacher_reg in event.teacher_registrations:
-            teacher = teacher_reg.teacher
-            if teacher and teacher.school_id:
-                school = School.query.get(teacher.school_id)
-                if school:
-                    all_schools.add(school.name)
-                    # Also add the school's district if available
-                    if hasattr(school, "district") and school.district:
-                        all_districts.add(school.district.name)
-
-    # Build session data
+        filter_keys = collect_event_filter_keys(event, schools)
+        all_districts.update(filter_keys["districts"])
+        all_schools.update(filter_keys["schools"])
+        all_career_clusters.update(filter_keys["career_clusters"])
+        all_statuses.update(filter_keys["statuses"])
+
+    # Build session data (one row per teacher registration)
     session_data = []
 
     for event in events:
-        # Get all teacher registrations for this event
-        teacher_registrations = event.teacher_registrations
-
-        if teacher_registrations:
-            # Create a row for each teacher registration
-            for teacher_reg in teacher_registrations:
-                teacher = teacher_reg.teacher
-
-                # Get school information
-                school = None
-                school_name = ""
-                school_level = ""
-
-                if teacher:
-                    if hasattr(teacher, "school_obj") and teacher.school_obj:
-                        school = teacher.school_obj
-                        school_name = school.name
-                        school_level = getattr(school, "level", "")
-                    elif teacher.school_id:
-                        school = School.query.get(teacher.school_id)
-                        if school:
-                            school_name = school.name
-                            school_level = getattr(school, "level", "")
-
-                # Determine district from multiple sources
-                # Prioritize teacher's school district over event's district
-                district_name = None
-                if school and hasattr(school, "district") and school.district:
-                    # Teacher's school district takes priority
-                    district_name = school.district.name
-                elif event.districts:
-                    district_name = event.districts[0].name
-                elif event.district_partner:
-                    district_name = event.district_partner
-                else:
-                    district_name = "Unknown District"
-
-                # Apply district filter if specified
-                if filters.get("district") and district_name != filters["district"]:
-                    continue
-
-                # Apply school filter if specified
-                if (
-                    filters.get("school")
-                    and school_name
-                    and filters["school"].lower() not in school_name.lower()
-                ):
-                    continue
-
-                session_data.append(
-                    {
-                        "event_id": event.id,
-                        "source_host": getattr(event, "session_host", "") or "",
-                        # Use the event's status for session-level filtering (completed/simulcast),
-                        # not the individual teacher registration status
-                        "status": (
-                            event.status.value if getattr(event, "status", None) else ""
-                        )
-                        or "registered",
-                        "date": (
-                            event.start_date.strftime("%m/%d/%y")
-                            if event.start_date
-                            else ""
-                        ),
-                        "time": (
-                            event.start_date.strftime("%I:%M %p")
-                            if event.start_date
-                            else ""
-                        ),
-                        "session_type": event.additional_information or "",
-                        "teacher_name": (
-                            f"{teacher.first_name} {teacher.last_name}"
-                            if teacher
-                            else ""
-                        ),
-                        "teacher_id": teacher.id if teacher else None,
-                        "school_name": school_name,
-                        "school_level": school_level,
-                        "district": district_name,
-                        "session_title": event.title,
-                        "presenter": (
-                            ", ".join([v.full_name for v in event.volunteers])
-                            if event.volunteers
-                            else ""
-                        ),
-                        "presenter_organization": (
-                            ", ".join(
-                                [
-                                    _get_primary_org_name_for_volunteer(v)
-                                    or "Independent"
-                                    for v in event.volunteers
-                                ]
-                            )
-                            if event.volunteers
-                            else ""
-                        ),
-                        "presenter_data": (
-                            [
-                                {
-                                    "id": v.id,
-                                    "name": v.full_name,
-                                    "is_people_of_color": v.is_people_of_color,
-                                    "organization_name": v.organization_name,
-                                    "organizations": (
-                                        [org.name for org in v.organizations]
-                                        if v.organizations
-                                        else []
-                                    ),
-                                    "is_local": getattr(v, "local_status", None)
-                                    == LocalStatusEnum.local,
-                                }
-                                for v in event.volunteers
-                            ]
-                            if event.volunteers
-                            else []
-                        ),
-                        "topic_theme": event.series or "",
-                        "session_link": event.registration_link or "",
-                        "session_id": event.session_id or "",
-                        "participant_count": event.participant_count or 0,
-                        "duration": event.duration or 0,
-                        "is_simulcast": teacher_reg.is_simulcast,
-                    }
-                )
-
-        else:
-            # Event with no teacher registrations - show the event itself
-            district_name = None
-            if event.districts:
-                district_name = event.districts[0].name
-            elif event.district_partner:
-                district_name = event.district_partner
-            else:
-                district_name = "Unknown District"
-
+        for row in build_event_session_rows(event, schools):
             # Apply district filter if specified
-            if filters.get("district") and district_name != filters["district"]:
+            if filters.get("district") and row["district"] != filters["district"]:
                 continue
 
-            session_data.append(
-                {
-                    "event_id": event.id,
-                    "source_host": getattr(event, "session_host", "") or "",
-                    "status": event.status.value if event.status else "",
-                    "date": (
-                        event.start_date.strftime("%m/%d/%y")
-                        if event.start_date
-                        else ""
-                    ),
-                    "time": (
-                        event.start_date.strftime("%I:%M %p")
-                        if event.start_date
-                        else ""
-                    ),
-                    "session_type": event.additional_information or "",
-                    "teacher_name": "",
-                    "teacher_id": None,
-                    "school_name": "",
-                    "school_level": "",
-                    "district": district_name,
-                    "session_title": event.title,
-                    "presenter": (
-                        ", ".join([v.full_name for v in event.volunteers])
-                        if event.volunteers
-                        else ""
-                    ),
-                    "presenter_organization": (
-                        ", ".join(
-                            [
-                                _get_primary_org_name_for_volunteer(v) or "Independent"
-                                for v in event.volunteers
-                            ]
-                        )
-                        if event.volunteers
-                        else ""
-                    ),
-                    "presenter_data": (
-                        [
-                            {
-                                "id": v.id,
-                                "name": v.full_name,
-                                "is_people_of_color": v.is_people_of_color,
-                                "organization_name": v.organization_name,
-                                "organizations": (
-                                    [org.name for org in v.organizations]
-                                    if v.organizations
-                                    else []
-                                ),
-                                "is_local": getattr(v, "local_status", None)
-                                == LocalStatusEnum.local,
-                            }
-                            for v in event.volunteers
-                        ]
-                        if event.volunteers
-                        else []
-                    ),
-                    "topic_theme": event.series or "",
-                    "session_link": event.registration_link or "",
-                    "session_id": event.session_id or "",
-                    "participant_count": event.participant_count or 0,
-                    "duration": event.duration or 0,
-                    "is_simulcast": False,
-                }
-            )
+            # Apply school filter if specified
+            if (
+                filters.get("school")
+                and row["school_name"]
+                and filters["school"].lower() not in row["school_name"].lower()
+            ):
+                continue
+
+            session_data.append(row)
 
     # Calculate summaries
     show_all_districts = filters.get("show_all_districts", False)
@@ -452,22 +241,11 @@ def _district_name_matches(target_district_name, compare_district_name):
     return False
 
 
-def compute_virtual_session_district_data(
-    district_name, virtual_year, date_from, date_to
-):
+def _virtual_session_window_events(date_from, date_to):
     """
-    Compute district-specific virtual session data from database.
-
-    Args:
-        district_name: Name of the district
-        virtual_year: The virtual year
-        date_from: Start date
-        date_to: End date
-
-    Returns:
-        Tuple of (session_data, monthly_stats, school_breakdown, teacher_breakdown, summary_stats)
+    Load the virtual session events in a date window, newest first, with the
+    teacher, district and presenter relationships the district walk reads.
     """
-    # Base query for virtual session events
     from sqlalchemy.orm import selectinload
 
     from models import eagerload_event_bundle
@@ -487,7 +265,124 @@ def compute_virtual_session_district_data(
         )
     )
 
-    events = base_query.order_by(Event.start_date.desc()).all()
+    return base_query.order_by(Event.start_date.desc()).all()
+
+
+class _DistrictLookups:
+    """
+    School lookups shared by the district computations over one event
+    window, so each school is loaded once rather than once per registration.
+    """
+
+    def __init__(self):
+        self._schools = {}
+        self._schools_by_name = {}
+
+    def school(self, school_id):
+        if school_id not in self._schools:
+            self._schools[school_id] = db.session.get(School, school_id)
+        return self._schools[school_id]
+
+    def school_by_name(self, school_name):
+        if school_name not in self._schools_by_name:
+            self._schools_by_name[school_name] = School.query.filter_by(
+                name=school_name
+            ).first()
+        return self._schools_by_name[school_name]
+
+    def teacher_district(self, teacher, event):
+        """
+        District a teacher registration counts toward: the teacher's school
+        district, else the event's first district, else its district partner.
+        """
+        teacher_district = None
+
+        # Check teacher's school district first
+        if teacher.school_id:
+            school = self.school(teacher.school_id)
+            if school and school.district:
+                teacher_district = school.district.name
+
+        # If no school district, check event's districts
+        if not teacher_district and event.districts:
+            teacher_district = event.districts[0].name
+
+        # If still no district, check event's district_partner
+        if not teacher_district and event.district_partner:
+            teacher_district = event.district_partner
+
+        return teacher_district
+
+
+def compute_virtual_session_district_data(
+    district_name, virtual_year, date_from, date_to
+):
+    """
+    Compute district-specific virtual session data from database.
+
+    Args:
+        district_name: Name of the district
+        virtual_year: The virtual year
+        date_from: Start date
+        date_to: End date
+
+    Returns:
+        Tuple of (session_data, monthly_stats, school_breakdown, teacher_breakdown, summary_stats)
+    """
+    events = _virtual_session_window_events(date_from, date_to)
+    return _district_data_from_events(district_name, events, _DistrictLookups())
+
+
+def compute_virtual_session_district_summaries(
+    district_names, virtual_year, date_from, date_to
+):
+    """
+    Compute district virtual session data for several districts in one pass.
+
+    Loads the event window once and partitions it by district: an event goes
+    to every requested district one of its registered teachers belongs to
+    (aliases included). Each district is then computed from its own events
+    only, with the same rules as compute_virtual_session_district_data().
+
+    Args:
+        district_names: Names of the districts to compute
+        virtual_year: The virtual year
+        date_from: Start date
+        date_to: End date
+
+    Returns:
+        dict: district name -> (session_data, monthly_stats, school_breakdown,
+        teacher_breakdown, summary_stats)
+    """
+    district_names = list(district_names)
+    lookups = _DistrictLookups()
+    partitions = {name: [] for name in district_names}
+    matching_districts = {}  # teacher district -> requested names it matches
+
+    for event in _virtual_session_window_events(date_from, date_to):
+        event_districts = set()
+        for teacher_reg in event.teacher_registrations:
+            if not teacher_reg.teacher:
+                continue
+            teacher_district = lookups.teacher_district(teacher_reg.teacher, event)
+            if teacher_district not in matching_districts:
+                matching_districts[teacher_district] = [
+                    name
+                    for name in district_names
+                    if _district_name_matches(name, teacher_district)
+                ]
+            event_districts.update(matching_districts[teacher_district])
+        for name in event_districts:
+            partitions[name].append(event)
+
+    return {
+        name: _district_data_from_events(name, events, lookups)
+        for name, events in partitions.items()
+    }
+
+
+def _district_data_from_events(district_name, events, lookups):
+    """District session data and statistics from a newest-first event list."""
     session_dict = {}
 
     for event in events:
@@ -499,22 +394,7 @@ def compute_virtual_session_district_data(
         for teacher_reg in event.teacher_registrations:
             teacher = teacher_reg.teacher
             if teacher:
-                # Determine district using the same logic as main function
-                teacher_district = None
-
-                # Check teacher's school district first
-                if teacher.school_id:
-                    school = School.query.get(teacher.school_id)
-                    if school and school.district:
-                        teacher_district = school.district.name
-
-                # If no school district, check event's districts
-                if not teacher_district and event.districts:
-                    teacher_district = event.districts[0].name
-
-                # If still no district, check event's district_partner
-                if not teacher_district and event.district_partner:
-                    teacher_district = event.district_partner
+                teacher_district = lookups.teacher_district(teacher, event)
 
                 # If teacher belongs to target district, include this event
                 # Use helper function to handle aliases (e.g., "KCPS (MO)" vs "Kansas City Public Schools (MO)")
@@ -524,7 +404,7 @@ def compute_virtual_session_district_data(
                         f"{teacher.first_name} {teacher.last_name}"
                     )
                     if teacher.school_id:
-                        school = School.query.get(teacher.school_id)
+                        school = lookups.school(teacher.school_id)
                         if school:
                             target_district_schools.add(school.name)
 
@@ -618,22 +498,7 @@ def compute_virtual_session_district_data(
         for teacher_reg in event.teacher_registrations:
             teacher = teacher_reg.teacher
             if teacher:
-                # Determine district using the same logic as main function
-                teacher_district = None
-
-                # Check teacher's school district first
-                if teacher.school_id:
-                    school = School.query.get(teacher.school_id)
-                    if school and school.district:
-                        teacher_district = school.district.name
-
-                # If no school district, check event's districts
-                if not teacher_district and event.districts:
-                    teacher_district = event.districts[0].name
-
-                # If still no district, check event's district_partner
-                if not teacher_district and event.district_partner:
-                    teacher_district = event.district_partner
+                teacher_district = lookups.teacher_district(teacher, event)
 
                 # If teacher belongs to target district, include this event
                 # Use helper function to handle aliases (e.g., "KCPS (MO)" vs "Kansas City Public Schools (MO)")
@@ -670,22 +535,7 @@ def compute_virtual_session_district_data(
 
             teacher = teacher_reg.teacher
             if teacher:
-                # Determine district using the same logic as main function
-                teacher_district = None
-
-                # Check teacher's school district first
-                if teacher.school_id:
-                    school = School.query.get(teacher.school_id)
-                    if school and school.district:
-                        teacher_district = school.district.name
-
-                # If no school district, check event's districts
-                if not teacher_district and event.districts:
-                    teacher_district = event.districts[0].name
-
-                # If still no district, check event's district_partner
-                if not teacher_district and event.district_partner:
-                    teacher_district = event.district_partner
+                teacher_district = lookups.teacher_district(teacher, event)
 
                 # Skip teachers not from the target district
                 # Use helper function to handle aliases (e.g., "KCPS (MO)" vs "Kansas City Public Schools (MO)")
@@ -700,7 +550,7 @@ def compute_virtual_session_district_data(
                 if hasattr(teacher, "school_obj") and teacher.school_obj:
                     school_name = teacher.school_obj.name
                 elif teacher.school_id:
-                    school_obj = School.query.get(teacher.school_id)
+                    school_obj = lookups.school(teacher.school_id)
                     if school_obj:
                         school_name = school_obj.name
 
@@ -754,7 +604,7 @@ def compute_virtual_session_district_data(
         # Schools - only count schools from the target district
         for school_name in session["schools"]:
             # Check if this school belongs to the target district
-            school = School.query.filter_by(name=school_name).first()
+            school = lookups.school_by_name(school_name)
             if (
                 school
                 and school.district
@@ -1028,4 +878,64 @@ def compute_virtual_session_district_data(
     )
 
 
+def district_breakdown_summary(summary_stats):
+    """Convert district summary stats to the usage page breakdown card format."""
+    return {
+        "teacher_count": summary_stats.get("total_teachers", 0),
+        "total_students": summary_stats.get("total_students", 0),
+        "session_count": summary_stats.get("total_unique_sessions", 0),
+        "total_experiences": summary_stats.get("total_experiences", 0),
+        "organization_count": summary_stats.get("total_organizations", 0),
+        "professional_count": summary_stats.get("total_professionals", 0),
+        "professional_of_color_count": summary_stats.get(
+            "total_professionals_of_color", 0
+        ),
+        "local_professional_count": summary_stats.get("total_local_professionals", 0),
+        "school_count": summary_stats.get("total_schools", 0),
+        "local_session_count": summary_stats.get("local_session_count", 0),
+        "poc_session_count": summary_stats.get("poc_session_count", 0),
+        "local_session_percent": summary_stats.get("local_session_percent", 0),
+        "poc_session_percent": summary_stats.get("poc_session_percent", 0),
+    }
+
+
+def compute_district_breakdown_summaries(
+    district_names, virtual_year, date_from, date_to, use_cache=False
+):
+    """
+    District breakdown cards for the usage page, computed in one pass.
+
+    With ``use_cache`` (full virtual year ranges), districts with a valid
+    VirtualSessionDistrictCache row are read from it, and the rest are
+    computed together by compute_virtual_session_district_summaries() and
+    saved to that cache for the district pages and later loads.
+
+    Returns:
+        dict: district name -> breakdown summary (see district_breakdown_summary)
+    """
+    district_names = set(district_names)
+    summaries = {}
+    if use_cache:
+        summaries = get_virtual_session_district_summaries(
+            district_names, virtual_year, date_from, date_to
+        )
+
+    missing = district_names - set(summaries)
+    if missing:
+        results = compute_virtual_session_district_summaries(
+            missing, virtual_year, date_from, date_to
+        )
+        for district_name, result in results.items():
+            summaries[district_name] = result[4]
+            if use_cache:
+                save_virtual_session_district_cache(
+                    district_name, virtual_year, date_from, date_to, *result
+                )
+
+    return {
+        district_name: district_breakdown_summary(summary_stats)
+        for district_name, summary_stats in summaries.items()
+    }
+
+
 # --- End Data Processing Helper Functions ---
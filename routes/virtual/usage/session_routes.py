@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 
 from flask import (
     Response,
+    current_app,
     flash,
     jsonify,
     make_response,
@@ -42,6 +43,14 @@ from routes.reports.common import (
     is_cache_valid,
 )
 from routes.virtual.routes import virtual_bp
+from services.virtual_aggregate_service import (
+    apply_virtual_session_deltas_or_drop,
+    get_virtual_aggregate_report,
+    invalidate_virtual_aggregates,
+    rebuild_virtual_aggregates,
+    virtual_year_for_date,
+)
+from services.virtual_session_frame import get_session_frame
 
 from .cache import (
     get_virtual_session_cache,
@@ -52,9 +61,9 @@ from .computation import (
     _get_primary_org_name_for_volunteer,
     apply_runtime_filters,
     apply_sorting_and_pagination,
-    calculate_summaries_from_sessions,
+    compute_district_breakdown_summaries,
     compute_virtual_session_data,
-    compute_virtual_session_district_data,
+    district_breakdown_summary,
     get_google_sheet_url,
 )
 
@@ -77,6 +86,17 @@ def _split_name(full_name: str) -> tuple[str, str]:
     return parts[0], " ".join(parts[1:])
 
 
+def _district_summaries(district_names, virtual_year, date_from, date_to, use_cache):
+    """Breakdown cards for the given districts; zeroed if the computation fails."""
+    try:
+        return compute_district_breakdown_summaries(
+            district_names, virtual_year, date_from, date_to, use_cache=use_cache
+        )
+    except Exception:
+        current_app.logger.exception("Error calculating district stats")
+        return {name: district_breakdown_summary({}) for name in district_names}
+
+
 def load_session_routes():
     def _group_sessions_for_table(session_rows):
         """
@@ -256,6 +276,7 @@ def load_session_routes():
         if refresh_requested and is_full_year:
             print(f"DEBUG: Refresh requested for {selected_virtual_year}")
             invalidate_virtual_session_caches(selected_virtual_year)
+            invalidate_virtual_aggregates(selected_virtual_year)
             print(
                 f"Cache invalidated for virtual session report {selected_virtual_year}"
             )
@@ -269,6 +290,9 @@ def load_session_routes():
             cached_data = get_virtual_session_cache(
                 selected_virtual_year, date_from, date_to
             )
+            if not cached_data:
+                # Assemble from the incrementally maintained aggregate store
+                cached_data = get_virtual_aggregate_report(selected_virtual_year)
             if cached_data:
                 is_cached = True
                 last_refreshed = cached_data.last_updated
@@ -339,6 +363,17 @@ def load_session_routes():
                         )
                         is_cached = False
 
+                # Vectorized filters/summaries/sorting over the cached rows
+                if is_cached and current_app.config.get("VIRTUAL_SESSION_COLUMNAR"):
+                    session_data = get_session_frame(
+                        (
+                            selected_virtual_year,
+                            type(cached_data).__name__,
+                            cached_data.last_updated,
+                        ),
+                        session_data,
+                    )
+
                 # Apply runtime filters if any
                 if any(
                     [
@@ -375,81 +410,18 @@ def load_session_routes():
                             d for d in all_districts_in_data if d in main_districts
                         }
 
-                    # Calculate district summaries using the same method as individual district pages
-                    district_summaries = {}
-                    for district_name in districts_to_show:
-                        try:
-                            _, _, _, _, summary_stats = (
-                                compute_virtual_session_district_data(
-                                    district_name,
-                                    selected_virtual_year,
-                                    date_from,
-                                    date_to,
-                                )
-                            )
-                            district_summaries[district_name] = {
-                                "teacher_count": summary_stats.get("total_teachers", 0),
-                                "total_students": summary_stats.get(
-                                    "total_students", 0
-                                ),
-                                "session_count": summary_stats.get(
-                                    "total_unique_sessions", 0
-                                ),
-                                "total_experiences": summary_stats.get(
-                                    "total_experiences", 0
-                                ),
-                                "organization_count": summary_stats.get(
-                                    "total_organizations", 0
-                                ),
-                                "professional_count": summary_stats.get(
-                                    "total_professionals", 0
-                                ),
-                                "professional_of_color_count": summary_stats.get(
-                                    "total_professionals_of_color", 0
-                                ),
-                                "local_professional_count": summary_stats.get(
-                                    "total_local_professionals", 0
-                                ),
-                                "school_count": summary_stats.get("total_schools", 0),
-                                "local_session_count": summary_stats.get(
-                                    "local_session_count", 0
-                                ),
-                                "poc_session_count": summary_stats.get(
-                                    "poc_session_count", 0
-                                ),
-                                "local_session_percent": summary_stats.get(
-                                    "local_session_percent", 0
-                                ),
-                                "poc_session_percent": summary_stats.get(
-                                    "poc_session_percent", 0
-                                ),
-                            }
-                        except Exception as e:
-                            print(
-                                f"DEBUG: Error calculating stats for {district_name}: {str(e)}"
-                            )
-                            district_summaries[district_name] = {
-                                "teacher_count": 0,
-                                "total_students": 0,
-                                "session_count": 0,
-                                "total_experiences": 0,
-                                "organization_count": 0,
-                                "professional_count": 0,
-                                "professional_of_color_count": 0,
-                                "local_professional_count": 0,
-                                "school_count": 0,
-                                "local_session_count": 0,
-                                "poc_session_count": 0,
-                                "local_session_percent": 0,
-                                "poc_session_percent": 0,
-                            }
-
-                    # Recalculate overall summary from unfiltered session data
-                    _, overall_summary = calculate_summaries_from_sessions(
-                        unfiltered_session_data,
-                        current_filters.get("show_all_districts", False),
+                    # Same statistics as the individual district pages,
+                    # computed for every district in one pass
+                    district_summaries = _district_summaries(
+                        districts_to_show,
+                        selected_virtual_year,
+                        date_from,
+                        date_to,
+                        use_cache=True,
                     )
 
+                    # overall_summary already covers the unfiltered session data
+
                     # Filter district summaries based on user scope
                     if (
                         current_user.scope_type == "district"
@@ -503,11 +475,34 @@ def load_session_routes():
             f"Computing fresh data for virtual session report {selected_virtual_year}"
         )
 
-        # Get unfiltered data first to ensure we have all districts for summaries
+        # Get unfiltered data first to ensure we have all districts for summaries.
+        # For the full year, one scan builds the aggregate store (which serves
+        # later requests and event edits) and the unfiltered data is read back
+        # from it instead of being recomputed.
         print("DEBUG: Getting unfiltered data for district summaries...")
-        session_data_unfiltered, _, _, filter_options = compute_virtual_session_data(
-            selected_virtual_year, date_from, date_to, {}
-        )
+        unfiltered_report = None
+        if is_full_year:
+            try:
+                rebuild_virtual_aggregates(selected_virtual_year)
+                unfiltered_report = get_virtual_aggregate_report(selected_virtual_year)
+            except Exception:
+                current_app.logger.exception(
+                    "Virtual aggregate rebuild failed for %s", selected_virtual_year
+                )
+        if unfiltered_report:
+            session_data_unfiltered = unfiltered_report.session_data
+            unfiltered_district_summaries = unfiltered_report.district_summaries
+            unfiltered_overall_summary = unfiltered_report.overall_summary
+            filter_options = unfiltered_report.filter_options
+        else:
+            (
+                session_data_unfiltered,
+                unfiltered_district_summaries,
+                unfiltered_overall_summary,
+                filter_options,
+            ) = compute_virtual_session_data(
+                selected_virtual_year, date_from, date_to, {}
+            )
 
         # Get list of all districts that appear in the data
         all_districts_in_data = set()
@@ -541,53 +536,13 @@ def load_session_routes():
 
         # Calculate district summaries using the same method as individual district pages
         # This ensures consistency between breakdown cards and individual district pages
-        all_district_summaries = {}
-        for district_name in districts_to_show:
-            try:
-                # Use the same calculation method as individual district page
-                _, _, _, _, summary_stats = compute_virtual_session_district_data(
-                    district_name, selected_virtual_year, date_from, date_to
-                )
-                # Convert to the format expected by the breakdown template
-                all_district_summaries[district_name] = {
-                    "teacher_count": summary_stats.get("total_teachers", 0),
-                    "total_students": summary_stats.get("total_students", 0),
-                    "session_count": summary_stats.get("total_unique_sessions", 0),
-                    "total_experiences": summary_stats.get("total_experiences", 0),
-                    "organization_count": summary_stats.get("total_organizations", 0),
-                    "professional_count": summary_stats.get("total_professionals", 0),
-                    "professional_of_color_count": summary_stats.get(
-                        "total_professionals_of_color", 0
-                    ),
-                    "local_professional_count": summary_stats.get(
-                        "total_local_professionals", 0
-                    ),
-                    "school_count": summary_stats.get("total_schools", 0),
-                    "local_session_count": summary_stats.get("local_session_count", 0),
-                    "poc_session_count": summary_stats.get("poc_session_count", 0),
-                    "local_session_percent": summary_stats.get(
-                        "local_session_percent", 0
-                    ),
-                    "poc_session_percent": summary_stats.get("poc_session_percent", 0),
-                }
-            except Exception as e:
-                print(f"DEBUG: Error calculating stats for {district_name}: {str(e)}")
-                # Create empty summary if calculation fails
-                all_district_summaries[district_name] = {
-                    "teacher_count": 0,
-                    "total_students": 0,
-                    "session_count": 0,
-                    "total_experiences": 0,
-                    "organization_count": 0,
-                    "professional_count": 0,
-                    "professional_of_color_count": 0,
-                    "local_professional_count": 0,
-                    "school_count": 0,
-                    "local_session_count": 0,
-                    "poc_session_count": 0,
-                    "local_session_percent": 0,
-                    "poc_session_percent": 0,
-                }
+        all_district_summaries = _district_summaries(
+            districts_to_show,
+            selected_virtual_year,
+            date_from,
+            date_to,
+            use_cache=is_full_year and not refresh_requested,
+        )
 
         print(
             f"DEBUG: Calculated district_summaries keys: {list(all_district_summaries.keys()) if all_district_summaries else 'None'}"
@@ -664,20 +619,12 @@ def load_session_routes():
 
         # Cache the data if it's a full year query
         if is_full_year:
-            # Cache the unfiltered data
-            (
-                unfiltered_data,
-                unfiltered_district_summaries,
-                unfiltered_overall_summary,
-                _,
-            ) = compute_virtual_session_data(
-                selected_virtual_year, date_from, date_to, {}  # No filters for cache
-            )
+            # Cache the unfiltered data computed above
             save_virtual_session_cache(
                 selected_virtual_year,
                 date_from,
                 date_to,
-                unfiltered_data,
+                session_data_unfiltered,
                 unfiltered_district_summaries,
                 unfiltered_overall_summary,
                 filter_options,
@@ -988,13 +935,17 @@ def load_session_routes():
         try:
             event.status = EventStatus(status_str)
             db.session.commit()
-            return jsonify({"success": True, "status": event.status.value})
         except ValueError:
             return jsonify({"error": "Invalid status"}), 400
         except Exception as e:
             db.session.rollback()
             return jsonify({"error": str(e)}), 500
 
+        apply_virtual_session_deltas_or_drop(
+            [event.id], [virtual_year_for_date(event.start_date)]
+        )
+        return jsonify({"success": True, "status": event.status.value})
+
     @virtual_bp.route("/usage/edit/<int:event_id>", methods=["GET", "POST"])
     @login_required
     @admin_required
@@ -1014,6 +965,7 @@ def load_session_routes():
         if event.session_host != "APP":
             flash("Only sessions created in the app can be edited here.", "warning")
             return redirect(url_for("virtual.virtual_usage"))
+        previous_year = virtual_year_for_date(event.start_date)
 
         if request.method == "GET":
             # Return event data as JSON for the edit form
@@ -1390,6 +1342,9 @@ def load_session_routes():
             invalidate_virtual_session_caches(year)
         except Exception:
             pass
+        apply_virtual_session_deltas_or_drop(
+            [event.id], [previous_year, virtual_year_for_date(event.start_date)]
+        )
 
         flash("Session updated successfully!", "success")
         return redirect(url_for("virtual.virtual_usage"))
@@ -1419,6 +1374,7 @@ def load_session_routes():
             from routes.reports.virtual_session import get_current_virtual_year
 
             year = get_current_virtual_year()
+            event_year = virtual_year_for_date(event.start_date)
 
             # Delete EventParticipation records (no cascade relationship)
             EventParticipation.query.filter_by(event_id=event.id).delete()
@@ -1432,6 +1388,7 @@ def load_session_routes():
                 invalidate_virtual_session_caches(year)
             except Exception:
                 pass
+            apply_virtual_session_deltas_or_drop([event_id], [event_year])
 
             flash("Session deleted successfully!", "success")
         except Exception as e:
@@ -1775,6 +1732,9 @@ def load_session_routes():
                 invalidate_virtual_session_caches(year)
             except Exception:
                 pass
+            apply_virtual_session_deltas_or_drop(
+                [event.id], [virtual_year_for_date(event.start_date)]
+            )
 
             flash("Virtual session created.", "success")
             return redirect(url_for("virtual.virtual_usage", year=year))
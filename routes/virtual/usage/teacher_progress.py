@@ -13,13 +13,14 @@ from flask_login import current_user
 from sqlalchemy.orm import joinedload
 
 from models import db
-from models.contact import LocalStatusEnum
+from models.contact import Email, LocalStatusEnum
 from models.district_model import District
 from models.event import Event, EventFormat, EventStatus, EventTeacher, EventType
 from models.school_model import School
 from models.teacher import Teacher
 from models.teacher_progress import TeacherProgress
 from models.teacher_progress_archive import TeacherProgressArchive
+from services.name_matching_service import NameIndex
 from services.session_status_service import (
     SessionClassification,
     classify_teacher_session,
@@ -464,7 +465,9 @@ def match_teacher_progress_to_teachers(virtual_year=None, min_similarity=0.85):
 
     Matching strategy:
     1. Match by email (exact match on primary email) - highest priority
-    2. Match by name (fuzzy matching with similarity threshold) - secondary
+    2. Match by name (fuzzy matching with similarity threshold) - secondary;
+       candidates come from a blocked NameIndex instead of scanning every
+       teacher
 
     Args:
         virtual_year: Virtual year to match teachers for (None = all years)
@@ -482,16 +485,26 @@ def match_teacher_progress_to_teachers(virtual_year=None, min_similarity=0.85):
 
     teacher_progress_entries = query.filter_by(teacher_id=None).all()
 
-    # Get all teachers with their primary emails
-    teachers = Teacher.query.all()
+    teachers = Teacher.query.order_by(Teacher.id).all()
 
-    # Build email lookup map (email -> teacher)
+    # First primary email per teacher, loaded in one query
+    primary_emails = {}
+    for contact_id, address in (
+        db.session.query(Email.contact_id, Email.email)
+        .join(Teacher, Teacher.id == Email.contact_id)
+        .filter(Email.primary.is_(True))
+        .order_by(Email.id)
+    ):
+        primary_emails.setdefault(contact_id, address)
+
+    # Build email lookup map (email -> teacher) and the fuzzy name index
     email_to_teacher = {}
+    name_index = NameIndex(normalize=normalize_name)
     for teacher in teachers:
-        primary_email = teacher.emails.filter_by(primary=True).first()
-        if primary_email and primary_email.email:
-            email_lower = primary_email.email.lower().strip()
-            email_to_teacher[email_lower] = teacher
+        primary_email = primary_emails.get(teacher.id)
+        if primary_email:
+            email_to_teacher[primary_email.lower().strip()] = teacher
+        name_index.add(f"{teacher.first_name} {teacher.last_name}".strip(), teacher)
 
     stats = {
         "total_processed": len(teacher_progress_entries),
@@ -514,24 +527,9 @@ def match_teacher_progress_to_teachers(virtual_year=None, min_similarity=0.85):
 
             # Strategy 2: Match by name (fuzzy matching) if email didn't match
             if not matched_teacher and tp_entry.name:
-                best_match = None
-                best_similarity = 0.0
-
-                for teacher in teachers:
-                    # Build full name from teacher
-                    teacher_full_name = (
-                        f"{teacher.first_name} {teacher.last_name}".strip()
-                    )
-                    if not teacher_full_name:
-                        continue
-
-                    similarity = name_similarity(tp_entry.name, teacher_full_name)
-                    if similarity > best_similarity and similarity >= min_similarity:
-                        best_similarity = similarity
-                        best_match = teacher
-
+                best_match = name_index.best_match(tp_entry.name, min_similarity)
                 if best_match:
-                    matched_teacher = best_match
+                    matched_teacher = best_match[0]
                     stats["matched_by_name"] += 1
 
             # Update TeacherProgress entry with matched teacher_id
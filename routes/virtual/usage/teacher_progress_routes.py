@@ -9,7 +9,6 @@ matching. Registered on virtual_bp.
 from datetime import datetime, timedelta, timezone
 
 from flask import (
-    Response,
     flash,
     jsonify,
     make_response,
@@ -43,9 +42,10 @@ from routes.reports.common import (
     is_cache_valid,
 )
 from routes.virtual.routes import virtual_bp
+from utils.spreadsheet_export import export_response
 
 from .computation import _district_name_matches
-from .exports import generate_teacher_progress_excel
+from .exports import teacher_progress_sheets
 from .teacher_progress import (
     compute_teacher_progress_tracking,
     compute_teacher_school_breakdown,
@@ -860,8 +860,7 @@ def load_teacher_progress_routes():
                 )
             )
 
-        # Generate Excel file
-        excel_data = generate_teacher_progress_excel(
+        sheets = teacher_progress_sheets(
             teacher_progress_data,
             district_name,
             selected_virtual_year,
@@ -873,12 +872,8 @@ def load_teacher_progress_routes():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"Teacher_Progress_Report_{timestamp}.xlsx"
 
-        # Return Excel file
-        return Response(
-            excel_data,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+        # Stream the workbook (or the teacher details as CSV)
+        return export_response(sheets, filename, csv_sheet=2)
 
     @virtual_bp.route(
         "/usage/district/<district_name>/teacher-progress/google-sheets/<int:sheet_id>/delete",
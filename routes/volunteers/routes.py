@@ -38,7 +38,7 @@ from flask import (
 )
 from flask_login import current_user, login_required
 from simple_salesforce import Salesforce, SalesforceAuthenticationFailed
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import contains_eager
 
 from config import Config
 from forms import VolunteerForm
@@ -66,6 +66,7 @@ from models.volunteer import (
     Volunteer,
     VolunteerSkill,
 )
+from models.volunteer_engagement import VolunteerEngagementStats
 from routes.decorators import admin_required, global_users_only, handle_route_errors
 from routes.utils import (
     get_email_addresses,
@@ -75,6 +76,11 @@ from routes.utils import (
     parse_skills,
 )
 from services.salesforce import map_age_group, map_education_level, map_race_ethnicity
+from services.volunteer_search_service import (
+    MATCH_ALL,
+    MATCH_PHRASE,
+    matching_volunteer_ids,
+)
 
 # Create Flask Blueprint for volunteer routes
 volunteers_bp = Blueprint("volunteers", __name__)
@@ -247,88 +253,43 @@ def volunteers():
     # Add sort parameters to current_filters
     current_filters.update({"sort_by": sort_by, "sort_direction": sort_direction})
 
-    # Start with a subquery to get the attended count
-    # This calculates the actual number of events each volunteer has attended
-    # by counting EventParticipation records with valid attendance statuses
-    attended_count_subq = (
-        db.session.query(
-            EventParticipation.volunteer_id,
-            db.func.count(EventParticipation.id).label("attended_count"),
-        )
-        .filter(
-            or_(
-                EventParticipation.status == "Attended",
-                EventParticipation.status == "Completed",
-                EventParticipation.status == "Successfully Completed",
-            )
-        )
-        .group_by(EventParticipation.volunteer_id)
-        .subquery()
-    )
+    # Attended counts come from the materialized engagement stats
+    # (services/volunteer_engagement_service.py), one row per volunteer
+    attended_count = db.func.coalesce(VolunteerEngagementStats.attended_count, 0)
 
     # Build main query with joins for filtering and organization data
     # This complex query allows for efficient filtering across multiple related tables
     query = (
-        db.session.query(
-            Volunteer,
-            db.func.coalesce(attended_count_subq.c.attended_count, 0).label(
-                "attended_count"
-            ),
-        )
+        db.session.query(Volunteer, attended_count.label("attended_count"))
         .outerjoin(
-            attended_count_subq, Volunteer.id == attended_count_subq.c.volunteer_id
+            VolunteerEngagementStats,
+            VolunteerEngagementStats.volunteer_id == Volunteer.id,
         )
+        .options(contains_eager(Volunteer.engagement_stats))
         .outerjoin(VolunteerOrganization)
         .outerjoin(
             Organization, VolunteerOrganization.organization_id == Organization.id
         )
     )
 
-    # Apply filters
+    # Apply filters (full-text search, see services/volunteer_search_service.py)
     if current_filters.get("search_name"):
-        # Split search terms and remove empty strings
-        search_terms = [
-            term.strip()
-            for term in current_filters["search_name"].split()
-            if term.strip()
-        ]
-
-        # Build dynamic search condition
-        name_conditions = []
-        for term in search_terms:
-            search_pattern = f"%{term}%"
-            name_conditions.append(
-                or_(
-                    Volunteer.first_name.ilike(search_pattern),
-                    Volunteer.middle_name.ilike(search_pattern),
-                    Volunteer.last_name.ilike(search_pattern),
-                    # Concatenated name search using SQLite's || operator
-                    (
-                        Volunteer.first_name
-                        + " "
-                        + db.func.coalesce(Volunteer.middle_name, "")
-                        + " "
-                        + Volunteer.last_name
-                    ).ilike(search_pattern),
+        # Each term must prefix-match a word of the volunteer's name
+        query = query.filter(
+            Volunteer.id.in_(
+                matching_volunteer_ids(
+                    current_filters["search_name"], match=MATCH_ALL, columns=("name",)
                 )
             )
-        # Combine all conditions with AND (each term must match somewhere)
-        if name_conditions:
-            query = query.filter(and_(*name_conditions))
+        )
 
     if current_filters.get("org_search"):
-        search_term = f"%{current_filters['org_search']}%"
-        # The joins are already established in the main query, so we can directly filter
+        # Workplace, title, department, industry, organizations and roles
         query = query.filter(
-            or_(
-                # Search direct volunteer fields
-                Volunteer.organization_name.ilike(search_term),
-                Volunteer.title.ilike(search_term),
-                Volunteer.department.ilike(search_term),
-                Volunteer.industry.ilike(search_term),
-                # Search related organization fields
-                Organization.name.ilike(search_term),
-                VolunteerOrganization.role.ilike(search_term),
+            Volunteer.id.in_(
+                matching_volunteer_ids(
+                    current_filters["org_search"], match=MATCH_PHRASE, columns=("work",)
+                )
             )
         )
 
@@ -337,8 +298,15 @@ def volunteers():
         query = query.join(Email).filter(Email.email.ilike(search_term))
 
     if current_filters.get("skill_search"):
-        search_term = f"%{current_filters['skill_search']}%"
-        query = query.join(Volunteer.skills).filter(Skill.name.ilike(search_term))
+        query = query.filter(
+            Volunteer.id.in_(
+                matching_volunteer_ids(
+                    current_filters["skill_search"],
+                    match=MATCH_PHRASE,
+                    columns=("skills",),
+                )
+            )
+        )
 
     if current_filters.get("local_status"):
         status_val = current_filters["local_status"]
@@ -379,10 +347,7 @@ def volunteers():
         elif sort_by == "times_volunteered":
             # Match the display calculation: attended_count + additional_volunteer_count
             # Exclude times_volunteered to avoid double counting (it may contain outdated Salesforce data)
-            sort_column = (
-                db.func.coalesce(attended_count_subq.c.attended_count, 0)
-                + Volunteer.additional_volunteer_count
-            )
+            sort_column = attended_count + Volunteer.additional_volunteer_count
 
         if sort_column is not None:
             if sort_direction == "desc":
@@ -1152,121 +1117,20 @@ def update_local_status(id):
 @global_users_only
 @admin_required
 def update_local_statuses():
+    """
+    Recompute local status for every volunteer (set-based).
 
+    Pass ``?incremental=true`` to only recompute volunteers whose addresses
+    or in-person participation changed since their last computation.
+    """
     try:
-        from models.student import Student
-        from models.teacher import Teacher
-
-        print("Starting enhanced local status update for all contacts...")
-
-        # Track statistics for each contact type
-        stats = {
-            "volunteers": {"total": 0, "updated": 0, "errors": 0},
-            "teachers": {"total": 0, "updated": 0, "errors": 0},
-            "students": {"total": 0, "updated": 0, "errors": 0},
-        }
-
-        # Process Volunteers with enhanced logic
-        print("\n=== Processing Volunteers ===")
-        volunteers = Volunteer.query.all()
-        stats["volunteers"]["total"] = len(volunteers)
-        print(f"Found {len(volunteers)} volunteers to process")
-
-        for i, volunteer in enumerate(volunteers):
-            try:
-                new_status = volunteer.calculate_local_status()
-                if volunteer.local_status != new_status:
-                    old_status = (
-                        volunteer.local_status.name
-                        if volunteer.local_status
-                        else "None"
-                    )
-                    volunteer.local_status = new_status
-                    volunteer.local_status_last_updated = datetime.now(timezone.utc)
-                    stats["volunteers"]["updated"] += 1
-
-                    # Show status changes for first 10 and every 100th
-                    if (
-                        stats["volunteers"]["updated"] <= 10
-                        or stats["volunteers"]["updated"] % 100 == 0
-                    ):
-                        print(
-                            f"[{i+1:4d}] VOLUNTEER: {volunteer.first_name} {volunteer.last_name} -> {old_status} to {new_status.name}"
-                        )
-
-            except Exception as e:
-                stats["volunteers"]["errors"] += 1
-                print(
-                    f"[{i+1:4d}] ERROR (Volunteer): {volunteer.first_name} {volunteer.last_name} - {str(e)[:80]}"
-                )
+        from services.local_status_service import recompute_local_statuses
 
-        # Process Teachers with local assumptions
-        print("\n=== Processing Teachers ===")
-        teachers = Teacher.query.all()
-        stats["teachers"]["total"] = len(teachers)
-        print(f"Found {len(teachers)} teachers to process")
+        incremental = request.args.get("incremental", "").lower() == "true"
+        mode = "incremental" if incremental else "full"
+        print(f"Starting {mode} local status update for all contacts...")
 
-        for i, teacher in enumerate(teachers):
-            try:
-                new_status = teacher.calculate_local_status()
-                if (
-                    not hasattr(teacher, "local_status")
-                    or teacher.local_status != new_status
-                ):
-                    old_status = getattr(teacher, "local_status", None)
-                    old_status_name = old_status.name if old_status else "None"
-                    teacher.local_status = new_status
-                    teacher.local_status_last_updated = datetime.now(timezone.utc)
-                    stats["teachers"]["updated"] += 1
-
-                    # Show status changes for first 10 and every 100th
-                    if (
-                        stats["teachers"]["updated"] <= 10
-                        or stats["teachers"]["updated"] % 100 == 0
-                    ):
-                        print(
-                            f"[{i+1:4d}] TEACHER: {teacher.first_name} {teacher.last_name} -> {old_status_name} to {new_status.name}"
-                        )
-
-            except Exception as e:
-                stats["teachers"]["errors"] += 1
-                print(
-                    f"[{i+1:4d}] ERROR (Teacher): {teacher.first_name} {teacher.last_name} - {str(e)[:80]}"
-                )
-
-        # Process Students with local assumptions
-        print("\n=== Processing Students ===")
-        students = Student.query.all()
-        stats["students"]["total"] = len(students)
-        print(f"Found {len(students)} students to process")
-
-        for i, student in enumerate(students):
-            try:
-                new_status = student.calculate_local_status()
-                if (
-                    not hasattr(student, "local_status")
-                    or student.local_status != new_status
-                ):
-                    old_status = getattr(student, "local_status", None)
-                    old_status_name = old_status.name if old_status else "None"
-                    student.local_status = new_status
-                    student.local_status_last_updated = datetime.now(timezone.utc)
-                    stats["students"]["updated"] += 1
-
-                    # Show status changes for first 10 and every 100th
-                    if (
-                        stats["students"]["updated"] <= 10
-                        or stats["students"]["updated"] % 100 == 0
-                    ):
-                        print(
-                            f"[{i+1:4d}] STUDENT: {student.first_name} {student.last_name} -> {old_status_name} to {new_status.name}"
-                        )
-
-            except Exception as e:
-                stats["students"]["errors"] += 1
-                print(
-                    f"[{i+1:4d}] ERROR (Student): {student.first_name} {student.last_name} - {str(e)[:80]}"
-                )
+        stats = recompute_local_statuses(incremental=incremental)
 
         # Calculate totals
         total_contacts = sum(stat["total"] for stat in stats.values())
@@ -1,17 +1,39 @@
 """
 Automated SQLite database backup.
 
-Creates timestamped copies of all .db files in instance/ to instance/backups/.
-Auto-prunes backups older than 7 days.
+Snapshots all .db files in instance/ into timestamped folders under
+instance/backups/ and auto-prunes backups older than 30 days.
+
+Snapshots are taken with SQLite's online backup API (sqlite3.Connection.backup)
+in small page steps, so they are consistent — including changes still in the
+-wal file — and the app keeps reading and writing while a backup runs.
+
+Storage modes:
+    pages  (default) Content-addressed chunk store. Each snapshot is split
+           into page-aligned chunks stored once, compressed, under
+           backups/objects/ by SHA-256; a backup folder only holds small
+           manifests. Unchanged chunks are shared between days, so 30 days
+           of retention cost little more than one full copy plus the churn.
+    gzip   One compressed .db.gz file per database per backup.
+    copy   One plain .db file per database per backup.
 
 Usage:
-    Standalone:  python scripts/daily_imports/backup_database.py
+    Standalone:  python scripts/daily_imports/backup_database.py [--mode gzip]
+    Restore:     python scripts/daily_imports/backup_database.py \\
+                     --restore instance/backups/<stamp>/<name>.db.manifest.json \\
+                     restored.db
     From code:   from scripts.daily_imports.backup_database import run_backup
 """
 
+import argparse
+import gzip
+import hashlib
+import json
 import logging
 import os
 import shutil
+import sqlite3
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -21,35 +43,64 @@ logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # project root
 INSTANCE_DIR = BASE_DIR / "instance"
 BACKUP_DIR = INSTANCE_DIR / "backups"
-RETENTION_DAYS = 7
+RETENTION_DAYS = 30
+
+MODE_PAGES = "pages"
+MODE_GZIP = "gzip"
+MODE_COPY = "copy"
+MODES = (MODE_PAGES, MODE_GZIP, MODE_COPY)
+DEFAULT_MODE = MODE_PAGES
+
+# Online backup step: pages copied per step and pause between steps (seconds).
+# Other connections can write between steps; SQLite restarts the copy if the
+# source changes through another connection, so keep steps short.
+BACKUP_STEP_PAGES = 1024
+BACKUP_STEP_SLEEP = 0.005
+
+# Page store: chunk size in database pages, and the object directory name
+PAGES_PER_CHUNK = 16
+OBJECTS_DIRNAME = "objects"
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M"
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
 def run_backup(
     instance_dir: Path = INSTANCE_DIR,
     backup_dir: Path = BACKUP_DIR,
     retention_days: int = RETENTION_DAYS,
+    mode: str = DEFAULT_MODE,
 ) -> Path | None:
     """
     Back up all .db files in *instance_dir* to a timestamped subfolder
     inside *backup_dir*.  Returns the backup folder path, or None if
     there were no databases to back up.
     """
+    if mode not in MODES:
+        raise ValueError(f"Unknown backup mode {mode!r}; expected one of {MODES}")
+
     instance_dir = Path(instance_dir)
     backup_dir = Path(backup_dir)
 
-    db_files = list(instance_dir.glob("*.db"))
+    db_files = sorted(instance_dir.glob("*.db"))
     if not db_files:
         logger.info("No .db files found in %s — nothing to back up.", instance_dir)
         return None
 
     # Create timestamped subfolder: instance/backups/2026-03-07_15-30/
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
     dest = backup_dir / timestamp
     dest.mkdir(parents=True, exist_ok=True)
 
     for db_file in db_files:
-        target = dest / db_file.name
-        shutil.copy2(db_file, target)
+        snapshot = dest / f"{db_file.name}.partial"
+        try:
+            snapshot_database(db_file, snapshot)
+            target = _store_snapshot(snapshot, dest, db_file.name, backup_dir, mode)
+        finally:
+            snapshot.unlink(missing_ok=True)
         size_mb = target.stat().st_size / (1024 * 1024)
         logger.info("Backed up %s → %s (%.1f MB)", db_file.name, target, size_mb)
 
@@ -59,6 +110,160 @@ def run_backup(
     return dest
 
 
+def snapshot_database(
+    source: Path,
+    target: Path,
+    pages: int = BACKUP_STEP_PAGES,
+    sleep: float = BACKUP_STEP_SLEEP,
+) -> None:
+    """
+    Copy a live SQLite database to *target* with the online backup API.
+
+    The copy is a consistent snapshot that includes committed transactions
+    still in the write-ahead log. Readers and writers are only blocked for
+    the duration of each *pages*-sized step.
+    """
+    target = Path(target)
+    target.unlink(missing_ok=True)
+    source_conn = sqlite3.connect(str(source))
+    try:
+        target_conn = sqlite3.connect(str(target))
+        try:
+            source_conn.backup(target_conn, pages=pages, sleep=sleep)
+            # Store a self-contained rollback-journal file, not a WAL database
+            target_conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target_conn.close()
+    finally:
+        source_conn.close()
+
+
+def _store_snapshot(
+    snapshot: Path, dest: Path, name: str, backup_dir: Path, mode: str
+) -> Path:
+    """Move a snapshot into the backup folder in the given storage mode."""
+    if mode == MODE_COPY:
+        target = dest / name
+        os.replace(snapshot, target)
+        return target
+
+    if mode == MODE_GZIP:
+        target = dest / f"{name}.gz"
+        with open(snapshot, "rb") as src, gzip.open(target, "wb") as out:
+            shutil.copyfileobj(src, out, COPY_BUFFER_SIZE)
+        return target
+
+    return write_page_manifest(snapshot, dest / f"{name}{MANIFEST_SUFFIX}", backup_dir)
+
+
+# ── Content-addressed page store ──────────────────────────────────────────
+
+
+def _object_path(objects_dir: Path, digest: str) -> Path:
+    return objects_dir / digest[:2] / digest[2:]
+
+
+def _page_size(snapshot: Path) -> int:
+    conn = sqlite3.connect(str(snapshot))
+    try:
+        return conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def write_page_manifest(snapshot: Path, manifest_path: Path, backup_dir: Path) -> Path:
+    """
+    Split a snapshot into page-aligned chunks in the object store and write
+    the manifest that lists them in order.
+
+    Chunks already in the store (from earlier backups) are not rewritten.
+    """
+    objects_dir = Path(backup_dir) / OBJECTS_DIRNAME
+    page_size = _page_size(snapshot)
+    chunk_size = page_size * PAGES_PER_CHUNK
+
+    file_hash = hashlib.sha256()
+    chunks = []
+    new_chunks = 0
+    size = 0
+    with open(snapshot, "rb") as src:
+        while chunk := src.read(chunk_size):
+            size += len(chunk)
+            file_hash.update(chunk)
+            digest = hashlib.sha256(chunk).hexdigest()
+            chunks.append(digest)
+            path = _object_path(objects_dir, digest)
+            if path.exists():
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{path.name}.partial")
+            partial.write_bytes(zlib.compress(chunk))
+            os.replace(partial, path)
+            new_chunks += 1
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "database": snapshot.name.removesuffix(".partial"),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "page_size": page_size,
+        "chunk_size": chunk_size,
+        "size": size,
+        "sha256": file_hash.hexdigest(),
+        "chunks": chunks,
+    }
+    manifest_path.write_text(json.dumps(manifest))
+    logger.info(
+        "Stored %s: %d chunks, %d new", manifest["database"], len(chunks), new_chunks
+    )
+    return manifest_path
+
+
+def restore_backup(manifest_path: Path, target: Path) -> Path:
+    """
+    Rebuild a database file from a page-store manifest.
+
+    Raises:
+        ValueError: If the rebuilt file does not match the manifest checksum
+    """
+    manifest_path = Path(manifest_path)
+    target = Path(target)
+    manifest = json.loads(manifest_path.read_text())
+    objects_dir = manifest_path.parent.parent / OBJECTS_DIRNAME
+
+    file_hash = hashlib.sha256()
+    partial = target.with_name(f"{target.name}.partial")
+    with open(partial, "wb") as out:
+        for digest in manifest["chunks"]:
+            chunk = zlib.decompress(_object_path(objects_dir, digest).read_bytes())
+            file_hash.update(chunk)
+            out.write(chunk)
+
+    if file_hash.hexdigest() != manifest["sha256"]:
+        partial.unlink()
+        raise ValueError(f"Checksum mismatch restoring {manifest_path}")
+    os.replace(partial, target)
+    return target
+
+
+def _collect_unreferenced_objects(backup_dir: Path) -> None:
+    """Delete page-store chunks no remaining manifest refers to."""
+    objects_dir = backup_dir / OBJECTS_DIRNAME
+    if not objects_dir.exists():
+        return
+
+    referenced = set()
+    for manifest_path in backup_dir.glob(f"*/*{MANIFEST_SUFFIX}"):
+        referenced.update(json.loads(manifest_path.read_text())["chunks"])
+
+    removed = 0
+    for path in objects_dir.glob("*/*"):
+        if path.parent.name + path.name not in referenced:
+            path.unlink()
+            removed += 1
+    if removed:
+        logger.info("Removed %d unreferenced backup chunk(s).", removed)
+
+
 def _prune_old_backups(backup_dir: Path, retention_days: int) -> None:
     """Remove backup subdirectories older than *retention_days*."""
     if not backup_dir.exists():
@@ -72,7 +277,7 @@ def _prune_old_backups(backup_dir: Path, retention_days: int) -> None:
             continue
         try:
             # Parse the folder name back to a datetime
-            folder_dt = datetime.strptime(entry.name, "%Y-%m-%d_%H-%M")
+            folder_dt = datetime.strptime(entry.name, TIMESTAMP_FORMAT)
         except ValueError:
             continue  # skip folders that don't match the pattern
 
@@ -84,6 +289,8 @@ def _prune_old_backups(backup_dir: Path, retention_days: int) -> None:
     if removed:
         logger.info("Pruned %d backup(s) older than %d days.", removed, retention_days)
 
+    _collect_unreferenced_objects(backup_dir)
+
 
 # ── CLI entry point ───────────────────────────────────────────────────────
 if __name__ == "__main__":
@@ -91,8 +298,22 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
-    result = run_backup()
-    if result:
-        print(f"Backup complete → {result}")
+    parser = argparse.ArgumentParser(description="Back up SQLite databases")
+    parser.add_argument("--mode", choices=MODES, default=DEFAULT_MODE)
+    parser.add_argument("--retention-days", type=int, default=RETENTION_DAYS)
+    parser.add_argument(
+        "--restore",
+        nargs=2,
+        metavar=("MANIFEST", "TARGET"),
+        help="Rebuild a database from a page-store manifest",
+    )
+    args = parser.parse_args()
+
+    if args.restore:
+        print(f"Restored → {restore_backup(*args.restore)}")
     else:
-        print("No databases found to back up.")
+        result = run_backup(mode=args.mode, retention_days=args.retention_days)
+        if result:
+            print(f"Backup complete → {result}")
+        else:
+            print("No databases found to back up.")
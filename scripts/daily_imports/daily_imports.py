@@ -84,18 +84,25 @@ from routes.salesforce.teacher_import import import_teachers_from_salesforce
 from routes.salesforce.volunteer_import import (
     import_from_salesforce as import_volunteers_from_salesforce,
 )
+from services.salesforce.import_scheduler import ImportScheduler, released_write_gate
 
 
 class ImportStep:
     """Represents a single import step with its configuration."""
 
     def __init__(
-        self, name: str, function, description: str = "", chunked: bool = False
+        self,
+        name: str,
+        function,
+        description: str = "",
+        chunked: bool = False,
+        depends_on: Optional[List[str]] = None,
     ):
         self.name = name
         self.function = function
         self.description = description
         self.chunked = chunked
+        self.depends_on = depends_on or []
         self.completed = False
         self.error = None
         self.start_time = None
@@ -108,12 +115,20 @@ class ImportStep:
 class DailyImporter:
     """Main class for handling daily imports."""
 
-    def __init__(self, app: Flask, logger: logging.Logger, delta_sync: bool = True):
+    def __init__(
+        self,
+        app: Flask,
+        logger: logging.Logger,
+        delta_sync: bool = True,
+        max_workers: int = 4,
+    ):
         self.app = app
         self.logger = logger
         self.delta_sync = delta_sync  # Enable delta sync by default
+        self.max_workers = max_workers  # Concurrent steps; 1 runs them in order
 
-        # Define import sequence (matching admin.html order)
+        # Import steps (matching admin.html order). depends_on drives the
+        # scheduler; dependencies outside the selected steps are ignored.
         self.import_steps = [
             # Daily/Weekly Imports
             ImportStep(
@@ -125,21 +140,25 @@ class DailyImporter:
                 "volunteers",
                 self._import_volunteers,
                 "Import Volunteers from Salesforce (requires organizations)",
+                depends_on=["organizations"],
             ),
             ImportStep(
                 "affiliations",
                 self._import_affiliations,
                 "Import Volunteer-Organization Affiliations (requires organizations, volunteers)",
+                depends_on=["organizations", "volunteers"],
             ),
             ImportStep(
                 "events",
                 self._import_events,
-                "Import Events from Salesforce (requires organizations, schools, teachers)",
+                "Import Events from Salesforce (requires organizations, volunteers, schools, teachers)",
+                depends_on=["organizations", "volunteers", "schools", "teachers"],
             ),
             ImportStep(
                 "history",
                 self._import_history,
                 "Import History from Salesforce (requires events, volunteers, students)",
+                depends_on=["events", "volunteers", "students"],
             ),
             # Quarterly Imports
             ImportStep(
@@ -151,11 +170,13 @@ class DailyImporter:
                 "classes",
                 self._import_classes,
                 "Import Classes from Salesforce (requires schools)",
+                depends_on=["schools"],
             ),
             ImportStep(
                 "teachers",
                 self._import_teachers,
                 "Import Teachers from Salesforce (requires schools)",
+                depends_on=["schools"],
             ),
             # Yearly Imports
             ImportStep(
@@ -163,17 +184,20 @@ class DailyImporter:
                 self._import_students,
                 "Import Students from Salesforce (requires schools, classes, teachers)",
                 chunked=True,
+                depends_on=["schools", "classes", "teachers"],
             ),
             ImportStep(
                 "student_participations",
                 self._import_student_participations,
                 "Import Student Participations (requires students, events)",
+                depends_on=["students", "events"],
             ),
             # Management Functions
             ImportStep(
                 "sync_unaffiliated_events",
                 self._sync_unaffiliated_events,
                 "Sync Unaffiliated Events (requires students, events)",
+                depends_on=["students", "events"],
             ),
         ]
 
@@ -622,7 +646,9 @@ class DailyImporter:
                         break
 
                     chunk_index += 1
-                    time.sleep(sleep_ms / 1000.0)
+                    # Other steps may write while this one pauses
+                    with released_write_gate():
+                        time.sleep(sleep_ms / 1000.0)
             else:
                 # Handle regular imports
                 result = step.function()
@@ -678,23 +704,31 @@ class DailyImporter:
 
         if dry_run:
             self.logger.info("DRY RUN - Steps that would be executed:")
+            names = {step.name for step in steps_to_run}
             for step in steps_to_run:
-                self.logger.info("  - %s: %s", step.name, step.description)
+                after = [dep for dep in step.depends_on if dep in names]
+                self.logger.info(
+                    "  - %s: %s%s",
+                    step.name,
+                    step.description,
+                    f" (after {', '.join(after)})" if after else "",
+                )
             return True
 
         # Authenticate
         self.authenticate()
 
-        # Run each step
-        overall_success = True
-        for step in steps_to_run:
-            self.logger.info("=== Running step: %s ===", step.name)
-
-            success = self.run_step(step, chunk_size, sleep_ms)
-            if not success:
-                overall_success = False
-                self.logger.error("Step failed: %s", step.name)
-                # Continue with remaining steps for resilience
+        # Run steps as a dependency DAG: independent steps overlap their
+        # Salesforce fetches while DB writes stay serialized
+        global_start_time = datetime.now()
+        scheduler = ImportScheduler(
+            steps_to_run,
+            lambda step: self.run_step(step, chunk_size, sleep_ms),
+            max_workers=self.max_workers,
+            logger=self.logger,
+        )
+        results = scheduler.run()
+        overall_success = all(results.values())
 
         # Log summary
         self.logger.info("=== Import Summary ===")
@@ -718,11 +752,6 @@ class DailyImporter:
         # Send summary email
         if not dry_run:  # Or allow dry_run to send dry-run email if desired
             # Calculate total duration
-            global_start_time = (
-                steps_to_run[0].start_time
-                if steps_to_run and steps_to_run[0].start_time
-                else datetime.now()
-            )
             global_end_time = datetime.now()
             total_duration_seconds = (
                 global_end_time - global_start_time
@@ -978,6 +1007,13 @@ Examples:
         help="Sleep between student chunks in milliseconds",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("IMPORT_WORKERS", "4")),
+        help="Import steps to run concurrently (1 runs them one at a time)",
+    )
+
     # Delta sync options
     delta_group = parser.add_mutually_exclusive_group()
     delta_group.add_argument(
@@ -1037,7 +1073,9 @@ def main() -> int:
         )
 
         # Create importer
-        importer = DailyImporter(app, logger, delta_sync=use_delta_sync)
+        importer = DailyImporter(
+            app, logger, delta_sync=use_delta_sync, max_workers=args.workers
+        )
 
         # Determine which steps to run
         only_steps = None
@@ -10,7 +10,8 @@ Usage:
 
 Options:
     --seed SEED           Random seed for deterministic generation (default: random)
-    --size SIZE           Dataset size: small, medium, or large (default: medium)
+    --size SIZE           Dataset size: small, medium, large, or xlarge (default: medium)
+    --scale FACTOR        Multiplier for the xlarge preset (default: 1.0)
     --mode MODE           Generation mode: demo (happy path) or edge (boundary conditions)
     --counts MODEL=N      Custom counts per model (e.g., --counts volunteer=100 event=50)
     --reset               Clear existing data before generating (USE WITH CAUTION)
@@ -20,6 +21,13 @@ Examples:
     python scripts/generate_synthetic_data.py --size small --mode demo
     python scripts/generate_synthetic_data.py --seed 123 --size large --mode edge
     python scripts/generate_synthetic_data.py --counts volunteer=200 event=100
+    python scripts/generate_synthetic_data.py --seed 7 --size xlarge --scale 2
+
+The xlarge preset is production-scale (at --scale 1: 25,000 volunteers,
+35,000 events, ~300,000 participations and ~120,000 virtual session
+registrations). It is loaded by BulkSyntheticLoader with batched Core
+inserts instead of ORM objects, does not need Faker, and ignores --mode and
+--counts.
 """
 
 import argparse
@@ -1301,6 +1309,383 @@ class SyntheticDataGenerator:
                 raise
 
 
+# --- Bulk (production-scale) loading ---
+
+# Rows per executemany batch in bulk mode
+BULK_BATCH_SIZE = 5000
+
+# Row counts at --scale 1 for the xlarge preset (bulk mode). Every count but
+# districts is multiplied by the scale factor.
+XLARGE_COUNTS = {
+    'school': 300,
+    'organization': 2000,
+    'volunteer': 25000,
+    'teacher': 5000,
+    'event': 20000,
+    'virtual_session': 15000,
+    'participations_per_event': 15,
+    'registrations_per_session': 8,
+}
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Carlos", "Maria", "Wei", "Aisha", "Diego", "Priya",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Nguyen", "Patel", "Kim", "Okafor",
+]
+TITLE_WORDS = [
+    "Career", "Engineering", "Health", "Finance", "Design", "Coding", "Robotics",
+    "Manufacturing", "Law", "Aviation", "Agriculture", "Media", "Construction",
+]
+CAREER_CLUSTERS = ["STEM", "Arts", "Business", "Healthcare", "Trades"]
+IN_PERSON_TYPES = [
+    EventType.IN_PERSON, EventType.CAREER_SPEAKER, EventType.CAREER_FAIR,
+    EventType.CAREER_JUMPING, EventType.CLASSROOM_SPEAKER, EventType.WORKPLACE_VISIT,
+    EventType.MENTORING, EventType.CAMPUS_VISIT, EventType.EMPLOYABILITY_SKILLS,
+]
+ATTENDED = ["Attended", "Completed", "Successfully Completed"]
+
+
+class BulkSyntheticLoader:
+    """
+    Production-scale synthetic data via bulk Core inserts.
+
+    Unlike SyntheticDataGenerator (ORM objects, Faker values, periodic
+    commits) this writes pre-built row dicts with executemany in batches of
+    BULK_BATCH_SIZE, so hundreds of thousands of participations and virtual
+    session registrations load in seconds to minutes. Values come from small
+    name pools and a seeded random.Random, so the same seed and scale always
+    produce the same data. Faker is not required.
+
+    ORM flush hooks do not see Core inserts; load() rebuilds the derived
+    tables (engagement stats, search index) afterwards.
+    """
+
+    def __init__(self, seed=None, scale=1.0):
+        """
+        Args:
+            seed: Random seed for deterministic generation
+            scale: Multiplier for XLARGE_COUNTS (e.g. 0.1 or 4)
+        """
+        self.seed = seed or random.randint(1, 1000000)
+        self.scale = scale
+        self.rng = random.Random(self.seed)
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.counts = {
+            name: max(1, int(round(count * scale)))
+            if not name.endswith(('_per_event', '_per_session')) else count
+            for name, count in XLARGE_COUNTS.items()
+        }
+        self.loaded = {}
+
+    # --- Helpers ---
+
+    def _insert(self, table, rows):
+        """Insert row dicts into a table in executemany batches."""
+        connection = db.session.connection()
+        total = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= BULK_BATCH_SIZE:
+                connection.execute(table.insert(), batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            connection.execute(table.insert(), batch)
+            total += len(batch)
+        self.loaded[table.name] = self.loaded.get(table.name, 0) + total
+        return total
+
+    def _next_id(self, table):
+        """First free integer id of a table (bulk rows carry explicit ids)."""
+        current = db.session.execute(db.select(db.func.max(table.c.id))).scalar()
+        return (current or 0) + 1
+
+    def _sf_id(self, prefix, number):
+        return f"{prefix}{number:0{18 - len(prefix)}d}"
+
+    def _name(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def _event_start(self):
+        """Start between three school years ago and two months ahead, on a school day."""
+        start = self.now - timedelta(days=3 * 365)
+        offset = self.rng.randint(0, 3 * 365 + 60)
+        day = start + timedelta(days=offset)
+        if day.weekday() >= 5:
+            day -= timedelta(days=day.weekday() - 4)
+        return day.replace(hour=self.rng.randint(8, 14), minute=0, second=0, microsecond=0)
+
+    # --- Entities ---
+
+    def load_districts(self):
+        """Districts from DISTRICT_MAPPING (so district reports find them)."""
+        from routes.reports.common import DISTRICT_MAPPING
+
+        existing = {
+            sf_id for (sf_id,) in db.session.execute(db.select(District.salesforce_id))
+        }
+        rows = [
+            {
+                'salesforce_id': sf_id,
+                'name': mapping['name'],
+                'district_code': mapping.get('district_code'),
+            }
+            for sf_id, mapping in DISTRICT_MAPPING.items()
+            if sf_id not in existing
+        ]
+        self._insert(District.__table__, rows)
+        return [
+            (district_id, name)
+            for district_id, name in db.session.execute(
+                db.select(District.id, District.name)
+            )
+        ]
+
+    def load_schools(self, districts):
+        levels = ["Elementary", "Middle", "High"]
+        start = db.session.execute(db.select(db.func.count()).select_from(School)).scalar()
+        school_ids = []
+        rows = []
+        for number in range(self.counts['school']):
+            district_id, district_name = districts[number % len(districts)]
+            school_id = self._sf_id('BULKSCH', start + number)
+            level = self.rng.choice(levels)
+            name = f"{self.rng.choice(LAST_NAMES)} {level} School {number}"
+            rows.append({
+                'id': school_id,
+                'name': name,
+                'normalized_name': name.lower(),
+                'district_id': district_id,
+                'level': level,
+            })
+            school_ids.append((school_id, district_id, district_name))
+        self._insert(School.__table__, rows)
+        return school_ids
+
+    def load_organizations(self):
+        first_id = self._next_id(Organization.__table__)
+        count = self.counts['organization']
+        self._insert(Organization.__table__, (
+            {
+                'id': first_id + n,
+                'name': f"{self.rng.choice(LAST_NAMES)} {self.rng.choice(TITLE_WORDS)} Co {n}",
+                'type': self.rng.choice(["Business", "Non-profit", "Healthcare"]),
+                'salesforce_id': self._sf_id('BULKORG', first_id + n),
+            }
+            for n in range(count)
+        ))
+        return list(range(first_id, first_id + count))
+
+    def _load_contacts(self, contact_type, count):
+        """Contact and Email rows; returns the new contact ids."""
+        first_id = self._next_id(Contact.__table__)
+        ids = list(range(first_id, first_id + count))
+        names = {}
+        contacts = []
+        for contact_id in ids:
+            first, last = self._name()
+            names[contact_id] = (first, last)
+            contacts.append({
+                'id': contact_id,
+                'type': contact_type,
+                'first_name': first,
+                'last_name': last,
+                'salesforce_individual_id': self._sf_id('BULKC', contact_id),
+            })
+        self._insert(Contact.__table__, contacts)
+        self._insert(Email.__table__, (
+            {
+                'contact_id': contact_id,
+                'email': f"{first}.{last}.{contact_id}@example.org".lower(),
+                'type': ContactTypeEnum.personal if contact_type == 'volunteer' else ContactTypeEnum.professional,
+                'primary': True,
+            }
+            for contact_id, (first, last) in names.items()
+        ))
+        return ids, names
+
+    def load_volunteers(self, organization_ids):
+        ids, names = self._load_contacts('volunteer', self.counts['volunteer'])
+        titles = ["Engineer", "Manager", "Analyst", "Director", "Nurse", "Teacher"]
+        self._insert(Volunteer.__table__, (
+            {
+                'id': volunteer_id,
+                'title': self.rng.choice(titles),
+                'industry': self.rng.choice(TITLE_WORDS),
+                'local_status': self.rng.choice(list(LocalStatusEnum)),
+                'status': VolunteerStatus.ACTIVE,
+            }
+            for volunteer_id in ids
+        ))
+        self._insert(VolunteerOrganization.__table__, (
+            {
+                'volunteer_id': volunteer_id,
+                'organization_id': self.rng.choice(organization_ids),
+                'role': 'Employee',
+                'is_primary': True,
+            }
+            for volunteer_id in ids
+        ))
+        return ids, names
+
+    def load_teachers(self, schools):
+        ids, names = self._load_contacts('teacher', self.counts['teacher'])
+        self._insert(Teacher.__table__, (
+            {
+                'id': teacher_id,
+                'school_id': self.rng.choice(schools)[0],
+                'cached_email': f"{names[teacher_id][0]}.{names[teacher_id][1]}.{teacher_id}@example.org".lower(),
+                'import_source': 'bulk_synthetic',
+            }
+            for teacher_id in ids
+        ))
+        return ids
+
+    def _load_events(self, count, schools, virtual):
+        """Event rows plus event_districts links; returns (id, start, status) tuples."""
+        first_id = self._next_id(Event.__table__)
+        events = []
+        rows = []
+        links = []
+        for n in range(count):
+            event_id = first_id + n
+            school_id, district_id, district_name = self.rng.choice(schools)
+            start = self._event_start()
+            if start > self.now:
+                status = EventStatus.CONFIRMED
+            else:
+                status = EventStatus.COMPLETED if self.rng.random() < 0.9 else EventStatus.CANCELLED
+            row = {
+                'id': event_id,
+                'title': f"{self.rng.choice(TITLE_WORDS)} {'Session' if virtual else 'Day'} {event_id}",
+                'type': EventType.VIRTUAL_SESSION if virtual else self.rng.choice(IN_PERSON_TYPES),
+                'format': EventFormat.VIRTUAL if virtual else EventFormat.IN_PERSON,
+                'status': status,
+                'start_date': start,
+                'end_date': start + timedelta(hours=1 if virtual else 3),
+                'duration': 60 if virtual else 180,
+                'school': school_id,
+                'district_partner': district_name,
+                'volunteers_needed': self.rng.randint(1, 20),
+                'career_cluster': self.rng.choice(CAREER_CLUSTERS),
+                'session_host': 'PREPKC',
+                'import_source': 'bulk_synthetic',
+            }
+            if virtual:
+                row['session_id'] = str(900000000 + event_id)
+                row['pathful_session_id'] = f"bulk-{event_id}"
+                row['series'] = row['career_cluster']
+            rows.append(row)
+            links.append({'event_id': event_id, 'district_id': district_id})
+            events.append((event_id, start, status))
+        self._insert(Event.__table__, rows)
+        self._insert(db.metadata.tables['event_districts'], links)
+        return events
+
+    def load_events(self, schools):
+        return self._load_events(self.counts['event'], schools, virtual=False)
+
+    def load_virtual_sessions(self, schools):
+        return self._load_events(self.counts['virtual_session'], schools, virtual=True)
+
+    def load_participations(self, events, volunteer_ids, names, presenters=False):
+        """EventParticipation rows (volunteers, or one presenter per virtual session)."""
+        per_event = 1 if presenters else self.counts['participations_per_event']
+        per_event = min(per_event, len(volunteer_ids))
+
+        def rows():
+            for event_id, start, status in events:
+                for volunteer_id in self.rng.sample(volunteer_ids, per_event):
+                    if status == EventStatus.COMPLETED:
+                        participation_status = self.rng.choice(ATTENDED) if self.rng.random() < 0.85 else 'No-Show'
+                    else:
+                        participation_status = 'Scheduled' if status == EventStatus.CONFIRMED else 'Cancelled'
+                    first, last = names[volunteer_id]
+                    yield {
+                        'volunteer_id': volunteer_id,
+                        'event_id': event_id,
+                        'status': participation_status,
+                        'delivery_hours': (1.0 if presenters else 3.0) if participation_status in ATTENDED else None,
+                        'email': f"{first}.{last}.{volunteer_id}@example.org".lower(),
+                        'participant_type': 'Presenter' if presenters else 'Volunteer',
+                    }
+
+        return self._insert(EventParticipation.__table__, rows())
+
+    def load_registrations(self, sessions, teacher_ids):
+        """EventTeacher registrations for virtual sessions."""
+        per_session = min(self.counts['registrations_per_session'], len(teacher_ids))
+
+        def rows():
+            for event_id, start, status in sessions:
+                for teacher_id in self.rng.sample(teacher_ids, per_session):
+                    if status == EventStatus.COMPLETED:
+                        registration_status = 'attended' if self.rng.random() < 0.9 else 'no_show'
+                    else:
+                        registration_status = 'registered'
+                    yield {
+                        'event_id': event_id,
+                        'teacher_id': teacher_id,
+                        'status': registration_status,
+                        'attendance_confirmed_at': start if registration_status == 'attended' else None,
+                    }
+
+        return self._insert(db.metadata.tables['event_teacher'], rows())
+
+    def rebuild_derived(self):
+        """Rebuild tables that ORM flush hooks normally keep current."""
+        from services.volunteer_engagement_service import rebuild_engagement_stats
+        from services.volunteer_search_service import rebuild_search_index
+
+        rebuild_engagement_stats()
+        rebuild_search_index()
+
+    def load(self, rebuild=True):
+        """
+        Load the whole dataset in one transaction.
+
+        Args:
+            rebuild: Rebuild derived tables afterwards (engagement stats and
+                the volunteer search index)
+
+        Returns:
+            dict: Rows inserted per table
+        """
+        import time
+
+        started = time.perf_counter()
+        print(f"[*] Bulk loading synthetic data (seed {self.seed}, scale {self.scale})")
+        try:
+            districts = self.load_districts()
+            schools = self.load_schools(districts)
+            organization_ids = self.load_organizations()
+            volunteer_ids, names = self.load_volunteers(organization_ids)
+            teacher_ids = self.load_teachers(schools)
+            events = self.load_events(schools)
+            sessions = self.load_virtual_sessions(schools)
+            self.load_participations(events, volunteer_ids, names)
+            self.load_participations(sessions, volunteer_ids, names, presenters=True)
+            self.load_registrations(sessions, teacher_ids)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        if rebuild:
+            self.rebuild_derived()
+
+        elapsed = time.perf_counter() - started
+        for table, count in sorted(self.loaded.items()):
+            print(f"  {table:25}: {count:8}")
+        print(f"[*] Bulk load complete in {elapsed:.1f}s")
+        return dict(self.loaded)
+
+
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -1318,9 +1703,16 @@ def parse_args():
     
     parser.add_argument(
         '--size',
-        choices=['small', 'medium', 'large'],
+        choices=['small', 'medium', 'large', 'xlarge'],
         default='medium',
-        help='Dataset size preset (default: medium)'
+        help='Dataset size preset (default: medium); xlarge bulk-loads production-scale data'
+    )
+
+    parser.add_argument(
+        '--scale',
+        type=float,
+        default=1.0,
+        help='Multiplier for the xlarge preset row counts (default: 1.0)'
     )
     
     parser.add_argument(
@@ -1374,13 +1766,16 @@ def main():
     # Parse custom counts
     counts = parse_counts(args.counts)
     
-    # Create generator
-    generator = SyntheticDataGenerator(
-        seed=args.seed,
-        size=args.size,
-        mode=args.mode,
-        counts=counts
-    )
+    # Create generator (xlarge uses the bulk loader instead)
+    if args.size == 'xlarge':
+        generator = BulkSyntheticLoader(seed=args.seed, scale=args.scale)
+    else:
+        generator = SyntheticDataGenerator(
+            seed=args.seed,
+            size=args.size,
+            mode=args.mode,
+            counts=counts
+        )
     
     # Handle reset
     if args.reset:
@@ -1426,6 +1821,14 @@ def main():
                 db.session.rollback()
                 return
     
+    if args.size == 'xlarge':
+        app = create_app()
+        with app.app_context():
+            generator.load()
+        if args.export:
+            print("[WARNING] --export is not supported with --size xlarge")
+        return
+
     generator.generate()
 
     if args.export:
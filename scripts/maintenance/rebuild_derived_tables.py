@@ -0,0 +1,83 @@
+"""
+Derived Table Rebuild
+=====================
+
+Regenerates tables that are derived from other data and kept in sync
+incrementally at write time. Request handlers only read these tables, so run
+this after adding one of them, after a bulk load that bypassed the ORM hooks,
+or whenever the app logs that one is out of date.
+
+Usage:
+    python scripts/maintenance/rebuild_derived_tables.py                 # Rebuild all
+    python scripts/maintenance/rebuild_derived_tables.py --table search  # Only search
+
+Tables:
+    search     - Volunteer full-text search documents
+    educators  - Event educator links (Event.educators parsed per name)
+    engagement - Volunteer participation and email aggregates
+
+Adding new tables:
+    1. Expose a rebuild_<name>() function in its service that commits and
+       returns the number of rows written
+    2. Register it in TABLES at the bottom of this file
+"""
+
+import argparse
+import os
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app import app  # noqa: E402
+
+
+def rebuild_search():
+    from services.volunteer_search_service import rebuild_search_index
+
+    return rebuild_search_index()
+
+
+def rebuild_educators():
+    from services.educator_link_service import rebuild_educator_links
+
+    return rebuild_educator_links()
+
+
+def rebuild_engagement():
+    from services.volunteer_engagement_service import rebuild_engagement_stats
+
+    return rebuild_engagement_stats()
+
+
+# ────────────────────────────────────────────────────────
+# Registry of derived tables — add new ones here
+# ────────────────────────────────────────────────────────
+TABLES = {
+    "search": ("Volunteer Search Documents", rebuild_search),
+    "educators": ("Event Educator Links", rebuild_educators),
+    "engagement": ("Volunteer Engagement Stats", rebuild_engagement),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild derived tables from their source data."
+    )
+    parser.add_argument(
+        "--table",
+        choices=list(TABLES.keys()),
+        help="Rebuild only a specific table (default: all)",
+    )
+    args = parser.parse_args()
+
+    tables_to_run = {args.table: TABLES[args.table]} if args.table else TABLES
+
+    with app.app_context():
+        for key, (label, rebuild_fn) in tables_to_run.items():
+            print(f"[{key.upper()}] {label}")
+            print(f"  Rows written: {rebuild_fn()}")
+
+
+if __name__ == "__main__":
+    main()
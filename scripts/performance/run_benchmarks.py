@@ -0,0 +1,296 @@
+"""
+Report and Import Benchmarks
+============================
+
+Times the report and import hot paths against production-scale synthetic
+data at several dataset sizes, and writes the results to JSON so runs can be
+compared across commits.
+
+Each size gets a fresh in-memory SQLite database loaded by
+BulkSyntheticLoader (scripts/generate_synthetic_data.py) at that scale. At
+--scale 1 that is 25,000 volunteers, 35,000 events, ~300,000 participations
+and ~120,000 virtual session registrations.
+
+Benchmarks:
+    refresh_district_cache      District year-end cache refresh (last full school year)
+    compute_virtual_session_data  Virtual usage computation (last full virtual year)
+    recruitment_candidates      GET /reports/recruitment/candidates for an upcoming event
+    build_import_caches_cold    Pathful import caches from an empty lookup cache
+    build_import_caches_warm    Pathful import caches from a built lookup cache
+    volunteers_list             GET /volunteers (first page, default sort)
+
+Usage:
+    python scripts/performance/run_benchmarks.py [options]
+
+Options:
+    --scales LIST       Comma-separated dataset scales (default: 0.05,0.2,1)
+    --repeat N          Timed runs per benchmark (default: 3)
+    --seed SEED         Random seed for the synthetic data (default: 42)
+    --only NAMES        Comma-separated benchmark names to run (default: all)
+    --output PATH       Results JSON (default: benchmark_results.json)
+    --compare PATH      Earlier results JSON; report benchmarks that slowed down
+    --threshold RATIO   Slowdown ratio reported as a regression (default: 1.25)
+
+Examples:
+    python scripts/performance/run_benchmarks.py --scales 0.05 --repeat 1
+    python scripts/performance/run_benchmarks.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from werkzeug.security import generate_password_hash
+
+from app import create_app
+from config import TestingConfig
+from models import db
+from models.event import Event
+from models.user import User
+from scripts.generate_synthetic_data import BulkSyntheticLoader
+
+
+def _previous_school_year():
+    """Last complete school year in 'YYZZ' format."""
+    from routes.reports.common import get_current_school_year
+
+    current = get_current_school_year()
+    return f"{int(current[:2]) - 1:02d}{int(current[2:]) - 1:02d}"
+
+
+def _previous_virtual_year():
+    """Last complete virtual year in 'YYYY-YYYY' format."""
+    from routes.reports.common import get_current_virtual_year
+
+    start = int(get_current_virtual_year().split("-")[0]) - 1
+    return f"{start}-{start + 1}"
+
+
+def _login_client(app):
+    """Test client logged in as a benchmark admin user."""
+    admin = User(
+        username="benchmark_admin",
+        email="benchmark_admin@example.com",
+        password_hash=generate_password_hash("benchmark"),
+        is_admin=True,
+    )
+    db.session.add(admin)
+    db.session.commit()
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["_user_id"] = str(admin.id)
+        session["_fresh"] = True
+    return client
+
+
+def _get(client, url):
+    response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f"GET {url} returned {response.status_code}")
+    return response
+
+
+def build_benchmarks(client):
+    """Benchmark name -> (setup or None, callable) for the loaded database."""
+    from routes.reports.common import get_virtual_year_dates
+    from routes.reports.district_year_end.computation import refresh_district_cache
+    from routes.virtual.pathful_import.lookup_cache import clear_lookup_caches
+    from routes.virtual.pathful_import.matching import build_import_caches
+    from routes.virtual.usage.computation import compute_virtual_session_data
+
+    school_year = _previous_school_year()
+    virtual_year = _previous_virtual_year()
+    date_from, date_to = get_virtual_year_dates(virtual_year)
+    upcoming = (
+        Event.query.filter(Event.start_date >= datetime.now())
+        .order_by(Event.start_date)
+        .first()
+    )
+    candidates_url = "/reports/recruitment/candidates"
+    if upcoming is not None:
+        candidates_url += f"?event_id={upcoming.id}"
+
+    return {
+        "refresh_district_cache": (
+            None,
+            lambda: refresh_district_cache(school_year),
+        ),
+        "compute_virtual_session_data": (
+            None,
+            lambda: compute_virtual_session_data(virtual_year, date_from, date_to, {}),
+        ),
+        "recruitment_candidates": (None, lambda: _get(client, candidates_url)),
+        "build_import_caches_cold": (clear_lookup_caches, build_import_caches),
+        "build_import_caches_warm": (build_import_caches, build_import_caches),
+        "volunteers_list": (None, lambda: _get(client, "/volunteers")),
+    }
+
+
+def time_benchmark(setup, func, repeat):
+    """Run func ``repeat`` times; returns timing statistics in seconds."""
+    timings = []
+    # Several hot paths print progress; keep it out of the results
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            db.session.expire_all()
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+            db.session.rollback()
+    return {
+        "runs": len(timings),
+        "min": round(min(timings), 4),
+        "median": round(statistics.median(timings), 4),
+        "mean": round(statistics.mean(timings), 4),
+        "max": round(max(timings), 4),
+    }
+
+
+def run_scale(scale, seed, repeat, only=None):
+    """Load one dataset size into a fresh database and run the benchmarks."""
+    app = create_app(config_class=TestingConfig)
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        rows = BulkSyntheticLoader(seed=seed, scale=scale).load()
+        load_seconds = time.perf_counter() - started
+
+        client = _login_client(app)
+        results = {}
+        for name, (setup, func) in build_benchmarks(client).items():
+            if only and name not in only:
+                continue
+            print(f"  {name} ...", end=" ", flush=True)
+            results[name] = time_benchmark(setup, func, repeat)
+            print(f"median {results[name]['median']:.3f}s")
+        db.session.remove()
+
+    return {
+        "scale": scale,
+        "rows": rows,
+        "load_seconds": round(load_seconds, 2),
+        "benchmarks": results,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(scales, seed=42, repeat=3, only=None, output=None):
+    """
+    Run every benchmark at every scale.
+
+    Returns:
+        dict: Results document (also written to ``output`` when given)
+    """
+    document = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "database": "sqlite (in-memory)",
+        "seed": seed,
+        "repeat": repeat,
+        "results": [],
+    }
+    for scale in scales:
+        print(f"[*] Scale {scale}")
+        document["results"].append(run_scale(scale, seed, repeat, only))
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"[*] Results written to {output}")
+    return document
+
+
+def compare_results(current, previous, threshold=1.25):
+    """
+    Compare median timings with an earlier results document.
+
+    Returns:
+        list: (scale, benchmark, previous median, current median, ratio) for
+        benchmarks whose median grew by at least ``threshold``
+    """
+    earlier = {
+        (result["scale"], name): stats["median"]
+        for result in previous.get("results", [])
+        for name, stats in result["benchmarks"].items()
+    }
+    regressions = []
+    for result in current["results"]:
+        for name, stats in result["benchmarks"].items():
+            before = earlier.get((result["scale"], name))
+            if not before:
+                continue
+            ratio = stats["median"] / before
+            print(
+                f"  scale {result['scale']:<6} {name:30} "
+                f"{before:8.3f}s -> {stats['median']:8.3f}s  x{ratio:.2f}"
+            )
+            if ratio >= threshold:
+                regressions.append(
+                    (result["scale"], name, before, stats["median"], ratio)
+                )
+    return regressions
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark report and import hot paths on synthetic data",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--scales", default="0.05,0.2,1")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", default=None)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", default=None, metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    logging.disable(logging.INFO)
+
+    scales = [float(scale) for scale in args.scales.split(",") if scale.strip()]
+    only = set(args.only.split(",")) if args.only else None
+    document = run_benchmarks(scales, args.seed, args.repeat, only, args.output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"[*] Compared with {args.compare}")
+        regressions = compare_results(document, previous, args.threshold)
+        if regressions:
+            print(f"[!] {len(regressions)} benchmark(s) slowed by x{args.threshold}+")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,7 @@ def reconcile(commit: bool = False):
         from models.pathful_import import PathfulUserProfile
         from models.teacher_progress import TeacherProgress
         from services.teacher_matching_service import (
+            build_profile_name_index,
             match_tp_to_profile,
             resolve_teacher_for_tp,
         )
@@ -54,6 +55,7 @@ def reconcile(commit: bool = False):
             tenant_id=1, academic_year="2025-2026", is_active=True
         ).all()
 
+        profile_index = build_profile_name_index()
         profile_linked = 0
         for tp in tps:
             if tp.pathful_user_id:
@@ -67,7 +69,7 @@ def reconcile(commit: bool = False):
                     print(f"  LINKED (pathful_id): TP {tp.id} [{tp.name}]")
                 continue
 
-            profile = match_tp_to_profile(tp)
+            profile = match_tp_to_profile(tp, profile_index=profile_index)
             if profile:
                 profile_linked += 1
                 print(f"  LINKED: TP {tp.id} [{tp.name}] → Profile [{profile.name}]")
@@ -0,0 +1,452 @@
+"""
+Report Cache Dependency Service
+===============================
+
+Dependency registry and event-driven invalidation for the report cache
+tables in models/reports.py.
+
+Every cache row can record the entities it was built from (event ids,
+district ids, organization ids, school year) in ReportCacheDependency.
+A SQLAlchemy ``after_flush`` hook watches Event, EventParticipation,
+EventTeacher and EventStudentParticipation writes and invalidates only the
+cache rows whose dependencies match the changed entities.
+
+Invalidation Policies:
+    - delete: Write-through caches that self-heal on next access
+      (virtual session, organization, volunteer, recruitment caches)
+    - mark_stale: Caches that pages treat as the source of truth
+      (DistrictYearEndReport). The row keeps serving but its last_updated
+      is set to INVALIDATED_AT so the next refresh regenerates it.
+
+Rows with no registered dependencies are left alone by the hooks and keep
+the existing TTL / post-import invalidation behavior.
+
+Usage:
+    from services.cache_dependency_service import (
+        register_cache_dependencies,
+        record_cache_lookup,
+        get_cache_metrics,
+    )
+
+    register_cache_dependencies(cache_record, school_year="2425",
+                                district_ids=[district.id])
+    record_cache_lookup("virtual_session_report_cache", hit=True)
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from sqlalchemy import delete
+from sqlalchemy import event as sa_event
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.orm import Session, attributes
+
+from models import db
+from models.event import Event, EventStudentParticipation, EventTeacher
+from models.organization import VolunteerOrganization
+from models.reports import (
+    DistrictYearEndReport,
+    FirstTimeVolunteerReportCache,
+    OrganizationDetailCache,
+    OrganizationReport,
+    OrganizationSummaryCache,
+    RecentVolunteersReportCache,
+    RecruitmentCandidatesCache,
+    ReportCacheDependency,
+    VirtualSessionDistrictCache,
+    VirtualSessionReportCache,
+)
+from models.school_model import School
+from models.teacher import Teacher
+from models.volunteer import EventParticipation
+
+logger = logging.getLogger(__name__)
+
+ENTITY_EVENT = "event"
+ENTITY_DISTRICT = "district"
+ENTITY_ORGANIZATION = "organization"
+ENTITY_SCHOOL_YEAR = "school_year"
+
+POLICY_DELETE = "delete"
+POLICY_MARK_STALE = "mark_stale"
+
+# last_updated value written to rows invalidated with POLICY_MARK_STALE
+INVALIDATED_AT = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Cache tables participating in dependency tracking, keyed by table name
+TRACKED_CACHE_MODELS = {
+    model.__tablename__: (model, policy)
+    for model, policy in (
+        (VirtualSessionReportCache, POLICY_DELETE),
+        (VirtualSessionDistrictCache, POLICY_DELETE),
+        (OrganizationReport, POLICY_DELETE),
+        (OrganizationSummaryCache, POLICY_DELETE),
+        (OrganizationDetailCache, POLICY_DELETE),
+        (RecentVolunteersReportCache, POLICY_DELETE),
+        (FirstTimeVolunteerReportCache, POLICY_DELETE),
+        (RecruitmentCandidatesCache, POLICY_DELETE),
+        (DistrictYearEndReport, POLICY_MARK_STALE),
+    )
+}
+
+# Keep IN lists well under SQLite's bound parameter limit
+_CHUNK_SIZE = 500
+
+_metrics_lock = threading.Lock()
+_metrics = defaultdict(lambda: {"hits": 0, "misses": 0, "invalidations": 0})
+
+
+# --- Metrics ---------------------------------------------------------------
+
+
+def record_cache_lookup(cache_name, hit):
+    """Count a cache hit or miss for the cache management page."""
+    with _metrics_lock:
+        _metrics[cache_name]["hits" if hit else "misses"] += 1
+
+
+def _record_invalidations(cache_name, count):
+    with _metrics_lock:
+        _metrics[cache_name]["invalidations"] += count
+
+
+def get_cache_metrics():
+    """
+    Get in-process hit/miss/invalidation counters for every tracked cache.
+
+    Returns:
+        dict: cache table name -> {"hits", "misses", "invalidations", "hit_rate"}
+    """
+    with _metrics_lock:
+        snapshot = {name: dict(counts) for name, counts in _metrics.items()}
+
+    for name in TRACKED_CACHE_MODELS:
+        snapshot.setdefault(name, {"hits": 0, "misses": 0, "invalidations": 0})
+
+    for counts in snapshot.values():
+        lookups = counts["hits"] + counts["misses"]
+        counts["hit_rate"] = (
+            round(counts["hits"] / lookups * 100, 1) if lookups else None
+        )
+    return dict(sorted(snapshot.items()))
+
+
+def reset_cache_metrics():
+    """Reset all in-process cache counters."""
+    with _metrics_lock:
+        _metrics.clear()
+
+
+# --- Registration ----------------------------------------------------------
+
+
+def school_year_for_date(value):
+    """Return the 'YYZZ' school year (Aug 1 - Jul 31) containing a date."""
+    if value is None:
+        return None
+    start_year = value.year if value.month >= 8 else value.year - 1
+    return f"{str(start_year)[-2:]}{str(start_year + 1)[-2:]}"
+
+
+def virtual_year_to_school_year(virtual_year):
+    """Convert a virtual year ('2024-2025') to a school year ('2425')."""
+    try:
+        start_year, end_year = (int(part) for part in virtual_year.split("-"))
+    except (AttributeError, ValueError):
+        return None
+    if start_year < 1000 or end_year < 1000:
+        return None
+    return f"{str(start_year)[-2:]}{str(end_year)[-2:]}"
+
+
+def register_cache_dependencies(
+    cache_record,
+    school_year=None,
+    event_ids=(),
+    district_ids=(),
+    organization_ids=(),
+    year_wide=False,
+):
+    """
+    Record the entities a cache row was built from, replacing any prior set.
+
+    Must be called inside the caller's transaction before it commits. The
+    cache row is flushed first if it has no primary key yet.
+
+    Args:
+        cache_record: Instance of one of the TRACKED_CACHE_MODELS
+        school_year: 'YYZZ' school year the row covers
+        event_ids: Events the row was computed from
+        district_ids: Districts the row is scoped to (within school_year)
+        organization_ids: Organizations the row is scoped to (within school_year)
+        year_wide: True if any event change in school_year affects the row
+    """
+    cache_table = cache_record.__tablename__
+    if cache_table not in TRACKED_CACHE_MODELS:
+        raise ValueError(f"{cache_table} is not a tracked cache table")
+
+    if cache_record.id is None:
+        db.session.flush()
+
+    rows = [(ENTITY_EVENT, event_id, None) for event_id in set(event_ids)]
+    if school_year:
+        rows.extend(
+            (ENTITY_DISTRICT, district_id, school_year)
+            for district_id in set(district_ids)
+        )
+        rows.extend(
+            (ENTITY_ORGANIZATION, org_id, school_year)
+            for org_id in set(organization_ids)
+        )
+        if year_wide:
+            rows.append((ENTITY_SCHOOL_YEAR, school_year, None))
+
+    db.session.execute(
+        delete(ReportCacheDependency).where(
+            ReportCacheDependency.cache_table == cache_table,
+            ReportCacheDependency.cache_id == cache_record.id,
+        )
+    )
+    if rows:
+        now = datetime.now(timezone.utc)
+        db.session.execute(
+            insert(ReportCacheDependency),
+            [
+                {
+                    "cache_table": cache_table,
+                    "cache_id": cache_record.id,
+                    "entity_type": entity_type,
+                    "entity_id": str(entity_id),
+                    "school_year": sy,
+                    "created_at": now,
+                }
+                for entity_type, entity_id, sy in rows
+            ],
+        )
+
+
+def untracked_filter(model):
+    """Filter clause selecting cache rows with no registered dependencies."""
+    tracked_ids = select(ReportCacheDependency.cache_id).where(
+        ReportCacheDependency.cache_table == model.__tablename__
+    )
+    return ~model.id.in_(tracked_ids)
+
+
+def is_invalidated(cache_record):
+    """True if a mark_stale cache row was invalidated by a dependency change."""
+    if not cache_record or cache_record.last_updated is None:
+        return False
+    last_updated = cache_record.last_updated
+    if last_updated.tzinfo is None:
+        last_updated = last_updated.replace(tzinfo=timezone.utc)
+    return last_updated <= INVALIDATED_AT
+
+
+# --- Invalidation ----------------------------------------------------------
+
+
+def _chunks(values):
+    values = list(values)
+    for i in range(0, len(values), _CHUNK_SIZE):
+        yield values[i : i + _CHUNK_SIZE]
+
+
+def _collect_changes(session):
+    """Collect changed event ids, volunteer ids and known start dates."""
+    event_ids = set()
+    volunteer_ids = set()
+    start_dates = []
+
+    def history_values(obj, attr):
+        hist = attributes.get_history(obj, attr)
+        return [v for v in (*hist.added, *hist.unchanged, *hist.deleted) if v]
+
+    changed = [
+        *session.new,
+        *session.deleted,
+        *(obj for obj in session.dirty if session.is_modified(obj)),
+    ]
+    for obj in changed:
+        if isinstance(obj, Event):
+            if obj.id is not None:
+                event_ids.add(obj.id)
+            start_dates.extend(history_values(obj, "start_date"))
+        elif isinstance(
+            obj, (EventParticipation, EventTeacher, EventStudentParticipation)
+        ):
+            event_ids.update(history_values(obj, "event_id"))
+            if isinstance(obj, EventParticipation):
+                volunteer_ids.update(history_values(obj, "volunteer_id"))
+
+    return event_ids, volunteer_ids, start_dates
+
+
+def _touched_keys(connection, event_ids, volunteer_ids, start_dates):
+    """Resolve changed events into the dependency keys they affect."""
+    event_table = Event.__table__
+    districts_table = Event.__table__.metadata.tables["event_districts"]
+    school_table = School.__table__
+    teacher_table = Teacher.__table__
+    event_teacher_table = EventTeacher.__table__
+    participation_table = EventParticipation.__table__
+    vol_org_table = VolunteerOrganization.__table__
+
+    years_by_event = {}
+    district_ids = set()
+    org_ids = set()
+    for chunk in _chunks(event_ids):
+        for event_id, start_date in connection.execute(
+            select(event_table.c.id, event_table.c.start_date).where(
+                event_table.c.id.in_(chunk)
+            )
+        ):
+            years_by_event[event_id] = school_year_for_date(start_date)
+        district_ids.update(
+            connection.execute(
+                select(districts_table.c.district_id).where(
+                    districts_table.c.event_id.in_(chunk)
+                )
+            ).scalars()
+        )
+        district_ids.update(
+            connection.execute(
+                select(school_table.c.district_id)
+                .join(event_table, event_table.c.school == school_table.c.id)
+                .where(event_table.c.id.in_(chunk))
+            ).scalars()
+        )
+        # Virtual sessions are attributed through the teachers' schools
+        district_ids.update(
+            connection.execute(
+                select(school_table.c.district_id)
+                .join(teacher_table, teacher_table.c.school_id == school_table.c.id)
+                .join(
+                    event_teacher_table,
+                    event_teacher_table.c.teacher_id == teacher_table.c.id,
+                )
+                .where(event_teacher_table.c.event_id.in_(chunk))
+            ).scalars()
+        )
+        org_ids.update(
+            connection.execute(
+                select(vol_org_table.c.organization_id)
+                .join(
+                    participation_table,
+                    participation_table.c.volunteer_id == vol_org_table.c.volunteer_id,
+                )
+                .where(participation_table.c.event_id.in_(chunk))
+            ).scalars()
+        )
+    for chunk in _chunks(volunteer_ids):
+        org_ids.update(
+            connection.execute(
+                select(vol_org_table.c.organization_id).where(
+                    vol_org_table.c.volunteer_id.in_(chunk)
+                )
+            ).scalars()
+        )
+
+    years = {y for y in years_by_event.values() if y}
+    years.update(school_year_for_date(d) for d in start_dates)
+    return {
+        ENTITY_EVENT: {str(e) for e in event_ids},
+        ENTITY_DISTRICT: {str(d) for d in district_ids if d is not None},
+        ENTITY_ORGANIZATION: {str(o) for o in org_ids if o is not None},
+        ENTITY_SCHOOL_YEAR: years,
+    }
+
+
+def _matching_cache_rows(connection, keys):
+    """Find (cache_table, cache_id) pairs whose dependencies match the keys."""
+    dep = ReportCacheDependency.__table__
+    years = keys[ENTITY_SCHOOL_YEAR]
+    matches = set()
+
+    def run(clause):
+        matches.update(
+            connection.execute(select(dep.c.cache_table, dep.c.cache_id).where(clause))
+        )
+
+    for chunk in _chunks(keys[ENTITY_EVENT]):
+        run((dep.c.entity_type == ENTITY_EVENT) & dep.c.entity_id.in_(chunk))
+    if years:
+        run(
+            (dep.c.entity_type == ENTITY_SCHOOL_YEAR) & dep.c.entity_id.in_(list(years))
+        )
+        for entity_type in (ENTITY_DISTRICT, ENTITY_ORGANIZATION):
+            for chunk in _chunks(keys[entity_type]):
+                run(
+                    (dep.c.entity_type == entity_type)
+                    & dep.c.entity_id.in_(chunk)
+                    & or_(dep.c.school_year.is_(None), dep.c.school_year.in_(years))
+                )
+    return matches
+
+
+def invalidate_dependent_caches(
+    connection, event_ids, volunteer_ids=(), start_dates=()
+):
+    """
+    Invalidate cache rows built from the given events or volunteers.
+
+    Runs on the caller's connection so it joins the surrounding transaction.
+
+    Returns:
+        dict: cache table name -> number of rows invalidated
+    """
+    if not event_ids and not volunteer_ids:
+        return {}
+
+    keys = _touched_keys(connection, event_ids, volunteer_ids, start_dates)
+    matches = _matching_cache_rows(connection, keys)
+    if not matches:
+        return {}
+
+    ids_by_table = defaultdict(set)
+    for cache_table, cache_id in matches:
+        ids_by_table[cache_table].add(cache_id)
+
+    dep = ReportCacheDependency.__table__
+    results = {}
+    for cache_table, cache_ids in ids_by_table.items():
+        if cache_table not in TRACKED_CACHE_MODELS:
+            continue
+        model, policy = TRACKED_CACHE_MODELS[cache_table]
+        table = model.__table__
+        for chunk in _chunks(cache_ids):
+            if policy == POLICY_MARK_STALE:
+                connection.execute(
+                    update(table)
+                    .where(table.c.id.in_(chunk))
+                    .values(last_updated=INVALIDATED_AT)
+                )
+            else:
+                connection.execute(delete(table).where(table.c.id.in_(chunk)))
+            connection.execute(
+                delete(dep).where(
+                    dep.c.cache_table == cache_table, dep.c.cache_id.in_(chunk)
+                )
+            )
+        results[cache_table] = len(cache_ids)
+        _record_invalidations(cache_table, len(cache_ids))
+
+    logger.info("Dependency-tracked cache invalidation: %s", results)
+    return results
+
+
+def _invalidate_after_flush(session, flush_context):
+    """after_flush hook: invalidate cache rows affected by this flush."""
+    event_ids, volunteer_ids, start_dates = _collect_changes(session)
+    if event_ids or volunteer_ids:
+        invalidate_dependent_caches(
+            session.connection(), event_ids, volunteer_ids, start_dates
+        )
+
+
+def register_cache_invalidation_hooks():
+    """Attach the after_flush invalidation hook (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _invalidate_after_flush):
+        sa_event.listen(Session, "after_flush", _invalidate_after_flush)
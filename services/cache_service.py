@@ -15,6 +15,7 @@ Usage:
         get_virtual_session_cache,
         save_virtual_session_cache,
         get_virtual_session_district_cache,
+        get_virtual_session_district_summaries,
         save_virtual_session_district_cache,
         invalidate_virtual_session_caches,
     )
@@ -23,8 +24,25 @@ Usage:
 from datetime import datetime, timezone
 
 from models import db
+from models.district_model import District
 from models.reports import VirtualSessionDistrictCache, VirtualSessionReportCache
 from routes.reports.common import is_cache_valid
+from services.cache_dependency_service import (
+    record_cache_lookup,
+    register_cache_dependencies,
+    virtual_year_to_school_year,
+)
+
+
+def _session_event_ids(session_data):
+    """Extract event ids from cached session rows (list of dicts)."""
+    if not isinstance(session_data, list):
+        return []
+    return [
+        row["event_id"]
+        for row in session_data
+        if isinstance(row, dict) and row.get("event_id") is not None
+    ]
 
 
 def get_virtual_session_cache(virtual_year, date_from=None, date_to=None):
@@ -48,8 +66,10 @@ def get_virtual_session_cache(virtual_year, date_from=None, date_to=None):
     cache_record = cache_query.first()
 
     if is_cache_valid(cache_record):
+        record_cache_lookup(VirtualSessionReportCache.__tablename__, hit=True)
         return cache_record
 
+    record_cache_lookup(VirtualSessionReportCache.__tablename__, hit=False)
     return None
 
 
@@ -102,6 +122,13 @@ def save_virtual_session_cache(
             )
             db.session.add(cache_record)
 
+        # Any event change within the year affects the year-wide report
+        register_cache_dependencies(
+            cache_record,
+            school_year=virtual_year_to_school_year(virtual_year),
+            year_wide=True,
+        )
+
         db.session.commit()
         print(f"Virtual session cache saved for {virtual_year}")
 
@@ -135,11 +162,63 @@ def get_virtual_session_district_cache(
     cache_record = cache_query.first()
 
     if is_cache_valid(cache_record):
+        record_cache_lookup(VirtualSessionDistrictCache.__tablename__, hit=True)
         return cache_record
 
+    record_cache_lookup(VirtualSessionDistrictCache.__tablename__, hit=False)
     return None
 
 
+def get_virtual_session_district_summaries(
+    district_names, virtual_year, date_from=None, date_to=None
+):
+    """
+    Get cached summary statistics for several districts in one query.
+
+    Only the summary_stats column is read; the session rows and breakdowns
+    stored alongside it are left in the database.
+
+    Args:
+        district_names: District names to look up
+        virtual_year: The virtual year
+        date_from: Optional start date filter
+        date_to: Optional end date filter
+
+    Returns:
+        dict: district name -> summary_stats for valid cache rows; districts
+        without a valid row are omitted
+    """
+    district_names = list(district_names)
+    if not district_names:
+        return {}
+
+    rows = db.session.execute(
+        db.select(
+            VirtualSessionDistrictCache.district_name,
+            VirtualSessionDistrictCache.summary_stats,
+            VirtualSessionDistrictCache.last_updated,
+        ).filter(
+            VirtualSessionDistrictCache.district_name.in_(district_names),
+            VirtualSessionDistrictCache.virtual_year == virtual_year,
+            VirtualSessionDistrictCache.date_from
+            == (date_from.date() if date_from else None),
+            VirtualSessionDistrictCache.date_to
+            == (date_to.date() if date_to else None),
+        )
+    ).all()
+
+    summaries = {
+        row.district_name: row.summary_stats
+        for row in rows
+        if is_cache_valid(row) and row.summary_stats
+    }
+    for name in district_names:
+        record_cache_lookup(
+            VirtualSessionDistrictCache.__tablename__, hit=name in summaries
+        )
+    return summaries
+
+
 def save_virtual_session_district_cache(
     district_name,
     virtual_year,
@@ -197,6 +276,14 @@ def save_virtual_session_district_cache(
             )
             db.session.add(cache_record)
 
+        district = District.query.filter_by(name=district_name).first()
+        register_cache_dependencies(
+            cache_record,
+            school_year=virtual_year_to_school_year(virtual_year),
+            event_ids=_session_event_ids(session_data),
+            district_ids=[district.id] if district else [],
+        )
+
         db.session.commit()
         print(
             f"Virtual session district cache saved for {district_name} {virtual_year}"
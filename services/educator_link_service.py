@@ -0,0 +1,252 @@
+"""
+Educator Link Service
+=====================
+
+Maintains the EventEducator link table (models/event.py): one row per
+educator name in the semicolon-separated Event.educators text, with the
+name normalized (teacher_matching_service.normalize_name) and resolved to
+the registered Teacher where possible.
+
+Readers that used to load every event and split its educators text
+(session counts, teacher detail, reminder batches) filter or group on the
+indexed link table instead.
+
+Links are kept current by an ``after_flush`` hook that re-derives them for
+every event whose educators text or teacher registrations changed in the
+flush. Writes that bypass the ORM call sync_educator_links() for the events
+they change; rebuild_educator_links() regenerates the whole table
+(scripts/maintenance/rebuild_derived_tables.py).
+
+Usage:
+    from services.educator_link_service import educator_event_ids
+
+    event_ids = educator_event_ids(
+        ["jane smith"], Event.status == EventStatus.COMPLETED
+    )
+"""
+
+import logging
+import weakref
+
+from sqlalchemy import delete
+from sqlalchemy import event as sa_event
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.orm import Session
+
+from models import db
+from models.contact import Contact
+from models.event import Event, EventEducator, EventTeacher
+from services.teacher_matching_service import normalize_name
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 500
+
+
+def _chunks(ids, size=_CHUNK_SIZE):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def parse_educators(text):
+    """
+    Split Event.educators text into (name, normalized_name) pairs.
+
+    Blank entries are dropped, and so are repeats of a normalized name.
+    """
+    pairs = []
+    seen = set()
+    for name in (text or "").split(";"):
+        name = name.strip()
+        normalized = normalize_name(name)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            pairs.append((name, normalized))
+    return pairs
+
+
+def _registered_teachers(connection, event_ids):
+    """(event_id, normalized teacher name) -> teacher_id for EventTeacher rows."""
+    rows = connection.execute(
+        select(
+            EventTeacher.event_id,
+            EventTeacher.teacher_id,
+            Contact.first_name,
+            Contact.middle_name,
+            Contact.last_name,
+        )
+        .join(Contact, Contact.id == EventTeacher.teacher_id)
+        .where(EventTeacher.event_id.in_(event_ids))
+    )
+    teachers = {}
+    for event_id, teacher_id, first, middle, last in rows:
+        full_names = [f"{first} {last}"]
+        if middle:
+            full_names.append(f"{first} {middle} {last}")
+        for full_name in full_names:
+            teachers.setdefault((event_id, normalize_name(full_name)), teacher_id)
+    return teachers
+
+
+def sync_educator_links(event_ids=None, connection=None):
+    """
+    Re-derive EventEducator rows from Event.educators.
+
+    Args:
+        event_ids: Events to refresh; None refreshes every event
+        connection: Connection to write through (defaults to the session's)
+
+    Returns:
+        Number of link rows written. Does not commit.
+    """
+    connection = connection or db.session.connection()
+    if event_ids is None:
+        connection.execute(delete(EventEducator))
+        event_ids = connection.execute(
+            select(Event.id).where(Event.educators.isnot(None))
+        ).scalars()
+
+    written = 0
+    for chunk in _chunks(event_ids):
+        connection.execute(
+            delete(EventEducator).where(EventEducator.event_id.in_(chunk))
+        )
+        texts = connection.execute(
+            select(Event.id, Event.educators).where(
+                Event.id.in_(chunk), Event.educators.isnot(None)
+            )
+        ).all()
+        if not texts:
+            continue
+        teachers = _registered_teachers(connection, [event_id for event_id, _ in texts])
+        rows = [
+            {
+                "event_id": event_id,
+                "name": name,
+                "normalized_name": normalized,
+                "teacher_id": teachers.get((event_id, normalized)),
+            }
+            for event_id, text in texts
+            for name, normalized in parse_educators(text)
+        ]
+        if rows:
+            connection.execute(insert(EventEducator), rows)
+            written += len(rows)
+    return written
+
+
+def rebuild_educator_links():
+    """Rebuild every educator link and commit. Returns rows written."""
+    written = sync_educator_links()
+    db.session.commit()
+    logger.info("Rebuilt educator links: %s rows", written)
+    return written
+
+
+# ── Queries ───────────────────────────────────────────────────────────
+
+
+def educator_names_for_events(*criteria):
+    """
+    (event_id, educator name) pairs for events matching *criteria*.
+
+    Args:
+        *criteria: SQL filter expressions on Event
+    """
+    return (
+        db.session.query(EventEducator.event_id, EventEducator.name)
+        .join(Event, Event.id == EventEducator.event_id)
+        .filter(*criteria)
+        .order_by(EventEducator.event_id, EventEducator.id)
+        .all()
+    )
+
+
+def educator_names_by_event(event_ids):
+    """(event_id, educator name) pairs for the given events."""
+    pairs = []
+    for chunk in _chunks(event_ids):
+        pairs.extend(
+            db.session.query(EventEducator.event_id, EventEducator.name)
+            .filter(EventEducator.event_id.in_(chunk))
+            .order_by(EventEducator.event_id, EventEducator.id)
+        )
+    return pairs
+
+
+def educator_event_ids(names, *criteria):
+    """
+    Ids of events matching *criteria* that list any of *names* as educator.
+
+    Names are compared normalized, through the normalized_name index.
+    """
+    keys = {normalize_name(name) for name in names if name}
+    keys.discard("")
+    if not keys:
+        return set()
+    rows = (
+        db.session.query(EventEducator.event_id)
+        .join(Event, Event.id == EventEducator.event_id)
+        .filter(EventEducator.normalized_name.in_(keys), *criteria)
+        .distinct()
+    )
+    return {event_id for (event_id,) in rows}
+
+
+# ── Keeping links in sync ─────────────────────────────────────────────
+
+
+def _collect_event_ids(session):
+    """Events whose educator links are affected by this flush."""
+    event_ids = set()
+    for obj in session.new:
+        if isinstance(obj, Event) and obj.educators:
+            event_ids.add(obj.id)
+        elif isinstance(obj, EventTeacher):
+            event_ids.add(obj.event_id)
+    for obj in session.dirty:
+        if isinstance(obj, Event):
+            if inspect(obj).attrs.educators.history.has_changes():
+                event_ids.add(obj.id)
+        elif isinstance(obj, EventTeacher):
+            event_ids.add(obj.event_id)
+    for obj in session.deleted:
+        if isinstance(obj, Event):
+            event_ids.add(obj.id)
+        elif isinstance(obj, EventTeacher):
+            event_ids.add(obj.event_id)
+    event_ids.discard(None)
+    return event_ids
+
+
+_ready_engines = weakref.WeakKeyDictionary()
+
+
+def _engine(session):
+    bind = session.get_bind()
+    return getattr(bind, "engine", bind)
+
+
+def _links_table_exists(session):
+    """Whether the link table exists (cached once found)."""
+    engine = _engine(session)
+    if _ready_engines.get(engine):
+        return True
+    found = inspect(session.connection()).has_table(EventEducator.__tablename__)
+    if found:
+        _ready_engines[engine] = True
+    return found
+
+
+def _sync_after_flush(session, flush_context):
+    """after_flush hook: re-derive links for events changed in this flush."""
+    event_ids = _collect_event_ids(session)
+    if event_ids and _links_table_exists(session):
+        sync_educator_links(event_ids, connection=session.connection())
+
+
+def register_educator_link_hooks():
+    """Attach the after_flush educator link hook (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _sync_after_flush):
+        sa_event.listen(Session, "after_flush", _sync_after_flush)
@@ -0,0 +1,486 @@
+"""
+Email Outbox Service
+====================
+
+Durable outbox for transactional email sent from request handlers (magic
+links, public event signup confirmations).
+
+Handlers call enqueue_email(), which stores the rendered email in the
+email_outbox table and returns immediately, so request latency no longer
+depends on the mail provider. A background OutboxWorker thread delivers due
+entries in batches over pooled provider connections
+(utils/email_provider.py). Failed deliveries are retried with exponential
+backoff up to MAX_ATTEMPTS; entries that cannot be delivered at all
+(delivery disabled, no provider configured, blocked by the allowlist) are
+marked SKIPPED.
+
+Enqueue-to-send latency is recorded for every delivered entry; the worker
+logs p50/p95 per batch and outbox_latency_stats() reports them over any
+window.
+
+Usage:
+    from services.email_outbox_service import enqueue_email
+
+    enqueue_email(
+        recipient="teacher@example.org",
+        subject="Your link",
+        html_body=html,
+        text_body=text,
+        purpose="magic_link",
+    )
+"""
+
+import base64
+import logging
+import math
+import random
+import threading
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import and_, or_, update
+
+from models import db
+from models.email import EmailOutbox, OutboxStatus
+from utils.email import check_safety_gates
+from utils.email_provider import OutgoingEmail, ProviderPool, get_provider_factory
+
+logger = logging.getLogger(__name__)
+
+# Entries claimed per worker batch
+BATCH_SIZE = 50
+# Concurrent provider connections per batch
+CONCURRENCY = 4
+# Delivery attempts before an entry is marked FAILED
+MAX_ATTEMPTS = 6
+# Retry delay after the first failure, doubled per attempt, capped
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+# SENDING entries older than this were orphaned by a dead worker
+CLAIM_TIMEOUT_SECONDS = 10 * 60
+# Seconds the worker sleeps between polls when not notified
+POLL_INTERVAL_SECONDS = 30
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite returns naive datetimes for timezone-aware columns
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def enqueue_email(
+    recipient: str,
+    subject: str,
+    html_body: str,
+    text_body: str,
+    purpose: str,
+    recipient_name: Optional[str] = None,
+    sender_email: Optional[str] = None,
+    sender_name: Optional[str] = None,
+    attachments: Optional[Iterable[Tuple[str, str, bytes]]] = None,
+) -> EmailOutbox:
+    """
+    Store a rendered email for background delivery and wake the worker.
+
+    Commits the session.
+
+    Args:
+        recipient: Recipient email address
+        subject: Rendered subject
+        html_body: Rendered HTML body
+        text_body: Rendered plain-text body
+        purpose: Short label for reporting (e.g. "magic_link")
+        recipient_name: Optional recipient display name
+        sender_email: Optional sender address (defaults to MAIL_FROM)
+        sender_name: Optional sender display name
+        attachments: Optional (filename, content_type, bytes) tuples
+
+    Returns:
+        The committed EmailOutbox entry
+    """
+    entry = EmailOutbox(
+        purpose=purpose,
+        recipient=recipient,
+        recipient_name=recipient_name,
+        sender_email=sender_email,
+        sender_name=sender_name,
+        subject=subject,
+        html_body=html_body,
+        text_body=text_body,
+        attachments=[
+            {
+                "filename": filename,
+                "content_type": content_type,
+                "content_b64": base64.b64encode(content).decode("ascii"),
+            }
+            for filename, content_type, content in attachments or ()
+        ]
+        or None,
+        status=OutboxStatus.PENDING,
+        next_attempt_at=_utcnow(),
+    )
+    db.session.add(entry)
+    db.session.commit()
+    notify_outbox_worker()
+    return entry
+
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds to wait before retrying after *attempts* failed attempts."""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    # Jitter so entries that failed together do not retry together
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _outgoing(entry: EmailOutbox) -> OutgoingEmail:
+    return OutgoingEmail(
+        message_id=entry.id,
+        recipients=[entry.recipient],
+        subject=entry.subject,
+        html_body=entry.html_body,
+        text_body=entry.text_body,
+        sender=entry.sender_email,
+        sender_name=entry.sender_name,
+        attachments=tuple(
+            (
+                item["filename"],
+                item["content_type"],
+                base64.b64decode(item["content_b64"]),
+            )
+            for item in entry.attachments or ()
+        ),
+    )
+
+
+def claim_due_entries(batch_size: int = BATCH_SIZE, now=None) -> List[EmailOutbox]:
+    """
+    Claim up to *batch_size* due entries for delivery and commit the claim.
+
+    Due entries are PENDING ones whose next attempt time has passed, plus
+    SENDING ones whose claim timed out. The claim is a conditional UPDATE
+    with a fresh token, so concurrent workers never claim the same entry.
+    """
+    now = now or _utcnow()
+    due = or_(
+        and_(
+            EmailOutbox.status == OutboxStatus.PENDING,
+            EmailOutbox.next_attempt_at <= now,
+        ),
+        and_(
+            EmailOutbox.status == OutboxStatus.SENDING,
+            EmailOutbox.claimed_at <= now - timedelta(seconds=CLAIM_TIMEOUT_SECONDS),
+        ),
+    )
+    ids = [
+        entry_id
+        for (entry_id,) in db.session.query(EmailOutbox.id)
+        .filter(due)
+        .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+        .limit(batch_size)
+    ]
+    if not ids:
+        return []
+
+    token = uuid.uuid4().hex
+    db.session.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids), due)
+        .values(status=OutboxStatus.SENDING, claim_token=token, claimed_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return EmailOutbox.query.filter_by(claim_token=token).order_by(EmailOutbox.id).all()
+
+
+def process_outbox(
+    batch_size: int = BATCH_SIZE,
+    provider_factory: Optional[Callable] = None,
+    concurrency: int = CONCURRENCY,
+) -> Dict:
+    """
+    Deliver one batch of due outbox entries.
+
+    Args:
+        batch_size: Maximum entries to claim
+        provider_factory: Callable returning provider connections (defaults
+            to the configured SMTP provider)
+        concurrency: Provider connections (and concurrent sends)
+
+    Returns:
+        Summary dict: claimed, sent, retried, failed and skipped counts plus
+        latency percentiles (seconds) of the entries sent in this batch
+    """
+    entries = claim_due_entries(batch_size)
+    summary = {
+        "claimed": len(entries),
+        "sent": 0,
+        "retried": 0,
+        "failed": 0,
+        "skipped": 0,
+        "latency": latency_percentiles([]),
+    }
+    if not entries:
+        return summary
+
+    if provider_factory is None:
+        provider_factory = get_provider_factory()
+
+    now = _utcnow()
+    deliverable = []
+    for entry in entries:
+        is_allowed, error_msg, _ = check_safety_gates([entry.recipient])
+        if not is_allowed or provider_factory is None:
+            entry.status = OutboxStatus.SKIPPED
+            entry.last_error = error_msg or "No email provider configured"
+            entry.claim_token = None
+            summary["skipped"] += 1
+            logger.warning(
+                "Outbox entry %s (%s) not delivered: %s",
+                entry.id,
+                entry.purpose,
+                entry.last_error,
+            )
+        else:
+            deliverable.append(entry)
+
+    results = {}
+    if deliverable:
+        with ProviderPool(
+            provider_factory, size=min(concurrency, len(deliverable))
+        ) as pool:
+            for result in pool.deliver_all([_outgoing(e) for e in deliverable]):
+                results[result.outgoing.message_id] = result
+
+    sent_at = _utcnow()
+    latencies = []
+    for entry in deliverable:
+        result = results[entry.id]
+        entry.attempts += 1
+        entry.claim_token = None
+        if result.success:
+            entry.status = OutboxStatus.SENT
+            entry.sent_at = sent_at
+            entry.last_error = None
+            entry.provider_message_id = (result.response or {}).get("message_id")
+            latencies.append((sent_at - _aware(entry.enqueued_at)).total_seconds())
+            summary["sent"] += 1
+        elif entry.attempts >= MAX_ATTEMPTS:
+            entry.status = OutboxStatus.FAILED
+            entry.last_error = result.error
+            summary["failed"] += 1
+            logger.error(
+                "Outbox entry %s (%s) failed after %s attempts: %s",
+                entry.id,
+                entry.purpose,
+                entry.attempts,
+                result.error,
+            )
+        else:
+            entry.status = OutboxStatus.PENDING
+            entry.last_error = result.error
+            entry.next_attempt_at = now + timedelta(
+                seconds=backoff_delay(entry.attempts)
+            )
+            summary["retried"] += 1
+    db.session.commit()
+
+    summary["latency"] = latency_percentiles(latencies)
+    get_outbox_worker().record_latencies(latencies)
+    logger.info(
+        "Outbox batch: sent=%s retried=%s failed=%s skipped=%s "
+        "latency p50=%.2fs p95=%.2fs",
+        summary["sent"],
+        summary["retried"],
+        summary["failed"],
+        summary["skipped"],
+        summary["latency"]["p50"] or 0,
+        summary["latency"]["p95"] or 0,
+    )
+    return summary
+
+
+def drain_outbox(max_batches: int = 100, **kwargs) -> Dict:
+    """
+    Process batches until nothing is due (or *max_batches* is reached).
+
+    Returns:
+        Totals across batches
+    """
+    totals = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0, "skipped": 0}
+    for _ in range(max_batches):
+        summary = process_outbox(**kwargs)
+        for key in totals:
+            totals[key] += summary[key]
+        if summary["claimed"] == 0:
+            break
+    return totals
+
+
+# ── Latency ───────────────────────────────────────────────────────────
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_percentiles(latencies: Iterable[float]) -> Dict:
+    """p50/p95 (seconds) and count of enqueue-to-send latencies."""
+    ordered = sorted(latencies)
+    if not ordered:
+        return {"count": 0, "p50": None, "p95": None}
+    return {
+        "count": len(ordered),
+        "p50": _percentile(ordered, 0.50),
+        "p95": _percentile(ordered, 0.95),
+    }
+
+
+def outbox_latency_stats(
+    since: Optional[datetime] = None, purpose: Optional[str] = None
+) -> Dict:
+    """
+    Enqueue-to-send latency percentiles of entries sent since *since*.
+
+    Args:
+        since: Only entries sent at or after this time (default: last 24h)
+        purpose: Optional purpose filter
+
+    Returns:
+        {"count", "p50", "p95"} with latencies in seconds
+    """
+    since = since or _utcnow() - timedelta(days=1)
+    query = db.session.query(EmailOutbox.enqueued_at, EmailOutbox.sent_at).filter(
+        EmailOutbox.status == OutboxStatus.SENT, EmailOutbox.sent_at >= since
+    )
+    if purpose:
+        query = query.filter(EmailOutbox.purpose == purpose)
+    return latency_percentiles(
+        (_aware(sent_at) - _aware(enqueued_at)).total_seconds()
+        for enqueued_at, sent_at in query
+    )
+
+
+# ── Worker ────────────────────────────────────────────────────────────
+
+
+class OutboxWorker:
+    """
+    Background thread delivering outbox entries.
+
+    Sleeps until notified by enqueue_email() (or for POLL_INTERVAL_SECONDS,
+    which also picks up retries whose backoff has elapsed), then drains the
+    due entries batch by batch.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.poll_interval = poll_interval
+        self.is_running = False
+        self.thread = None
+        self._app = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=1000)
+
+    def start(self, app):
+        """Start the worker thread for *app* (no-op if already running)."""
+        with self._lock:
+            if self.is_running:
+                return
+            self._app = app
+            self.is_running = True
+            self.thread = threading.Thread(
+                target=self._run, name="email-outbox", daemon=True
+            )
+            self.thread.start()
+        logger.info("Email outbox worker started")
+
+    def stop(self, timeout: float = 5):
+        """Stop the worker thread."""
+        self.is_running = False
+        self._wake.set()
+        if self.thread:
+            self.thread.join(timeout=timeout)
+        logger.info("Email outbox worker stopped")
+
+    def notify(self):
+        """Wake the worker to deliver newly enqueued entries."""
+        self._wake.set()
+
+    def record_latencies(self, latencies: Iterable[float]):
+        """Add enqueue-to-send latencies to the rolling window."""
+        with self._lock:
+            self._latencies.extend(latencies)
+
+    def latency_stats(self) -> Dict:
+        """p50/p95 over the most recent deliveries of this process."""
+        with self._lock:
+            return latency_percentiles(self._latencies)
+
+    def _run(self):
+        while self.is_running:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            if not self.is_running:
+                break
+            try:
+                with self._app.app_context():
+                    try:
+                        drain_outbox()
+                    finally:
+                        db.session.remove()
+            except Exception as e:
+                logger.exception("Error in email outbox worker: %s", e)
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def get_outbox_worker() -> OutboxWorker:
+    """Get the process-wide outbox worker instance."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = OutboxWorker()
+        return _worker
+
+
+def init_outbox_worker(app):
+    """
+    Start the outbox worker for *app* when EMAIL_OUTBOX_WORKER is enabled
+    (off under testing).
+
+    The worker drains right away, so entries left pending or due for retry
+    by a previous process are delivered without waiting for a new enqueue.
+    """
+    if not app.config.get("EMAIL_OUTBOX_WORKER", False):
+        return
+    worker = get_outbox_worker()
+    worker.start(app)
+    worker.notify()
+
+
+def notify_outbox_worker():
+    """
+    Wake the outbox worker, starting it if the app enables it but it is not
+    running yet (EMAIL_OUTBOX_WORKER; off under testing).
+
+    Apps that disable the worker leave it alone, so a worker started for
+    another app in the same process is not woken by their enqueues.
+    """
+    if has_app_context() and not current_app.config.get("EMAIL_OUTBOX_WORKER"):
+        return
+    worker = get_outbox_worker()
+    if not worker.is_running and has_app_context():
+        worker.start(current_app._get_current_object())
+    worker.notify()
@@ -0,0 +1,318 @@
+"""
+Local Status Service
+====================
+
+Set-based recomputation of volunteer local status.
+
+Contact.calculate_local_status() decides one contact at a time, issuing an
+EventParticipation/Event query and an address load per volunteer. This
+service computes the same result for every volunteer with a few aggregate
+queries per chunk and writes the changed rows back in one executemany:
+
+1. In-person attendance: an attended participation in a non-virtual event
+   makes a volunteer local
+2. Address zip: the first primary address (partial when it has no zip),
+   else the first personal address with a zip
+3. Virtual presenter hints: optional caller-supplied {volunteer_id: bool}
+   (the bulk equivalent of the transient Contact._is_local_hint)
+4. Otherwise keep a known status, else unknown
+
+Incremental mode only recomputes stale volunteers: those never computed,
+and those whose addresses, participations or attended events changed since
+their last computation. An ``after_flush`` hook marks them stale by clearing
+Volunteer.local_status_last_updated.
+
+Teachers and students have no stored local status (the model assumes they
+are local), so runs only count them.
+
+Usage:
+    from services.local_status_service import recompute_local_statuses
+
+    stats = recompute_local_statuses(incremental=True)
+    db.session.commit()
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam
+from sqlalchemy import event as sa_event
+from sqlalchemy import func, select, true, update
+from sqlalchemy.orm import Session, attributes
+
+from models import db
+from models.contact import (
+    Address,
+    ContactTypeEnum,
+    LocalStatusEnum,
+    local_status_for_zip,
+)
+from models.event import Event, EventFormat, EventType
+from models.volunteer import ATTENDED_STATUSES, EventParticipation, Volunteer
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 500
+
+
+def _chunks(ids, size=_CHUNK_SIZE):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+# ── Signals ───────────────────────────────────────────────────────────
+
+
+def _attended_in_person(connection, volunteer_ids):
+    """Volunteers (of the given ids) with an attended in-person event."""
+    participation = EventParticipation.__table__.c
+    event = Event.__table__.c
+    return set(
+        connection.execute(
+            select(participation.volunteer_id)
+            .join(Event.__table__, event.id == participation.event_id)
+            .where(
+                participation.volunteer_id.in_(volunteer_ids),
+                participation.status.in_(ATTENDED_STATUSES),
+                event.type != EventType.VIRTUAL_SESSION,
+                event.format != EventFormat.VIRTUAL,
+            )
+            .distinct()
+        ).scalars()
+    )
+
+
+def _first_address_zips(connection, volunteer_ids, condition):
+    """{contact_id: zip_code} of each contact's first address matching condition."""
+    address = Address.__table__.c
+    first = (
+        select(address.contact_id, func.min(address.id).label("address_id"))
+        .where(address.contact_id.in_(volunteer_ids), condition)
+        .group_by(address.contact_id)
+        .subquery()
+    )
+    return dict(
+        connection.execute(
+            select(first.c.contact_id, address.zip_code).join(
+                Address.__table__, address.id == first.c.address_id
+            )
+        ).all()
+    )
+
+
+def _address_statuses(connection, volunteer_ids):
+    """{volunteer_id: LocalStatusEnum} from primary/personal address zips."""
+    address = Address.__table__.c
+    statuses = {}
+    personal = _first_address_zips(
+        connection, volunteer_ids, address.type == ContactTypeEnum.personal
+    )
+    for contact_id, zip_code in personal.items():
+        if zip_code:
+            statuses[contact_id] = local_status_for_zip(zip_code)
+    # A primary address wins; one without a zip still counts as partial
+    primary = _first_address_zips(connection, volunteer_ids, address.primary == true())
+    for contact_id, zip_code in primary.items():
+        statuses[contact_id] = local_status_for_zip(zip_code) or LocalStatusEnum.partial
+    return statuses
+
+
+def compute_local_statuses(volunteer_ids, connection=None, hints=None):
+    """
+    Compute local status for the given volunteers.
+
+    Args:
+        volunteer_ids: Volunteer ids to compute
+        connection: Connection to read through (defaults to the session's)
+        hints: Optional {volunteer_id: bool} virtual presenter location hints
+
+    Returns:
+        dict: {volunteer_id: (current_status, new_status, last_updated)}
+    """
+    connection = connection or db.session.connection()
+    hints = hints or {}
+    volunteer = Volunteer.__table__.c
+    results = {}
+    for chunk in _chunks(volunteer_ids):
+        attended = _attended_in_person(connection, chunk)
+        from_address = _address_statuses(connection, chunk)
+        rows = connection.execute(
+            select(
+                volunteer.id,
+                volunteer.local_status,
+                volunteer.local_status_last_updated,
+            ).where(volunteer.id.in_(chunk))
+        ).all()
+        for volunteer_id, current, last_updated in rows:
+            if volunteer_id in attended:
+                new_status = LocalStatusEnum.local
+            elif volunteer_id in from_address:
+                new_status = from_address[volunteer_id]
+            elif volunteer_id in hints:
+                new_status = (
+                    LocalStatusEnum.local
+                    if hints[volunteer_id]
+                    else LocalStatusEnum.non_local
+                )
+            elif current is not None and current != LocalStatusEnum.unknown:
+                new_status = current
+            else:
+                new_status = LocalStatusEnum.unknown
+            results[volunteer_id] = (current, new_status, last_updated)
+    return results
+
+
+# ── Recompute runs ────────────────────────────────────────────────────
+
+
+def recompute_local_statuses(incremental=False, hints=None, connection=None):
+    """
+    Recompute volunteer local statuses and write back the changed rows.
+
+    A run writes the volunteers whose status changed plus any stale ones
+    (stamping local_status_last_updated), and refreshes the search
+    documents of volunteers whose status changed. Does not commit.
+
+    Args:
+        incremental: Only recompute stale volunteers
+        hints: Optional {volunteer_id: bool} virtual presenter location hints
+        connection: Connection to run on (defaults to the session's)
+
+    Returns:
+        dict: Route-shaped stats for volunteers, teachers and students
+    """
+    from models.student import Student
+    from models.teacher import Teacher
+    from services.volunteer_search_service import refresh_search_documents
+
+    connection = connection or db.session.connection()
+    volunteer = Volunteer.__table__.c
+
+    query = select(volunteer.id)
+    if incremental:
+        query = query.where(volunteer.local_status_last_updated.is_(None))
+    volunteer_ids = connection.execute(query).scalars().all()
+
+    results = compute_local_statuses(volunteer_ids, connection, hints)
+    now = datetime.now(timezone.utc)
+    writes = [
+        {"b_id": volunteer_id, "b_status": new_status}
+        for volunteer_id, (current, new_status, last_updated) in results.items()
+        if new_status != current or last_updated is None
+    ]
+    changed = [
+        volunteer_id
+        for volunteer_id, (current, new_status, _) in results.items()
+        if new_status != current
+    ]
+    if writes:
+        connection.execute(
+            update(Volunteer.__table__)
+            .where(volunteer.id == bindparam("b_id"))
+            .values(
+                local_status=bindparam("b_status"),
+                local_status_last_updated=now,
+            ),
+            writes,
+        )
+    if changed:
+        refresh_search_documents(changed, connection=connection)
+
+    logger.info(
+        "Local status recompute (%s): %s volunteers, %s changed, %s stamped",
+        "incremental" if incremental else "full",
+        len(results),
+        len(changed),
+        len(writes),
+    )
+
+    def _count(model):
+        return connection.execute(
+            select(func.count()).select_from(model.__table__)
+        ).scalar()
+
+    return {
+        "volunteers": {"total": len(results), "updated": len(changed), "errors": 0},
+        "teachers": {"total": _count(Teacher), "updated": 0, "errors": 0},
+        "students": {"total": _count(Student), "updated": 0, "errors": 0},
+    }
+
+
+# ── Marking stale volunteers ──────────────────────────────────────────
+
+
+def _history_values(obj, attr):
+    hist = attributes.get_history(obj, attr)
+    return [v for v in (*hist.added, *hist.unchanged, *hist.deleted) if v]
+
+
+def _changed(obj, *attrs):
+    return any(attributes.get_history(obj, attr).has_changes() for attr in attrs)
+
+
+def _collect_stale_ids(session):
+    """Volunteer ids and event ids whose local status inputs changed."""
+    volunteer_ids = set()
+    event_ids = set()
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Address):
+            volunteer_ids.update(_history_values(obj, "contact_id"))
+        elif isinstance(obj, EventParticipation):
+            volunteer_ids.update(_history_values(obj, "volunteer_id"))
+    for obj in session.dirty:
+        if not session.is_modified(obj):
+            continue
+        if isinstance(obj, Address):
+            if _changed(obj, "contact_id", "zip_code", "type", "primary"):
+                volunteer_ids.update(_history_values(obj, "contact_id"))
+        elif isinstance(obj, EventParticipation):
+            if _changed(obj, "volunteer_id", "event_id", "status"):
+                volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif isinstance(obj, Event) and _changed(obj, "type", "format"):
+            event_ids.add(obj.id)
+    volunteer_ids.discard(None)
+    event_ids.discard(None)
+    return volunteer_ids, event_ids
+
+
+def mark_local_status_stale(volunteer_ids=(), event_ids=(), connection=None):
+    """
+    Queue volunteers for the next incremental run.
+
+    Args:
+        volunteer_ids: Volunteers (or other contact ids, which are ignored)
+        event_ids: Events whose participants should be recomputed
+        connection: Connection to write through (defaults to the session's)
+    """
+    connection = connection or db.session.connection()
+    volunteer = Volunteer.__table__.c
+    participation = EventParticipation.__table__.c
+    stale = update(Volunteer.__table__).values(local_status_last_updated=None)
+    for chunk in _chunks(volunteer_ids):
+        connection.execute(stale.where(volunteer.id.in_(chunk)))
+    for chunk in _chunks(event_ids):
+        connection.execute(
+            stale.where(
+                volunteer.id.in_(
+                    select(participation.volunteer_id).where(
+                        participation.event_id.in_(chunk)
+                    )
+                )
+            )
+        )
+
+
+def _mark_stale_after_flush(session, flush_context):
+    """after_flush hook: mark volunteers affected by this flush as stale."""
+    volunteer_ids, event_ids = _collect_stale_ids(session)
+    if volunteer_ids or event_ids:
+        mark_local_status_stale(
+            volunteer_ids, event_ids, connection=session.connection()
+        )
+
+
+def register_local_status_hooks():
+    """Attach the after_flush stale-marking hook (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _mark_stale_after_flush):
+        sa_event.listen(Session, "after_flush", _mark_stale_after_flush)
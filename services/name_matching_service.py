@@ -0,0 +1,223 @@
+"""
+Name Matching Index
+===================
+
+Blocked candidate generation for fuzzy name matching, shared by teacher
+progress matching, teacher/profile reconciliation and organization
+near-match lookups (Pathful imports).
+
+Comparing every name against every other name with difflib.SequenceMatcher
+is O(N×M). A NameIndex files each normalized name under a few blocking keys:
+
+- first three letters of the first and of the last word
+- Soundex codes of the first and of the last word
+- character trigrams of the whole name (a candidate must share at least
+  ``gram_overlap`` of the query's trigrams)
+
+and scores only names that share a block with the query. Candidates whose
+length alone caps SequenceMatcher.ratio() below the threshold are dropped
+before scoring, and ratio() is only computed when difflib's cheap upper
+bounds (real_quick_ratio, quick_ratio) pass.
+
+Usage:
+    from services.name_matching_service import NameIndex
+
+    index = NameIndex()
+    for teacher in teachers:
+        index.add(f"{teacher.first_name} {teacher.last_name}", teacher.id)
+
+    match = index.best_match("Jon Smyth", min_similarity=0.85)
+    if match:
+        teacher_id, similarity = match
+"""
+
+import difflib
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+# Share of the query's trigrams a candidate must have to be scored
+DEFAULT_GRAM_OVERLAP = 0.4
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+_NON_LETTER_RE = re.compile(r"[^a-z]")
+
+
+def default_normalize(name: str) -> str:
+    """Lowercase, turn punctuation into spaces and collapse whitespace."""
+    if not name:
+        return ""
+    return " ".join(re.sub(r"[^\w\s]", " ", name.lower()).split())
+
+
+def soundex(word: str) -> str:
+    """American Soundex code of a word ("" if it has no letters)."""
+    letters = _NON_LETTER_RE.sub("", word.lower())
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def trigrams(name: str) -> set:
+    """Character trigrams of a normalized name, padded at both ends."""
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _block_keys(name: str) -> List[str]:
+    words = name.split()
+    keys = []
+    for label, word in (("last", words[-1]), ("first", words[0])):
+        keys.append(f"{label}:{word[:3]}")
+        phonetic = soundex(word)
+        if phonetic:
+            keys.append(f"{label}-soundex:{phonetic}")
+    return keys
+
+
+def similarity_upper_bound(length_a: int, length_b: int) -> float:
+    """Largest SequenceMatcher.ratio() possible for strings of these lengths."""
+    total = length_a + length_b
+    return 2.0 * min(length_a, length_b) / total if total else 1.0
+
+
+class NameIndex:
+    """
+    In-memory index of names for exact and fuzzy lookups.
+
+    Values are returned in insertion order on ties, so an index built in the
+    same order as a brute-force loop picks the same winner.
+    """
+
+    def __init__(
+        self,
+        normalize: Optional[Callable[[str], str]] = None,
+        gram_overlap: float = DEFAULT_GRAM_OVERLAP,
+    ):
+        self.normalize = normalize or default_normalize
+        self.gram_overlap = gram_overlap
+        self._names: List[str] = []
+        self._values: List[Any] = []
+        self._exact = defaultdict(list)  # normalized name -> positions
+        self._blocks = defaultdict(list)  # block key -> positions
+        self._grams = defaultdict(list)  # trigram -> positions
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, name: str, value: Any) -> None:
+        """Index a name; names that normalize to "" are ignored."""
+        normalized = self.normalize(name or "")
+        if not normalized:
+            return
+        position = len(self._values)
+        self._names.append(normalized)
+        self._values.append(value)
+        self._exact[normalized].append(position)
+        for key in _block_keys(normalized):
+            self._blocks[key].append(position)
+        for gram in trigrams(normalized):
+            self._grams[gram].append(position)
+
+    def exact(self, name: str) -> List[Any]:
+        """Values whose normalized name equals the normalized query."""
+        positions = self._exact.get(self.normalize(name or ""), ())
+        return [self._values[position] for position in positions]
+
+    def _candidates(self, normalized: str) -> List[int]:
+        positions = set(self._exact.get(normalized, ()))
+        for key in _block_keys(normalized):
+            positions.update(self._blocks.get(key, ()))
+
+        grams = trigrams(normalized)
+        needed = max(1, math.ceil(len(grams) * self.gram_overlap))
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._grams.get(gram, ()))
+        positions.update(
+            position for position, count in shared.items() if count >= needed
+        )
+        return sorted(positions)
+
+    def matches(
+        self, name: str, min_similarity: float = 0.0
+    ) -> List[Tuple[Any, float]]:
+        """
+        Candidates scoring at least min_similarity, best first.
+
+        Scores are difflib.SequenceMatcher ratios of the normalized names.
+        """
+        normalized = self.normalize(name or "")
+        if not normalized:
+            return []
+
+        matcher = difflib.SequenceMatcher(None, normalized, "")
+        scored = []
+        for position in self._candidates(normalized):
+            candidate = self._names[position]
+            if similarity_upper_bound(len(normalized), len(candidate)) < min_similarity:
+                continue
+            matcher.set_seq2(candidate)
+            if (
+                matcher.real_quick_ratio() < min_similarity
+                or matcher.quick_ratio() < min_similarity
+            ):
+                continue
+            score = matcher.ratio()
+            if score >= min_similarity:
+                scored.append((position, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return [(self._values[position], score) for position, score in scored]
+
+    def best_match(
+        self, name: str, min_similarity: float = 0.0
+    ) -> Optional[Tuple[Any, float]]:
+        """Best (value, similarity) at or above min_similarity, or None."""
+        found = self.matches(name, min_similarity)
+        return found[0] if found else None
+
+
+def brute_force_best_match(
+    name: str,
+    entries: List[Tuple[str, Hashable]],
+    min_similarity: float,
+    normalize: Optional[Callable[[str], str]] = None,
+) -> Optional[Tuple[Any, float]]:
+    """
+    Reference O(N) scan scoring every entry (for recall checks).
+
+    Args:
+        entries: (name, value) pairs in index insertion order
+    """
+    normalize = normalize or default_normalize
+    normalized = normalize(name or "")
+    if not normalized:
+        return None
+    best = None
+    for entry_name, value in entries:
+        candidate = normalize(entry_name or "")
+        if not candidate:
+            continue
+        score = difflib.SequenceMatcher(None, normalized, candidate).ratio()
+        if score >= min_similarity and (best is None or score > best[1]):
+            best = (value, score)
+    return best
@@ -17,6 +17,8 @@ from typing import TYPE_CHECKING, Optional
 
 from flask import current_app
 
+from services.name_matching_service import NameIndex
+
 if TYPE_CHECKING:
     from models.organization import Organization
 
@@ -102,7 +104,9 @@ def resolve_organization(
         return None
 
     # If a near-match exists, log it but do NOT write the alias.
-    candidate = find_org_near_match(name)
+    candidate = find_org_near_match(
+        name, name_index=get_organization_name_index(caches)
+    )
     if candidate:
         logger.info(
             "Near-org match found (T4, quarantine-first): '%s' ~~ '%s' (ID %s). "
@@ -117,7 +121,35 @@ def resolve_organization(
     return None
 
 
-def find_org_near_match(name: str) -> "Organization | None":
+def build_organization_name_index() -> NameIndex:
+    """
+    Index organization ids by suffix-stripped name for repeated near-match
+    probes (e.g. once per Pathful import instead of a full scan per row).
+    """
+    from models import db
+    from models.organization import Organization
+
+    index = NameIndex(normalize=clean_organization_suffix)
+    rows = db.session.query(Organization.id, Organization.name).order_by(
+        Organization.id
+    )
+    for org_id, org_name in rows:
+        index.add(org_name, org_id)
+    return index
+
+
+def get_organization_name_index(caches: Optional[dict]) -> Optional[NameIndex]:
+    """Organization name index stored in an import's caches, built on first use."""
+    if caches is None:
+        return None
+    if "organization_name_index" not in caches:
+        caches["organization_name_index"] = build_organization_name_index()
+    return caches["organization_name_index"]
+
+
+def find_org_near_match(
+    name: str, name_index: Optional[NameIndex] = None
+) -> "Organization | None":
     """
     Probe-only version of the T4 suffix-strip logic.
 
@@ -125,18 +157,28 @@ def find_org_near_match(name: str) -> "Organization | None":
     logic, WITHOUT writing anything to the database. Used by callers that want
     to surface the near-match candidate to an admin for confirmation.
 
+    Args:
+        name: Organization name to probe
+        name_index: Optional index from build_organization_name_index();
+            without one every organization is scanned
+
     Returns None if no near-match is found.
     """
     if not name or not name.strip():
         return None
 
+    from models import db
     from models.organization import Organization
 
     stripped_name = clean_organization_suffix(name.strip())
     if not stripped_name or stripped_name == name.strip().lower():
         return None
 
-    all_orgs = Organization.query.all()
+    if name_index is not None:
+        org_ids = name_index.exact(name.strip())
+        return db.session.get(Organization, org_ids[0]) if org_ids else None
+
+    all_orgs = Organization.query.order_by(Organization.id).all()
     for candidate in all_orgs:
         if (
             candidate.name
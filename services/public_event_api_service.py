@@ -0,0 +1,300 @@
+"""
+Public Event API Service
+========================
+
+Caching support for the public district event API
+(routes/api/public_events.py), which district websites poll.
+
+- Tenant resolution: (slug, API key) pairs that validated are remembered
+  for TENANT_CACHE_TTL_SECONDS, so polls skip the tenant query and the key
+  hash. Tenant key, slug or status changes clear the cache immediately in
+  this process; other processes pick them up within the TTL.
+- Change tracking: an ``after_flush`` hook bumps Tenant.event_change_counter
+  (and events_changed_at) whenever one of the tenant's events is written.
+- Response cache: serialized responses are kept per (tenant, endpoint,
+  query) and reused while the tenant's counter is unchanged. Each entry has
+  a content ETag and a Last-Modified time, so unchanged polls are answered
+  with 304 after a primary-key lookup of the counter.
+- Keyset cursors: opaque (start_date, id) tokens for cursor pagination.
+
+Usage:
+    from services.public_event_api_service import (
+        event_feed_version,
+        get_cached_feed,
+        store_feed,
+    )
+
+    counter, changed_at = event_feed_version(tenant.id)
+    entry = get_cached_feed(key, counter) or store_feed(
+        key, counter, changed_at, payload
+    )
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, attributes
+
+from models import db
+from models.event import Event
+from models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+TENANT_CACHE_TTL_SECONDS = 60
+RESPONSE_CACHE_TTL_SECONDS = 300
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+
+# ── Tenant resolution ─────────────────────────────────────────────────
+
+
+class ApiTenant(NamedTuple):
+    """The tenant fields public API routes need (safe to cache)."""
+
+    id: int
+    slug: str
+
+
+_tenant_cache = {}  # (slug, api_key) -> (ApiTenant, expires_at)
+_tenant_lock = threading.Lock()
+
+
+def resolve_api_tenant(slug, api_key):
+    """
+    Resolve an active tenant by slug and validate the API key.
+
+    Returns:
+        tuple: (ApiTenant or None, error code or None). Error codes are
+        "TENANT_NOT_FOUND" and "INVALID_API_KEY"; failures are not cached.
+    """
+    key = (slug, api_key)
+    now = time.monotonic()
+    with _tenant_lock:
+        cached = _tenant_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0], None
+
+    tenant = Tenant.query.filter_by(slug=slug, is_active=True).first()
+    if not tenant:
+        return None, "TENANT_NOT_FOUND"
+    if not tenant.validate_api_key(api_key):
+        return None, "INVALID_API_KEY"
+
+    resolved = ApiTenant(tenant.id, tenant.slug)
+    with _tenant_lock:
+        _tenant_cache[key] = (resolved, now + TENANT_CACHE_TTL_SECONDS)
+    return resolved, None
+
+
+def clear_tenant_cache():
+    """Forget every resolved (slug, API key) pair."""
+    with _tenant_lock:
+        _tenant_cache.clear()
+
+
+# ── Response cache ────────────────────────────────────────────────────
+
+
+class CachedFeed(NamedTuple):
+    """A serialized API response and its validators."""
+
+    counter: int
+    body: bytes
+    etag: str
+    last_modified: datetime
+    expires_at: float
+
+
+_feed_cache = OrderedDict()  # key -> CachedFeed, least recently used first
+_feed_lock = threading.Lock()
+
+
+def event_feed_version(tenant_id):
+    """(event_change_counter, events_changed_at) of a tenant."""
+    row = db.session.execute(
+        select(Tenant.event_change_counter, Tenant.events_changed_at).where(
+            Tenant.id == tenant_id
+        )
+    ).first()
+    if row is None:
+        return 0, None
+    return row[0] or 0, row[1]
+
+
+def get_cached_feed(key, counter):
+    """The cached response for key if it is still current, else None."""
+    with _feed_lock:
+        entry = _feed_cache.get(key)
+        if entry is None:
+            return None
+        if entry.counter != counter or entry.expires_at <= time.monotonic():
+            return None
+        _feed_cache.move_to_end(key)
+        return entry
+
+
+def store_feed(key, counter, changed_at, payload, valid_until=None):
+    """
+    Serialize and cache a response payload.
+
+    The ETag covers the payload without meta.generated_at, so a rebuilt
+    response with the same content keeps its ETag and Last-Modified.
+
+    Args:
+        key: Cache key (tenant, endpoint and normalized query)
+        counter: Tenant event change counter the payload was built at
+        changed_at: Tenant events_changed_at
+        payload: JSON-serializable response dict
+        valid_until: Optional aware datetime after which the content may
+            change without a counter bump (e.g. upcoming events starting)
+
+    Returns:
+        CachedFeed
+    """
+    now = datetime.now(timezone.utc)
+    content = json.dumps(payload, sort_keys=True, default=str).encode()
+    etag = hashlib.sha256(content).hexdigest()[:32]
+
+    previous = _feed_cache.get(key)
+    if previous is not None and previous.etag == etag:
+        last_modified = previous.last_modified
+    elif previous is not None and previous.counter == counter:
+        last_modified = now  # changed with time, not with an event write
+    else:
+        last_modified = changed_at or now
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+    ttl = RESPONSE_CACHE_TTL_SECONDS
+    if valid_until is not None:
+        ttl = max(0, min(ttl, (valid_until - now).total_seconds()))
+
+    payload.setdefault("meta", {})["generated_at"] = now.isoformat()
+    entry = CachedFeed(
+        counter=counter,
+        body=json.dumps(payload, default=str).encode(),
+        etag=etag,
+        last_modified=last_modified,
+        expires_at=time.monotonic() + ttl,
+    )
+    with _feed_lock:
+        _feed_cache[key] = entry
+        _feed_cache.move_to_end(key)
+        while len(_feed_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _feed_cache.popitem(last=False)
+    return entry
+
+
+def clear_feed_cache():
+    """Drop every cached response."""
+    with _feed_lock:
+        _feed_cache.clear()
+
+
+# ── Keyset cursors ────────────────────────────────────────────────────
+
+
+def encode_cursor(event):
+    """Opaque cursor pointing just after the given event."""
+    raw = json.dumps([event.start_date.isoformat(), event.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor) -> Optional[tuple]:
+    """
+    Decode a cursor into (start_date, event_id).
+
+    Returns:
+        tuple or None: None for an empty cursor (first page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start, event_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(start), int(event_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+# ── Change tracking ───────────────────────────────────────────────────
+
+_TENANT_AUTH_FIELDS = ("slug", "is_active", "api_key_hash")
+
+
+def _history_values(obj, attr):
+    hist = attributes.get_history(obj, attr)
+    return [v for v in (*hist.added, *hist.unchanged, *hist.deleted) if v]
+
+
+def _collect_changes(session):
+    """Tenants whose events changed, and whether tenant auth changed."""
+    tenant_ids = set()
+    auth_changed = False
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Event):
+            tenant_ids.update(_history_values(obj, "tenant_id"))
+        elif isinstance(obj, Tenant) and obj in session.deleted:
+            auth_changed = True
+    for obj in session.dirty:
+        if isinstance(obj, Event):
+            if session.is_modified(obj):
+                tenant_ids.update(_history_values(obj, "tenant_id"))
+        elif isinstance(obj, Tenant):
+            if any(
+                attributes.get_history(obj, attr).has_changes()
+                for attr in _TENANT_AUTH_FIELDS
+            ):
+                auth_changed = True
+    tenant_ids.discard(None)
+    return tenant_ids, auth_changed
+
+
+def bump_event_change_counter(tenant_ids, connection=None):
+    """
+    Record that events of the given tenants changed.
+
+    Writes that bypass the ORM call this for the tenants they touch.
+    """
+    if not tenant_ids:
+        return
+    connection = connection or db.session.connection()
+    tenant = Tenant.__table__.c
+    connection.execute(
+        update(Tenant.__table__)
+        .where(tenant.id.in_(sorted(tenant_ids)))
+        .values(
+            event_change_counter=tenant.event_change_counter + 1,
+            events_changed_at=datetime.now(timezone.utc),
+            # Event changes are not tenant edits; skip the onupdate timestamp
+            updated_at=tenant.updated_at,
+        )
+    )
+
+
+def _track_after_flush(session, flush_context):
+    """after_flush hook: bump counters of tenants whose events changed."""
+    tenant_ids, auth_changed = _collect_changes(session)
+    if auth_changed:
+        clear_tenant_cache()
+    if tenant_ids:
+        bump_event_change_counter(tenant_ids, connection=session.connection())
+
+
+def register_public_event_api_hooks():
+    """Attach the after_flush change tracking hook (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _track_after_flush):
+        sa_event.listen(Session, "after_flush", _track_after_flush)
@@ -17,7 +17,13 @@ Usage:
 """
 
 # Re-export client functions
-from services.salesforce.client import get_salesforce_client, safe_query, safe_query_all
+from services.salesforce.client import (
+    QueryStream,
+    get_salesforce_client,
+    safe_query,
+    safe_query_all,
+    safe_query_more,
+)
 
 # Re-export delta sync
 from services.salesforce.delta_sync import DeltaSyncHelper
@@ -53,9 +59,11 @@ from services.salesforce.utils import (
 
 __all__ = [
     # Client
+    "QueryStream",
     "get_salesforce_client",
     "safe_query",
     "safe_query_all",
+    "safe_query_more",
     # Mappers
     "map_age_group",
     "map_education_level",
@@ -0,0 +1,182 @@
+"""
+Bulk Upsert Write Path
+======================
+
+Batched ``INSERT ... ON CONFLICT (salesforce_id) DO UPDATE`` writes for
+Salesforce imports, used instead of building one ORM object per row.
+
+Rows are accumulated as plain dicts in a BulkUpsert batch for a single
+model and written with one executemany statement per batch, bypassing the
+ORM unit of work (no identity map, no per-object change tracking). Works on
+SQLite (3.24+) and PostgreSQL, keyed on the model's unique salesforce_id
+column.
+
+Usage:
+    from services.salesforce.bulk_upsert import BulkUpsert, supports_bulk_upsert
+
+    batch = BulkUpsert(
+        EventParticipation,
+        update_columns=["status", "delivery_hours"],
+        fill_columns=["email", "title", "age_group"],
+    )
+    for values in rows:
+        batch.add(values)
+        if batch.full:
+            batch.flush()
+            db.session.commit()
+    batch.flush()
+"""
+
+from typing import Dict, Iterable, List
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import db
+
+# Rows written per INSERT ... ON CONFLICT executemany
+DEFAULT_BATCH_SIZE = 1000
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def supports_bulk_upsert(session=None) -> bool:
+    """Whether the session's database supports INSERT ... ON CONFLICT."""
+    session = session or db.session
+    return session.get_bind().dialect.name in _DIALECT_INSERTS
+
+
+class BulkUpsert:
+    """
+    Accumulates rows for one model and upserts them in batches.
+
+    On conflict with an existing row (matched on ``key``):
+      - ``update_columns`` are overwritten with the incoming values
+      - ``fill_columns`` are only overwritten when the incoming value is not
+        None, so optional Salesforce fields never blank out stored data
+      - all other columns (foreign keys, created_at, ...) are left as they are
+
+    Columns with a Python-side ``onupdate`` (e.g. updated_at) are refreshed
+    on conflict as well, since ON CONFLICT updates do not apply them.
+
+    Rows with a key already in the pending batch are merged into the earlier
+    row, as a second upsert of the same key in one statement is rejected by
+    PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        model,
+        update_columns: Iterable[str] = (),
+        fill_columns: Iterable[str] = (),
+        key: str = "salesforce_id",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        session=None,
+    ):
+        self.model = model
+        self.table = model.__table__
+        self.key = key
+        self.update_columns = list(update_columns)
+        self.fill_columns = list(fill_columns)
+        self.batch_size = max(1, int(batch_size))
+        self.session = session or db.session
+        self.written = 0
+        self._pending: Dict[str, dict] = {}
+
+        unknown = {key, *self.update_columns, *self.fill_columns} - set(
+            self.table.columns.keys()
+        )
+        if unknown:
+            raise ValueError(
+                f"Unknown columns for {self.table.name}: {', '.join(sorted(unknown))}"
+            )
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, key_value) -> bool:
+        return key_value in self._pending
+
+    @property
+    def full(self) -> bool:
+        """Whether the pending batch has reached batch_size."""
+        return len(self._pending) >= self.batch_size
+
+    def add(self, values: dict) -> None:
+        """Queue one row (column name -> value) for the next flush."""
+        key_value = values.get(self.key)
+        if key_value is None:
+            raise ValueError(f"Bulk upsert row is missing {self.key}")
+
+        previous = self._pending.get(key_value)
+        if previous is not None:
+            values = {
+                **previous,
+                **{
+                    name: value
+                    for name, value in values.items()
+                    if value is not None or name not in self.fill_columns
+                },
+            }
+        self._pending[key_value] = values
+
+    def flush(self) -> int:
+        """
+        Write the pending rows in one statement.
+
+        Runs in the session's current transaction; committing is left to the
+        caller. Pending rows are dropped even if the statement fails, so a
+        caller can roll back and carry on with the next batch.
+
+        Returns:
+            Number of rows written
+        """
+        if not self._pending:
+            return 0
+
+        rows = self._normalized_rows(list(self._pending.values()))
+        self._pending = {}
+
+        self.session.execute(self._statement(), rows)
+        self.written += len(rows)
+        return len(rows)
+
+    def _normalized_rows(self, rows: List[dict]) -> List[dict]:
+        """Give every row the same keys, as executemany requires."""
+        columns = set()
+        for row in rows:
+            columns.update(row)
+        return [{name: row.get(name) for name in columns} for row in rows]
+
+    def _statement(self):
+        insert = _DIALECT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert is None:
+            raise NotImplementedError(
+                "Bulk upsert requires SQLite or PostgreSQL; "
+                f"got {self.session.get_bind().dialect.name}"
+            )
+
+        stmt = insert(self.table)
+        columns = self.table.columns
+        set_ = {name: stmt.excluded[name] for name in self.update_columns}
+        set_.update(
+            {
+                name: func.coalesce(stmt.excluded[name], columns[name])
+                for name in self.fill_columns
+            }
+        )
+        for column in columns:
+            if column.onupdate is not None and column.name not in set_:
+                set_[column.name] = _onupdate_value(column)
+
+        return stmt.on_conflict_do_update(index_elements=[self.key], set_=set_)
+
+
+def _onupdate_value(column):
+    """Value of a column's onupdate default, for use in an ON CONFLICT SET."""
+    onupdate = column.onupdate
+    # SQLAlchemy wraps Python callables to take an execution context
+    return onupdate.arg(None) if onupdate.is_callable else onupdate.arg
@@ -16,6 +16,7 @@ Usage:
 """
 
 import logging
+import threading
 import time
 from functools import wraps
 
@@ -25,6 +26,7 @@ from simple_salesforce import Salesforce
 from simple_salesforce.exceptions import SalesforceAuthenticationFailed
 
 from config import Config
+from services.salesforce.import_scheduler import released_write_gate
 
 # Connection cache for reuse within a request context
 _sf_client_cache = {}
@@ -34,7 +36,8 @@ def get_salesforce_client(force_new: bool = False) -> Salesforce:
     """
     Get an authenticated Salesforce client.
 
-    Uses cached connection if available to avoid repeated auth.
+    Uses cached connection if available to avoid repeated auth. Connections
+    are cached per thread so concurrent import steps never share one.
     Set force_new=True to create a fresh connection.
 
     Args:
@@ -46,7 +49,7 @@ def get_salesforce_client(force_new: bool = False) -> Salesforce:
     Raises:
         SalesforceAuthenticationFailed: If credentials are invalid
     """
-    cache_key = "default"
+    cache_key = f"default:{threading.get_ident()}"
 
     if not force_new and cache_key in _sf_client_cache:
         return _sf_client_cache[cache_key]
@@ -107,7 +110,10 @@ def retry_on_failure(
                             e,
                             delay,
                         )
-                        time.sleep(delay)
+                        # Other import steps may write during the backoff;
+                        # the gate is taken back before the retry
+                        with released_write_gate():
+                            time.sleep(delay)
                         delay *= backoff
                     else:
                         logger.exception(
@@ -141,7 +147,9 @@ def safe_query_all(sf: Salesforce, query: str) -> dict:
     Raises:
         Exception: After max retries if still failing
     """
-    return sf.query_all(query)
+    # Let other scheduled import steps use the database while we wait on the API
+    with released_write_gate():
+        return sf.query_all(query)
 
 
 @retry_on_failure(max_attempts=3, initial_delay=1.0, backoff=2.0)
@@ -156,7 +164,66 @@ def safe_query(sf: Salesforce, query: str) -> dict:
     Returns:
         Query result dictionary
     """
-    return sf.query(query)
+    with released_write_gate():
+        return sf.query(query)
+
+
+@retry_on_failure(max_attempts=3, initial_delay=1.0, backoff=2.0)
+def safe_query_more(sf: Salesforce, next_records_url: str) -> dict:
+    """
+    Fetch the next page of a SOQL query result with automatic retry.
+
+    Args:
+        sf: Authenticated Salesforce client
+        next_records_url: nextRecordsUrl from the previous page
+
+    Returns:
+        Query result dictionary for the next page
+    """
+    with released_write_gate():
+        return sf.query_more(next_records_url, identifier_is_url=True)
+
+
+class QueryStream:
+    """
+    Iterate a SOQL query's records one page at a time.
+
+    Unlike safe_query_all, only the current page (up to ~2000 records) is
+    held in memory, so callers that process and commit rows as they go keep
+    a flat memory profile regardless of result size. The first page is
+    fetched on construction so total_size is available for progress output.
+    A stream can only be iterated once.
+
+    Usage:
+        records = QueryStream(sf, "SELECT Id FROM Contact")
+        print(f"Found {records.total_size} records")
+        for row in records:
+            ...
+    """
+
+    def __init__(self, sf: Salesforce, query: str):
+        self._sf = sf
+        self._page = safe_query(sf, query)
+        self.total_size = self._page.get(
+            "totalSize", len(self._page.get("records", []))
+        )
+
+    def __len__(self):
+        return self.total_size
+
+    def pages(self):
+        """Yield each page's list of records, fetching the next on demand."""
+        page, self._page = self._page, None
+        while page is not None:
+            yield page.get("records", [])
+            next_url = page.get("nextRecordsUrl")
+            if page.get("done", True) or not next_url:
+                break
+            page = safe_query_more(self._sf, next_url)
+
+    def __iter__(self):
+        for records in self.pages():
+            yield from records
 
 
 # Import dependency definitions
@@ -0,0 +1,233 @@
+"""
+Import Step Scheduler
+=====================
+
+Dependency-aware, concurrent runner for the nightly Salesforce import
+pipeline (scripts/daily_imports/daily_imports.py).
+
+Each step declares the steps it depends on. Steps whose dependencies have
+finished run concurrently in a thread pool, but all database work is
+serialized through a single write gate: a step holds the gate while it
+runs and only gives it up while it waits on the Salesforce API
+(safe_query_all) or sleeps between chunks. Independent Salesforce fetches
+therefore overlap while the DB write phases still run one at a time.
+
+The gate is only released when the step's session has no pending or
+flushed-but-uncommitted writes, so a step never holds a SQLite write lock
+while another step writes.
+
+Usage:
+    from services.salesforce.import_scheduler import ImportScheduler
+
+    scheduler = ImportScheduler(steps, run_step, max_workers=4, logger=logger)
+    results = scheduler.run()  # {step name: success}
+"""
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Session.info key set while a session has uncommitted writes
+_WRITES_KEY = "import_scheduler_writes"
+
+# Gate of the scheduler currently running, if any
+_active_gate = None
+
+
+class WriteGate:
+    """Serializes database work across concurrently running import steps."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def hold(self):
+        """Hold the gate in this thread for the duration of the block."""
+        self._lock.acquire()
+        self._local.held = True
+        try:
+            yield
+        finally:
+            self._local.held = False
+            self._lock.release()
+
+    @contextmanager
+    def released(self):
+        """
+        Give up the gate held by this thread around network I/O or sleeps.
+
+        No-op when this thread does not hold the gate or its session has
+        uncommitted writes.
+        """
+        if not getattr(self._local, "held", False) or _session_has_writes():
+            yield
+            return
+
+        self._local.held = False
+        self._lock.release()
+        try:
+            yield
+        finally:
+            self._lock.acquire()
+            self._local.held = True
+
+
+def released_write_gate():
+    """Context manager releasing the active scheduler's gate, if any."""
+    gate = _active_gate
+    return gate.released() if gate else nullcontext()
+
+
+def _session_has_writes():
+    """Whether the current app context's session has uncommitted writes."""
+    try:
+        from models import db
+
+        session = db.session()
+    except RuntimeError:
+        # No app context: nothing to protect
+        return False
+    return bool(
+        session.new or session.dirty or session.deleted or session.info.get(_WRITES_KEY)
+    )
+
+
+def _mark_writes(session, *args):
+    session.info[_WRITES_KEY] = True
+
+
+def _mark_orm_execute(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_WRITES_KEY] = True
+
+
+def _clear_writes(session, *args):
+    session.info.pop(_WRITES_KEY, None)
+
+
+def _register_write_tracking():
+    """Track uncommitted writes on every Session (idempotent)."""
+    if event.contains(Session, "after_flush", _mark_writes):
+        return
+    event.listen(Session, "after_flush", _mark_writes)
+    event.listen(Session, "do_orm_execute", _mark_orm_execute)
+    event.listen(Session, "after_commit", _clear_writes)
+    event.listen(Session, "after_rollback", _clear_writes)
+
+
+class ImportScheduler:
+    """
+    Runs import steps as a dependency DAG on a thread pool.
+
+    Steps are any objects with ``name`` and ``depends_on`` attributes.
+    Dependencies on steps that are not part of this run are treated as
+    already satisfied. A failed step does not block its dependents, matching
+    the pipeline's continue-on-failure behavior; a warning is logged.
+    """
+
+    def __init__(self, steps, run_step, max_workers=4, logger=None):
+        self.steps = list(steps)
+        self.run_step = run_step
+        self.max_workers = max(1, int(max_workers))
+        self.logger = logger or logging.getLogger(__name__)
+        self.gate = WriteGate()
+        self.dependencies = self._resolve_dependencies()
+
+    def _resolve_dependencies(self):
+        names = [step.name for step in self.steps]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate import step names")
+
+        dependencies = {
+            step.name: [dep for dep in (step.depends_on or []) if dep in names]
+            for step in self.steps
+        }
+
+        # Reject cycles up front rather than deadlocking mid-run
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Import step dependency cycle at '{name}'")
+            visiting.add(name)
+            for dep in dependencies[name]:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in names:
+            visit(name)
+        return dependencies
+
+    def _run_gated(self, step):
+        with self.gate.hold():
+            try:
+                return bool(self.run_step(step))
+            except Exception as e:
+                self.logger.error(
+                    "%s failed with exception: %s", step.name, e, exc_info=True
+                )
+                return False
+
+    def run(self):
+        """
+        Run every step once its dependencies have finished.
+
+        Returns:
+            Dict of step name -> success, in the order steps finished
+        """
+        global _active_gate
+
+        _register_write_tracking()
+        results = {}
+        waiting = list(self.steps)
+        running = {}
+
+        previous_gate, _active_gate = _active_gate, self.gate
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="import-step"
+            ) as pool:
+                while waiting or running:
+                    for step in [s for s in waiting if self._is_ready(s, results)]:
+                        waiting.remove(step)
+                        failed = [
+                            dep
+                            for dep in self.dependencies[step.name]
+                            if not results[dep]
+                        ]
+                        if failed:
+                            self.logger.warning(
+                                "Running %s although dependencies failed: %s",
+                                step.name,
+                                ", ".join(failed),
+                            )
+                        self.logger.info("=== Running step: %s ===", step.name)
+                        running[pool.submit(self._run_gated, step)] = step
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        step = running.pop(future)
+                        results[step.name] = future.result()
+                        if not results[step.name]:
+                            self.logger.error("Step failed: %s", step.name)
+        finally:
+            _active_gate = previous_gate
+
+        return results
+
+    def _is_ready(self, step, results):
+        return all(dep in results for dep in self.dependencies[step.name])
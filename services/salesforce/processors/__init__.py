@@ -19,12 +19,16 @@ Usage:
 
 # Import processors for convenient access
 from services.salesforce.processors.event import (
+    bulk_process_participation_rows,
+    bulk_process_student_participation_rows,
     process_event_row,
     process_participation_row,
     process_student_participation_row,
 )
 
 __all__ = [
+    "bulk_process_participation_rows",
+    "bulk_process_student_participation_rows",
     "process_event_row",
     "process_participation_row",
     "process_student_participation_row",
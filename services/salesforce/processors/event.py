@@ -10,6 +10,8 @@ This module contains:
 - process_participation_row: Process volunteer participation records
 - process_student_participation_row: Process student participation records
 - resolve_pending_participations: Retry queue sweep for orphaned participations
+- bulk_process_participation_rows / bulk_process_student_participation_rows:
+  Batched INSERT ... ON CONFLICT write path for participation imports
 
 Usage:
     from services.salesforce.processors.event import (
@@ -23,7 +25,7 @@ Usage:
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +45,17 @@ from routes.utils import (
     parse_date,
     parse_event_skills,
 )
+from services.cache_dependency_service import invalidate_dependent_caches
 from services.district_service import resolve_district
-from services.salesforce.utils import extract_href_from_html, safe_parse_delivery_hours
+from services.local_status_service import mark_local_status_stale
+from services.salesforce.bulk_upsert import DEFAULT_BATCH_SIZE, BulkUpsert
+from services.salesforce.utils import (
+    QUERY_CHUNK_SIZE,
+    extract_href_from_html,
+    safe_parse_delivery_hours,
+)
+from services.volunteer_engagement_service import refresh_engagement_stats
+from services.volunteer_search_service import refresh_search_documents
 
 
 def _map_event_fields(event: Event, row: dict) -> None:
@@ -695,3 +706,304 @@ def resolve_pending_participations(
         logger.exception("Error during pending participation sweep final commit: %s", e)
 
     return resolved_count
+
+
+# =============================================================================
+# BULK WRITE PATH
+# =============================================================================
+
+
+def _resolve_participation_flags(sf_participation_ids: List[str]) -> None:
+    """Bulk form of _resolve_participation_flag_if_exists for a written batch."""
+    if not sf_participation_ids:
+        return
+    try:
+        from models.data_quality_flag import DataQualityFlag, DataQualityIssueType
+
+        for start in range(0, len(sf_participation_ids), QUERY_CHUNK_SIZE):
+            chunk = sf_participation_ids[start : start + QUERY_CHUNK_SIZE]
+            flags = DataQualityFlag.query.filter(
+                DataQualityFlag.entity_type == "sf_participation",
+                DataQualityFlag.entity_sf_id.in_(chunk),
+                DataQualityFlag.issue_type
+                == DataQualityIssueType.UNMATCHED_SF_PARTICIPATION,
+                DataQualityFlag.status == "open",
+            ).all()
+            for flag in flags:
+                flag.resolve(
+                    status="auto_fixed",
+                    notes=f"Participation {flag.entity_sf_id} successfully imported on re-run.",
+                )
+    except Exception:
+        pass  # Non-critical — never break a successful import
+
+
+def _commit_bulk_batch(
+    batch: BulkUpsert,
+    label: str,
+    errors: List[str],
+    new_sf_ids=None,
+    new_volunteer_ids=None,
+    written_volunteer_ids=None,
+    written_event_ids=None,
+) -> bool:
+    """Write a BulkUpsert batch and commit it with any row-path changes."""
+    try:
+        written = batch.flush()
+        if new_sf_ids:
+            _resolve_participation_flags(new_sf_ids)
+        if new_volunteer_ids:
+            # Core writes skip the ORM hook that keeps search documents current
+            refresh_search_documents(new_volunteer_ids)
+        if written_volunteer_ids:
+            # ...and the one that keeps engagement stats current
+            refresh_engagement_stats(written_volunteer_ids)
+            # ...and the one that queues local status recomputation
+            mark_local_status_stale(
+                written_volunteer_ids, connection=db.session.connection()
+            )
+        if written_event_ids or written_volunteer_ids:
+            # ...and the one that invalidates dependent report caches
+            invalidate_dependent_caches(
+                db.session.connection(),
+                written_event_ids or (),
+                written_volunteer_ids or (),
+            )
+        db.session.commit()
+        print(f"  -> Bulk upserted {written} {label} ({batch.written} total)")
+        return True
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error writing %s batch: %s", label, e)
+        errors.append(f"Error processing {label} batch: {str(e)}")
+        return False
+
+
+def bulk_process_participation_rows(
+    rows: Iterable[dict],
+    errors: List[str],
+    volunteers_cache: Dict[str, int],
+    events_cache: Dict[str, int],
+    ep_sf_ids_cache: Set[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tuple[int, int]:
+    """
+    Bulk equivalent of calling process_participation_row for every row.
+
+    Rows whose volunteer and event resolve from the caches (the common case,
+    both new and already-imported participations) are upserted in batches
+    keyed on salesforce_id. Status and delivery hours are overwritten;
+    email, title and age group only when Salesforce provides them. Unmatched
+    rows keep the row-level path, so they are still flagged and queued for
+    retry.
+
+    Each batch is committed as it is written. A failed batch is rolled back
+    and all of its rows are counted as errors.
+
+    Args:
+        rows: Participation records from Salesforce (any iterable)
+        errors: List to collect error messages
+        volunteers_cache: Maps salesforce_individual_id -> volunteer_id
+        events_cache: Maps salesforce_id -> event_id
+        ep_sf_ids_cache: Set of existing participation salesforce_ids
+        batch_size: Rows per INSERT ... ON CONFLICT statement
+
+    Returns:
+        tuple: (success_count, error_count)
+    """
+    batch = BulkUpsert(
+        EventParticipation,
+        update_columns=["status", "delivery_hours"],
+        fill_columns=["email", "title", "age_group"],
+        batch_size=batch_size,
+    )
+    success_count = error_count = 0
+    batch_rows = 0
+    new_sf_ids = []
+    new_volunteer_ids = set()
+    batch_volunteer_ids = set()
+    batch_event_ids = set()
+
+    def write_batch():
+        nonlocal success_count, error_count, batch_rows
+        if _commit_bulk_batch(
+            batch,
+            "volunteer participations",
+            errors,
+            new_sf_ids,
+            new_volunteer_ids,
+            batch_volunteer_ids,
+            batch_event_ids,
+        ):
+            success_count += batch_rows
+            # Only ids that are now in the database
+            ep_sf_ids_cache.update(new_sf_ids)
+        else:
+            error_count += batch_rows
+        batch_rows = 0
+        new_sf_ids.clear()
+        new_volunteer_ids.clear()
+        batch_volunteer_ids.clear()
+        batch_event_ids.clear()
+
+    for row in rows:
+        sf_id = row.get("Id")
+        vol_id = volunteers_cache.get(row.get("Contact__c"))
+        event_id = events_cache.get(row.get("Session__c"))
+
+        if not sf_id or not vol_id or not event_id:
+            if sf_id in batch:
+                write_batch()  # Let the row path see the pending write
+            success_count, error_count = process_participation_row(
+                row,
+                success_count,
+                error_count,
+                errors,
+                volunteers_cache=volunteers_cache,
+                events_cache=events_cache,
+                ep_sf_ids_cache=ep_sf_ids_cache,
+            )
+            continue
+
+        is_new = sf_id not in ep_sf_ids_cache and sf_id not in batch
+        try:
+            batch.add(
+                {
+                    "salesforce_id": sf_id,
+                    "volunteer_id": vol_id,
+                    "event_id": event_id,
+                    "status": row["Status__c"],
+                    "delivery_hours": safe_parse_delivery_hours(
+                        row.get("Delivery_Hours__c")
+                    ),
+                    "email": row.get("Email__c") or None,
+                    "title": row.get("Title__c") or None,
+                    "age_group": row.get("Age_Group__c") or None,
+                }
+            )
+        except Exception as e:
+            errors.append(f"Error processing participation row: {str(e)}")
+            error_count += 1
+            continue
+
+        batch_rows += 1
+        batch_volunteer_ids.add(vol_id)
+        batch_event_ids.add(event_id)
+        if is_new:
+            new_sf_ids.append(sf_id)
+            new_volunteer_ids.add(vol_id)
+        if batch.full:
+            write_batch()
+
+    write_batch()
+    return success_count, error_count
+
+
+def bulk_process_student_participation_rows(
+    rows: Iterable[dict],
+    errors: List[str],
+    events_cache: Dict[str, int],
+    students_cache: Dict[str, int],
+    participations_by_sf_id: Set[str],
+    participations_by_pair: Set[Tuple[int, int]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tuple[int, int]:
+    """
+    Bulk equivalent of calling process_student_participation_row for every row.
+
+    New participations (unknown salesforce_id and event/student pair) are
+    upserted in batches keyed on salesforce_id. Rows that are already
+    imported, match an existing pair or cannot be resolved keep the
+    row-level path, so skip and error handling are unchanged.
+
+    Each batch is committed as it is written. A failed batch is rolled back
+    and all of its rows are counted as errors.
+
+    Args:
+        rows: Student participation records from Salesforce (any iterable)
+        errors: List to collect error messages
+        events_cache: Maps salesforce_id -> event_id
+        students_cache: Maps salesforce_individual_id -> student_id
+        participations_by_sf_id: Set of existing participation salesforce_ids
+        participations_by_pair: Set of existing (event_id, student_id) pairs
+        batch_size: Rows per INSERT ... ON CONFLICT statement
+
+    Returns:
+        tuple: (success_count, error_count)
+    """
+    batch = BulkUpsert(
+        EventStudentParticipation,
+        fill_columns=["status", "delivery_hours", "age_group"],
+        batch_size=batch_size,
+    )
+    success_count = error_count = 0
+    batch_rows = 0
+    pending_sf_ids = set()
+    pending_pairs = set()
+    batch_event_ids = set()
+
+    def write_batch():
+        nonlocal success_count, error_count, batch_rows
+        if _commit_bulk_batch(
+            batch, "student participations", errors, written_event_ids=batch_event_ids
+        ):
+            success_count += batch_rows
+            # Only rows that are now in the database
+            participations_by_sf_id.update(pending_sf_ids)
+            participations_by_pair.update(pending_pairs)
+        else:
+            error_count += batch_rows
+        batch_rows = 0
+        pending_sf_ids.clear()
+        pending_pairs.clear()
+        batch_event_ids.clear()
+
+    for row in rows:
+        sf_id = row.get("Id")
+        event_id = events_cache.get(row.get("Session__c"))
+        student_id = students_cache.get(row.get("Contact__c"))
+        pair_key = (event_id, student_id)
+
+        if sf_id in pending_sf_ids or pair_key in pending_pairs:
+            write_batch()  # Let the checks below see the pending write
+
+        if (
+            not sf_id
+            or not event_id
+            or not student_id
+            or sf_id in participations_by_sf_id
+            or pair_key in participations_by_pair
+        ):
+            success_count, error_count = process_student_participation_row(
+                row,
+                success_count,
+                error_count,
+                errors,
+                events_cache=events_cache,
+                students_cache=students_cache,
+                participations_by_sf_id=participations_by_sf_id,
+                participations_by_pair=participations_by_pair,
+            )
+            continue
+
+        batch.add(
+            {
+                "salesforce_id": sf_id,
+                "event_id": event_id,
+                "student_id": student_id,
+                "status": row.get("Status__c") or None,
+                "delivery_hours": safe_parse_delivery_hours(
+                    row.get("Delivery_Hours__c")
+                ),
+                "age_group": row.get("Age_Group__c") or None,
+            }
+        )
+        batch_rows += 1
+        pending_sf_ids.add(sf_id)
+        pending_pairs.add(pair_key)
+        batch_event_ids.add(event_id)
+        if batch.full:
+            write_batch()
+
+    write_batch()
+    return success_count, error_count
@@ -17,6 +17,8 @@ Used by: tenant_teacher_usage, pathful_import processing, pathful_import routes
 import logging
 from typing import Any, Dict, List, Optional
 
+from services.name_matching_service import NameIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -140,8 +142,8 @@ def count_sessions_for_teachers(
     """
     Count completed sessions for each teacher based on Event.educators field.
 
-    Parses the semicolon-separated educators field from each event and
-    matches names to teachers using the alias map.
+    Reads the events' educator names from the EventEducator link table and
+    matches each distinct name to a teacher once, using the alias map.
 
     Args:
         events: List of Event objects with educators attribute
@@ -151,20 +153,19 @@ def count_sessions_for_teachers(
     Returns:
         Updated progress_map with session counts
     """
-    for event in events:
-        if not event.educators:
-            continue
-
-        # Parse semicolon-separated educator names
-        educator_names = [
-            name.strip() for name in event.educators.split(";") if name.strip()
-        ]
-
-        for educator_name in educator_names:
-            teacher_id = match_educator_to_teacher(educator_name, alias_map)
+    from services.educator_link_service import educator_names_by_event
+
+    event_ids = [event.id for event in events if event.educators]
+    teacher_by_name = {}
+    for _event_id, educator_name in educator_names_by_event(event_ids):
+        if educator_name not in teacher_by_name:
+            teacher_by_name[educator_name] = match_educator_to_teacher(
+                educator_name, alias_map
+            )
+        teacher_id = teacher_by_name[educator_name]
 
-            if teacher_id and teacher_id in progress_map:
-                progress_map[teacher_id] += 1
+        if teacher_id and teacher_id in progress_map:
+            progress_map[teacher_id] += 1
 
     return progress_map
 
@@ -290,7 +291,31 @@ def resolve_teacher_for_tp(tp):
     return teacher
 
 
-def match_tp_to_profile(tp):
+def build_profile_name_index():
+    """Index unlinked Educator PathfulUserProfile ids by normalized name.
+
+    Lets callers matching many TPs (e.g. the reconciliation script) skip the
+    per-TP scan of every unlinked profile in match_tp_to_profile.
+    """
+    from models import db
+    from models.pathful_import import PathfulUserProfile
+
+    index = NameIndex(normalize=normalize_name)
+    rows = (
+        db.session.query(PathfulUserProfile.id, PathfulUserProfile.name)
+        .filter(
+            PathfulUserProfile.signup_role == "Educator",
+            PathfulUserProfile.teacher_progress_id.is_(None),
+            PathfulUserProfile.name.isnot(None),
+        )
+        .order_by(PathfulUserProfile.id)
+    )
+    for profile_id, profile_name in rows:
+        index.add(profile_name, profile_id)
+    return index
+
+
+def match_tp_to_profile(tp, profile_index=None):
     """Link a TeacherProgress to its PathfulUserProfile.
 
     This is the canonical path for linking TeacherProgress → PathfulUserProfile.
@@ -301,6 +326,12 @@ def match_tp_to_profile(tp):
     2. Email — TP.email vs PathfulUserProfile.login_email
     3. Normalized name — normalize_name(TP.name) vs PathfulUserProfile.name
 
+    Args:
+        tp: TeacherProgress to link
+        profile_index: Optional index from build_profile_name_index() used
+            for priority 3 instead of scanning all unlinked profiles.
+            Profiles linked after the index was built are skipped.
+
     Side effects:
     - Sets profile.teacher_progress_id if matched
     - Sets tp.pathful_user_id from profile if not already set
@@ -311,6 +342,7 @@ def match_tp_to_profile(tp):
     """
     from sqlalchemy import func as sqla_func
 
+    from models import db
     from models.pathful_import import PathfulUserProfile
 
     profile = None
@@ -332,7 +364,18 @@ def match_tp_to_profile(tp):
     # --- Priority 3: Normalized name ---
     if not profile and tp.name:
         tp_normalized = normalize_name(tp.name)
-        if tp_normalized:
+        if tp_normalized and profile_index is not None:
+            name_matches = [
+                p
+                for p in (
+                    db.session.get(PathfulUserProfile, profile_id)
+                    for profile_id in profile_index.exact(tp.name)
+                )
+                if p is not None and p.teacher_progress_id is None
+            ]
+            if len(name_matches) == 1:
+                profile = name_matches[0]
+        elif tp_normalized:
             # Get candidate profiles with no TP link
             candidates = PathfulUserProfile.query.filter(
                 PathfulUserProfile.signup_role == "Educator",
@@ -0,0 +1,494 @@
+"""
+Virtual Session Aggregate Service
+=================================
+
+Persistent, incrementally maintained aggregate store for the virtual
+session usage dashboard.
+
+The store has two parts (models/reports.py):
+    - VirtualSessionEventRows: the unfiltered report rows each event
+      contributes, so an event's old contribution can be subtracted
+    - VirtualSessionAggregate: per-district and overall counts, per-month
+      experience counts and reference-counted distinct-key maps (teachers,
+      schools, sessions, professionals, ...)
+
+A full rebuild scans the year once. After that, a Pathful import or an edit
+to a single event applies a delta for just the touched events, and the
+dashboard assembles its rows and summaries from the store instead of
+recomputing the year and rewriting VirtualSessionReportCache.session_data.
+
+The store is not tracked by the after_flush dependency hooks; callers that
+change virtual session events apply deltas explicitly. Changes made through
+other paths (Salesforce imports, contact renames) are picked up by the full
+rebuild once the store is older than the cache TTL.
+
+Usage:
+    from services.virtual_aggregate_service import (
+        apply_virtual_session_deltas,
+        get_virtual_aggregate_report,
+        rebuild_virtual_aggregates,
+    )
+
+    rebuild_virtual_aggregates("2024-2025")
+    apply_virtual_session_deltas([event.id])
+    apply_virtual_session_deltas_or_drop([event.id], ["2024-2025"])
+    report = get_virtual_aggregate_report("2024-2025")
+"""
+
+import json
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from models import db, eagerload_virtual_session_bundle
+from models.event import Event, EventType
+from models.reports import VirtualSessionAggregate, VirtualSessionEventRows
+from routes.reports.common import generate_school_year_options, get_virtual_year_dates
+from services.virtual_computation_service import (
+    MAIN_DISTRICTS,
+    SUMMARY_KEY_SETS,
+    build_event_session_rows,
+    collect_event_filter_keys,
+    load_event_schools,
+    session_summary_keys,
+    summarize_district_keys,
+    summarize_overall_keys,
+)
+
+logger = logging.getLogger(__name__)
+
+# district_name of the cross-district aggregate row
+OVERALL_DISTRICT = "__all__"
+
+FILTER_KEY_SETS = ("districts", "schools", "career_clusters", "statuses")
+
+# Full rebuild age after which the store is treated as missing
+MAX_AGE_HOURS = 24
+
+
+@dataclass
+class VirtualAggregateReport:
+    """Full-year virtual session report assembled from the aggregate store."""
+
+    session_data: list
+    district_summaries: dict
+    overall_summary: dict
+    filter_options: dict
+    monthly_counts: dict
+    last_updated: datetime
+
+
+@dataclass
+class _AggregateDelta:
+    """Signed changes to one VirtualSessionAggregate row."""
+
+    rows: int = 0
+    experiences: int = 0
+    keys: dict = field(default_factory=lambda: defaultdict(Counter))
+    months: Counter = field(default_factory=Counter)
+    filters: dict = field(default_factory=lambda: defaultdict(Counter))
+
+
+def virtual_year_for_date(value):
+    """Return the virtual year ('2024-2025', Aug 1 - Jul 31) containing a date."""
+    if value is None:
+        return None
+    start_year = value.year if value.month >= 8 else value.year - 1
+    return f"{start_year}-{start_year + 1}"
+
+
+def _month_key(value):
+    return value.strftime("%Y-%m") if value else None
+
+
+def _encode(key):
+    # JSON object keys are strings; encoding keeps 5 and "5" distinct
+    return json.dumps(key)
+
+
+# --- Delta accumulation ----------------------------------------------------
+
+
+def _add_contribution(deltas, rows, filter_keys, month, sign):
+    """Add (sign=1) or subtract (sign=-1) one event's rows to a delta map."""
+    overall = deltas[OVERALL_DISTRICT]
+    for name in FILTER_KEY_SETS:
+        for value in filter_keys.get(name, ()):
+            overall.filters[name][_encode(value)] += sign
+
+    for row in rows:
+        district_name = row["district"]
+        if not district_name:
+            continue
+        deltas[district_name].rows += sign
+        overall.rows += sign
+
+        keys = session_summary_keys(row)
+        if keys is None:
+            continue
+        for target in (deltas[district_name], overall):
+            target.experiences += sign
+            if month:
+                target.months[month] += sign
+            for name, values in keys.items():
+                for value in values:
+                    target.keys[name][_encode(value)] += sign
+
+
+def _merge_counter(stored, changes):
+    """Apply signed changes to a {key: count} map, dropping zeros."""
+    merged = dict(stored or {})
+    for key, change in changes.items():
+        value = merged.get(key, 0) + change
+        if value > 0:
+            merged[key] = value
+        else:
+            merged.pop(key, None)
+    return merged
+
+
+def _merge_counts(stored, changes):
+    """Apply signed changes to a {name: {key: refcount}} map."""
+    merged = dict(stored or {})
+    for name, counter in changes.items():
+        merged[name] = _merge_counter(merged.get(name), counter)
+    return merged
+
+
+def _apply_deltas(virtual_year, deltas, built_at=None):
+    """Write accumulated deltas to the VirtualSessionAggregate rows of a year."""
+    existing = {
+        aggregate.district_name: aggregate
+        for aggregate in VirtualSessionAggregate.query.filter(
+            VirtualSessionAggregate.virtual_year == virtual_year,
+            VirtualSessionAggregate.district_name.in_(list(deltas)),
+        )
+    }
+
+    for district_name, delta in deltas.items():
+        is_overall = district_name == OVERALL_DISTRICT
+        aggregate = existing.get(district_name)
+        if aggregate is None:
+            aggregate = VirtualSessionAggregate(
+                virtual_year=virtual_year,
+                district_name=district_name,
+                row_count=0,
+                experience_count=0,
+                key_counts={},
+                monthly_counts={},
+                filter_counts={} if is_overall else None,
+            )
+            db.session.add(aggregate)
+
+        aggregate.row_count += delta.rows
+        aggregate.experience_count += delta.experiences
+        aggregate.key_counts = _merge_counts(aggregate.key_counts, delta.keys)
+        aggregate.monthly_counts = _merge_counter(
+            aggregate.monthly_counts, delta.months
+        )
+        if is_overall:
+            aggregate.filter_counts = _merge_counts(
+                aggregate.filter_counts, delta.filters
+            )
+            if built_at:
+                aggregate.built_at = built_at
+        elif aggregate.row_count <= 0:
+            # District no longer has any rows
+            if aggregate.id is None:
+                db.session.expunge(aggregate)
+            else:
+                db.session.delete(aggregate)
+
+
+# --- Public API ------------------------------------------------------------
+
+
+def rebuild_virtual_aggregates(virtual_year):
+    """
+    Rebuild the aggregate store for a virtual year from the event tables.
+
+    Args:
+        virtual_year: The virtual year (e.g. "2024-2025")
+
+    Returns:
+        int: Number of events in the rebuilt store
+    """
+    date_from, date_to = get_virtual_year_dates(virtual_year)
+    try:
+        _delete_year(virtual_year)
+
+        events = (
+            eagerload_virtual_session_bundle(Event.query)
+            .filter(
+                Event.type == EventType.VIRTUAL_SESSION,
+                Event.start_date >= date_from,
+                Event.start_date <= date_to,
+            )
+            .all()
+        )
+
+        schools = load_event_schools(events)
+        deltas = defaultdict(_AggregateDelta)
+        # Overall row must exist even for an empty year
+        deltas[OVERALL_DISTRICT] = _AggregateDelta()
+        for event in events:
+            rows = build_event_session_rows(event, schools)
+            filter_keys = collect_event_filter_keys(event, schools)
+            _add_contribution(
+                deltas, rows, filter_keys, _month_key(event.start_date), 1
+            )
+            db.session.add(
+                VirtualSessionEventRows(
+                    virtual_year=virtual_year,
+                    event_id=event.id,
+                    start_date=event.start_date,
+                    rows=rows,
+                    filter_keys=filter_keys,
+                )
+            )
+
+        _apply_deltas(virtual_year, deltas, built_at=datetime.now(timezone.utc))
+        db.session.commit()
+        logger.info(
+            "Virtual aggregate store rebuilt for %s (%d events)",
+            virtual_year,
+            len(events),
+        )
+        return len(events)
+    except Exception:
+        db.session.rollback()
+        logger.exception("Virtual aggregate rebuild failed for %s", virtual_year)
+        raise
+
+
+def apply_virtual_session_deltas(event_ids):
+    """
+    Update the aggregate store for created, edited or deleted events.
+
+    Each event's stored rows are subtracted and its current rows added.
+    Years whose store has not been built are skipped; they are built in
+    full on the next dashboard request.
+
+    Args:
+        event_ids: Ids of events that changed (deleted ids are allowed)
+
+    Returns:
+        dict: virtual year -> number of events applied
+    """
+    event_ids = {event_id for event_id in event_ids if event_id is not None}
+    if not event_ids:
+        return {}
+
+    try:
+        built_years = {
+            year
+            for (year,) in db.session.query(VirtualSessionAggregate.virtual_year)
+            .filter_by(district_name=OVERALL_DISTRICT)
+            .all()
+        }
+        stored = {
+            record.event_id: record
+            for record in VirtualSessionEventRows.query.filter(
+                VirtualSessionEventRows.event_id.in_(event_ids)
+            )
+        }
+        events = {
+            event.id: event
+            for event in eagerload_virtual_session_bundle(Event.query).filter(
+                Event.id.in_(event_ids), Event.type == EventType.VIRTUAL_SESSION
+            )
+        }
+
+        schools = load_event_schools(events.values())
+        deltas_by_year = defaultdict(lambda: defaultdict(_AggregateDelta))
+        applied = defaultdict(set)
+
+        # Subtract previous contributions
+        for event_id, old in stored.items():
+            if old.virtual_year in built_years:
+                _add_contribution(
+                    deltas_by_year[old.virtual_year],
+                    old.rows,
+                    old.filter_keys,
+                    _month_key(old.start_date),
+                    -1,
+                )
+                applied[old.virtual_year].add(event_id)
+            db.session.delete(old)
+        # Free the unique event_id values before re-adding
+        db.session.flush()
+
+        # Add current contributions
+        for event_id, event in events.items():
+            year = virtual_year_for_date(event.start_date)
+            if year not in built_years:
+                continue
+
+            rows = build_event_session_rows(event, schools)
+            filter_keys = collect_event_filter_keys(event, schools)
+            _add_contribution(
+                deltas_by_year[year],
+                rows,
+                filter_keys,
+                _month_key(event.start_date),
+                1,
+            )
+            applied[year].add(event_id)
+            db.session.add(
+                VirtualSessionEventRows(
+                    virtual_year=year,
+                    event_id=event_id,
+                    start_date=event.start_date,
+                    rows=rows,
+                    filter_keys=filter_keys,
+                )
+            )
+
+        for year, deltas in deltas_by_year.items():
+            _apply_deltas(year, deltas)
+        db.session.commit()
+        return {year: len(ids) for year, ids in applied.items()}
+    except Exception:
+        db.session.rollback()
+        logger.exception("Virtual aggregate delta failed for events %s", event_ids)
+        raise
+
+
+def apply_virtual_session_deltas_or_drop(event_ids, virtual_years):
+    """
+    Apply deltas for changed events, or drop the store if that fails.
+
+    A failed delta leaves the store out of step with the events, so the
+    affected years are dropped and rebuilt in full on the next dashboard
+    request instead of serving stale counts. Never raises.
+
+    Args:
+        event_ids: Ids of events that changed (deleted ids are allowed)
+        virtual_years: Virtual years the events belong (or belonged) to;
+            None drops every year
+
+    Returns:
+        bool: True if the deltas were applied
+    """
+    try:
+        apply_virtual_session_deltas(event_ids)
+        return True
+    except Exception:
+        years = set(virtual_years) if virtual_years is not None else {None}
+        for virtual_year in years:
+            try:
+                invalidate_virtual_aggregates(virtual_year)
+            except Exception:
+                # Already logged by invalidate_virtual_aggregates
+                pass
+        return False
+
+
+def get_virtual_aggregate_report(virtual_year, show_all_districts=False):
+    """
+    Assemble the full-year virtual session report from the aggregate store.
+
+    Mirrors compute_virtual_session_data(virtual_year, ..., filters={}) for
+    the full virtual year date range.
+
+    Args:
+        virtual_year: The virtual year (e.g. "2024-2025")
+        show_all_districts: If True, summarize every district
+
+    Returns:
+        VirtualAggregateReport, or None if the store is missing or stale
+    """
+    overall = VirtualSessionAggregate.query.filter_by(
+        virtual_year=virtual_year, district_name=OVERALL_DISTRICT
+    ).first()
+    if not overall or not _is_fresh(overall.built_at):
+        return None
+
+    def key_sets(aggregate):
+        return {name: aggregate.key_counts.get(name, {}) for name in SUMMARY_KEY_SETS}
+
+    district_summaries = {
+        aggregate.district_name: summarize_district_keys(
+            key_sets(aggregate), aggregate.experience_count
+        )
+        for aggregate in VirtualSessionAggregate.query.filter(
+            VirtualSessionAggregate.virtual_year == virtual_year,
+            VirtualSessionAggregate.district_name != OVERALL_DISTRICT,
+        )
+    }
+    if not show_all_districts:
+        district_summaries = {
+            k: v for k, v in district_summaries.items() if k in MAIN_DISTRICTS
+        }
+
+    filter_values = {
+        name: sorted(json.loads(key) for key in overall.filter_counts.get(name, {}))
+        for name in FILTER_KEY_SETS
+    }
+    empty_key_sets = {name: () for name in SUMMARY_KEY_SETS}
+    for district_name in filter_values["districts"]:
+        if district_name not in district_summaries:
+            district_summaries[district_name] = summarize_district_keys(
+                empty_key_sets, 0
+            )
+
+    session_data = []
+    for (rows,) in (
+        db.session.query(VirtualSessionEventRows.rows)
+        .filter_by(virtual_year=virtual_year)
+        .order_by(
+            VirtualSessionEventRows.start_date.desc(),
+            VirtualSessionEventRows.event_id,
+        )
+    ):
+        session_data.extend(rows)
+
+    return VirtualAggregateReport(
+        session_data=session_data,
+        district_summaries=district_summaries,
+        overall_summary=summarize_overall_keys(
+            key_sets(overall), overall.experience_count
+        ),
+        filter_options={
+            "school_years": generate_school_year_options(),
+            "career_clusters": filter_values["career_clusters"],
+            "schools": filter_values["schools"],
+            "districts": filter_values["districts"],
+            "statuses": filter_values["statuses"],
+        },
+        monthly_counts=dict(sorted(overall.monthly_counts.items())),
+        last_updated=overall.last_updated,
+    )
+
+
+def invalidate_virtual_aggregates(virtual_year=None):
+    """
+    Drop the aggregate store for a virtual year, or for all years.
+
+    Args:
+        virtual_year: Specific year to drop, or None for all years
+    """
+    try:
+        _delete_year(virtual_year)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("Virtual aggregate invalidation failed")
+        raise
+
+
+def _delete_year(virtual_year):
+    for model in (VirtualSessionAggregate, VirtualSessionEventRows):
+        query = model.query
+        if virtual_year:
+            query = query.filter_by(virtual_year=virtual_year)
+        query.delete(synchronize_session=False)
+
+
+def _is_fresh(built_at):
+    if built_at is None:
+        return False
+    if built_at.tzinfo is None:
+        built_at = built_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - built_at < timedelta(hours=MAX_AGE_HOURS)
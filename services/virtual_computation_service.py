@@ -11,6 +11,9 @@ utilities used by both UIs.
 
 from datetime import datetime
 
+from sqlalchemy.orm import joinedload
+
+from models.contact import LocalStatusEnum
 from models.google_sheet import GoogleSheet
 from models.school_model import School
 
@@ -245,6 +248,201 @@ def district_name_matches(target_district_name, compare_district_name):
     return False
 
 
+# ── Session Rows ──────────────────────────────────────────────────────
+
+
+def load_event_schools(events):
+    """
+    Load every school referenced by the events' registered teachers.
+
+    One query for all schools (with their districts) instead of a
+    School lookup per teacher registration.
+
+    Args:
+        events: Event instances with teacher_registrations loaded
+
+    Returns:
+        Dict of school id -> School
+    """
+    school_ids = {
+        teacher_reg.teacher.school_id
+        for event in events
+        for teacher_reg in event.teacher_registrations
+        if teacher_reg.teacher and teacher_reg.teacher.school_id
+    }
+    if not school_ids:
+        return {}
+
+    schools = School.query.options(joinedload(School.district)).filter(
+        School.id.in_(school_ids)
+    )
+    return {school.id: school for school in schools}
+
+
+def collect_event_filter_keys(event, schools):
+    """
+    Collect the filter option values an event contributes.
+
+    Args:
+        event: Virtual session Event instance
+        schools: Dict of school id -> School from load_event_schools
+
+    Returns:
+        Dict with "districts", "schools", "career_clusters" and "statuses" lists
+    """
+    keys = {"districts": [], "schools": [], "career_clusters": [], "statuses": []}
+
+    if event.districts:
+        keys["districts"].append(event.districts[0].name)
+    elif event.district_partner:
+        keys["districts"].append(event.district_partner)
+
+    if event.series:
+        keys["career_clusters"].append(event.series)
+    if event.status:
+        keys["statuses"].append(event.status.value)
+
+    # Schools and their districts from teacher registrations
+    for teacher_reg in event.teacher_registrations:
+        teacher = teacher_reg.teacher
+        if teacher and teacher.school_id:
+            school = schools.get(teacher.school_id)
+            if school:
+                keys["schools"].append(school.name)
+                if hasattr(school, "district") and school.district:
+                    keys["districts"].append(school.district.name)
+
+    return keys
+
+
+def _event_district_name(event):
+    """Event-level district fallback for session rows."""
+    if event.districts:
+        return event.districts[0].name
+    if event.district_partner:
+        return event.district_partner
+    return "Unknown District"
+
+
+def _event_presenter_fields(event):
+    """Presenter columns shared by every row of an event."""
+    if not event.volunteers:
+        return {"presenter": "", "presenter_organization": "", "presenter_data": []}
+
+    return {
+        "presenter": ", ".join([v.full_name for v in event.volunteers]),
+        "presenter_organization": ", ".join(
+            [get_primary_org_name(v) or "Independent" for v in event.volunteers]
+        ),
+        "presenter_data": [
+            {
+                "id": v.id,
+                "name": v.full_name,
+                "is_people_of_color": v.is_people_of_color,
+                "organization_name": v.organization_name,
+                "organizations": (
+                    [org.name for org in v.organizations] if v.organizations else []
+                ),
+                "is_local": getattr(v, "local_status", None) == LocalStatusEnum.local,
+            }
+            for v in event.volunteers
+        ],
+    }
+
+
+def build_event_session_rows(event, schools):
+    """
+    Build the report rows for a virtual session event.
+
+    One row per teacher registration, or a single event-level row when the
+    event has no registrations. Rows are unfiltered.
+
+    Args:
+        event: Virtual session Event instance
+        schools: Dict of school id -> School from load_event_schools
+
+    Returns:
+        List of session records
+    """
+    presenter_fields = _event_presenter_fields(event)
+    event_fields = {
+        "event_id": event.id,
+        "source_host": getattr(event, "session_host", "") or "",
+        "date": event.start_date.strftime("%m/%d/%y") if event.start_date else "",
+        "time": event.start_date.strftime("%I:%M %p") if event.start_date else "",
+        "session_type": event.additional_information or "",
+    }
+    trailing_fields = {
+        "topic_theme": event.series or "",
+        "session_link": event.registration_link or "",
+        "session_id": event.session_id or "",
+        "participant_count": event.participant_count or 0,
+        "duration": event.duration or 0,
+    }
+
+    if not event.teacher_registrations:
+        return [
+            {
+                **event_fields,
+                "status": event.status.value if event.status else "",
+                "teacher_name": "",
+                "teacher_id": None,
+                "school_name": "",
+                "school_level": "",
+                "district": _event_district_name(event),
+                "session_title": event.title,
+                **presenter_fields,
+                **trailing_fields,
+                "is_simulcast": False,
+            }
+        ]
+
+    rows = []
+    for teacher_reg in event.teacher_registrations:
+        teacher = teacher_reg.teacher
+
+        school = None
+        school_name = ""
+        school_level = ""
+        if teacher:
+            if hasattr(teacher, "school_obj") and teacher.school_obj:
+                school = teacher.school_obj
+            elif teacher.school_id:
+                school = schools.get(teacher.school_id)
+            if school:
+                school_name = school.name
+                school_level = getattr(school, "level", "")
+
+        # Teacher's school district takes priority over the event's district
+        if school and hasattr(school, "district") and school.district:
+            district_name = school.district.name
+        else:
+            district_name = _event_district_name(event)
+
+        rows.append(
+            {
+                **event_fields,
+                # Use the event's status for session-level filtering
+                # (completed/simulcast), not the teacher registration status
+                "status": (event.status.value if getattr(event, "status", None) else "")
+                or "registered",
+                "teacher_name": (
+                    f"{teacher.first_name} {teacher.last_name}" if teacher else ""
+                ),
+                "teacher_id": teacher.id if teacher else None,
+                "school_name": school_name,
+                "school_level": school_level,
+                "district": district_name,
+                "session_title": event.title,
+                **presenter_fields,
+                **trailing_fields,
+                "is_simulcast": teacher_reg.is_simulcast,
+            }
+        )
+
+    return rows
+
+
 # ── Filtering ─────────────────────────────────────────────────────────
 
 
@@ -253,12 +451,18 @@ def apply_runtime_filters(session_data, filters):
     Apply runtime filters to session data.
 
     Args:
-        session_data: List of session records
+        session_data: List of session records or a SessionFrame
         filters: Dictionary of filter criteria
 
     Returns:
         Filtered session data
     """
+    # Imported here: virtual_session_frame builds on this module
+    from services.virtual_session_frame import SessionFrame
+
+    if isinstance(session_data, SessionFrame):
+        return session_data.filter(filters)
+
     filtered_data = []
 
     for session in session_data:
@@ -320,6 +524,160 @@ def apply_runtime_filters(session_data, filters):
 
 # ── Summarization ─────────────────────────────────────────────────────
 
+# Distinct-key sets tracked per district and overall for summaries
+SUMMARY_KEY_SETS = (
+    "teachers",
+    "schools",
+    "sessions",
+    "session_ids",
+    "organizations",
+    "professionals",
+    "professionals_of_color",
+    "local_professionals",
+    "local_sessions",
+    "poc_sessions",
+)
+
+
+def session_summary_keys(session):
+    """
+    Get the distinct keys a session row contributes to summaries.
+
+    Only rows with a district and a status in COMPLETED_STATUSES count.
+
+    Args:
+        session: Session record
+
+    Returns:
+        Dict of SUMMARY_KEY_SETS name -> list of keys, or None if the row
+        does not count towards summaries
+    """
+    session_status = session.get("status", "").strip().lower()
+    if session_status not in COMPLETED_STATUSES or not session["district"]:
+        return None
+
+    keys = {name: [] for name in SUMMARY_KEY_SETS}
+
+    if session["teacher_name"]:
+        keys["teachers"].append(session["teacher_name"])
+    if session["school_name"]:
+        keys["schools"].append(session["school_name"])
+
+    # Sessions (prefer event_id when available)
+    if session.get("session_title"):
+        keys["sessions"].append(session["session_title"])
+    if session.get("event_id"):
+        keys["session_ids"].append(session["event_id"])
+
+    if session["presenter_data"]:
+        for presenter_data in session["presenter_data"]:
+            presenter_name = presenter_data.get("name", "")
+            if not presenter_name:
+                continue
+
+            # Unique professionals (prefer ID)
+            pid = presenter_data.get("id") or presenter_name
+            keys["professionals"].append(pid)
+
+            organization_name = presenter_data.get("organization_name")
+            if organization_name:
+                keys["organizations"].append(organization_name)
+            if presenter_data.get("is_people_of_color", False):
+                keys["professionals_of_color"].append(pid)
+            if presenter_data.get("is_local"):
+                keys["local_professionals"].append(pid)
+
+        # Session-level flags (local / POC sessions)
+        sid_flag = session.get("event_id") or session.get("session_title")
+        if sid_flag:
+            if any(p.get("is_local") for p in session["presenter_data"]):
+                keys["local_sessions"].append(sid_flag)
+            if any(p.get("is_people_of_color") for p in session["presenter_data"]):
+                keys["poc_sessions"].append(sid_flag)
+
+    elif session["presenter"]:
+        # Fallback to old presenter format
+        for presenter in (p.strip() for p in session["presenter"].split(",")):
+            if presenter:
+                keys["professionals"].append(presenter)
+
+    return keys
+
+
+def summarize_district_keys(key_sets, experience_count):
+    """
+    Build a district summary from its distinct-key containers.
+
+    Args:
+        key_sets: Dict of SUMMARY_KEY_SETS name -> sized container of keys
+        experience_count: Number of completed session rows
+
+    Returns:
+        District summary dict
+    """
+    session_count = len(key_sets["session_ids"]) or len(key_sets["sessions"])
+    local_session_count = len(key_sets["local_sessions"])
+    poc_session_count = len(key_sets["poc_sessions"])
+    teacher_count = len(key_sets["teachers"])
+
+    return {
+        "total_students": teacher_count * 25,
+        "total_experiences": experience_count,
+        "teacher_count": teacher_count,
+        "school_count": len(key_sets["schools"]),
+        "session_count": session_count,
+        "organization_count": len(key_sets["organizations"]),
+        "professional_count": len(key_sets["professionals"]),
+        "professional_of_color_count": len(key_sets["professionals_of_color"]),
+        "local_professional_count": len(key_sets["local_professionals"]),
+        "local_session_count": local_session_count,
+        "poc_session_count": poc_session_count,
+        "local_session_percent": (
+            round(100 * local_session_count / session_count) if session_count else 0
+        ),
+        "poc_session_percent": (
+            round(100 * poc_session_count / session_count) if session_count else 0
+        ),
+    }
+
+
+def summarize_overall_keys(key_sets, experience_count):
+    """
+    Build the overall summary from distinct-key containers across districts.
+
+    Args:
+        key_sets: Dict of SUMMARY_KEY_SETS name -> sized container of keys
+        experience_count: Number of completed session rows
+
+    Returns:
+        Overall summary dict
+    """
+    teacher_count = len(key_sets["teachers"])
+    session_count = len(key_sets["session_ids"]) or len(key_sets["sessions"])
+    local_session_count = len(key_sets["local_sessions"])
+    poc_session_count = len(key_sets["poc_sessions"])
+    denom = session_count or 1
+
+    return {
+        "teacher_count": teacher_count,
+        "student_count": teacher_count * 25,
+        "session_count": session_count,
+        "experience_count": experience_count,
+        "organization_count": len(key_sets["organizations"]),
+        "professional_count": len(key_sets["professionals"]),
+        "professional_of_color_count": len(key_sets["professionals_of_color"]),
+        "local_professional_count": len(key_sets["local_professionals"]),
+        "school_count": len(key_sets["schools"]),
+        "local_session_count": local_session_count,
+        "poc_session_count": poc_session_count,
+        "local_session_percent": (
+            round(100 * local_session_count / denom) if local_session_count else 0
+        ),
+        "poc_session_percent": (
+            round(100 * poc_session_count / denom) if poc_session_count else 0
+        ),
+    }
+
 
 def calculate_summaries_from_sessions(session_data, show_all_districts=False):
     """
@@ -327,172 +685,49 @@ def calculate_summaries_from_sessions(session_data, show_all_districts=False):
     Only counts sessions with status in COMPLETED_STATUSES.
 
     Args:
-        session_data: List of session records
+        session_data: List of session records or a SessionFrame
         show_all_districts: If True, show all districts.
 
     Returns:
         Tuple of (district_summaries, overall_summary)
     """
-    district_summaries = {}
-    overall_stats = {
-        "teacher_count": set(),
-        "student_count": 0,
-        "session_count": set(),
-        "experience_count": 0,
-        "organization_count": set(),
-        "professional_count": set(),
-        "professional_of_color_count": set(),
-        "local_professional_count": set(),
-        "local_sessions": set(),
-        "poc_sessions": set(),
-        "school_count": set(),
-    }
+    # Imported here: virtual_session_frame builds on this module
+    from services.virtual_session_frame import SessionFrame
+
+    if isinstance(session_data, SessionFrame):
+        return session_data.summarize(show_all_districts)
+
+    district_keys = {}
+    district_experiences = {}
+    overall_keys = {name: set() for name in SUMMARY_KEY_SETS}
+    overall_experiences = 0
 
-    # First pass: initialize districts
-    for session in session_data:
-        if session["district"]:
-            if session["district"] not in district_summaries:
-                district_summaries[session["district"]] = {
-                    "teachers": set(),
-                    "schools": set(),
-                    "sessions": set(),
-                    "total_students": 0,
-                    "total_experiences": 0,
-                    "organizations": set(),
-                    "professionals": set(),
-                    "professionals_of_color": set(),
-                    "local_professionals": set(),
-                }
-
-    # Second pass: process completed sessions
     for session in session_data:
-        session_status = session.get("status", "").strip().lower()
-        if session_status not in COMPLETED_STATUSES:
+        district_name = session["district"]
+        if not district_name:
             continue
 
-        if not session["district"]:
+        # Every district with rows gets a summary, even with no completed sessions
+        if district_name not in district_keys:
+            district_keys[district_name] = {name: set() for name in SUMMARY_KEY_SETS}
+            district_experiences[district_name] = 0
+
+        keys = session_summary_keys(session)
+        if keys is None:
             continue
 
-        district_summary = district_summaries[session["district"]]
-
-        # Teachers
-        if session["teacher_name"]:
-            district_summary["teachers"].add(session["teacher_name"])
-            overall_stats["teacher_count"].add(session["teacher_name"])
-
-        # Schools
-        if session["school_name"]:
-            district_summary["schools"].add(session["school_name"])
-            overall_stats["school_count"].add(session["school_name"])
-
-        # Sessions (prefer event_id when available)
-        if session.get("session_title"):
-            district_summary["sessions"].add(session["session_title"])
-            overall_stats["session_count"].add(session["session_title"])
-        if session.get("event_id"):
-            if "session_ids" not in district_summary:
-                district_summary["session_ids"] = set()
-            district_summary["session_ids"].add(session["event_id"])
-            overall_stats.setdefault("session_ids", set()).add(session["event_id"])
-
-        # Experiences
-        district_summary["total_experiences"] += 1
-        overall_stats["experience_count"] += 1
-
-        # Process presenters
-        if session["presenter_data"]:
-            for presenter_data in session["presenter_data"]:
-                presenter_name = presenter_data.get("name", "")
-                presenter_id = presenter_data.get("id")
-                if not presenter_name:
-                    continue
+        for name, values in keys.items():
+            district_keys[district_name][name].update(values)
+            overall_keys[name].update(values)
+        district_experiences[district_name] += 1
+        overall_experiences += 1
 
-                # Unique professionals (prefer ID)
-                pid = presenter_id or presenter_name
-                district_summary["professionals"].add(pid)
-                overall_stats["professional_count"].add(pid)
-
-                # Organizations
-                organization_name = presenter_data.get("organization_name")
-                if organization_name:
-                    district_summary["organizations"].add(organization_name)
-                    overall_stats["organization_count"].add(organization_name)
-
-                # People of color
-                if presenter_data.get("is_people_of_color", False):
-                    district_summary["professionals_of_color"].add(pid)
-                    overall_stats["professional_of_color_count"].add(pid)
-
-                # Local professionals (single check — no duplicate)
-                if presenter_data.get("is_local"):
-                    district_summary["local_professionals"].add(pid)
-                    overall_stats["local_professional_count"].add(pid)
-
-            # Session-level flags (local / POC sessions)
-            sid_flag = session.get("event_id") or session.get("session_title")
-            if sid_flag:
-                if any(p.get("is_local") for p in session["presenter_data"]):
-                    overall_stats["local_sessions"].add(sid_flag)
-                    if "local_sessions" not in district_summary:
-                        district_summary["local_sessions"] = set()
-                    district_summary["local_sessions"].add(sid_flag)
-                if any(p.get("is_people_of_color") for p in session["presenter_data"]):
-                    overall_stats["poc_sessions"].add(sid_flag)
-                    if "poc_sessions" not in district_summary:
-                        district_summary["poc_sessions"] = set()
-                    district_summary["poc_sessions"].add(sid_flag)
-
-        elif session["presenter"]:
-            # Fallback to old presenter format
-            presenters = [p.strip() for p in session["presenter"].split(",")]
-            for presenter in presenters:
-                if presenter:
-                    district_summary["professionals"].add(presenter)
-                    overall_stats["professional_count"].add(presenter)
-
-    # Convert sets to counts
-    for district_name, summary in district_summaries.items():
-        summary["teacher_count"] = len(summary["teachers"])
-        summary["school_count"] = len(summary["schools"])
-        summary["session_count"] = (
-            len(summary.get("session_ids", set()))
-            if summary.get("session_ids")
-            else len(summary["sessions"])
+    district_summaries = {
+        district_name: summarize_district_keys(
+            key_sets, district_experiences[district_name]
         )
-        summary["organization_count"] = len(summary["organizations"])
-        summary["professional_count"] = len(summary["professionals"])
-        summary["professional_of_color_count"] = len(summary["professionals_of_color"])
-        summary["local_professional_count"] = len(summary["local_professionals"])
-        summary["local_session_count"] = len(summary.get("local_sessions", set()))
-        summary["poc_session_count"] = len(summary.get("poc_sessions", set()))
-
-        if summary["session_count"]:
-            summary["local_session_percent"] = round(
-                100 * summary["local_session_count"] / summary["session_count"]
-            )
-            summary["poc_session_percent"] = round(
-                100 * summary["poc_session_count"] / summary["session_count"]
-            )
-        else:
-            summary["local_session_percent"] = 0
-            summary["poc_session_percent"] = 0
-
-        summary["total_students"] = summary["teacher_count"] * 25
-
-        # Clean up working sets
-        for key in (
-            "teachers",
-            "schools",
-            "sessions",
-            "session_ids",
-            "organizations",
-            "professionals",
-            "professionals_of_color",
-            "local_professionals",
-            "local_sessions",
-            "poc_sessions",
-        ):
-            summary.pop(key, None)
+        for district_name, key_sets in district_keys.items()
+    }
 
     # Filter districts
     if not show_all_districts:
@@ -500,53 +735,90 @@ def calculate_summaries_from_sessions(session_data, show_all_districts=False):
             k: v for k, v in district_summaries.items() if k in MAIN_DISTRICTS
         }
 
-    # Overall summary
-    unique_teacher_count = len(overall_stats["teacher_count"])
-    overall_session_count = (
-        len(overall_stats.get("session_ids", set()))
-        if overall_stats.get("session_ids")
-        else len(overall_stats["session_count"])
-    )
+    return district_summaries, summarize_overall_keys(overall_keys, overall_experiences)
 
-    overall_summary = {
-        "teacher_count": unique_teacher_count,
-        "student_count": unique_teacher_count * 25,
-        "session_count": overall_session_count,
-        "experience_count": overall_stats["experience_count"],
-        "organization_count": len(overall_stats["organization_count"]),
-        "professional_count": len(overall_stats["professional_count"]),
-        "professional_of_color_count": len(
-            overall_stats["professional_of_color_count"]
-        ),
-        "local_professional_count": len(overall_stats["local_professional_count"]),
-        "school_count": len(overall_stats["school_count"]),
-        "local_session_count": len(overall_stats["local_sessions"]),
-        "poc_session_count": len(overall_stats["poc_sessions"]),
-    }
 
-    # Percentages
-    denom = (
-        len(overall_stats.get("session_ids", set()))
-        if overall_stats.get("session_ids")
-        else (overall_summary["session_count"] or 1)
-    )
-    if denom == 0:
-        denom = 1
-    overall_summary["local_session_percent"] = (
-        round(100 * overall_summary["local_session_count"] / denom)
-        if overall_summary["local_session_count"]
-        else 0
-    )
-    overall_summary["poc_session_percent"] = (
-        round(100 * overall_summary["poc_session_count"] / denom)
-        if overall_summary["poc_session_count"]
-        else 0
-    )
+# ── Sorting & Pagination ──────────────────────────────────────────────
 
-    return district_summaries, overall_summary
+SORTABLE_COLUMNS = (
+    "status",
+    "date",
+    "time",
+    "session_type",
+    "teacher_name",
+    "school_name",
+    "school_level",
+    "district",
+    "session_title",
+    "presenter",
+    "presenter_organization",
+    "topic_theme",
+)
+
+
+def session_date_sort_key(value, current_filters):
+    """
+    Sort key for a session row's "M/D/YY" or "M/D" date string.
 
+    Two-part dates are placed in the selected virtual year (July-June).
+    Unparseable or empty dates sort as datetime.min.
+    """
+    try:
+        if value:
+            date_parts = value.split("/")
+            if len(date_parts) == 3:
+                month = int(date_parts[0])
+                day = int(date_parts[1])
+                year = int(date_parts[2])
+                if year < 50:
+                    year += 2000
+                else:
+                    year += 1900
+                return datetime(year, month, day)
+            elif len(date_parts) == 2:
+                month = int(date_parts[0])
+                day = int(date_parts[1])
+                virtual_year_start = int(current_filters["year"].split("-")[0])
+                if month >= 7:
+                    year = virtual_year_start
+                else:
+                    year = virtual_year_start + 1
+                return datetime(year, month, day)
+        return datetime.min
+    except (ValueError, IndexError):
+        return datetime.min
+
+
+def session_time_sort_key(value):
+    """Sort key for a session row's "HH:MM AM" time string."""
+    try:
+        if value:
+            return datetime.strptime(value, "%I:%M %p").time()
+        return datetime.min.time()
+    except ValueError:
+        return datetime.min.time()
 
-# ── Sorting & Pagination ──────────────────────────────────────────────
+
+def parse_pagination_args(request_args):
+    """
+    Parse page and per_page request arguments.
+
+    Returns:
+        Tuple of (page, per_page), falling back to 1 and 25
+    """
+    try:
+        page = int(request_args.get("page", 1))
+        if page < 1:
+            page = 1
+    except ValueError:
+        page = 1
+    try:
+        per_page = int(request_args.get("per_page", 25))
+        if per_page < 1:
+            per_page = 25
+    except ValueError:
+        per_page = 25
+    return page, per_page
 
 
 def apply_sorting_and_pagination(session_data, request_args, current_filters):
@@ -554,82 +826,43 @@ def apply_sorting_and_pagination(session_data, request_args, current_filters):
     Apply sorting and pagination to session data.
 
     Args:
-        session_data: List of session records
+        session_data: List of session records or a SessionFrame
         request_args: Request arguments for sorting/pagination
         current_filters: Current filter settings
 
     Returns:
         Dictionary with paginated_data and pagination info
     """
+    # Imported here: virtual_session_frame builds on this module
+    from services.virtual_session_frame import SessionFrame
+
+    if isinstance(session_data, SessionFrame):
+        return session_data.sort_and_paginate(request_args, current_filters)
+
     sort_column = request_args.get("sort", "date")
     sort_order = request_args.get("order", "desc")
 
-    sortable_columns = {
-        "status": "status",
-        "date": "date",
-        "time": "time",
-        "session_type": "session_type",
-        "teacher_name": "teacher_name",
-        "school_name": "school_name",
-        "school_level": "school_level",
-        "district": "district",
-        "session_title": "session_title",
-        "presenter": "presenter",
-        "presenter_organization": "presenter_organization",
-        "topic_theme": "topic_theme",
-    }
-
-    if sort_column in sortable_columns:
+    if sort_column in SORTABLE_COLUMNS:
         reverse_order = sort_order == "desc"
 
         if sort_column == "date":
-
-            def date_sort_key(session):
-                try:
-                    if session["date"]:
-                        date_parts = session["date"].split("/")
-                        if len(date_parts) == 3:
-                            month = int(date_parts[0])
-                            day = int(date_parts[1])
-                            year = int(date_parts[2])
-                            if year < 50:
-                                year += 2000
-                            else:
-                                year += 1900
-                            return datetime(year, month, day)
-                        elif len(date_parts) == 2:
-                            month = int(date_parts[0])
-                            day = int(date_parts[1])
-                            virtual_year_start = int(
-                                current_filters["year"].split("-")[0]
-                            )
-                            if month >= 7:
-                                year = virtual_year_start
-                            else:
-                                year = virtual_year_start + 1
-                            return datetime(year, month, day)
-                    return datetime.min
-                except (ValueError, IndexError):
-                    return datetime.min
-
-            session_data.sort(key=date_sort_key, reverse=reverse_order)
+            session_data.sort(
+                key=lambda session: session_date_sort_key(
+                    session["date"], current_filters
+                ),
+                reverse=reverse_order,
+            )
 
         elif sort_column == "time":
-
-            def time_sort_key(session):
-                try:
-                    if session["time"]:
-                        return datetime.strptime(session["time"], "%I:%M %p").time()
-                    return datetime.min.time()
-                except ValueError:
-                    return datetime.min.time()
-
-            session_data.sort(key=time_sort_key, reverse=reverse_order)
+            session_data.sort(
+                key=lambda session: session_time_sort_key(session["time"]),
+                reverse=reverse_order,
+            )
 
         else:
 
             def string_sort_key(session):
-                value = session.get(sortable_columns[sort_column], "") or ""
+                value = session.get(sort_column, "") or ""
                 return str(value).lower()
 
             session_data.sort(key=string_sort_key, reverse=reverse_order)
@@ -638,18 +871,7 @@ def apply_sorting_and_pagination(session_data, request_args, current_filters):
     current_filters["order"] = sort_order
 
     # Pagination
-    try:
-        page = int(request_args.get("page", 1))
-        if page < 1:
-            page = 1
-    except ValueError:
-        page = 1
-    try:
-        per_page = int(request_args.get("per_page", 25))
-        if per_page < 1:
-            per_page = 25
-    except ValueError:
-        per_page = 25
+    page, per_page = parse_pagination_args(request_args)
 
     total_records = len(session_data)
     total_pages = (total_records + per_page - 1) // per_page
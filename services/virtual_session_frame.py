@@ -0,0 +1,374 @@
+"""
+Columnar backend for virtual session rows.
+
+Wraps the cached session rows (list of dicts) in a pandas DataFrame so the
+runtime filters, summaries and sorting in virtual_computation_service can
+run as vectorized operations instead of per-row Python loops:
+
+  - district and status are categorical columns; status matching against
+    STATUS_FILTER_MAPPING is a single ``isin``
+  - lower-cased text columns are categorical, so substring filters are
+    evaluated once per distinct value rather than once per row
+  - distinct-key summaries are ``nunique`` over a precomputed long table
+    of (row, key set, key) built from session_summary_keys
+  - sort keys are ranked once per column and reused across requests
+
+A SessionFrame behaves like a read-only sequence of the original row dicts,
+so apply_runtime_filters, calculate_summaries_from_sessions and
+apply_sorting_and_pagination accept it in place of a list and return
+identical results.
+
+Usage:
+    from services.virtual_session_frame import get_session_frame
+
+    session_data = get_session_frame(cache_key, cached_rows)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from services.virtual_computation_service import (
+    COMPLETED_STATUSES,
+    MAIN_DISTRICTS,
+    SORTABLE_COLUMNS,
+    STATUS_FILTER_MAPPING,
+    SUMMARY_KEY_SETS,
+    parse_pagination_args,
+    session_date_sort_key,
+    session_summary_keys,
+    session_time_sort_key,
+    summarize_district_keys,
+    summarize_overall_keys,
+)
+
+# Lower-cased text columns used by substring filters
+TEXT_COLUMNS = {
+    "topic_lower": "topic_theme",
+    "school_lower": "school_name",
+    "teacher_lower": "teacher_name",
+    "title_lower": "session_title",
+    "presenter_lower": "presenter",
+}
+
+# Number of session row sets kept in the process-wide frame cache
+FRAME_CACHE_SIZE = 4
+
+_frame_cache = OrderedDict()
+_frame_cache_lock = threading.Lock()
+
+
+class _KeyCount:
+    """Sized stand-in for a distinct-key set whose size is already known."""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count):
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+
+class _SessionColumns:
+    """Column data shared by a base SessionFrame and every subset of it."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.columns = pd.DataFrame(
+            {
+                "district": pd.Categorical([row.get("district") or "" for row in rows]),
+                "status": pd.Categorical(
+                    [(row.get("status") or "").strip().lower() for row in rows]
+                ),
+                **{
+                    name: pd.Categorical(
+                        [str(row.get(field) or "").lower() for row in rows]
+                    )
+                    for name, field in TEXT_COLUMNS.items()
+                },
+            }
+        )
+        self.columns["counted"] = (self.columns["district"] != "") & self.columns[
+            "status"
+        ].isin(COMPLETED_STATUSES)
+        self.keys = self._build_keys()
+        self._ranks = {}
+        self._lock = threading.Lock()
+
+    def _build_keys(self):
+        """Long table of (pos, kind, key) for every row counted in summaries."""
+        positions, kinds, keys = [], [], []
+        counted = self.columns["counted"].to_numpy()
+        for pos in np.flatnonzero(counted):
+            for kind, values in session_summary_keys(self.rows[pos]).items():
+                positions.extend([pos] * len(values))
+                kinds.extend([kind] * len(values))
+                keys.extend(values)
+        return pd.DataFrame(
+            {
+                "pos": np.asarray(positions, dtype=np.int64),
+                "kind": pd.Categorical(kinds, categories=SUMMARY_KEY_SETS),
+                "key": pd.Series(keys, dtype=object),
+            }
+        )
+
+    def rank(self, column, current_filters):
+        """
+        Dense sort rank of every row for a sortable column.
+
+        Ranks are computed once per column (and per virtual year for dates)
+        from the same sort keys apply_sorting_and_pagination uses.
+        """
+        if column == "date":
+            cache_key = (column, current_filters.get("year"))
+            raw = [row["date"] for row in self.rows]
+
+            def sort_key(value):
+                return session_date_sort_key(value, current_filters)
+
+        elif column == "time":
+            cache_key = (column,)
+            raw = [row["time"] for row in self.rows]
+            sort_key = session_time_sort_key
+        else:
+            cache_key = (column,)
+            raw = [row.get(column, "") for row in self.rows]
+
+            def sort_key(value):
+                return str(value or "").lower()
+
+        with self._lock:
+            ranks = self._ranks.get(cache_key)
+            if ranks is not None:
+                return ranks
+
+            index = {}
+            codes = np.fromiter(
+                (index.setdefault(value, len(index)) for value in raw),
+                dtype=np.int64,
+                count=len(raw),
+            )
+            unique_ranks = np.empty(len(index), dtype=np.int64)
+            previous, rank = None, -1
+            for position, key in sorted(
+                ((position, sort_key(value)) for position, value in enumerate(index)),
+                key=lambda item: item[1],
+            ):
+                # Equal keys share a rank so the sort stays stable across them
+                if rank < 0 or key != previous:
+                    rank += 1
+                    previous = key
+                unique_ranks[position] = rank
+
+            ranks = unique_ranks[codes]
+            self._ranks[cache_key] = ranks
+            return ranks
+
+
+class SessionFrame:
+    """
+    Read-only, vectorized view over a list of virtual session rows.
+
+    Filtering returns a new SessionFrame sharing the same row dicts and
+    column data; rows are only materialized for the page being rendered.
+    """
+
+    def __init__(self, data, columns=None):
+        self._data = data
+        self.columns = data.columns if columns is None else columns
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a SessionFrame over a list of session row dicts."""
+        return cls(_SessionColumns(list(rows)))
+
+    # ── Sequence protocol ──
+
+    @property
+    def positions(self):
+        return self.columns.index.to_numpy()
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __iter__(self):
+        rows = self._data.rows
+        return (rows[pos] for pos in self.positions)
+
+    def __getitem__(self, item):
+        rows = self._data.rows
+        if isinstance(item, slice):
+            return [rows[pos] for pos in self.positions[item]]
+        return rows[self.positions[item]]
+
+    def copy(self):
+        return SessionFrame(self._data, self.columns)
+
+    def to_rows(self):
+        """Materialize the rows as a list of dicts."""
+        return list(self)
+
+    # ── Filtering ──
+
+    def filter(self, filters):
+        """Vectorized equivalent of apply_runtime_filters."""
+        columns = self.columns
+        mask = np.ones(len(columns), dtype=bool)
+
+        if filters.get("career_cluster"):
+            mask &= _contains(columns["topic_lower"], filters["career_cluster"].lower())
+
+        if filters.get("school"):
+            mask &= _contains(columns["school_lower"], filters["school"].lower())
+
+        if filters.get("district"):
+            mask &= (columns["district"] == filters["district"]).to_numpy()
+
+        if filters.get("status"):
+            filter_status = filters["status"].strip().lower()
+            allowed = {filter_status, *STATUS_FILTER_MAPPING.get(filter_status, ())}
+            mask &= columns["status"].isin(allowed).to_numpy()
+
+        if filters.get("search"):
+            search_term = filters["search"].strip().lower()
+            if search_term:
+                mask &= (
+                    _contains(columns["teacher_lower"], search_term)
+                    | _contains(columns["title_lower"], search_term)
+                    | _contains(columns["presenter_lower"], search_term)
+                )
+
+        return SessionFrame(self._data, columns[mask])
+
+    # ── Summarization ──
+
+    def summarize(self, show_all_districts=False):
+        """Vectorized equivalent of calculate_summaries_from_sessions."""
+        columns = self.columns
+        districts = columns["district"]
+
+        # Every district with rows gets a summary, in first-seen order
+        district_names = [name for name in pd.unique(districts) if name]
+
+        counted = columns["counted"].to_numpy()
+        experiences = districts[counted].value_counts()
+
+        selected = np.zeros(len(self._data.rows), dtype=bool)
+        selected[self.positions[counted]] = True
+        keys = self._data.keys
+        keys = keys[selected[keys["pos"].to_numpy()]]
+        base_districts = self._data.columns["district"].to_numpy()
+        keys = keys.assign(district=base_districts[keys["pos"].to_numpy()])
+
+        district_counts = {}
+        grouped = keys.groupby(["district", "kind"], observed=True)["key"].nunique()
+        for (district_name, kind), count in grouped.items():
+            district_counts.setdefault(district_name, {})[kind] = count
+        overall_counts = keys.groupby("kind", observed=True)["key"].nunique()
+
+        district_summaries = {
+            district_name: summarize_district_keys(
+                _key_counts(district_counts.get(district_name, {})),
+                int(experiences.get(district_name, 0)),
+            )
+            for district_name in district_names
+        }
+
+        if not show_all_districts:
+            district_summaries = {
+                k: v for k, v in district_summaries.items() if k in MAIN_DISTRICTS
+            }
+
+        overall_summary = summarize_overall_keys(
+            _key_counts(overall_counts), int(counted.sum())
+        )
+        return district_summaries, overall_summary
+
+    # ── Sorting & Pagination ──
+
+    def sort_and_paginate(self, request_args, current_filters):
+        """Vectorized equivalent of apply_sorting_and_pagination."""
+        sort_column = request_args.get("sort", "date")
+        sort_order = request_args.get("order", "desc")
+
+        positions = self.positions
+        if sort_column in SORTABLE_COLUMNS:
+            ranks = self._data.rank(sort_column, current_filters)[positions]
+            if sort_order == "desc":
+                ranks = -ranks
+            positions = positions[np.argsort(ranks, kind="stable")]
+
+        current_filters["sort"] = sort_column
+        current_filters["order"] = sort_order
+
+        page, per_page = parse_pagination_args(request_args)
+
+        total_records = len(positions)
+        total_pages = (total_records + per_page - 1) // per_page
+        start_idx = (page - 1) * per_page
+        rows = self._data.rows
+        paginated_data = [
+            rows[pos] for pos in positions[start_idx : start_idx + per_page]
+        ]
+
+        pagination = {
+            "current_page": page,
+            "per_page": per_page,
+            "total_pages": total_pages,
+            "total_records": total_records,
+        }
+
+        return {"paginated_data": paginated_data, "pagination": pagination}
+
+
+def _contains(column, term):
+    """Substring match on a categorical column, evaluated per category."""
+    categories = column.cat.categories
+    if not len(categories):
+        return np.zeros(len(column), dtype=bool)
+    hits = np.asarray(categories.str.contains(term, regex=False), dtype=bool)
+    return hits[column.cat.codes.to_numpy()]
+
+
+def _key_counts(counts):
+    """Map SUMMARY_KEY_SETS names to sized stand-ins from per-kind counts."""
+    return {name: _KeyCount(int(counts.get(name, 0))) for name in SUMMARY_KEY_SETS}
+
+
+def get_session_frame(cache_key, rows):
+    """
+    Get the SessionFrame for a set of cached session rows.
+
+    Frames are kept in a small process-wide LRU so repeated requests over
+    the same cache record reuse the built columns and sort ranks.
+
+    Args:
+        cache_key: Hashable identity of the rows, e.g. (virtual_year,
+            date_from, date_to, last_updated) of the cache record
+        rows: List of session row dicts
+
+    Returns:
+        SessionFrame over rows
+    """
+    with _frame_cache_lock:
+        frame = _frame_cache.get(cache_key)
+        if frame is not None:
+            _frame_cache.move_to_end(cache_key)
+            return frame
+
+    frame = SessionFrame.from_rows(rows)
+
+    with _frame_cache_lock:
+        _frame_cache[cache_key] = frame
+        while len(_frame_cache) > FRAME_CACHE_SIZE:
+            _frame_cache.popitem(last=False)
+    return frame
+
+
+def clear_session_frames():
+    """Drop every cached SessionFrame."""
+    with _frame_cache_lock:
+        _frame_cache.clear()
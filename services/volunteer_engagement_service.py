@@ -0,0 +1,291 @@
+"""
+Volunteer Engagement Service
+============================
+
+Maintains the VolunteerEngagementStats table (models/volunteer_engagement.py):
+attended and total participation counts, counts per event type, first and
+last attended event dates, and the last email date of every volunteer.
+
+The /volunteers list sorts on the materialized attended count, recruitment
+scoring reads per-type and total counts from it, and
+Volunteer.total_times_volunteered reads its row instead of counting
+participations.
+
+Rows are kept current by an ``after_flush`` hook that re-aggregates the
+volunteers touched by each flush (participations, their events, email
+history and the volunteer itself). Writes that bypass the ORM (the bulk
+Salesforce participation import) call refresh_engagement_stats() for the
+volunteers they change. The a3d8e6b10c57 migration fills the table for
+existing volunteers; rebuild_engagement_stats()
+(scripts/maintenance/rebuild_derived_tables.py) regenerates it from scratch.
+
+Usage:
+    volunteers = Volunteer.query.options(
+        selectinload(Volunteer.engagement_stats)
+    ).all()
+"""
+
+import logging
+import weakref
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, case, delete
+from sqlalchemy import event as sa_event
+from sqlalchemy import false, func, insert, inspect, or_, select
+from sqlalchemy.orm import Session, attributes
+
+from models import db
+from models.event import Event
+from models.history import History
+from models.volunteer import ATTENDED_STATUSES, EventParticipation, Volunteer
+from models.volunteer_engagement import VolunteerEngagementStats
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 500
+
+
+def _chunks(ids, size=_CHUNK_SIZE):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def email_history_condition():
+    """History rows that record an email (activity or "Email:" note)."""
+    return and_(
+        or_(History.is_deleted == false(), History.is_deleted.is_(None)),
+        or_(
+            and_(History.history_type == "activity", History.activity_type == "Email"),
+            and_(History.history_type == "note", History.summary.ilike("%email:%")),
+        ),
+    )
+
+
+# ── Aggregation ───────────────────────────────────────────────────────
+
+
+def _build_rows(connection, volunteer_ids):
+    """Stats rows for those of the given volunteers that exist."""
+    participation = EventParticipation.__table__.c
+    event = Event.__table__.c
+    now = datetime.now(timezone.utc)
+
+    rows = {
+        volunteer_id: {
+            "volunteer_id": volunteer_id,
+            "attended_count": 0,
+            "participation_count": 0,
+            "event_type_counts": {},
+            "first_volunteer_date": None,
+            "last_volunteer_date": None,
+            "last_email_date": last_email_date,
+            "updated_at": now,
+        }
+        for volunteer_id, last_email_date in connection.execute(
+            select(Volunteer.id, Volunteer.last_email_date).where(
+                Volunteer.id.in_(volunteer_ids)
+            )
+        )
+    }
+    if not rows:
+        return []
+
+    attended = participation.status.in_(ATTENDED_STATUSES)
+    by_type = connection.execute(
+        select(
+            participation.volunteer_id,
+            event.type,
+            func.count(participation.id),
+            func.sum(case((attended, 1), else_=0)),
+            func.min(case((attended, event.start_date))),
+            func.max(case((attended, event.start_date))),
+        )
+        .join(Event.__table__, event.id == participation.event_id)
+        .where(participation.volunteer_id.in_(list(rows)))
+        .group_by(participation.volunteer_id, event.type)
+    )
+    for volunteer_id, event_type, count, attended_count, first, last in by_type:
+        row = rows[volunteer_id]
+        row["participation_count"] += count
+        row["attended_count"] += attended_count or 0
+        if event_type is not None:
+            row["event_type_counts"][event_type.value] = count
+        if first and (
+            row["first_volunteer_date"] is None or first < row["first_volunteer_date"]
+        ):
+            row["first_volunteer_date"] = first
+        if last and (
+            row["last_volunteer_date"] is None or last > row["last_volunteer_date"]
+        ):
+            row["last_volunteer_date"] = last
+
+    email_history = connection.execute(
+        select(History.contact_id, func.max(History.activity_date))
+        .where(History.contact_id.in_(list(rows)), email_history_condition())
+        .group_by(History.contact_id)
+    )
+    for contact_id, activity_date in email_history:
+        row = rows[contact_id]
+        activity_date = _as_date(activity_date)
+        if activity_date and (
+            row["last_email_date"] is None or activity_date > row["last_email_date"]
+        ):
+            row["last_email_date"] = activity_date
+
+    return list(rows.values())
+
+
+def refresh_engagement_stats(volunteer_ids=None, connection=None):
+    """
+    Re-aggregate the engagement stats of the given volunteers.
+
+    Volunteers that no longer exist lose their row. Runs on the given
+    connection (default: the session's), so it joins the surrounding
+    transaction; committing is left to the caller.
+
+    Args:
+        volunteer_ids: Volunteer ids to refresh, or None for every volunteer
+
+    Returns:
+        int: Number of rows written
+    """
+    connection = connection or db.session.connection()
+    stats = VolunteerEngagementStats.__table__
+
+    if volunteer_ids is None:
+        connection.execute(delete(stats))
+        volunteer_ids = connection.execute(select(Volunteer.__table__.c.id)).scalars()
+    written = 0
+    for chunk in _chunks(set(volunteer_ids)):
+        connection.execute(delete(stats).where(stats.c.volunteer_id.in_(chunk)))
+        rows = _build_rows(connection, chunk)
+        if rows:
+            connection.execute(insert(stats), rows)
+            written += len(rows)
+    return written
+
+
+def rebuild_engagement_stats():
+    """Rebuild every volunteer's engagement stats and commit. Returns rows written."""
+    written = refresh_engagement_stats()
+    db.session.commit()
+    logger.info("Rebuilt volunteer engagement stats: %s rows", written)
+    return written
+
+
+# ── Write tracking ────────────────────────────────────────────────────
+
+_HISTORY_FIELDS = (
+    "contact_id",
+    "activity_date",
+    "activity_type",
+    "history_type",
+    "summary",
+    "is_deleted",
+)
+
+
+def _history_values(obj, attr):
+    hist = attributes.get_history(obj, attr)
+    return [v for v in (*hist.added, *hist.unchanged, *hist.deleted) if v]
+
+
+def _changed(obj, *attrs):
+    return any(attributes.get_history(obj, attr).has_changes() for attr in attrs)
+
+
+def _collect_volunteer_ids(session):
+    """Volunteer ids and event ids whose aggregates this flush affects."""
+    volunteer_ids = set()
+    event_ids = set()
+
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Volunteer):
+            volunteer_ids.add(obj.id)
+        elif isinstance(obj, EventParticipation):
+            volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif isinstance(obj, History):
+            volunteer_ids.update(_history_values(obj, "contact_id"))
+
+    for obj in session.dirty:
+        if not session.is_modified(obj):
+            continue
+        if isinstance(obj, Volunteer):
+            if _changed(obj, "last_email_date"):
+                volunteer_ids.add(obj.id)
+        elif isinstance(obj, EventParticipation):
+            if _changed(obj, "volunteer_id", "event_id", "status"):
+                volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif isinstance(obj, History):
+            if _changed(obj, *_HISTORY_FIELDS):
+                volunteer_ids.update(_history_values(obj, "contact_id"))
+        elif isinstance(obj, Event) and _changed(obj, "type", "start_date"):
+            event_ids.add(obj.id)
+
+    volunteer_ids.discard(None)
+    event_ids.discard(None)
+    return volunteer_ids, event_ids
+
+
+def _event_volunteer_ids(connection, event_ids):
+    """Volunteers participating in the given events."""
+    participation = EventParticipation.__table__.c
+    volunteer_ids = set()
+    for chunk in _chunks(event_ids):
+        volunteer_ids.update(
+            connection.execute(
+                select(participation.volunteer_id)
+                .where(participation.event_id.in_(chunk))
+                .distinct()
+            ).scalars()
+        )
+    return volunteer_ids
+
+
+_ready_engines = weakref.WeakKeyDictionary()
+
+
+def _engine(session):
+    bind = session.get_bind()
+    return getattr(bind, "engine", bind)
+
+
+def _stats_table_exists(session):
+    """Whether the stats table exists (cached once found)."""
+    engine = _engine(session)
+    if _ready_engines.get(engine):
+        return True
+    found = inspect(session.connection()).has_table(
+        VolunteerEngagementStats.__tablename__
+    )
+    if found:
+        _ready_engines[engine] = True
+    return found
+
+
+def _refresh_after_flush(session, flush_context):
+    """after_flush hook: re-aggregate volunteers affected by this flush."""
+    volunteer_ids, event_ids = _collect_volunteer_ids(session)
+    if not volunteer_ids and not event_ids:
+        return
+    if not _stats_table_exists(session):
+        return
+
+    connection = session.connection()
+    if event_ids:
+        volunteer_ids |= _event_volunteer_ids(connection, event_ids)
+    if volunteer_ids:
+        refresh_engagement_stats(volunteer_ids, connection=connection)
+
+
+def register_engagement_stats_hooks():
+    """Attach the after_flush engagement stats hook (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _refresh_after_flush):
+        sa_event.listen(Session, "after_flush", _refresh_after_flush)
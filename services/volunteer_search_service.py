@@ -0,0 +1,545 @@
+"""
+Volunteer Search Service
+========================
+
+Full-text volunteer search shared by the recruitment search, the recruitment
+candidate prefilter and the /volunteers list filters.
+
+Searches run against the per-volunteer search documents in
+models/volunteer_search.py instead of OR-ing ``ilike('%term%')`` across
+Volunteer, Organization, Skill and Event joins:
+
+- SQLite: FTS5 ``MATCH``, ranked by bm25
+- PostgreSQL: ``tsvector @@ tsquery`` on a GIN index, ranked by ts_rank
+- Other databases, or SQLite built without FTS5: ``ilike`` on the document
+  table (no joins, unranked)
+
+Every term is matched as a word prefix ("vict" finds "Victoria"). Documents
+are kept current by an ``after_flush`` hook that re-indexes the volunteers
+touched by each flush. Writes that bypass the ORM call
+refresh_search_documents() for the volunteers they change. The
+c4a8e1f2b7d3 migration indexes existing volunteers, and
+scripts/maintenance/rebuild_derived_tables.py rebuilds the whole index.
+
+Usage:
+    from services.volunteer_search_service import (
+        MATCH_ALL,
+        volunteer_search_subquery,
+    )
+
+    matches = volunteer_search_subquery("python engineer", match=MATCH_ALL)
+    query = (
+        Volunteer.query.join(matches, matches.c.volunteer_id == Volunteer.id)
+        .order_by(matches.c.rank)
+    )
+"""
+
+import logging
+import re
+import threading
+import weakref
+from collections import defaultdict
+
+from sqlalchemy import and_, column, delete
+from sqlalchemy import event as sa_event
+from sqlalchemy import (
+    false,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.orm import Session, attributes
+
+from models import db
+from models.contact import Contact
+from models.event import Event
+from models.organization import Organization, VolunteerOrganization
+from models.volunteer import EventParticipation, Skill, Volunteer, VolunteerSkill
+from models.volunteer_search import (
+    FTS_TABLE,
+    PG_DOCUMENT_VECTOR,
+    SEARCH_COLUMNS,
+    VolunteerSearchDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+# How terms combine
+MATCH_ANY = "any"  # at least one term matches
+MATCH_ALL = "all"  # every term matches, in any column
+MATCH_PHRASE = "phrase"  # the terms appear together, in order
+
+BACKEND_FTS5 = "fts5"
+BACKEND_TSVECTOR = "tsvector"
+BACKEND_LIKE = "like"
+
+# bm25 column weights (FTS5); PostgreSQL uses the setweight labels below
+COLUMN_WEIGHTS = {
+    "name": 10.0,
+    "work": 5.0,
+    "skills": 4.0,
+    "events": 1.0,
+    "status": 1.0,
+}
+PG_COLUMN_LABELS = {
+    "name": "A",
+    "work": "B",
+    "skills": "C",
+    "events": "D",
+    "status": "D",
+}
+
+# Volunteers per query/write when building documents
+_CHUNK_SIZE = 500
+
+# Volunteer attributes that feed a search document
+_INDEXED_VOLUNTEER_FIELDS = (
+    "first_name",
+    "middle_name",
+    "last_name",
+    "organization_name",
+    "title",
+    "department",
+    "industry",
+    "local_status",
+    "skills",
+    "organizations",
+    "volunteer_organizations",
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _chunks(ids, size=_CHUNK_SIZE):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+# ── Documents ─────────────────────────────────────────────────────────
+
+
+def _join_text(values):
+    seen = []
+    for value in values:
+        if value and value not in seen:
+            seen.append(value)
+    return " ".join(seen) or None
+
+
+def _enum_text(value):
+    return getattr(value, "name", value)
+
+
+def _build_documents(connection, volunteer_ids):
+    """Search document rows for existing volunteers among volunteer_ids."""
+    volunteer = Volunteer.__table__
+    contact = Contact.__table__
+    documents = {}
+    for row in connection.execute(
+        select(
+            volunteer.c.id,
+            contact.c.first_name,
+            contact.c.middle_name,
+            contact.c.last_name,
+            volunteer.c.organization_name,
+            volunteer.c.title,
+            volunteer.c.department,
+            volunteer.c.industry,
+            volunteer.c.local_status,
+        )
+        .join(contact, contact.c.id == volunteer.c.id)
+        .where(volunteer.c.id.in_(volunteer_ids))
+    ):
+        documents[row.id] = {
+            "volunteer_id": row.id,
+            "name": [row.first_name, row.middle_name, row.last_name],
+            "work": [row.organization_name, row.title, row.department, row.industry],
+            "skills": [],
+            "events": [],
+            "status": [_enum_text(row.local_status)],
+        }
+    if not documents:
+        return []
+
+    vol_org = VolunteerOrganization.__table__
+    organization = Organization.__table__
+    for volunteer_id, name, role in connection.execute(
+        select(vol_org.c.volunteer_id, organization.c.name, vol_org.c.role)
+        .join(organization, organization.c.id == vol_org.c.organization_id)
+        .where(vol_org.c.volunteer_id.in_(documents))
+    ):
+        documents[volunteer_id]["work"].extend([name, role])
+
+    volunteer_skill = VolunteerSkill.__table__
+    skill = Skill.__table__
+    for volunteer_id, name in connection.execute(
+        select(volunteer_skill.c.volunteer_id, skill.c.name)
+        .join(skill, skill.c.id == volunteer_skill.c.skill_id)
+        .where(volunteer_skill.c.volunteer_id.in_(documents))
+    ):
+        documents[volunteer_id]["skills"].append(name)
+
+    participation = EventParticipation.__table__
+    event = Event.__table__
+    for volunteer_id, title, event_type in connection.execute(
+        select(participation.c.volunteer_id, event.c.title, event.c.type)
+        .join(event, event.c.id == participation.c.event_id)
+        .where(participation.c.volunteer_id.in_(documents))
+        .distinct()
+    ):
+        documents[volunteer_id]["events"].extend([title, _enum_text(event_type)])
+
+    return [
+        {
+            name: (value if name == "volunteer_id" else _join_text(value))
+            for name, value in document.items()
+        }
+        for document in documents.values()
+    ]
+
+
+def refresh_search_documents(volunteer_ids=None, connection=None):
+    """
+    Rebuild the search documents of the given volunteers.
+
+    Volunteers that no longer exist lose their document. Runs on the given
+    connection (default: the session's), so it joins the surrounding
+    transaction; committing is left to the caller.
+
+    Args:
+        volunteer_ids: Volunteer ids to re-index, or None for every volunteer
+
+    Returns:
+        int: Number of documents written
+    """
+    connection = connection or db.session.connection()
+    documents = VolunteerSearchDocument.__table__
+
+    if volunteer_ids is None:
+        connection.execute(delete(documents))
+        volunteer_ids = connection.execute(select(Volunteer.__table__.c.id)).all()
+        volunteer_ids = [row[0] for row in volunteer_ids]
+    written = 0
+    for chunk in _chunks(set(volunteer_ids)):
+        connection.execute(delete(documents).where(documents.c.volunteer_id.in_(chunk)))
+        rows = _build_documents(connection, chunk)
+        if rows:
+            connection.execute(insert(documents), rows)
+            written += len(rows)
+    return written
+
+
+def rebuild_search_index():
+    """Regenerate every volunteer search document and commit."""
+    written = refresh_search_documents()
+    db.session.commit()
+    logger.info("Rebuilt volunteer search index: %s documents", written)
+    return written
+
+
+# ── Backend selection ─────────────────────────────────────────────────
+
+_backends = weakref.WeakKeyDictionary()
+_backends_lock = threading.Lock()
+
+
+def _engine(session):
+    bind = session.get_bind()
+    return getattr(bind, "engine", bind)
+
+
+def _detect_backend(engine):
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        return BACKEND_TSVECTOR
+    if dialect == "sqlite" and inspect(engine).has_table(FTS_TABLE):
+        return BACKEND_FTS5
+    return BACKEND_LIKE
+
+
+def search_backend(session=None):
+    """
+    Full-text backend for the session's database (detected once per database).
+
+    Read-only: if documents are out of step with the volunteer table (e.g.
+    after a bulk load that bypassed the ORM hooks), a warning is logged and searches miss
+    the unindexed volunteers until rebuild_search_index() is run
+    (scripts/maintenance/rebuild_derived_tables.py --table search).
+    """
+    session = session or db.session
+    engine = _engine(session)
+    with _backends_lock:
+        backend = _backends.get(engine)
+    if backend is not None:
+        return backend
+
+    backend = _detect_backend(engine)
+    volunteer_count = session.query(func.count(Volunteer.id)).scalar()
+    document_count = session.query(
+        func.count(VolunteerSearchDocument.volunteer_id)
+    ).scalar()
+    if volunteer_count != document_count:
+        logger.warning(
+            "Volunteer search index out of date (%s volunteers, %s documents); "
+            "run scripts/maintenance/rebuild_derived_tables.py --table search",
+            volunteer_count,
+            document_count,
+        )
+
+    with _backends_lock:
+        _backends[engine] = backend
+    return backend
+
+
+# ── Queries ───────────────────────────────────────────────────────────
+
+
+def search_terms(search):
+    """
+    Split a search into terms, each a list of lowercase words.
+
+    A string is split on whitespace; an iterable of strings keeps each item
+    as one term (so multi-word keywords match as phrases).
+    """
+    if isinstance(search, str):
+        search = search.split()
+    terms = []
+    for term in search:
+        words = _WORD_RE.findall(str(term).lower())
+        if words:
+            terms.append(words)
+    return terms
+
+
+def _fts5_query(terms, match, columns):
+    if match == MATCH_PHRASE:
+        phrases = ['"' + " ".join(w for words in terms for w in words) + '"*']
+    else:
+        phrases = ['"' + " ".join(words) + '"*' for words in terms]
+    expression = (" OR " if match == MATCH_ANY else " AND ").join(phrases)
+    if columns:
+        expression = "{" + " ".join(columns) + "} : (" + expression + ")"
+    return expression
+
+
+def _tsquery(terms, match, columns):
+    labels = "".join(sorted({PG_COLUMN_LABELS[name] for name in columns or ()}))
+
+    def lexemes(words, joiner):
+        return "(" + joiner.join(f"{word}:*{labels}" for word in words) + ")"
+
+    if match == MATCH_PHRASE:
+        return lexemes([w for words in terms for w in words], " <-> ")
+    parts = [lexemes(words, " <-> ") for words in terms]
+    return (" | " if match == MATCH_ANY else " & ").join(parts)
+
+
+def _like_condition(terms, match, columns):
+    documents = VolunteerSearchDocument.__table__
+    targets = [documents.c[name] for name in columns or SEARCH_COLUMNS]
+
+    def contains(text):
+        return or_(*[target.ilike(f"%{text}%") for target in targets])
+
+    if match == MATCH_PHRASE:
+        return contains(" ".join(w for words in terms for w in words))
+    conditions = [and_(*[contains(word) for word in words]) for words in terms]
+    return or_(*conditions) if match == MATCH_ANY else and_(*conditions)
+
+
+def volunteer_search_select(search, match=MATCH_ANY, columns=None, session=None):
+    """
+    Select of (volunteer_id, rank) for volunteers matching a search.
+
+    Lower rank is a better match.
+
+    Args:
+        search: Search string, or an iterable of terms (each matched as a
+            phrase)
+        match: MATCH_ANY, MATCH_ALL or MATCH_PHRASE
+        columns: Restrict matching to these document columns
+            (name, work, skills, events, status); default all
+
+    Returns:
+        Select: Matching volunteer ids with a rank column
+    """
+    columns = tuple(columns or ())
+    unknown = set(columns) - set(SEARCH_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown search columns: {', '.join(sorted(unknown))}")
+
+    documents = VolunteerSearchDocument.__table__
+    terms = search_terms(search)
+    if not terms:
+        return select(documents.c.volunteer_id, literal(0.0).label("rank")).where(
+            false()
+        )
+
+    backend = search_backend(session)
+    if backend == BACKEND_FTS5:
+        fts = table(FTS_TABLE, column("rowid"))
+        fts_ref = literal_column(FTS_TABLE)
+        weights = [COLUMN_WEIGHTS[name] for name in SEARCH_COLUMNS]
+        return (
+            select(
+                fts.c.rowid.label("volunteer_id"),
+                func.bm25(fts_ref, *weights).label("rank"),
+            )
+            .select_from(fts)
+            .where(fts_ref.op("MATCH")(_fts5_query(terms, match, columns)))
+        )
+
+    if backend == BACKEND_TSVECTOR:
+        vector = literal_column(f"({PG_DOCUMENT_VECTOR})")
+        query = func.to_tsquery(
+            literal_column("'simple'"), _tsquery(terms, match, columns)
+        )
+        return select(
+            documents.c.volunteer_id, (-func.ts_rank(vector, query)).label("rank")
+        ).where(vector.op("@@")(query))
+
+    return select(documents.c.volunteer_id, literal(0.0).label("rank")).where(
+        _like_condition(terms, match, columns)
+    )
+
+
+def volunteer_search_subquery(search, match=MATCH_ANY, columns=None, session=None):
+    """volunteer_search_select() as a subquery to join against Volunteer."""
+    return volunteer_search_select(search, match, columns, session).subquery()
+
+
+def matching_volunteer_ids(search, match=MATCH_ANY, columns=None, session=None):
+    """Select of matching volunteer ids, for ``Volunteer.id.in_(...)``."""
+    matches = volunteer_search_subquery(search, match, columns, session)
+    return select(matches.c.volunteer_id)
+
+
+def search_volunteer_ids(search, match=MATCH_ANY, columns=None, limit=None):
+    """Ids of volunteers matching a search, best match first."""
+    matches = volunteer_search_subquery(search, match, columns)
+    query = select(matches.c.volunteer_id).order_by(
+        matches.c.rank, matches.c.volunteer_id
+    )
+    if limit:
+        query = query.limit(limit)
+    return list(db.session.execute(query).scalars())
+
+
+# ── Write tracking ────────────────────────────────────────────────────
+
+
+def _history_values(obj, attr):
+    hist = attributes.get_history(obj, attr)
+    return [v for v in (*hist.added, *hist.unchanged, *hist.deleted) if v]
+
+
+def _changed(obj, *attrs):
+    return any(attributes.get_history(obj, attr).has_changes() for attr in attrs)
+
+
+def _collect_volunteer_ids(session):
+    """Volunteers whose search documents are affected by this flush."""
+    volunteer_ids = set()
+    related = defaultdict(set)  # table key -> ids needing a volunteer lookup
+
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Volunteer):
+            volunteer_ids.add(obj.id)
+        elif isinstance(obj, (VolunteerOrganization, VolunteerSkill)):
+            volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif isinstance(obj, EventParticipation):
+            volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif obj in session.deleted and isinstance(obj, Organization):
+            related["organization"].add(obj.id)
+        elif obj in session.deleted and isinstance(obj, Skill):
+            related["skill"].add(obj.id)
+
+    for obj in session.dirty:
+        if not session.is_modified(obj):
+            continue
+        if isinstance(obj, Volunteer):
+            if _changed(obj, *_INDEXED_VOLUNTEER_FIELDS):
+                volunteer_ids.add(obj.id)
+        elif isinstance(obj, (VolunteerOrganization, VolunteerSkill)):
+            volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif isinstance(obj, EventParticipation):
+            if _changed(obj, "volunteer_id", "event_id"):
+                volunteer_ids.update(_history_values(obj, "volunteer_id"))
+        elif isinstance(obj, Organization) and _changed(obj, "name"):
+            related["organization"].add(obj.id)
+        elif isinstance(obj, Skill) and _changed(obj, "name"):
+            related["skill"].add(obj.id)
+        elif isinstance(obj, Event) and _changed(obj, "title", "type"):
+            related["event"].add(obj.id)
+
+    volunteer_ids.discard(None)
+    return volunteer_ids, related
+
+
+def _related_volunteer_ids(connection, related):
+    """Volunteers linked to renamed organizations, skills or events."""
+    links = {
+        "organization": VolunteerOrganization.__table__.c,
+        "skill": VolunteerSkill.__table__.c,
+        "event": EventParticipation.__table__.c,
+    }
+    key_columns = {
+        "organization": "organization_id",
+        "skill": "skill_id",
+        "event": "event_id",
+    }
+    volunteer_ids = set()
+    for kind, ids in related.items():
+        link = links[kind]
+        for chunk in _chunks(ids):
+            volunteer_ids.update(
+                connection.execute(
+                    select(link.volunteer_id)
+                    .where(link[key_columns[kind]].in_(chunk))
+                    .distinct()
+                ).scalars()
+            )
+    return volunteer_ids
+
+
+_ready_engines = weakref.WeakKeyDictionary()
+
+
+def _documents_table_exists(session):
+    """Whether the search document table exists (cached once found)."""
+    engine = _engine(session)
+    if _ready_engines.get(engine):
+        return True
+    exists = inspect(session.connection()).has_table(
+        VolunteerSearchDocument.__tablename__
+    )
+    if exists:
+        _ready_engines[engine] = True
+    return exists
+
+
+def _reindex_after_flush(session, flush_context):
+    """after_flush hook: re-index volunteers affected by this flush."""
+    volunteer_ids, related = _collect_volunteer_ids(session)
+    if not volunteer_ids and not related:
+        return
+    if not _documents_table_exists(session):
+        return
+
+    connection = session.connection()
+    if related:
+        volunteer_ids |= _related_volunteer_ids(connection, related)
+    if volunteer_ids:
+        refresh_search_documents(volunteer_ids, connection=connection)
+
+
+def register_search_index_hooks():
+    """Attach the after_flush search index hook (idempotent)."""
+    if not sa_event.contains(Session, "after_flush", _reindex_after_flush):
+        sa_event.listen(Session, "after_flush", _reindex_after_flush)
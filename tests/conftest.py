@@ -1,5 +1,8 @@
+import email
 import json
 import os
+import socketserver
+import threading
 from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
@@ -826,3 +829,82 @@ def new_session(app):
         session = db.Session(bind=db.engine)
         yield session
         session.close()
+
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server side: accepts every message into server.messages."""
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self._reply("220 sink ready")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 sink")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip(" <>")
+                if address in server.refuse:
+                    self._reply("550 no such user")
+                else:
+                    recipients.append(address)
+                    self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 end with <CRLF>.<CRLF>")
+                data = []
+                for raw in iter(self.rfile.readline, b""):
+                    if raw in (b".\r\n", b".\n"):
+                        break
+                    data.append(raw)
+                with server.lock:
+                    server.messages.append(
+                        (recipients, email.message_from_bytes(b"".join(data)))
+                    )
+                self._reply("250 queued")
+            elif verb == "RSET":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+class _SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPSinkHandler)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.connections = 0
+        self.refuse = set()
+
+
+@pytest.fixture
+def smtp_sink(monkeypatch):
+    """In-process SMTP server; SMTP_HOST/SMTP_PORT point at it."""
+    sink = _SMTPSink()
+    thread = threading.Thread(target=sink.serve_forever, daemon=True)
+    thread.start()
+    host, port = sink.server_address
+    monkeypatch.setenv("SMTP_HOST", host)
+    monkeypatch.setenv("SMTP_PORT", str(port))
+    monkeypatch.setenv("MAIL_FROM", "noreply@example.com")
+    yield sink
+    sink.shutdown()
+    sink.server_close()
@@ -324,3 +324,36 @@ class TestDistrictYearEndReport:
         stats = report.report_data
         assert stats["total_events"] == 1
         assert stats["total_volunteer_hours"] == 1
+
+    def test_refresh_limited_to_invalidated_districts(self, district_data):
+        """Passing district_ids regenerates only those districts' rows."""
+        from models.reports import DistrictYearEndReport
+        from routes.reports.common import get_current_school_year
+        from routes.reports.district_year_end.computation import refresh_district_cache
+
+        other = District(
+            name="Kansas City Kansas Public Schools",
+            salesforce_id="0015f00000JU4pVAAT",
+        )
+        db.session.add(other)
+        db.session.commit()
+        school_year = get_current_school_year()
+        refresh_district_cache(school_year)
+        reports = {
+            report.district.id: report
+            for report in DistrictYearEndReport.query.filter_by(
+                school_year=school_year
+            )
+        }
+        stamp = datetime(2000, 1, 1)
+        for report in reports.values():
+            report.last_updated = stamp
+        db.session.commit()
+
+        district_id = district_data["district"].id
+        refresh_district_cache(school_year, district_ids=[district_id])
+
+        db.session.expire_all()
+        assert reports[district_id].last_updated > stamp
+        assert reports[district_id].report_data["total_events"] == 2
+        assert reports[other.id].last_updated == stamp
@@ -233,6 +233,36 @@ class TestMagicLinkRoutes:
             link = MagicLink.query.filter_by(email="alice.teacher@kckps.org").first()
             assert link is not None
 
+    def test_request_link_queues_outbox_email(self, client, app):
+        """The request only enqueues the email; the outbox worker delivers it."""
+        from models.email import EmailOutbox, OutboxStatus
+
+        with app.app_context():
+            db.session.add(
+                TeacherProgress(
+                    academic_year="2024-2025",
+                    virtual_year="2024-2025",
+                    building="Test School",
+                    name="Alice Teacher",
+                    email="alice.teacher@kckps.org",
+                )
+            )
+            db.session.commit()
+
+        response = client.post(
+            "/district/kck/teacher/request-link",
+            data={"email": "alice.teacher@kckps.org"},
+        )
+
+        assert response.status_code == 302
+        with app.app_context():
+            entry = EmailOutbox.query.one()
+            assert entry.purpose == "magic_link"
+            assert entry.recipient == "alice.teacher@kckps.org"
+            assert entry.status == OutboxStatus.PENDING
+            link = MagicLink.query.filter_by(email="alice.teacher@kckps.org").one()
+            assert link.token in entry.html_body
+
     def test_request_link_unknown_email_generic_response(self, client, app):
         """TC-021: Request for unknown email shows generic response."""
         with patch("routes.district.magic_link._send_magic_link_email") as mock_send:
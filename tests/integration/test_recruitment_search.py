@@ -323,3 +323,16 @@ def test_search_csv_no_query_returns_empty(client, auth_headers, recruitment_dat
     response = client.get("/reports/recruitment/search.csv", headers=auth_headers)
     assert response.status_code == 200
     assert "text/csv" in response.content_type
+
+
+def test_search_sort_by_relevance(client, auth_headers, recruitment_data):
+    """Best-match sort returns the same matches, ordered by rank."""
+    response = client.get(
+        "/reports/recruitment/search?search=Victor&sort=relevance",
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    content = response.data.decode()
+    assert "Victor" in content
+    assert "Victoria" in content
+    assert "Vol Three" not in content
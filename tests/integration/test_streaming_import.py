@@ -0,0 +1,144 @@
+"""
+Integration tests for streamed Salesforce imports (SF_IMPORT_STREAMING).
+
+A fake Salesforce client serves query results in pages through
+query/query_more. The tests check that event and volunteer imports process
+every page, and that each page is only fetched after the previous page's
+rows have been written, so only one page is held in memory at a time.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.event import Event
+from models.volunteer import Volunteer
+from tests.integration.test_volunteer_import import _make_sf_row
+
+PAGE_SIZE = 40
+
+
+class FakeSalesforce:
+    """Serves each query's records in pages via nextRecordsUrl."""
+
+    def __init__(self, results, on_next_page=None):
+        # List of record lists, one per query in call order
+        self.results = list(results)
+        self.on_next_page = on_next_page
+        self.pages_served = 0
+        self._pending = {}
+
+    def _page(self, key, records, start):
+        end = start + PAGE_SIZE
+        done = end >= len(records)
+        if not done:
+            self._pending[f"/next/{key}/{end}"] = (key, records, end)
+        self.pages_served += 1
+        return {
+            "totalSize": len(records),
+            "done": done,
+            "records": records[start:end],
+            "nextRecordsUrl": None if done else f"/next/{key}/{end}",
+        }
+
+    def query(self, query, **kwargs):
+        return self._page(len(self.results), self.results.pop(0), 0)
+
+    def query_more(self, next_records_url, identifier_is_url=False, **kwargs):
+        assert identifier_is_url
+        key, records, start = self._pending.pop(next_records_url)
+        if self.on_next_page:
+            self.on_next_page(start)
+        return self._page(key, records, start)
+
+    def query_all(self, query, **kwargs):
+        raise AssertionError("query_all must not be used when streaming")
+
+
+def _event_row(i):
+    return {
+        "Id": f"a0STREAM{i:05d}",
+        "Name": f"Streamed Event {i}",
+        "Session_Type__c": "Career Day",
+        "Session_Status__c": "Confirmed",
+        "Start_Date_and_Time__c": "2026-05-20T10:00:00.000+0000",
+        "End_Date_and_Time__c": "2026-05-20T12:00:00.000+0000",
+    }
+
+
+@pytest.fixture
+def streaming(app):
+    app.config["SF_IMPORT_STREAMING"] = True
+    yield
+    app.config["SF_IMPORT_STREAMING"] = False
+
+
+def test_event_import_streams_pages(client, auth_headers, app, streaming):
+    rows = [_event_row(i) for i in range(PAGE_SIZE * 3 + 5)]
+
+    def on_next_page(start):
+        # Every row of the previous pages is already written
+        assert Event.query.filter(Event.salesforce_id.like("a0STREAM%")).count() == (
+            start
+        )
+
+    fake_sf = FakeSalesforce([rows, []], on_next_page=on_next_page)
+
+    with (
+        patch("routes.salesforce.event_import.get_salesforce_client") as mock_get_sf,
+        patch("routes.salesforce.event_import.refresh_all_caches"),
+    ):
+        mock_get_sf.return_value = fake_sf
+        response = client.post("/events/import-from-salesforce", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["events_processed"] == len(rows)
+    assert data["total_events_from_salesforce"] == len(rows)
+    assert data["total_participants_from_salesforce"] == 0
+    assert fake_sf.pages_served == 5
+    with app.app_context():
+        assert Event.query.filter(Event.salesforce_id.like("a0STREAM%")).count() == (
+            len(rows)
+        )
+
+
+def test_volunteer_import_streams_pages(client, auth_headers, app, streaming):
+    rows = [
+        _make_sf_row(
+            {
+                "Id": f"003STREAM{i:05d}",
+                "FirstName": f"Stream{i}",
+                "Email": f"stream{i}@example.com",
+            }
+        )
+        for i in range(PAGE_SIZE * 2 + 1)
+    ]
+    fake_sf = FakeSalesforce([rows])
+
+    with (
+        patch("routes.salesforce.volunteer_import.get_salesforce_client") as mock_sf,
+        patch("services.salesforce.DeltaSyncHelper") as mock_delta_cls,
+    ):
+        mock_delta = MagicMock()
+        mock_delta.get_delta_info.return_value = {
+            "actual_delta": False,
+            "requested_delta": False,
+            "watermark": None,
+            "watermark_formatted": None,
+        }
+        mock_delta_cls.return_value = mock_delta
+        mock_sf.return_value = fake_sf
+
+        response = client.post(
+            "/volunteers/import-from-salesforce", headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["processed_count"] == len(rows)
+    assert fake_sf.pages_served == 3
+    with app.app_context():
+        assert Volunteer.query.filter(
+            Volunteer.salesforce_individual_id.like("003STREAM%")
+        ).count() == len(rows)
@@ -0,0 +1,155 @@
+"""
+Query-count tests for virtual session report computation.
+
+compute_virtual_session_data (usage dashboard and reports suite) resolves
+teacher schools and districts in one batched query, so the number of SQL
+statements must not grow with the number of events or registrations. The
+usage page's district breakdown loads the event window once for every
+district instead of once per district.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event as sa_event
+
+from models import db
+from models.district_model import District
+from models.event import Event, EventFormat, EventStatus, EventTeacher, EventType
+from models.school_model import School
+from models.teacher import Teacher
+from models.volunteer import Volunteer
+from routes.reports.common import get_virtual_year_dates
+from routes.reports.virtual_session.computation import (
+    compute_virtual_session_data as compute_report_session_data,
+)
+from routes.virtual.usage.computation import compute_district_breakdown_summaries
+from routes.virtual.usage.computation import (
+    compute_virtual_session_data as compute_usage_session_data,
+)
+from routes.virtual.usage.computation import (
+    compute_virtual_session_district_data,
+    compute_virtual_session_district_summaries,
+)
+
+YEAR = "2024-2025"
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa_event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _add_sessions(start_index, count):
+    """Add virtual sessions, each with two teachers at their own school."""
+    district = District(name=f"Query District {start_index}")
+    db.session.add(district)
+    db.session.flush()
+
+    for i in range(start_index, start_index + count):
+        school = School(
+            id=f"QC_SCHOOL_{i:03d}", name=f"Query School {i}", district_id=district.id
+        )
+        teachers = [
+            Teacher(first_name=f"T{i}", last_name=suffix, school_id=school.id)
+            for suffix in ("A", "B")
+        ]
+        presenter = Volunteer(first_name=f"P{i}", last_name="Presenter")
+        event = Event(
+            title=f"Query Session {i}",
+            type=EventType.VIRTUAL_SESSION,
+            format=EventFormat.VIRTUAL,
+            status=EventStatus.COMPLETED,
+            start_date=datetime(2024, 10, 1 + i % 28, 9),
+        )
+        event.volunteers.append(presenter)
+        db.session.add_all([school, *teachers, presenter, event])
+        db.session.flush()
+        for teacher in teachers:
+            db.session.add(
+                EventTeacher(
+                    event_id=event.id, teacher_id=teacher.id, status="attended"
+                )
+            )
+    db.session.commit()
+
+
+@pytest.mark.parametrize(
+    "compute", [compute_usage_session_data, compute_report_session_data]
+)
+def test_query_count_independent_of_event_count(app, compute):
+    with app.app_context():
+        date_from, date_to = get_virtual_year_dates(YEAR)
+
+        _add_sessions(0, 2)
+        db.session.expire_all()
+        with _count_queries() as small:
+            session_data, _, _, _ = compute(YEAR, date_from, date_to, {})
+        assert len(session_data) == 4
+
+        _add_sessions(2, 8)
+        db.session.expire_all()
+        with _count_queries() as large:
+            session_data, _, _, filter_options = compute(YEAR, date_from, date_to, {})
+        assert len(session_data) == 20
+        assert len(filter_options["schools"]) == 10
+
+        assert len(large) == len(small)
+
+
+def test_district_summaries_match_per_district_computation(app):
+    with app.app_context():
+        date_from, date_to = get_virtual_year_dates(YEAR)
+        for start_index in (0, 3, 6):
+            _add_sessions(start_index, 3)
+        names = [f"Query District {i}" for i in (0, 3, 6)] + ["Empty District"]
+
+        db.session.expire_all()
+        with _count_queries() as separate:
+            expected = {
+                name: compute_virtual_session_district_data(
+                    name, YEAR, date_from, date_to
+                )
+                for name in names
+            }
+        db.session.expire_all()
+        with _count_queries() as single_pass:
+            results = compute_virtual_session_district_summaries(
+                names, YEAR, date_from, date_to
+            )
+
+        assert results == expected
+        assert results["Query District 3"][4]["total_teachers"] == 6
+        assert results["Empty District"][4]["total_teachers"] == 0
+        assert len(single_pass) < len(separate)
+
+
+def test_district_breakdown_reads_cached_summaries(app):
+    with app.app_context():
+        date_from, date_to = get_virtual_year_dates(YEAR)
+        _add_sessions(0, 2)
+        _add_sessions(2, 2)
+        names = {"Query District 0", "Query District 2"}
+
+        computed = compute_district_breakdown_summaries(
+            names, YEAR, date_from, date_to, use_cache=True
+        )
+        db.session.expire_all()
+        with _count_queries() as cached_load:
+            cached = compute_district_breakdown_summaries(
+                names, YEAR, date_from, date_to, use_cache=True
+            )
+
+        assert cached == computed
+        assert computed["Query District 0"]["teacher_count"] == 4
+        assert len(cached_load) == 1
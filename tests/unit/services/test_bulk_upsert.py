@@ -0,0 +1,492 @@
+"""
+Unit tests for services/salesforce/bulk_upsert.py and the bulk participation
+processors in services/salesforce/processors/event.py.
+
+Tests cover INSERT ... ON CONFLICT semantics (overwrite vs fill columns,
+in-batch duplicates, updated_at refresh), equivalence of the bulk processors
+with the row-level path, and a rows-per-second benchmark on 50k volunteer
+participation rows (marked slow).
+"""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from models import db
+from models.data_quality_flag import DataQualityFlag, DataQualityIssueType
+from models.event import Event, EventStudentParticipation
+from models.reports import VirtualSessionDistrictCache
+from models.student import Student
+from models.volunteer import EventParticipation, Volunteer
+from services.cache_dependency_service import register_cache_dependencies
+from services.salesforce.bulk_upsert import BulkUpsert, supports_bulk_upsert
+from services.salesforce.processors.event import (
+    bulk_process_participation_rows,
+    bulk_process_student_participation_rows,
+    process_participation_row,
+    process_student_participation_row,
+)
+
+# ── Helpers ───────────────────────────────────────────────────────────
+
+
+def _add_volunteers_and_events(volunteer_count, event_count, prefix=""):
+    """Add volunteers and events, returning (volunteers_cache, events_cache)."""
+    start = datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+    db.session.add_all(
+        Volunteer(
+            first_name=f"V{i}",
+            last_name="Bulk",
+            salesforce_individual_id=f"{prefix}CONTACT{i:05d}",
+        )
+        for i in range(volunteer_count)
+    )
+    db.session.add_all(
+        Event(
+            title=f"Bulk Event {i}",
+            salesforce_id=f"{prefix}SESSION{i:05d}",
+            start_date=start,
+            end_date=start,
+        )
+        for i in range(event_count)
+    )
+    db.session.commit()
+
+    volunteers_cache = dict(
+        db.session.query(Volunteer.salesforce_individual_id, Volunteer.id).all()
+    )
+    events_cache = dict(db.session.query(Event.salesforce_id, Event.id).all())
+    return volunteers_cache, events_cache
+
+
+def _participation_rows(
+    count, volunteer_count, event_count, status="Attended", prefix=""
+):
+    return [
+        {
+            "Id": f"{prefix}EP{i:08d}",
+            "Contact__c": f"{prefix}CONTACT{i % volunteer_count:05d}",
+            "Session__c": f"{prefix}SESSION{i % event_count:05d}",
+            "Status__c": status,
+            "Delivery_Hours__c": "1.5",
+            "Email__c": f"v{i}@example.com" if i % 2 else None,
+            "Title__c": None,
+            "Age_Group__c": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _run_row_path(rows, volunteers_cache, events_cache, ep_sf_ids_cache, errors):
+    success = error = 0
+    for i, row in enumerate(rows):
+        success, error = process_participation_row(
+            row,
+            success,
+            error,
+            errors,
+            volunteers_cache=volunteers_cache,
+            events_cache=events_cache,
+            ep_sf_ids_cache=ep_sf_ids_cache,
+        )
+        if (i + 1) % 100 == 0:
+            db.session.commit()
+    db.session.commit()
+    return success, error
+
+
+def _participations(prefix=""):
+    """Imported participations, with Salesforce IDs stripped of prefix."""
+    rows = (
+        db.session.query(
+            EventParticipation.salesforce_id,
+            Volunteer.salesforce_individual_id,
+            Event.salesforce_id,
+            EventParticipation.status,
+            EventParticipation.delivery_hours,
+        )
+        .join(Volunteer, Volunteer.id == EventParticipation.volunteer_id)
+        .join(Event, Event.id == EventParticipation.event_id)
+        .filter(EventParticipation.salesforce_id.startswith(prefix))
+        .all()
+    )
+    return sorted(
+        (sf_id[len(prefix) :], contact[len(prefix) :], session[len(prefix) :], *rest)
+        for sf_id, contact, session, *rest in rows
+    )
+
+
+# ── BulkUpsert ────────────────────────────────────────────────────────
+
+
+class TestBulkUpsert:
+
+    def test_supported_on_sqlite(self, app):
+        with app.app_context():
+            assert supports_bulk_upsert()
+
+    def test_insert_then_update_on_conflict(self, app):
+        with app.app_context():
+            volunteers, events = _add_volunteers_and_events(1, 1)
+            vol_id, event_id = volunteers["CONTACT00000"], events["SESSION00000"]
+
+            batch = BulkUpsert(
+                EventParticipation,
+                update_columns=["status"],
+                fill_columns=["email", "title"],
+            )
+            values = {"volunteer_id": vol_id, "event_id": event_id}
+            batch.add(
+                {
+                    **values,
+                    "salesforce_id": "EP1",
+                    "status": "Registered",
+                    "email": "a@example.com",
+                    "title": "Engineer",
+                }
+            )
+            assert batch.flush() == 1
+            batch.add(
+                {**values, "salesforce_id": "EP1", "status": "Attended", "title": None}
+            )
+            batch.flush()
+            db.session.commit()
+
+            participation = EventParticipation.query.filter_by(
+                salesforce_id="EP1"
+            ).one()
+            assert participation.status == "Attended"
+            assert participation.email == "a@example.com"
+            assert participation.title == "Engineer"
+            assert participation.participant_type == "Volunteer"
+            assert batch.written == 2
+
+    def test_duplicate_keys_in_batch_are_merged(self, app):
+        with app.app_context():
+            volunteers, events = _add_volunteers_and_events(1, 1)
+            values = {
+                "salesforce_id": "EP1",
+                "volunteer_id": volunteers["CONTACT00000"],
+                "event_id": events["SESSION00000"],
+            }
+
+            batch = BulkUpsert(
+                EventParticipation, update_columns=["status"], fill_columns=["email"]
+            )
+            batch.add({**values, "status": "Registered", "email": "a@example.com"})
+            batch.add({**values, "status": "Attended", "email": None})
+
+            assert len(batch) == 1
+            assert "EP1" in batch
+            batch.flush()
+            db.session.commit()
+
+            participation = EventParticipation.query.one()
+            assert (participation.status, participation.email) == (
+                "Attended",
+                "a@example.com",
+            )
+
+    def test_onupdate_columns_are_refreshed(self, app):
+        with app.app_context():
+            student = Student(
+                first_name="S", last_name="Bulk", salesforce_individual_id="STU1"
+            )
+            event = Event(
+                title="Bulk Student Event",
+                salesforce_id="SESSION1",
+                start_date=datetime(2025, 3, 1, 9),
+            )
+            db.session.add_all([student, event])
+            db.session.commit()
+            old = datetime(2020, 1, 1)
+            db.session.add(
+                EventStudentParticipation(
+                    salesforce_id="ESP1",
+                    event_id=event.id,
+                    student_id=student.id,
+                    status="Registered",
+                    updated_at=old,
+                )
+            )
+            db.session.commit()
+
+            batch = BulkUpsert(EventStudentParticipation, fill_columns=["status"])
+            batch.add(
+                {
+                    "salesforce_id": "ESP1",
+                    "event_id": event.id,
+                    "student_id": student.id,
+                    "status": "Attended",
+                }
+            )
+            batch.flush()
+            db.session.commit()
+            db.session.expire_all()
+
+            participation = EventStudentParticipation.query.one()
+            assert participation.status == "Attended"
+            assert participation.updated_at.replace(tzinfo=None) > old
+
+    def test_rejects_unknown_columns_and_missing_key(self, app):
+        with app.app_context():
+            with pytest.raises(ValueError, match="Unknown columns"):
+                BulkUpsert(EventParticipation, update_columns=["nope"])
+
+            batch = BulkUpsert(EventParticipation)
+            with pytest.raises(ValueError, match="salesforce_id"):
+                batch.add({"status": "Attended"})
+
+
+# ── Bulk processors ───────────────────────────────────────────────────
+
+
+class TestBulkProcessParticipationRows:
+
+    def _run(self, process, prefix):
+        volunteers, events = _add_volunteers_and_events(5, 3, prefix)
+        rows = _participation_rows(30, 5, 3, prefix=prefix)
+        rows.append(
+            {
+                "Id": f"{prefix}EPUNMATCHED",
+                "Contact__c": "MISSING",
+                "Session__c": f"{prefix}SESSION00000",
+                "Status__c": "Attended",
+            }
+        )
+        errors = []
+
+        # First import creates, second import (changed status) updates
+        first = process(rows[:20], volunteers, events, set(), errors)
+        for row in rows:
+            row["Status__c"] = "No-Show"
+        ep_sf_ids = {
+            sf_id for (sf_id,) in db.session.query(EventParticipation.salesforce_id)
+        }
+        second = process(rows, volunteers, events, ep_sf_ids, errors)
+
+        flag = DataQualityFlag.query.filter_by(
+            entity_sf_id=f"{prefix}EPUNMATCHED",
+            issue_type=DataQualityIssueType.UNMATCHED_SF_PARTICIPATION,
+        ).one()
+        return first, second, _participations(prefix), len(errors), flag.status
+
+    def test_matches_row_path(self, app):
+        def bulk(rows, volunteers, events, ep_sf_ids, errors):
+            return bulk_process_participation_rows(
+                rows, errors, volunteers, events, ep_sf_ids, batch_size=7
+            )
+
+        with app.app_context():
+            expected = self._run(_run_row_path, "ROW")
+            result = self._run(bulk, "BULK")
+
+        assert result == expected
+        assert result[1] == (30, 1)
+
+    def test_fills_optional_fields_and_resolves_flags(self, app):
+        with app.app_context():
+            volunteers, events = _add_volunteers_and_events(1, 1)
+            db.session.add(
+                DataQualityFlag(
+                    entity_type="sf_participation",
+                    entity_sf_id="EP00000001",
+                    issue_type=DataQualityIssueType.UNMATCHED_SF_PARTICIPATION,
+                    details="Missing volunteer",
+                    status="open",
+                )
+            )
+            db.session.commit()
+
+            rows = _participation_rows(2, 1, 1)
+            success, error = bulk_process_participation_rows(
+                rows, [], volunteers, events, set()
+            )
+
+            assert (success, error) == (2, 0)
+            participation = EventParticipation.query.filter_by(
+                salesforce_id="EP00000001"
+            ).one()
+            assert participation.email == "v1@example.com"
+            assert DataQualityFlag.query.one().status == "auto_fixed"
+
+    def test_invalidates_dependent_report_caches(self, app):
+        with app.app_context():
+            volunteers, events = _add_volunteers_and_events(1, 2)
+            affected, untouched = (
+                VirtualSessionDistrictCache(
+                    district_name=name, virtual_year="2024-2025", session_data=[]
+                )
+                for name in ("Alpha", "Beta")
+            )
+            db.session.add_all([affected, untouched])
+            db.session.flush()
+            register_cache_dependencies(affected, event_ids=[events["SESSION00000"]])
+            register_cache_dependencies(untouched, event_ids=[events["SESSION00001"]])
+            db.session.commit()
+            affected_id, untouched_id = affected.id, untouched.id
+
+            bulk_process_participation_rows(
+                _participation_rows(1, 1, 1), [], volunteers, events, set()
+            )
+
+            assert db.session.get(VirtualSessionDistrictCache, affected_id) is None
+            assert db.session.get(VirtualSessionDistrictCache, untouched_id)
+
+    def test_failed_batch_does_not_cache_sf_ids(self, app, monkeypatch):
+        def fail(volunteer_ids):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            "services.salesforce.processors.event.refresh_engagement_stats", fail
+        )
+        with app.app_context():
+            volunteers, events = _add_volunteers_and_events(2, 1)
+            ep_sf_ids = set()
+
+            result = bulk_process_participation_rows(
+                _participation_rows(2, 2, 1), [], volunteers, events, ep_sf_ids
+            )
+
+            assert result == (0, 2)
+            assert ep_sf_ids == set()
+            assert EventParticipation.query.count() == 0
+
+
+class TestBulkProcessStudentParticipationRows:
+
+    def _run(self, bulk, prefix):
+        students = [
+            Student(
+                first_name=f"S{i}",
+                last_name="Bulk",
+                salesforce_individual_id=f"{prefix}STU{i}",
+            )
+            for i in range(4)
+        ]
+        event = Event(
+            title="Bulk Student Event",
+            salesforce_id=f"{prefix}SESSION1",
+            start_date=datetime(2025, 3, 1, 9),
+        )
+        db.session.add_all([*students, event])
+        db.session.commit()
+        # Pair already imported without a Salesforce ID
+        db.session.add(
+            EventStudentParticipation(
+                event_id=event.id, student_id=students[0].id, status="Registered"
+            )
+        )
+        db.session.commit()
+
+        rows = [
+            {
+                "Id": f"{prefix}ESP{i}",
+                "Session__c": event.salesforce_id,
+                "Contact__c": student.salesforce_individual_id,
+                "Status__c": "Attended",
+                "Delivery_Hours__c": 2,
+                "Age_Group__c": "High School",
+            }
+            for i, student in enumerate(students)
+        ]
+        rows.append({**rows[1]})  # Already imported in this run: skipped
+        rows.append({**rows[2], "Id": f"{prefix}ESPX", "Contact__c": "MISSING"})
+
+        events_cache = {event.salesforce_id: event.id}
+        students_cache = {s.salesforce_individual_id: s.id for s in students}
+        by_sf_id = set()
+        by_pair = {(event.id, students[0].id)}
+        errors = []
+        if bulk:
+            counts = bulk_process_student_participation_rows(
+                rows,
+                errors,
+                events_cache,
+                students_cache,
+                by_sf_id,
+                by_pair,
+                batch_size=2,
+            )
+        else:
+            counts = (0, 0)
+            for row in rows:
+                counts = process_student_participation_row(
+                    row,
+                    *counts,
+                    errors,
+                    events_cache=events_cache,
+                    students_cache=students_cache,
+                    participations_by_sf_id=by_sf_id,
+                    participations_by_pair=by_pair,
+                )
+            db.session.commit()
+
+        participations = sorted(
+            (sf_id[len(prefix) :], *rest)
+            for sf_id, *rest in db.session.query(
+                EventStudentParticipation.salesforce_id,
+                EventStudentParticipation.status,
+                EventStudentParticipation.delivery_hours,
+                EventStudentParticipation.age_group,
+            ).filter(EventStudentParticipation.event_id == event.id)
+        )
+        return counts, participations, len(errors)
+
+    def test_matches_row_path(self, app):
+        with app.app_context():
+            expected = self._run(bulk=False, prefix="ROW")
+            result = self._run(bulk=True, prefix="BULK")
+
+        assert result == expected
+        assert result[0] == (4, 1)
+        assert len(result[1]) == 4
+
+
+# ── Benchmark ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_benchmark_against_row_path(app):
+    """
+    Import then re-import 50k volunteer participation rows.
+
+    The row-level path runs at tens of rows per second, so it is timed on
+    the first 2k rows of the same data; the bulk path runs all 50k.
+    """
+    row_count, sample, volunteer_count, event_count = 50_000, 2_000, 5_000, 1_000
+
+    def rows_per_second(process, prefix, count):
+        volunteers, events = _add_volunteers_and_events(
+            volunteer_count, event_count, prefix
+        )
+        ep_sf_ids = set()
+        rates = []
+        for status in ("Registered", "Attended"):
+            rows = _participation_rows(
+                row_count, volunteer_count, event_count, status, prefix
+            )[:count]
+            start = time.perf_counter()
+            counts = process(rows, volunteers, events, ep_sf_ids, [])
+            rates.append(count / (time.perf_counter() - start))
+            assert counts == (count, 0)
+        return rates, _participations(prefix)
+
+    def bulk(rows, volunteers, events, ep_sf_ids, errors):
+        return bulk_process_participation_rows(
+            rows, errors, volunteers, events, ep_sf_ids
+        )
+
+    with app.app_context():
+        row_rates, row_state = rows_per_second(_run_row_path, "ROW", sample)
+        bulk_rates, bulk_state = rows_per_second(bulk, "BULK", row_count)
+
+    for label, row_rate, bulk_rate in zip(("insert", "update"), row_rates, bulk_rates):
+        print(
+            f"\n50k participations ({label}): row path {row_rate:,.0f} rows/s, "
+            f"bulk upsert {bulk_rate:,.0f} rows/s"
+        )
+    assert bulk_state[:sample] == row_state
+    assert all(bulk > row for bulk, row in zip(bulk_rates, row_rates))
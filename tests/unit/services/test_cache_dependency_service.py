@@ -0,0 +1,269 @@
+"""
+Unit tests for services/cache_dependency_service.py
+
+Tests cover dependency registration, after_flush invalidation of only the
+affected cache rows, the mark_stale policy for district year-end rows, and
+the hit/miss/invalidation counters.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from models import db
+from models.district_model import District
+from models.event import Event, EventFormat, EventStatus, EventType
+from models.organization import Organization, VolunteerOrganization
+from models.reports import (
+    DistrictYearEndReport,
+    OrganizationDetailCache,
+    ReportCacheDependency,
+    VirtualSessionDistrictCache,
+    VirtualSessionReportCache,
+)
+from models.volunteer import EventParticipation, Volunteer
+from services.cache_dependency_service import (
+    get_cache_metrics,
+    is_invalidated,
+    record_cache_lookup,
+    register_cache_dependencies,
+    reset_cache_metrics,
+    school_year_for_date,
+    virtual_year_to_school_year,
+)
+
+# ── Fixtures ──────────────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_cache_metrics()
+    yield
+    reset_cache_metrics()
+
+
+def _make_event(title, start_date, districts=()):
+    event = Event(
+        title=title,
+        type=EventType.IN_PERSON,
+        format=EventFormat.IN_PERSON,
+        start_date=start_date,
+        status=EventStatus.COMPLETED,
+    )
+    event.districts.extend(districts)
+    db.session.add(event)
+    db.session.flush()
+    return event
+
+
+def _make_district_cache(name, virtual_year="2024-2025"):
+    cache = VirtualSessionDistrictCache(
+        district_name=name, virtual_year=virtual_year, session_data=[]
+    )
+    db.session.add(cache)
+    db.session.flush()
+    return cache
+
+
+# ── Helpers ───────────────────────────────────────────────────────────
+
+
+class TestYearHelpers:
+
+    def test_school_year_for_date_fall(self):
+        assert school_year_for_date(datetime(2024, 8, 1)) == "2425"
+
+    def test_school_year_for_date_spring(self):
+        assert school_year_for_date(datetime(2025, 7, 31)) == "2425"
+
+    def test_school_year_for_none(self):
+        assert school_year_for_date(None) is None
+
+    def test_virtual_year_to_school_year(self):
+        assert virtual_year_to_school_year("2024-2025") == "2425"
+
+    def test_virtual_year_to_school_year_invalid(self):
+        assert virtual_year_to_school_year("24-25") is None
+        assert virtual_year_to_school_year(None) is None
+
+
+# ── Registration ──────────────────────────────────────────────────────
+
+
+class TestRegistration:
+
+    def test_register_replaces_previous_dependencies(self, app):
+        with app.app_context():
+            cache = _make_district_cache("Alpha")
+            register_cache_dependencies(cache, event_ids=[1, 2, 3])
+            register_cache_dependencies(
+                cache, school_year="2425", district_ids=[7], event_ids=[4]
+            )
+            db.session.commit()
+
+            deps = ReportCacheDependency.query.filter_by(
+                cache_table="virtual_session_district_cache", cache_id=cache.id
+            ).all()
+            assert sorted((d.entity_type, d.entity_id) for d in deps) == [
+                ("district", "7"),
+                ("event", "4"),
+            ]
+
+    def test_register_untracked_model_raises(self, app):
+        with app.app_context():
+            with pytest.raises(ValueError):
+                register_cache_dependencies(District(name="Nope"))
+
+
+# ── after_flush invalidation ──────────────────────────────────────────
+
+
+class TestInvalidation:
+
+    def test_event_change_deletes_only_dependent_rows(self, app):
+        with app.app_context():
+            event = _make_event("Session A", datetime(2024, 10, 1, tzinfo=timezone.utc))
+            other = _make_event("Session B", datetime(2024, 10, 2, tzinfo=timezone.utc))
+            affected = _make_district_cache("Alpha")
+            untouched = _make_district_cache("Beta")
+            register_cache_dependencies(affected, event_ids=[event.id])
+            register_cache_dependencies(untouched, event_ids=[other.id])
+            db.session.commit()
+            affected_id, untouched_id = affected.id, untouched.id
+
+            event.title = "Session A (renamed)"
+            db.session.commit()
+
+            assert db.session.get(VirtualSessionDistrictCache, affected_id) is None
+            assert db.session.get(VirtualSessionDistrictCache, untouched_id)
+            assert (
+                get_cache_metrics()["virtual_session_district_cache"]["invalidations"]
+                == 1
+            )
+
+    def test_new_event_invalidates_year_wide_and_district_rows(self, app):
+        with app.app_context():
+            district = District(name="Gamma District")
+            db.session.add(district)
+            year_report = VirtualSessionReportCache(
+                virtual_year="2024-2025", session_data=[]
+            )
+            other_year = VirtualSessionReportCache(
+                virtual_year="2023-2024", session_data=[]
+            )
+            db.session.add_all([year_report, other_year])
+            district_cache = _make_district_cache("Gamma District")
+            register_cache_dependencies(year_report, school_year="2425", year_wide=True)
+            register_cache_dependencies(other_year, school_year="2324", year_wide=True)
+            register_cache_dependencies(
+                district_cache, school_year="2425", district_ids=[district.id]
+            )
+            db.session.commit()
+            ids = (year_report.id, other_year.id, district_cache.id)
+
+            _make_event(
+                "New Session",
+                datetime(2025, 2, 1, tzinfo=timezone.utc),
+                districts=[district],
+            )
+            db.session.commit()
+
+            assert db.session.get(VirtualSessionReportCache, ids[0]) is None
+            assert db.session.get(VirtualSessionReportCache, ids[1]) is not None
+            assert db.session.get(VirtualSessionDistrictCache, ids[2]) is None
+
+    def test_participation_invalidates_volunteer_organization_rows(self, app):
+        with app.app_context():
+            org = Organization(name="Dependency Org")
+            volunteer = Volunteer(first_name="Dee", last_name="Pend")
+            db.session.add_all([org, volunteer])
+            db.session.flush()
+            db.session.add(
+                VolunteerOrganization(volunteer_id=volunteer.id, organization_id=org.id)
+            )
+            event = _make_event("Org Event", datetime(2024, 9, 5, tzinfo=timezone.utc))
+            detail = OrganizationDetailCache(organization_id=org.id, school_year="2425")
+            db.session.add(detail)
+            register_cache_dependencies(
+                detail, school_year="2425", organization_ids=[org.id]
+            )
+            db.session.commit()
+            detail_id = detail.id
+
+            db.session.add(
+                EventParticipation(
+                    volunteer_id=volunteer.id, event_id=event.id, status="Attended"
+                )
+            )
+            db.session.commit()
+
+            assert db.session.get(OrganizationDetailCache, detail_id) is None
+
+    def test_district_year_end_rows_are_marked_stale(self, app):
+        with app.app_context():
+            district = District(name="Delta District")
+            db.session.add(district)
+            event = _make_event(
+                "Year End Event",
+                datetime(2024, 11, 1, tzinfo=timezone.utc),
+                districts=[district],
+            )
+            report = DistrictYearEndReport(
+                district_id=district.id, school_year="2425", report_data={"x": 1}
+            )
+            db.session.add(report)
+            register_cache_dependencies(
+                report,
+                school_year="2425",
+                event_ids=[event.id],
+                district_ids=[district.id],
+            )
+            db.session.commit()
+            assert not is_invalidated(report)
+
+            event.status = EventStatus.CANCELLED
+            db.session.commit()
+
+            db.session.refresh(report)
+            assert report.report_data == {"x": 1}
+            assert is_invalidated(report)
+            assert (
+                ReportCacheDependency.query.filter_by(
+                    cache_table="district_year_end_reports", cache_id=report.id
+                ).count()
+                == 0
+            )
+
+    def test_rollback_discards_invalidation(self, app):
+        with app.app_context():
+            event = _make_event("Rollback", datetime(2024, 10, 1, tzinfo=timezone.utc))
+            cache = _make_district_cache("Epsilon")
+            register_cache_dependencies(cache, event_ids=[event.id])
+            db.session.commit()
+            cache_id = cache.id
+
+            event.title = "Changed"
+            db.session.flush()
+            db.session.rollback()
+
+            assert db.session.get(VirtualSessionDistrictCache, cache_id) is not None
+
+
+# ── Metrics ───────────────────────────────────────────────────────────
+
+
+class TestMetrics:
+
+    def test_hit_rate(self):
+        record_cache_lookup("virtual_session_report_cache", hit=True)
+        record_cache_lookup("virtual_session_report_cache", hit=True)
+        record_cache_lookup("virtual_session_report_cache", hit=False)
+        metrics = get_cache_metrics()["virtual_session_report_cache"]
+        assert metrics["hits"] == 2
+        assert metrics["misses"] == 1
+        assert metrics["hit_rate"] == 66.7
+
+    def test_all_tracked_caches_listed(self):
+        metrics = get_cache_metrics()
+        assert "district_year_end_reports" in metrics
+        assert metrics["organization_detail_cache"]["hit_rate"] is None
@@ -0,0 +1,172 @@
+"""
+Unit tests for services/educator_link_service.py
+
+Tests cover deriving EventEducator rows from Event.educators through the
+flush hook, resolving registered teachers, rebuilding the table after links
+were dropped, and the readers built on the link table.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete
+
+from models import db
+from models.event import Event, EventEducator, EventStatus, EventTeacher, EventType
+from models.teacher import Teacher
+from models.teacher_progress import TeacherProgress
+from services.educator_link_service import (
+    educator_event_ids,
+    parse_educators,
+    rebuild_educator_links,
+)
+from services.teacher_matching_service import (
+    build_teacher_alias_map,
+    count_sessions_for_teachers,
+)
+from utils.email_reminders import get_completed_session_counts
+
+
+def _session(title, educators, status=EventStatus.COMPLETED):
+    return Event(
+        title=title,
+        type=EventType.VIRTUAL_SESSION,
+        status=status,
+        start_date=datetime.now(timezone.utc) - timedelta(days=3),
+        educators=educators,
+    )
+
+
+def _links(event_id):
+    return sorted(
+        (link.name, link.normalized_name, link.teacher_id)
+        for link in EventEducator.query.filter_by(event_id=event_id)
+    )
+
+
+def test_parse_educators():
+    assert parse_educators(" Jane Smith; ;jane smith;O'Neil, Pat ") == [
+        ("Jane Smith", "jane smith"),
+        ("O'Neil, Pat", "oneil pat"),
+    ]
+    assert parse_educators(None) == []
+
+
+class TestLinkSync:
+
+    def test_links_follow_educators_text(self, app):
+        with app.app_context():
+            event = _session("Robotics", "Jane Smith; Bob Lee")
+            db.session.add(event)
+            db.session.commit()
+            assert _links(event.id) == [
+                ("Bob Lee", "bob lee", None),
+                ("Jane Smith", "jane smith", None),
+            ]
+
+            event.educators = "Mary-Ann Cole"
+            db.session.commit()
+            assert _links(event.id) == [("Mary-Ann Cole", "mary ann cole", None)]
+
+            event.educators = None
+            db.session.commit()
+            assert _links(event.id) == []
+
+    def test_registered_teacher_resolved(self, app):
+        with app.app_context():
+            teacher = Teacher(first_name="Jane", last_name="Smith")
+            event = _session("Robotics", "Jane Smith; Guest Reader")
+            db.session.add_all([teacher, event])
+            db.session.flush()
+            db.session.add(EventTeacher(event_id=event.id, teacher_id=teacher.id))
+            db.session.commit()
+
+            assert _links(event.id) == [
+                ("Guest Reader", "guest reader", None),
+                ("Jane Smith", "jane smith", teacher.id),
+            ]
+
+    def test_deleted_event_drops_links(self, app):
+        with app.app_context():
+            event = _session("Robotics", "Jane Smith")
+            db.session.add(event)
+            db.session.commit()
+            event_id = event.id
+
+            db.session.delete(event)
+            db.session.commit()
+
+            assert _links(event_id) == []
+
+    def test_rebuild(self, app):
+        with app.app_context():
+            db.session.add_all(
+                [_session("A", "Jane Smith; Bob Lee"), _session("B", "Bob Lee")]
+            )
+            db.session.commit()
+
+            db.session.execute(delete(EventEducator))
+            db.session.commit()
+
+            assert rebuild_educator_links() == 3
+            assert EventEducator.query.count() == 3
+
+
+class TestLinkReaders:
+
+    @pytest.fixture
+    def sessions(self, app):
+        with app.app_context():
+            events = [
+                _session("A", "Jane Smith; Bob Lee"),
+                _session("B", "JANE SMITH"),
+                _session("C", "Jane Smith", status=EventStatus.CONFIRMED),
+                _session("D", "jane.smith@school.org"),
+            ]
+            db.session.add_all(events)
+            db.session.commit()
+            yield events
+
+    def test_educator_event_ids(self, sessions):
+        ids = educator_event_ids(["Jane Smith"], Event.status == EventStatus.COMPLETED)
+
+        assert ids == {sessions[0].id, sessions[1].id}
+
+    def test_completed_session_counts(self, sessions):
+        jane = TeacherProgress(
+            academic_year="2025-2026",
+            virtual_year="2025-2026",
+            building="Central",
+            name="Jane Smith",
+            email="jane.smith@school.org",
+        )
+        bob = TeacherProgress(
+            academic_year="2025-2026",
+            virtual_year="2025-2026",
+            building="Central",
+            name="Bob Lee",
+            email="bob@school.org",
+        )
+        db.session.add_all([jane, bob])
+        db.session.commit()
+
+        assert get_completed_session_counts([jane, bob]) == {jane.id: 3, bob.id: 1}
+
+    def test_count_sessions_for_teachers(self, sessions):
+        teachers = [
+            TeacherProgress(
+                academic_year="2025-2026",
+                virtual_year="2025-2026",
+                building="Central",
+                name=name,
+                email=f"{index}@school.org",
+            )
+            for index, name in enumerate(["Jane Smith", "Bob Lee"])
+        ]
+        db.session.add_all(teachers)
+        db.session.commit()
+        progress_map, alias_map = build_teacher_alias_map(teachers)
+
+        counts = count_sessions_for_teachers(sessions[:3], alias_map, progress_map)
+
+        assert counts == {teachers[0].id: 3, teachers[1].id: 1}
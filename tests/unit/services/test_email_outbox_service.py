@@ -0,0 +1,195 @@
+"""
+Unit tests for services/email_outbox_service.py
+
+Tests cover enqueueing, batched delivery through an in-process SMTP sink,
+retry with backoff, giving up after MAX_ATTEMPTS, skipping undeliverable
+entries, reclaiming orphaned claims, and latency percentiles.
+"""
+
+import smtplib
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models import db
+from models.email import EmailOutbox, OutboxStatus
+from services import email_outbox_service
+from services.email_outbox_service import (
+    MAX_ATTEMPTS,
+    drain_outbox,
+    enqueue_email,
+    init_outbox_worker,
+    latency_percentiles,
+    outbox_latency_stats,
+    process_outbox,
+)
+
+
+def _enqueue(index=0, **kwargs):
+    return enqueue_email(
+        recipient=f"teacher{index}@example.org",
+        subject=f"Subject {index}",
+        html_body=f"<p>Body {index}</p>",
+        text_body=f"Body {index}",
+        purpose="magic_link",
+        **kwargs,
+    )
+
+
+class _FailingProvider:
+    def send(self, outgoing):
+        raise smtplib.SMTPServerDisconnected("provider down")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def delivery_enabled(monkeypatch):
+    monkeypatch.setenv("EMAIL_DELIVERY_ENABLED", "true")
+    monkeypatch.delenv("EMAIL_ALLOWLIST", raising=False)
+
+
+def test_enqueue_stores_pending_entry(app):
+    with app.app_context():
+        entry = _enqueue(attachments=[("invite.ics", "text/calendar", b"BEGIN")])
+
+        stored = db.session.get(EmailOutbox, entry.id)
+        assert stored.status == OutboxStatus.PENDING
+        assert stored.attempts == 0
+        assert stored.attachments[0]["filename"] == "invite.ics"
+
+
+def test_delivers_batch_through_smtp_sink(app, delivery_enabled, smtp_sink):
+    with app.app_context():
+        _enqueue(0, sender_name="KCK", attachments=[("a.ics", "text/calendar", b"X")])
+        for index in range(1, 5):
+            _enqueue(index)
+
+        summary = process_outbox(batch_size=3)
+
+        assert summary["claimed"] == 3
+        assert summary["sent"] == 3
+        assert summary["latency"]["count"] == 3
+        assert drain_outbox()["sent"] == 2
+        assert {e.status for e in EmailOutbox.query} == {OutboxStatus.SENT}
+        assert all(e.provider_message_id for e in EmailOutbox.query)
+
+        recipients = sorted(rcpts[0] for rcpts, _ in smtp_sink.messages)
+        assert recipients == [f"teacher{i}@example.org" for i in range(5)]
+        first = next(
+            msg
+            for rcpts, msg in smtp_sink.messages
+            if rcpts == ["teacher0@example.org"]
+        )
+        assert "KCK" in first["From"]
+        assert [p.get_filename() for p in first.walk() if p.get_filename()] == ["a.ics"]
+
+        stats = outbox_latency_stats()
+        assert stats["count"] == 5
+        assert 0 <= stats["p50"] <= stats["p95"]
+
+
+def test_failures_retry_with_backoff_then_fail(app, delivery_enabled):
+    with app.app_context():
+        entry = _enqueue()
+
+        summary = process_outbox(provider_factory=_FailingProvider)
+
+        assert summary["retried"] == 1
+        db.session.refresh(entry)
+        assert entry.status == OutboxStatus.PENDING
+        assert entry.attempts == 1
+        assert "provider down" in entry.last_error
+        next_attempt = entry.next_attempt_at.replace(tzinfo=timezone.utc)
+        assert next_attempt > datetime.now(timezone.utc)
+
+        # Not due again until the backoff elapses
+        assert process_outbox(provider_factory=_FailingProvider)["claimed"] == 0
+
+        for attempt in range(2, MAX_ATTEMPTS + 1):
+            entry.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            db.session.commit()
+            process_outbox(provider_factory=_FailingProvider)
+            db.session.refresh(entry)
+            assert entry.attempts == attempt
+
+        assert entry.status == OutboxStatus.FAILED
+
+
+def test_backoff_grows_and_is_capped():
+    delays = [email_outbox_service.backoff_delay(n) for n in (1, 2, 3, 20)]
+
+    assert delays[0] < delays[1] < delays[2]
+    assert delays[3] <= email_outbox_service.BACKOFF_MAX_SECONDS * 1.2
+
+
+def test_undeliverable_entries_are_skipped(app, monkeypatch):
+    monkeypatch.delenv("EMAIL_DELIVERY_ENABLED", raising=False)
+    with app.app_context():
+        entry = _enqueue()
+
+        summary = process_outbox(provider_factory=_FailingProvider)
+
+        assert summary["skipped"] == 1
+        db.session.refresh(entry)
+        assert entry.status == OutboxStatus.SKIPPED
+        assert "disabled" in entry.last_error
+
+
+def test_orphaned_claims_are_reclaimed(app, delivery_enabled, smtp_sink):
+    with app.app_context():
+        fresh, orphaned = _enqueue(0), _enqueue(1)
+        now = datetime.now(timezone.utc)
+        fresh.status = orphaned.status = OutboxStatus.SENDING
+        fresh.claimed_at = now
+        orphaned.claimed_at = now - timedelta(hours=1)
+        db.session.commit()
+
+        summary = process_outbox()
+
+        assert summary["sent"] == 1
+        db.session.refresh(fresh)
+        db.session.refresh(orphaned)
+        assert fresh.status == OutboxStatus.SENDING
+        assert orphaned.status == OutboxStatus.SENT
+
+
+def test_latency_percentiles_nearest_rank():
+    assert latency_percentiles([]) == {"count": 0, "p50": None, "p95": None}
+    stats = latency_percentiles(range(1, 101))
+    assert (stats["p50"], stats["p95"]) == (50, 95)
+
+
+def test_worker_started_with_app_drains_existing_entries(
+    app, delivery_enabled, smtp_sink, monkeypatch
+):
+    worker = email_outbox_service.OutboxWorker(poll_interval=60)
+    monkeypatch.setattr(email_outbox_service, "_worker", worker)
+    with app.app_context():
+        entry = EmailOutbox(
+            purpose="magic_link",
+            recipient="teacher@example.org",
+            subject="Left over",
+            html_body="<p>Left over</p>",
+            text_body="Left over",
+            status=OutboxStatus.PENDING,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        db.session.add(entry)
+        db.session.commit()
+
+        app.config["EMAIL_OUTBOX_WORKER"] = True
+        try:
+            init_outbox_worker(app)
+            # Nothing was enqueued, so only the start-up drain delivers it
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and not smtp_sink.messages:
+                time.sleep(0.05)
+        finally:
+            worker.stop()
+            app.config["EMAIL_OUTBOX_WORKER"] = False
+
+        db.session.refresh(entry)
+        assert entry.status == OutboxStatus.SENT
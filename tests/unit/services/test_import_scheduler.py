@@ -0,0 +1,203 @@
+"""
+Unit tests for services/salesforce/import_scheduler.py
+
+Tests cover dependency ordering, concurrent Salesforce fetch phases,
+serialized database phases, and the write gate staying held while a
+session has uncommitted writes.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from models import db
+from models.district_model import District
+from services.salesforce import import_scheduler
+from services.salesforce.client import retry_on_failure
+from services.salesforce.import_scheduler import (
+    ImportScheduler,
+    WriteGate,
+    released_write_gate,
+)
+
+
+def _step(name, depends_on=None):
+    return SimpleNamespace(name=name, depends_on=depends_on or [])
+
+
+class _Recorder:
+    """run_step stand-in recording order and concurrent DB phases."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.started = []
+        self.lock = threading.Lock()
+        self.in_db_phase = 0
+        self.max_db_phase = 0
+
+    def _db_phase(self):
+        with self.lock:
+            self.in_db_phase += 1
+            self.max_db_phase = max(self.max_db_phase, self.in_db_phase)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_db_phase -= 1
+
+    def __call__(self, step):
+        with self.lock:
+            self.started.append(step.name)
+        self._db_phase()
+        with released_write_gate():
+            time.sleep(0.02)  # Salesforce fetch
+        self._db_phase()
+        return step.name not in self.fail
+
+
+# ── Scheduling ────────────────────────────────────────────────────────
+
+
+class TestImportScheduler:
+
+    def test_dependencies_run_first(self):
+        steps = [
+            _step("events", ["organizations", "volunteers"]),
+            _step("volunteers", ["organizations"]),
+            _step("organizations"),
+            _step("participations", ["events", "volunteers"]),
+        ]
+        recorder = _Recorder()
+
+        results = ImportScheduler(steps, recorder, max_workers=4).run()
+
+        assert set(results) == {s.name for s in steps}
+        assert all(results.values())
+        order = recorder.started
+        assert order.index("organizations") < order.index("volunteers")
+        assert order.index("volunteers") < order.index("events")
+        assert order.index("events") < order.index("participations")
+
+    def test_db_phases_are_serialized(self):
+        steps = [_step(f"step{i}") for i in range(4)]
+        recorder = _Recorder()
+
+        ImportScheduler(steps, recorder, max_workers=4).run()
+
+        assert recorder.max_db_phase == 1
+
+    def test_independent_fetches_overlap(self):
+        fetching = threading.Barrier(2, timeout=5)
+
+        def run_step(step):
+            with released_write_gate():
+                fetching.wait()  # Only passes if both fetches are in flight
+            return True
+
+        results = ImportScheduler(
+            [_step("organizations"), _step("schools")], run_step, max_workers=2
+        ).run()
+
+        assert results == {"organizations": True, "schools": True}
+
+    def test_failed_dependency_does_not_block_dependents(self):
+        logger = MagicMock()
+        recorder = _Recorder(fail={"organizations"})
+
+        results = ImportScheduler(
+            [_step("organizations"), _step("volunteers", ["organizations"])],
+            recorder,
+            logger=logger,
+        ).run()
+
+        assert results == {"organizations": False, "volunteers": True}
+        logger.warning.assert_called_once()
+
+    def test_exception_marks_step_failed(self):
+        def run_step(step):
+            raise RuntimeError("boom")
+
+        assert ImportScheduler([_step("schools")], run_step).run() == {"schools": False}
+
+    def test_unselected_dependencies_are_ignored(self):
+        scheduler = ImportScheduler(
+            [_step("events", ["schools", "volunteers"]), _step("volunteers")],
+            _Recorder(),
+        )
+
+        assert scheduler.dependencies == {"events": ["volunteers"], "volunteers": []}
+
+    def test_cycle_is_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            ImportScheduler([_step("a", ["b"]), _step("b", ["a"])], _Recorder())
+
+    def test_daily_import_steps_form_a_dag(self, app):
+        from scripts.daily_imports.daily_imports import DailyImporter
+
+        importer = DailyImporter(app, MagicMock())
+        scheduler = ImportScheduler(importer.import_steps, _Recorder())
+
+        assert scheduler.dependencies["student_participations"] == [
+            "students",
+            "events",
+        ]
+        assert "volunteers" in scheduler.dependencies["events"]
+
+
+# ── Write gate ────────────────────────────────────────────────────────
+
+
+class TestWriteGate:
+
+    def test_released_without_hold_is_noop(self):
+        gate = WriteGate()
+        with gate.released():
+            assert gate._lock.acquire(blocking=False)
+            gate._lock.release()
+
+    def test_released_frees_lock_for_other_threads(self):
+        gate = WriteGate()
+        with gate.hold():
+            with gate.released():
+                assert gate._lock.acquire(blocking=False)
+                gate._lock.release()
+            assert not gate._lock.acquire(blocking=False)
+
+    def test_stays_held_with_pending_writes(self, app):
+        gate = WriteGate()
+        with app.app_context():
+            db.session.add(District(name="Gate District"))
+            with gate.hold():
+                with gate.released():
+                    assert not gate._lock.acquire(blocking=False)
+            db.session.rollback()
+
+    def test_retry_backoff_releases_gate(self, monkeypatch):
+        gate = WriteGate()
+        monkeypatch.setattr(import_scheduler, "_active_gate", gate)
+        gate_free_during_sleep = []
+
+        def fake_sleep(seconds):
+            if gate._lock.acquire(blocking=False):
+                gate._lock.release()
+                gate_free_during_sleep.append(True)
+            else:
+                gate_free_during_sleep.append(False)
+
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        attempts = []
+
+        @retry_on_failure(max_attempts=2, initial_delay=0.01)
+        def flaky():
+            attempts.append(gate._lock.locked())
+            if len(attempts) == 1:
+                raise ConnectionError("reset")
+            return "ok"
+
+        with gate.hold():
+            assert flaky() == "ok"
+            assert gate._lock.locked()
+
+        assert gate_free_during_sleep == [True]
+        assert attempts == [True, True]
@@ -0,0 +1,188 @@
+"""
+Unit tests for services/local_status_service.py
+
+Tests cover parity with Contact.calculate_local_status(), writing back only
+changed volunteers, virtual presenter hints, and incremental runs driven by
+the stale-marking flush hook.
+"""
+
+from datetime import datetime, timezone
+
+from models import db
+from models.contact import Address, ContactTypeEnum, LocalStatusEnum
+from models.event import Event, EventFormat, EventStatus, EventType
+from models.volunteer import EventParticipation, Volunteer
+from services.local_status_service import (
+    compute_local_statuses,
+    recompute_local_statuses,
+)
+from services.salesforce.processors.event import bulk_process_participation_rows
+
+
+def _volunteer(name, *addresses, status=LocalStatusEnum.unknown):
+    volunteer = Volunteer(first_name=name, last_name="Test", local_status=status)
+    db.session.add(volunteer)
+    db.session.flush()
+    for zip_code, address_type, primary in addresses:
+        db.session.add(
+            Address(
+                contact_id=volunteer.id,
+                zip_code=zip_code,
+                type=address_type,
+                primary=primary,
+            )
+        )
+    return volunteer
+
+
+def _event(fmt, event_type=EventType.IN_PERSON):
+    event = Event(
+        title=f"{fmt.value} event",
+        type=event_type,
+        format=fmt,
+        status=EventStatus.COMPLETED,
+        start_date=datetime(2024, 3, 1, tzinfo=timezone.utc),
+    )
+    db.session.add(event)
+    db.session.flush()
+    return event
+
+
+def _attend(volunteer, event, status="Attended"):
+    db.session.add(
+        EventParticipation(volunteer_id=volunteer.id, event_id=event.id, status=status)
+    )
+
+
+def _mixed_volunteers():
+    personal, professional = ContactTypeEnum.personal, ContactTypeEnum.professional
+    in_person = _event(EventFormat.IN_PERSON)
+    virtual = _event(EventFormat.VIRTUAL, EventType.VIRTUAL_SESSION)
+    volunteers = [
+        _volunteer("Metro", ("64111", professional, True)),
+        _volunteer("Region", ("67202", personal, True)),
+        _volunteer("Far", ("90210", personal, True)),
+        _volunteer("NoZip", (None, personal, True), ("64111", personal, False)),
+        _volunteer(
+            "Personal", ("90210", professional, False), ("66044", personal, False)
+        ),
+        _volunteer("BlankPersonal", ("", personal, False), ("64111", personal, False)),
+        _volunteer("Kept", status=LocalStatusEnum.partial),
+        _volunteer("Nothing"),
+        _volunteer("Attended", ("90210", personal, True)),
+        _volunteer("Virtual", ("90210", personal, True)),
+        _volunteer("NoShow", ("90210", personal, True)),
+    ]
+    _attend(volunteers[8], in_person)
+    _attend(volunteers[9], virtual)
+    _attend(volunteers[10], in_person, status="No Show")
+    db.session.commit()
+    return volunteers
+
+
+def test_matches_per_contact_calculation(app):
+    with app.app_context():
+        volunteers = _mixed_volunteers()
+
+        results = compute_local_statuses([v.id for v in volunteers])
+
+        expected = {v.id: v.calculate_local_status() for v in volunteers}
+        assert {vid: new for vid, (_, new, _) in results.items()} == expected
+        assert expected[volunteers[8].id] == LocalStatusEnum.local
+        assert expected[volunteers[3].id] == LocalStatusEnum.partial
+
+
+def test_recompute_writes_changes_and_search_documents(app):
+    with app.app_context():
+        volunteers = _mixed_volunteers()
+        metro = volunteers[0]
+
+        stats = recompute_local_statuses()
+        db.session.commit()
+
+        assert stats["volunteers"]["total"] == len(volunteers)
+        # Kept (partial), BlankPersonal and Nothing (unknown) are unchanged
+        assert stats["volunteers"]["updated"] == len(volunteers) - 3
+        db.session.expire_all()
+        assert metro.local_status == LocalStatusEnum.local
+        assert all(v.local_status_last_updated for v in Volunteer.query)
+        from services.volunteer_search_service import search_volunteer_ids
+
+        assert metro.id in search_volunteer_ids("Metro local")
+
+        # A second full run has nothing to write
+        assert recompute_local_statuses()["volunteers"]["updated"] == 0
+
+
+def test_virtual_hints_apply_after_address(app):
+    with app.app_context():
+        far = _volunteer("Far", ("90210", ContactTypeEnum.personal, True))
+        hinted = _volunteer("Hinted")
+        db.session.commit()
+
+        results = compute_local_statuses(
+            [far.id, hinted.id], hints={far.id: True, hinted.id: True}
+        )
+
+        assert results[far.id][1] == LocalStatusEnum.non_local
+        assert results[hinted.id][1] == LocalStatusEnum.local
+
+
+def test_incremental_run_recomputes_only_stale_volunteers(app):
+    with app.app_context():
+        volunteers = _mixed_volunteers()
+        recompute_local_statuses()
+        db.session.commit()
+        assert recompute_local_statuses(incremental=True)["volunteers"]["total"] == 0
+
+        far, virtual = volunteers[2], volunteers[9]
+        Address.query.filter_by(contact_id=far.id).one().zip_code = "64105"
+        virtual_event = db.session.get(Event, virtual.event_participations[0].event_id)
+        virtual_event.type = EventType.IN_PERSON
+        virtual_event.format = EventFormat.IN_PERSON
+        db.session.commit()
+
+        stats = recompute_local_statuses(incremental=True)
+        db.session.commit()
+
+        assert stats["volunteers"]["total"] == 2
+        assert stats["volunteers"]["updated"] == 2
+        db.session.expire_all()
+        assert far.local_status == LocalStatusEnum.local
+        assert virtual.local_status == LocalStatusEnum.local
+        assert recompute_local_statuses(incremental=True)["volunteers"]["total"] == 0
+
+
+def test_bulk_participation_import_marks_volunteers_stale(app):
+    with app.app_context():
+        volunteers = _mixed_volunteers()
+        recompute_local_statuses()
+        db.session.commit()
+        assert recompute_local_statuses(incremental=True)["volunteers"]["total"] == 0
+
+        volunteer = volunteers[0]
+        event = _event(EventFormat.IN_PERSON)
+        event.salesforce_id = "SESSION-BULK"
+        volunteer.salesforce_individual_id = "CONTACT-BULK"
+        db.session.commit()
+        recompute_local_statuses(incremental=True)
+        db.session.commit()
+
+        success, error = bulk_process_participation_rows(
+            [
+                {
+                    "Id": "EP-BULK",
+                    "Contact__c": "CONTACT-BULK",
+                    "Session__c": "SESSION-BULK",
+                    "Status__c": "Attended",
+                }
+            ],
+            [],
+            {"CONTACT-BULK": volunteer.id},
+            {"SESSION-BULK": event.id},
+            set(),
+        )
+
+        assert (success, error) == (1, 0)
+        stats = recompute_local_statuses(incremental=True)
+        assert stats["volunteers"]["total"] == 1
@@ -0,0 +1,155 @@
+"""
+Unit tests for services/name_matching_service.py
+
+Tests cover exact and fuzzy lookups, tie-breaking in insertion order, and
+recall of the blocked index against a brute-force SequenceMatcher scan on
+synthetic misspelled names. The benchmark is marked slow.
+"""
+
+import random
+import string
+import time
+
+import pytest
+
+from services.name_matching_service import (
+    NameIndex,
+    brute_force_best_match,
+    default_normalize,
+    soundex,
+)
+
+FIRST_NAMES = [
+    "john", "mary", "patricia", "robert", "jennifer", "michael", "linda",
+    "william", "elizabeth", "david", "barbara", "richard", "susan", "joseph",
+    "jessica", "thomas", "sarah", "charles", "karen", "christopher", "lisa",
+    "daniel", "nancy", "matthew", "betty", "anthony", "sandra", "mark",
+    "margaret", "donald", "ashley", "steven", "kimberly", "paul", "emily",
+]  # fmt: skip
+LAST_NAMES = [
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller",
+    "davis", "rodriguez", "martinez", "hernandez", "lopez", "gonzalez",
+    "wilson", "anderson", "taylor", "moore", "jackson", "martin", "lee",
+    "perez", "thompson", "white", "harris", "sanchez", "clark", "ramirez",
+    "lewis", "robinson", "walker", "young", "allen", "king", "wright",
+    "scott", "torres", "nguyen", "hill", "flores", "green", "adams",
+]  # fmt: skip
+
+
+def _misspell(name, rng):
+    chars = list(name)
+    position = rng.randrange(len(chars))
+    edit = rng.choice(["substitute", "delete", "insert", "transpose"])
+    if edit == "substitute":
+        chars[position] = rng.choice(string.ascii_lowercase)
+    elif edit == "delete" and len(chars) > 3:
+        del chars[position]
+    elif edit == "insert":
+        chars.insert(position, rng.choice(string.ascii_lowercase))
+    elif position < len(chars) - 1:
+        chars[position], chars[position + 1] = chars[position + 1], chars[position]
+    return "".join(chars)
+
+
+def _synthetic_names(count, seed=7):
+    """(entries, queries): indexed names and misspelled copies of them."""
+    rng = random.Random(seed)
+    entries = [
+        (
+            f"{rng.choice(FIRST_NAMES)}{rng.choice(['', 'a', 'e'])} "
+            f"{rng.choice(LAST_NAMES)}{rng.choice(['', 'son', 'er'])}",
+            position,
+        )
+        for position in range(count)
+    ]
+    queries = []
+    for _ in range(count):
+        name = rng.choice(entries)[0]
+        for _ in range(rng.choice([0, 1, 1, 2, 3])):
+            name = _misspell(name, rng)
+        queries.append(name)
+    return entries, queries
+
+
+def _index(entries, **kwargs):
+    index = NameIndex(**kwargs)
+    for name, value in entries:
+        index.add(name, value)
+    return index
+
+
+class TestNameIndex:
+
+    def test_exact_lookup_normalizes(self):
+        index = _index([("Mary O'Brien", 1), ("Mary OBrien", 2), ("Mary O Brien", 3)])
+
+        assert index.exact("MARY o'brien") == [1, 3]
+        assert index.exact("nobody") == []
+
+    def test_best_match_above_threshold(self):
+        index = _index([("Jonathan Smith", 1), ("Joan Smythe", 2)])
+
+        value, similarity = index.best_match("Jonathon Smith", min_similarity=0.85)
+
+        assert value == 1
+        assert similarity >= 0.85
+        assert index.best_match("Completely Different", min_similarity=0.85) is None
+
+    def test_ties_go_to_first_added(self):
+        index = _index([("Ann Lee", "first"), ("Ann Lee", "second")])
+
+        assert index.best_match("Ann Lee", min_similarity=0.85) == ("first", 1.0)
+        assert [value for value, _ in index.matches("Ann Lee")] == ["first", "second"]
+
+    def test_empty_names_ignored(self):
+        index = _index([("", 1), ("...", 2), (None, 3)])
+
+        assert len(index) == 0
+        assert index.best_match("") is None
+
+    def test_custom_normalizer(self):
+        index = NameIndex(normalize=lambda name: name.upper())
+        index.add("abc", 1)
+
+        assert index.exact("ABC") == [1]
+
+    def test_soundex(self):
+        assert soundex("Robert") == soundex("Rupert") == "R163"
+        assert soundex("Ashcraft") == "A261"
+        assert soundex("Lee") == "L000"
+        assert soundex("123") == ""
+
+    def test_recall_matches_brute_force(self):
+        entries, queries = _synthetic_names(300)
+        index = _index(entries)
+
+        for query in queries:
+            expected = brute_force_best_match(query, entries, 0.85)
+            assert index.best_match(query, min_similarity=0.85) == expected, query
+
+    def test_default_normalize(self):
+        assert default_normalize("  Smith-Jones, Jr. ") == "smith jones jr"
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_benchmark_against_brute_force():
+    entries, queries = _synthetic_names(2000)
+
+    started = time.perf_counter()
+    index = _index(entries)
+    indexed = [index.best_match(query, min_similarity=0.85) for query in queries]
+    index_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = [brute_force_best_match(query, entries, 0.85) for query in queries]
+    scan_seconds = time.perf_counter() - started
+
+    matched = sum(1 for result in scanned if result)
+    recall = sum(1 for a, b in zip(indexed, scanned) if b and a == b) / matched
+    print(
+        f"\n{len(queries)}x{len(entries)} names: index {index_seconds:.2f}s, "
+        f"brute force {scan_seconds:.2f}s, recall {recall:.3f}"
+    )
+    assert recall == 1.0
+    assert index_seconds * 5 < scan_seconds
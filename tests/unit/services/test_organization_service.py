@@ -92,3 +92,29 @@ def test_unresolvable_organization(app):
     with app.app_context():
         result = resolve_organization("Completely Unknown Entity LLC")
         assert result is None
+
+
+def test_near_match_with_name_index(app):
+    with app.app_context():
+        from services.organization_service import (
+            build_organization_name_index,
+            find_org_near_match,
+            get_organization_name_index,
+        )
+
+        first = Organization(name="Next Level")
+        second = Organization(name="Next Level LLC")
+        db.session.add_all([first, second, Organization(name="Prep-KC")])
+        db.session.commit()
+
+        index = build_organization_name_index()
+
+        # Same answer as the full scan: first org by id wins
+        assert find_org_near_match("Next Level, Inc.", name_index=index) == first
+        assert find_org_near_match("Next Level, Inc.") == first
+        assert find_org_near_match("Unknown Corp", name_index=index) is None
+        assert find_org_near_match("next level", name_index=index) is None
+
+        caches = {}
+        assert get_organization_name_index(caches) is caches["organization_name_index"]
+        assert get_organization_name_index(None) is None
@@ -0,0 +1,231 @@
+"""
+Unit tests for routes/virtual/pathful_import/lookup_cache.py
+
+Tests cover the initial build, incremental refresh of new, updated and
+deleted rows, collision markers, lazy hydration of matched rows, event
+cutoff filtering and isolation of per-import views.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from models import db
+from models.contact import Email
+from models.district_model import District, DistrictAlias
+from models.event import Event, EventType
+from models.teacher_progress import TeacherProgress
+from models.volunteer import Volunteer
+from routes.virtual.pathful_import.lookup_cache import (
+    LazyLookup,
+    clear_lookup_caches,
+    get_lookup_cache,
+)
+
+
+@pytest.fixture
+def ctx(app):
+    with app.app_context():
+        clear_lookup_caches()
+        yield
+        db.session.rollback()
+        clear_lookup_caches()
+
+
+def _teacher_progress(name, email):
+    record = TeacherProgress(
+        academic_year="2025-2026",
+        virtual_year="2025-2026",
+        building="Banneker",
+        name=name,
+        email=email,
+    )
+    db.session.add(record)
+    return record
+
+
+def _virtual_event(title, start, session_id=None):
+    event = Event(
+        title=title,
+        start_date=start,
+        type=EventType.VIRTUAL_SESSION,
+        pathful_session_id=session_id,
+    )
+    db.session.add(event)
+    return event
+
+
+# ── Build and refresh ─────────────────────────────────────────────────
+
+
+class TestLookupCacheRefresh:
+
+    def test_initial_build_indexes_keys(self, ctx):
+        teacher = _teacher_progress("Ada Lovelace", "Ada@School.org")
+        db.session.commit()
+
+        views = get_lookup_cache().views()
+
+        assert views["teacher_by_email"].get("ada@school.org") is teacher
+        assert views["teacher_by_name"].get("ada lovelace") is teacher
+
+    def test_refresh_picks_up_new_rows(self, ctx):
+        get_lookup_cache()
+        teacher = _teacher_progress("Grace Hopper", "grace@school.org")
+        db.session.commit()
+
+        views = get_lookup_cache().views()
+
+        assert views["teacher_by_email"].get("grace@school.org") is teacher
+
+    def test_refresh_picks_up_updated_rows(self, ctx):
+        teacher = _teacher_progress("Alan Turing", "alan@school.org")
+        db.session.commit()
+        get_lookup_cache()
+
+        teacher.email = "turing@school.org"
+        db.session.commit()
+        views = get_lookup_cache().views()
+
+        assert "alan@school.org" not in views["teacher_by_email"]
+        assert views["teacher_by_email"].get("turing@school.org") is teacher
+
+    def test_refresh_drops_deleted_rows(self, ctx):
+        teacher = _teacher_progress("Edsger Dijkstra", "edsger@school.org")
+        db.session.commit()
+        get_lookup_cache()
+
+        db.session.delete(teacher)
+        db.session.commit()
+        views = get_lookup_cache().views()
+
+        assert "edsger@school.org" not in views["teacher_by_email"]
+
+    def test_refresh_reloads_full_sources(self, ctx):
+        district = District(name="Kansas City Public Schools")
+        db.session.add(district)
+        db.session.commit()
+        get_lookup_cache()
+
+        db.session.add(DistrictAlias(alias="KCPS", district_id=district.id))
+        db.session.commit()
+        views = get_lookup_cache().views()
+
+        assert views["district_by_name"].get("kcps") is district
+        assert views["district_by_name"].get("kansas city public schools") is district
+
+    def test_incremental_refresh_skips_full_rebuild(self, ctx):
+        _teacher_progress("Ada Lovelace", "ada@school.org")
+        db.session.commit()
+        cache = get_lookup_cache()
+        built_at = cache.built_at
+
+        _teacher_progress("Grace Hopper", "grace@school.org")
+        db.session.commit()
+        get_lookup_cache()
+
+        assert cache.built_at == built_at
+        assert cache.stats["rows_loaded"] < 10
+
+    def test_zero_max_age_rebuilds(self, app, ctx):
+        app.config["PATHFUL_LOOKUP_CACHE_MAX_AGE"] = 0
+        cache = get_lookup_cache()
+        built_at = cache.built_at
+
+        get_lookup_cache()
+
+        assert cache.built_at != built_at
+
+
+# ── Collisions and views ──────────────────────────────────────────────
+
+
+class TestLookupCacheViews:
+
+    def test_volunteer_name_collision_marker(self, ctx):
+        db.session.add_all(
+            [
+                Volunteer(first_name="Sam", last_name="Smith"),
+                Volunteer(first_name="Sam", last_name="Smith"),
+            ]
+        )
+        db.session.commit()
+
+        views = get_lookup_cache().views()
+
+        assert ("sam", "smith") in views["volunteer_by_name"]
+        assert views["volunteer_by_name"][("sam", "smith")] is None
+
+    def test_shared_volunteer_email_is_collision(self, ctx):
+        first = Volunteer(first_name="Pat", last_name="Lee")
+        second = Volunteer(first_name="Kim", last_name="Lee")
+        db.session.add_all([first, second])
+        db.session.flush()
+        db.session.add_all(
+            [
+                Email(contact_id=first.id, email="lee@home.org"),
+                Email(contact_id=second.id, email="lee@home.org"),
+            ]
+        )
+        db.session.commit()
+
+        views = get_lookup_cache().views()
+
+        assert "lee@home.org" in views["volunteer_by_email"]
+        assert views["volunteer_by_email"]["lee@home.org"] is None
+
+    def test_collision_clears_when_row_removed(self, ctx):
+        first = Volunteer(first_name="Sam", last_name="Smith")
+        second = Volunteer(first_name="Sam", last_name="Smith")
+        db.session.add_all([first, second])
+        db.session.commit()
+        get_lookup_cache()
+
+        second.last_name = "Smythe"
+        db.session.commit()
+        views = get_lookup_cache().views()
+
+        assert views["volunteer_by_name"][("sam", "smith")] is first
+
+    def test_event_cutoff_filters_sessions(self, ctx):
+        old = _virtual_event(
+            "Career Talk", datetime(2024, 9, 1, tzinfo=timezone.utc), "S-OLD"
+        )
+        new = _virtual_event(
+            "Career Talk", datetime(2025, 9, 1, tzinfo=timezone.utc), "S-NEW"
+        )
+        db.session.commit()
+        cache = get_lookup_cache()
+
+        recent = cache.views(datetime(2025, 1, 1))
+        everything = cache.views()
+
+        assert "S-OLD" not in recent["event_by_session_id"]
+        assert recent["event_by_session_id"].get("S-NEW") is new
+        assert everything["event_by_session_id"].get("S-OLD") is old
+
+    def test_view_writes_do_not_leak(self, ctx):
+        cache = get_lookup_cache()
+        views = cache.views()
+
+        teacher = _teacher_progress("Ada Lovelace", "ada@school.org")
+        views["teacher_by_email"]["ada@school.org"] = teacher
+        views["event_teacher_set"].add((1, 2))
+
+        fresh = cache.views()
+        assert views["teacher_by_email"].get("ada@school.org") is teacher
+        assert "ada@school.org" not in fresh["teacher_by_email"]
+        assert (1, 2) not in fresh["event_teacher_set"]
+
+    def test_lazy_lookup_hydrates_on_access(self, ctx):
+        teacher = _teacher_progress("Ada Lovelace", "ada@school.org")
+        db.session.commit()
+
+        lookup = LazyLookup(TeacherProgress, {"ada": teacher.id, "dup": None})
+
+        assert len(lookup) == 2
+        assert lookup.get("ada") is teacher
+        assert lookup.get("dup", "missing") is None
+        assert lookup.get("nobody", "missing") == "missing"
+        assert lookup.pop("ada") is teacher
+        assert "ada" not in lookup
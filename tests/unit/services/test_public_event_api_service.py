@@ -0,0 +1,122 @@
+"""
+Unit tests for services/public_event_api_service.py
+
+Tests cover keyset cursor pagination, conditional GETs against the cached
+responses, invalidation through the tenant event change counter, and the
+resolved tenant cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models import db
+from models.event import Event, EventStatus, EventType
+from models.tenant import Tenant
+from services.public_event_api_service import (
+    clear_feed_cache,
+    clear_tenant_cache,
+    decode_cursor,
+)
+
+
+@pytest.fixture
+def api_tenant(app):
+    """An active tenant with five published events and its API key."""
+    clear_feed_cache()
+    clear_tenant_cache()
+    tenant = Tenant(slug="test-district", name="Test District")
+    api_key = tenant.generate_api_key()
+    db.session.add(tenant)
+    db.session.flush()
+    start = datetime.now(timezone.utc) + timedelta(days=7)
+    for index in range(5):
+        db.session.add(
+            Event(
+                title=f"Event {index}",
+                type=EventType.CAREER_FAIR,
+                status=EventStatus.PUBLISHED,
+                # Two events share a start date to exercise the id tiebreak
+                start_date=start + timedelta(days=index // 2),
+                tenant_id=tenant.id,
+            )
+        )
+    db.session.commit()
+    yield tenant, api_key
+    clear_feed_cache()
+    clear_tenant_cache()
+
+
+def _get(client, api_key, path="events", **params):
+    return client.get(
+        f"/api/v1/district/test-district/{path}",
+        query_string=params,
+        headers={"X-API-Key": api_key},
+    )
+
+
+def test_cursor_pagination_walks_every_event_once(client, api_tenant):
+    _, api_key = api_tenant
+    titles, cursor = [], ""
+    while cursor is not None:
+        body = _get(client, api_key, per_page=2, cursor=cursor).get_json()
+        titles += [event["title"] for event in body["data"]]
+        cursor = body["pagination"]["next_cursor"]
+        assert "total_items" not in body["pagination"]
+
+    assert titles == [f"Event {index}" for index in range(5)]
+
+    response = _get(client, api_key, cursor="not-a-cursor")
+    assert response.status_code == 400
+    assert response.get_json()["error"]["code"] == "INVALID_CURSOR"
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_page_mode_keeps_totals_and_offers_a_cursor(client, api_tenant):
+    _, api_key = api_tenant
+    pagination = _get(client, api_key, per_page=2, page=1).get_json()["pagination"]
+
+    assert pagination["total_items"] == 5
+    assert pagination["has_next"] is True
+    follow = _get(client, api_key, per_page=2, cursor=pagination["next_cursor"])
+    assert [e["title"] for e in follow.get_json()["data"]] == ["Event 2", "Event 3"]
+
+
+def test_conditional_get_and_invalidation_on_event_change(client, api_tenant):
+    tenant, api_key = api_tenant
+    first = _get(client, api_key)
+    assert first.status_code == 200
+    assert first.headers["ETag"] and first.headers["Last-Modified"]
+
+    not_modified = _get(client, api_key, path="events/upcoming")
+    etag = not_modified.headers["ETag"]
+    response = client.get(
+        "/api/v1/district/test-district/events/upcoming",
+        headers={"X-API-Key": api_key, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+    counter, updated_at = tenant.event_change_counter, tenant.updated_at
+    Event.query.filter_by(title="Event 0").one().title = "Renamed"
+    db.session.commit()
+    assert tenant.event_change_counter == counter + 1
+    assert tenant.updated_at == updated_at
+
+    response = client.get(
+        "/api/v1/district/test-district/events/upcoming",
+        headers={"X-API-Key": api_key, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.get_json()["data"][0]["title"] == "Renamed"
+
+
+def test_tenant_cache_forgets_rotated_keys(client, api_tenant):
+    tenant, api_key = api_tenant
+    assert _get(client, api_key).status_code == 200
+
+    new_key = tenant.generate_api_key()
+    db.session.commit()
+
+    assert _get(client, api_key).status_code == 401
+    assert _get(client, new_key).status_code == 200
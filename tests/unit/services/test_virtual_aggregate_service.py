@@ -0,0 +1,216 @@
+"""
+Unit tests for services/virtual_aggregate_service.py
+
+Tests cover the full rebuild, delta application for edited, added and
+deleted events, and that the assembled report matches a full
+compute_virtual_session_data recompute.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from models import db
+from models.district_model import District
+from models.event import Event, EventFormat, EventStatus, EventTeacher, EventType
+from models.reports import VirtualSessionAggregate, VirtualSessionEventRows
+from models.school_model import School
+from models.teacher import Teacher
+from models.volunteer import Volunteer
+from routes.reports.common import get_virtual_year_dates
+from routes.virtual.usage.computation import compute_virtual_session_data
+from services.virtual_aggregate_service import (
+    OVERALL_DISTRICT,
+    apply_virtual_session_deltas,
+    apply_virtual_session_deltas_or_drop,
+    get_virtual_aggregate_report,
+    invalidate_virtual_aggregates,
+    rebuild_virtual_aggregates,
+    virtual_year_for_date,
+)
+
+YEAR = "2024-2025"
+
+# ── Fixtures ──────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def virtual_data(app):
+    """Two districts, three teachers, a presenter and three virtual sessions."""
+    with app.app_context():
+        kck = District(name="Kansas City Kansas Public Schools")
+        other = District(name="Aggregate Test District")
+        db.session.add_all([kck, other])
+        db.session.flush()
+
+        schools = [
+            School(id="AGG_SCHOOL_01", name="Agg School One", district_id=kck.id),
+            School(id="AGG_SCHOOL_02", name="Agg School Two", district_id=other.id),
+        ]
+        db.session.add_all(schools)
+        teachers = [
+            Teacher(first_name="Ada", last_name="One", school_id="AGG_SCHOOL_01"),
+            Teacher(first_name="Ben", last_name="Two", school_id="AGG_SCHOOL_01"),
+            Teacher(first_name="Cy", last_name="Three", school_id="AGG_SCHOOL_02"),
+        ]
+        presenter = Volunteer(first_name="Pat", last_name="Presenter")
+        db.session.add_all([*teachers, presenter])
+        db.session.flush()
+
+        events = [
+            _make_event("Robotics", datetime(2024, 9, 10, 10), teachers[:2]),
+            _make_event("Finance", datetime(2024, 11, 5, 9), teachers[1:], presenter),
+            _make_event("Unregistered", datetime(2025, 2, 3, 13), [], district=other),
+        ]
+        db.session.commit()
+
+        yield {"teachers": teachers, "events": events, "presenter": presenter}
+
+
+def _make_event(title, start_date, teachers, presenter=None, district=None):
+    event = Event(
+        title=title,
+        type=EventType.VIRTUAL_SESSION,
+        format=EventFormat.VIRTUAL,
+        status=EventStatus.COMPLETED,
+        start_date=start_date,
+        series="STEM",
+    )
+    if district:
+        event.districts.append(district)
+    if presenter:
+        event.volunteers.append(presenter)
+    db.session.add(event)
+    db.session.flush()
+    for teacher in teachers:
+        db.session.add(
+            EventTeacher(event_id=event.id, teacher_id=teacher.id, status="attended")
+        )
+    db.session.flush()
+    return event
+
+
+def _assert_matches_full_compute():
+    db.session.expire_all()
+    date_from, date_to = get_virtual_year_dates(YEAR)
+    session_data, district_summaries, overall_summary, filter_options = (
+        compute_virtual_session_data(YEAR, date_from, date_to, {})
+    )
+    report = get_virtual_aggregate_report(YEAR)
+
+    assert report is not None
+    assert report.session_data == session_data
+    assert report.district_summaries == district_summaries
+    assert report.overall_summary == overall_summary
+    assert report.filter_options == filter_options
+    return report
+
+
+# ── Helpers ───────────────────────────────────────────────────────────
+
+
+class TestVirtualYearForDate:
+
+    def test_fall(self):
+        assert virtual_year_for_date(datetime(2024, 8, 1)) == "2024-2025"
+
+    def test_spring(self):
+        assert virtual_year_for_date(datetime(2025, 7, 31)) == "2024-2025"
+
+    def test_none(self):
+        assert virtual_year_for_date(None) is None
+
+
+# ── Rebuild ───────────────────────────────────────────────────────────
+
+
+class TestRebuild:
+
+    def test_report_missing_until_built(self, app, virtual_data):
+        with app.app_context():
+            assert get_virtual_aggregate_report(YEAR) is None
+
+    def test_rebuild_matches_full_compute(self, app, virtual_data):
+        with app.app_context():
+            assert rebuild_virtual_aggregates(YEAR) == 3
+            report = _assert_matches_full_compute()
+            assert report.monthly_counts == {"2024-09": 2, "2024-11": 2, "2025-02": 1}
+
+    def test_invalidate_drops_store(self, app, virtual_data):
+        with app.app_context():
+            rebuild_virtual_aggregates(YEAR)
+            invalidate_virtual_aggregates(YEAR)
+
+            assert get_virtual_aggregate_report(YEAR) is None
+            assert VirtualSessionEventRows.query.count() == 0
+
+
+# ── Deltas ────────────────────────────────────────────────────────────
+
+
+class TestDeltas:
+
+    def test_status_change_applies_delta(self, app, virtual_data):
+        with app.app_context():
+            rebuild_virtual_aggregates(YEAR)
+            event = db.session.get(Event, virtual_data["events"][1].id)
+            event.status = EventStatus.CANCELLED
+            db.session.commit()
+
+            assert apply_virtual_session_deltas([event.id]) == {YEAR: 1}
+            report = _assert_matches_full_compute()
+            assert report.overall_summary["teacher_count"] == 2
+
+    def test_new_registration_and_event(self, app, virtual_data):
+        with app.app_context():
+            rebuild_virtual_aggregates(YEAR)
+            teachers = [db.session.get(Teacher, t.id) for t in virtual_data["teachers"]]
+            db.session.add(
+                EventTeacher(
+                    event_id=virtual_data["events"][0].id,
+                    teacher_id=teachers[2].id,
+                    status="attended",
+                )
+            )
+            new_event = _make_event("Art", datetime(2025, 3, 1, 11), teachers[2:])
+            db.session.commit()
+
+            apply_virtual_session_deltas([virtual_data["events"][0].id, new_event.id])
+            _assert_matches_full_compute()
+
+    def test_deleted_event_is_subtracted(self, app, virtual_data):
+        with app.app_context():
+            rebuild_virtual_aggregates(YEAR)
+            event_id = virtual_data["events"][2].id
+            db.session.delete(db.session.get(Event, event_id))
+            db.session.commit()
+
+            apply_virtual_session_deltas([event_id])
+            _assert_matches_full_compute()
+            assert not VirtualSessionEventRows.query.filter_by(
+                event_id=event_id
+            ).first()
+
+    def test_unbuilt_year_is_skipped(self, app, virtual_data):
+        with app.app_context():
+            assert apply_virtual_session_deltas([virtual_data["events"][0].id]) == {}
+            assert not VirtualSessionAggregate.query.filter_by(
+                district_name=OVERALL_DISTRICT
+            ).first()
+
+    def test_failed_delta_drops_year(self, app, virtual_data, monkeypatch):
+        from services import virtual_aggregate_service
+
+        def fail(event_ids):
+            raise RuntimeError("boom")
+
+        with app.app_context():
+            rebuild_virtual_aggregates(YEAR)
+            event_id = virtual_data["events"][0].id
+            assert apply_virtual_session_deltas_or_drop([event_id], [YEAR])
+
+            monkeypatch.setattr(
+                virtual_aggregate_service, "apply_virtual_session_deltas", fail
+            )
+            assert not apply_virtual_session_deltas_or_drop([event_id], [YEAR])
+            assert get_virtual_aggregate_report(YEAR) is None
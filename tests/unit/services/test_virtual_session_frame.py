@@ -0,0 +1,232 @@
+"""
+Unit tests for services/virtual_session_frame.py
+
+Tests check that the columnar SessionFrame path returns exactly what the
+dict-based apply_runtime_filters, calculate_summaries_from_sessions and
+apply_sorting_and_pagination return for the same rows, plus a benchmark
+against the dict path on 100k synthetic rows (marked slow).
+"""
+
+import random
+import time
+
+import pytest
+
+from services.virtual_computation_service import (
+    SORTABLE_COLUMNS,
+    STATUS_FILTER_MAPPING,
+    apply_runtime_filters,
+    apply_sorting_and_pagination,
+    calculate_summaries_from_sessions,
+)
+from services.virtual_session_frame import (
+    SessionFrame,
+    clear_session_frames,
+    get_session_frame,
+)
+
+DISTRICTS = [
+    "Kansas City Kansas Public Schools",
+    "Hickman Mills School District",
+    "Grandview School District",
+    "Other District",
+    None,
+]
+STATUSES = [
+    "completed",
+    "Successfully Completed",
+    " simulcast ",
+    "teacher no-show",
+    "Cancelled",
+    "draft",
+    "",
+]
+TOPICS = ["STEM", "Health Sciences", "Arts & Media", None, ""]
+DATES = ["09/10/24", "1/15/25", "12/3", "2/28", "bad", None]
+TIMES = ["10:00 AM", "09:30 AM", "1:15 PM", "noon", None]
+
+# ── Helpers ───────────────────────────────────────────────────────────
+
+
+def _synthetic_rows(count, seed=7):
+    """Session rows with repeated teachers, sessions and presenters."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        event_id = rng.randrange(count // 4 + 1) or None
+        presenters = [
+            {
+                "id": rng.choice([rng.randrange(200), None]),
+                "name": rng.choice([f"Presenter {rng.randrange(200)}", ""]),
+                "organization_name": rng.choice([f"Org {rng.randrange(50)}", None]),
+                "is_people_of_color": rng.random() < 0.3,
+                "is_local": rng.random() < 0.5,
+            }
+            for _ in range(rng.randrange(3))
+        ]
+        rows.append(
+            {
+                "event_id": event_id,
+                "district": rng.choice(DISTRICTS),
+                "status": rng.choice(STATUSES),
+                "teacher_name": rng.choice([f"Teacher {rng.randrange(500)}", None]),
+                "school_name": rng.choice([f"School {rng.randrange(60)}", ""]),
+                "session_title": rng.choice([f"Session {event_id}", None]),
+                "presenter": ", ".join(p["name"] for p in presenters)
+                or rng.choice(["Ann Lee, Bo Park", None]),
+                "presenter_data": presenters,
+                "presenter_organization": rng.choice(["Acme", "acme", None]),
+                "topic_theme": rng.choice(TOPICS),
+                "date": rng.choice(DATES),
+                "time": rng.choice(TIMES),
+                "session_type": rng.choice(["Virtual", "virtual", "Hybrid"]),
+                "school_level": rng.choice(["Elementary", "High", None]),
+            }
+        )
+    return rows
+
+
+FILTER_CASES = [
+    {},
+    {"district": "Kansas City Kansas Public Schools"},
+    {"status": "completed"},
+    {"status": "Cancelled"},
+    {"status": "teacher no-show"},
+    {"career_cluster": "health"},
+    {"school": "school 1"},
+    {"search": " presenter 1"},
+    {"search": "   "},
+    {"district": "Other District", "status": "simulcast", "search": "teacher"},
+]
+
+
+def _sort_args(column, order):
+    return {"sort": column, "order": order, "page": "2", "per_page": "15"}
+
+
+# ── Equivalence ───────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return _synthetic_rows(600)
+
+
+class TestSessionFrameEquivalence:
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_filters_match(self, rows, filters):
+        frame = SessionFrame.from_rows(rows)
+        expected = apply_runtime_filters(rows, filters)
+        result = apply_runtime_filters(frame, filters)
+
+        assert isinstance(result, SessionFrame)
+        assert result.to_rows() == expected
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    @pytest.mark.parametrize("show_all_districts", [True, False])
+    def test_summaries_match(self, rows, filters, show_all_districts):
+        frame = apply_runtime_filters(SessionFrame.from_rows(rows), filters)
+        expected = calculate_summaries_from_sessions(
+            apply_runtime_filters(rows, filters), show_all_districts
+        )
+
+        assert calculate_summaries_from_sessions(frame, show_all_districts) == expected
+
+    @pytest.mark.parametrize("column", [*SORTABLE_COLUMNS, "unknown"])
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    def test_sorting_and_pagination_match(self, rows, column, order):
+        frame = apply_runtime_filters(
+            SessionFrame.from_rows(rows), {"status": "completed"}
+        )
+        filtered = apply_runtime_filters(rows, {"status": "completed"})
+        expected_filters = {"year": "2024-2025"}
+        frame_filters = {"year": "2024-2025"}
+
+        expected = apply_sorting_and_pagination(
+            filtered, _sort_args(column, order), expected_filters
+        )
+        result = apply_sorting_and_pagination(
+            frame, _sort_args(column, order), frame_filters
+        )
+
+        assert result == expected
+        assert frame_filters == expected_filters
+
+    def test_status_mapping_is_covered(self, rows):
+        frame = SessionFrame.from_rows(rows)
+        for status in STATUS_FILTER_MAPPING:
+            expected = apply_runtime_filters(rows, {"status": status})
+            assert apply_runtime_filters(frame, {"status": status}).to_rows() == (
+                expected
+            )
+
+    def test_empty_rows(self):
+        frame = SessionFrame.from_rows([])
+
+        assert len(apply_runtime_filters(frame, {"search": "x"})) == 0
+        assert calculate_summaries_from_sessions(
+            frame
+        ) == calculate_summaries_from_sessions([])
+
+
+class TestSequenceProtocol:
+
+    def test_behaves_like_row_list(self):
+        rows = _synthetic_rows(20)
+        frame = SessionFrame.from_rows(rows)
+
+        assert len(frame) == 20
+        assert frame[0] is rows[0]
+        assert frame[-1] is rows[-1]
+        assert frame[2:5] == rows[2:5]
+        assert list(frame.copy()) == rows
+
+
+class TestGetSessionFrame:
+
+    def test_reuses_frame_for_same_key(self):
+        clear_session_frames()
+        rows = _synthetic_rows(10)
+
+        first = get_session_frame(("2024-2025", 1), rows)
+        assert get_session_frame(("2024-2025", 1), rows) is first
+        assert get_session_frame(("2024-2025", 2), rows) is not first
+        clear_session_frames()
+
+
+# ── Benchmark ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_benchmark_against_dict_path():
+    """Filter, summarize, sort and paginate 100k rows with both backends."""
+    rows = _synthetic_rows(100_000)
+    filters = {"status": "completed", "search": "teacher 1"}
+    request_args = _sort_args("school_name", "asc")
+
+    start = time.perf_counter()
+    frame = SessionFrame.from_rows(rows)
+    build_seconds = time.perf_counter() - start
+
+    def run(session_data):
+        start = time.perf_counter()
+        filtered = apply_runtime_filters(session_data, filters)
+        summaries = calculate_summaries_from_sessions(filtered, True)
+        page = apply_sorting_and_pagination(
+            filtered, request_args, {"year": "2024-2025"}
+        )
+        return time.perf_counter() - start, summaries, page
+
+    dict_seconds, dict_summaries, dict_page = run(list(rows))
+    run(frame)  # warm the sort rank cache
+    frame_seconds, frame_summaries, frame_page = run(frame)
+
+    print(
+        f"\n100k rows: dict {dict_seconds:.3f}s, columnar {frame_seconds:.3f}s "
+        f"(one-off build {build_seconds:.3f}s)"
+    )
+    assert frame_summaries == dict_summaries
+    assert frame_page == dict_page
+    assert frame_seconds < dict_seconds
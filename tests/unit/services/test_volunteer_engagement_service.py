@@ -0,0 +1,145 @@
+"""
+Unit tests for services/volunteer_engagement_service.py
+
+Tests cover keeping VolunteerEngagementStats current through the flush
+hook (participations, event changes, email history), backfilling volunteers
+without a row, and the readers built on the table.
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import delete
+
+from models import db
+from models.event import Event, EventStatus, EventType
+from models.history import History
+from models.volunteer import EventParticipation, Volunteer
+from models.volunteer_engagement import VolunteerEngagementStats
+from services.volunteer_engagement_service import rebuild_engagement_stats
+
+
+def _event(title, event_type, start):
+    event = Event(
+        title=title, type=event_type, status=EventStatus.COMPLETED, start_date=start
+    )
+    db.session.add(event)
+    db.session.flush()
+    return event
+
+
+def _stats(volunteer_id):
+    db.session.expire_all()
+    return db.session.get(VolunteerEngagementStats, volunteer_id)
+
+
+def test_participation_writes_keep_stats_current(app):
+    with app.app_context():
+        volunteer = Volunteer(first_name="Ada", last_name="Lovelace")
+        db.session.add(volunteer)
+        db.session.commit()
+        assert _stats(volunteer.id).attended_count == 0
+
+        fair = _event("Fair", EventType.CAREER_FAIR, datetime(2024, 2, 1, 9))
+        talk = _event("Talk", EventType.CAREER_SPEAKER, datetime(2024, 5, 1, 9))
+        later = _event("Later", EventType.CAREER_SPEAKER, datetime(2024, 9, 1, 9))
+        no_show = EventParticipation(
+            volunteer_id=volunteer.id, event_id=later.id, status="No Show"
+        )
+        db.session.add_all(
+            [
+                EventParticipation(
+                    volunteer_id=volunteer.id, event_id=fair.id, status="Attended"
+                ),
+                EventParticipation(
+                    volunteer_id=volunteer.id, event_id=talk.id, status="Completed"
+                ),
+                no_show,
+            ]
+        )
+        db.session.commit()
+
+        stats = _stats(volunteer.id)
+        assert (stats.attended_count, stats.participation_count) == (2, 3)
+        assert stats.event_type_counts == {"career_fair": 1, "career_speaker": 2}
+        assert stats.first_volunteer_date == datetime(2024, 2, 1, 9)
+        assert stats.last_volunteer_date == datetime(2024, 5, 1, 9)
+        assert volunteer.total_times_volunteered == 2
+
+        no_show.status = "Attended"
+        db.session.commit()
+        assert _stats(volunteer.id).last_volunteer_date == datetime(2024, 9, 1, 9)
+
+        later.type = EventType.CAREER_FAIR
+        db.session.commit()
+        assert _stats(volunteer.id).event_type_counts == {
+            "career_fair": 2,
+            "career_speaker": 1,
+        }
+
+        db.session.delete(no_show)
+        db.session.commit()
+        assert _stats(volunteer.id).attended_count == 2
+
+
+def test_last_email_date_combines_contact_and_history(app):
+    with app.app_context():
+        volunteer = Volunteer(
+            first_name="Grace", last_name="Hopper", last_email_date=date(2024, 1, 5)
+        )
+        db.session.add(volunteer)
+        db.session.commit()
+        assert _stats(volunteer.id).last_email_date == date(2024, 1, 5)
+
+        db.session.add_all(
+            [
+                History(
+                    contact_id=volunteer.id,
+                    history_type="activity",
+                    activity_type="Email",
+                    activity_date=datetime(2024, 3, 2, 10),
+                ),
+                History(
+                    contact_id=volunteer.id,
+                    history_type="note",
+                    summary="Call",
+                    activity_date=datetime(2024, 6, 1, 10),
+                ),
+            ]
+        )
+        db.session.commit()
+
+        assert _stats(volunteer.id).last_email_date == date(2024, 3, 2)
+
+
+def test_rebuild_backfills_missing_rows(app):
+    with app.app_context():
+        volunteer = Volunteer(first_name="Alan", last_name="Turing")
+        db.session.add(volunteer)
+        db.session.flush()
+        event = _event("Fair", EventType.CAREER_FAIR, datetime(2024, 2, 1, 9))
+        db.session.add(
+            EventParticipation(
+                volunteer_id=volunteer.id, event_id=event.id, status="Attended"
+            )
+        )
+        db.session.commit()
+        db.session.execute(delete(VolunteerEngagementStats))
+        db.session.commit()
+
+        assert volunteer.total_times_volunteered == 1
+
+        assert rebuild_engagement_stats() == 1
+        assert _stats(volunteer.id).attended_count == 1
+
+
+def test_volunteer_deletion_removes_row(app):
+    with app.app_context():
+        volunteer = Volunteer(first_name="Temp", last_name="Volunteer")
+        db.session.add(volunteer)
+        db.session.commit()
+        volunteer_id = volunteer.id
+
+        db.session.delete(volunteer)
+        db.session.commit()
+
+        assert _stats(volunteer_id) is None
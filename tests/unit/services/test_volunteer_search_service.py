@@ -0,0 +1,175 @@
+"""
+Unit tests for services/volunteer_search_service.py
+
+Tests cover prefix matching, match modes, column restriction and ranking on
+the FTS5 backend, the ilike fallback, and search documents staying in sync
+with ORM writes to volunteers, organizations, skills and participations.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from models import db
+from models.event import Event, EventType
+from models.organization import Organization, VolunteerOrganization
+from models.volunteer import EventParticipation, Skill, Volunteer
+from models.volunteer_search import VolunteerSearchDocument
+from services import volunteer_search_service as search
+from services.volunteer_search_service import (
+    BACKEND_FTS5,
+    BACKEND_LIKE,
+    MATCH_ALL,
+    MATCH_ANY,
+    MATCH_PHRASE,
+    rebuild_search_index,
+    search_backend,
+    search_volunteer_ids,
+)
+
+
+@pytest.fixture
+def people(app):
+    with app.app_context():
+        org = Organization(name="TechCorp Industries")
+        python = Skill(name="Python")
+        victor = Volunteer(
+            first_name="Victor",
+            last_name="Alvarez",
+            title="Senior Engineer",
+            industry="Technology",
+        )
+        victor.skills.append(python)
+        victoria = Volunteer(first_name="Victoria", last_name="Banks", title="Manager")
+        engineer = Volunteer(
+            first_name="Sam", last_name="Smith", title="Engineer Victor Lab"
+        )
+        db.session.add_all([org, python, victor, victoria, engineer])
+        db.session.flush()
+        db.session.add(
+            VolunteerOrganization(
+                volunteer_id=victoria.id, organization_id=org.id, role="Recruiter"
+            )
+        )
+        db.session.commit()
+        yield {"victor": victor, "victoria": victoria, "engineer": engineer}
+        db.session.rollback()
+
+
+# ── Searching ─────────────────────────────────────────────────────────
+
+
+class TestVolunteerSearch:
+
+    def test_uses_fts5_on_sqlite(self, people):
+        assert search_backend() == BACKEND_FTS5
+
+    def test_prefix_match(self, people):
+        ids = search_volunteer_ids("vict", columns=("name",))
+
+        assert set(ids) == {people["victor"].id, people["victoria"].id}
+
+    def test_match_all_requires_every_term(self, people):
+        ids = search_volunteer_ids("victor engineer", match=MATCH_ALL)
+
+        assert set(ids) == {people["victor"].id, people["engineer"].id}
+
+    def test_phrase_match(self, people):
+        ids = search_volunteer_ids("senior engineer", match=MATCH_PHRASE)
+
+        assert ids == [people["victor"].id]
+
+    def test_column_restriction(self, people):
+        assert search_volunteer_ids("techcorp", columns=("name",)) == []
+        assert search_volunteer_ids("techcorp", columns=("work",)) == [
+            people["victoria"].id
+        ]
+
+    def test_name_matches_rank_first(self, people):
+        ids = search_volunteer_ids("victor", match=MATCH_ANY)
+
+        # Name matches outrank a match in a job title
+        assert len(ids) == 3
+        assert ids[-1] == people["engineer"].id
+
+    def test_punctuation_only_search_matches_nothing(self, people):
+        assert search_volunteer_ids('"*:') == []
+
+    def test_like_backend_matches(self, people, monkeypatch):
+        monkeypatch.setattr(search, "search_backend", lambda session=None: BACKEND_LIKE)
+
+        ids = search_volunteer_ids("techcorp recruiter", match=MATCH_ALL)
+
+        assert ids == [people["victoria"].id]
+
+    def test_unknown_column_rejected(self, people):
+        with pytest.raises(ValueError, match="Unknown search columns"):
+            search_volunteer_ids("victor", columns=("email",))
+
+
+# ── Keeping documents in sync ─────────────────────────────────────────
+
+
+class TestSearchDocumentSync:
+
+    def test_volunteer_edit_reindexes(self, people):
+        people["victoria"].title = "Architect"
+        db.session.commit()
+
+        assert search_volunteer_ids("architect") == [people["victoria"].id]
+        assert search_volunteer_ids("manager") == []
+
+    def test_organization_rename_reindexes_members(self, people):
+        org = Organization.query.filter_by(name="TechCorp Industries").one()
+        org.name = "Initech"
+        db.session.commit()
+
+        assert search_volunteer_ids("initech") == [people["victoria"].id]
+        assert search_volunteer_ids("techcorp") == []
+
+    def test_skill_and_participation_reindex(self, people):
+        people["victoria"].skills.append(Skill(name="Welding"))
+        event = Event(
+            title="Cloud Computing Workshop",
+            type=EventType.VIRTUAL_SESSION,
+            start_date=datetime(2025, 10, 1),
+        )
+        db.session.add(event)
+        db.session.flush()
+        db.session.add(
+            EventParticipation(
+                volunteer_id=people["engineer"].id, event_id=event.id, status="Attended"
+            )
+        )
+        db.session.commit()
+
+        assert search_volunteer_ids("weld") == [people["victoria"].id]
+        assert search_volunteer_ids("cloud") == [people["engineer"].id]
+        assert search_volunteer_ids("virtual_session") == [people["engineer"].id]
+
+    def test_deleted_volunteer_is_dropped(self, people):
+        victor_id = people["victor"].id
+        db.session.delete(people["victor"])
+        db.session.commit()
+
+        assert victor_id not in search_volunteer_ids("victor")
+        assert db.session.get(VolunteerSearchDocument, victor_id) is None
+
+    def test_first_search_is_read_only(self, people):
+        VolunteerSearchDocument.query.delete()
+        db.session.commit()
+        people["victor"].title = "Uncommitted"
+
+        assert search_volunteer_ids("victoria") == []
+        db.session.rollback()
+        assert people["victor"].title == "Senior Engineer"
+        assert VolunteerSearchDocument.query.count() == 0
+
+    def test_rebuild_search_index(self, people):
+        search_backend()
+        VolunteerSearchDocument.query.delete()
+        db.session.commit()
+        assert search_volunteer_ids("victoria") == []
+
+        assert rebuild_search_index() == 3
+        assert search_volunteer_ids("victoria") == [people["victoria"].id]
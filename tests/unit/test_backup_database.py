@@ -0,0 +1,143 @@
+"""
+Unit tests for scripts/daily_imports/backup_database.py
+
+Tests cover consistent online snapshots of WAL databases, the copy, gzip and
+page-store modes, restoring from a manifest, chunk deduplication between
+backups, and pruning of expired backups and their unreferenced chunks.
+"""
+
+import gzip
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from scripts.daily_imports.backup_database import (
+    MANIFEST_SUFFIX,
+    MODE_COPY,
+    MODE_GZIP,
+    MODE_PAGES,
+    OBJECTS_DIRNAME,
+    TIMESTAMP_FORMAT,
+    restore_backup,
+    run_backup,
+)
+
+
+@pytest.fixture
+def live_db(tmp_path):
+    """A WAL database whose committed rows are still only in the -wal file."""
+    instance = tmp_path / "instance"
+    instance.mkdir()
+    conn = sqlite3.connect(str(instance / "app.db"))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    conn.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, payload TEXT)")
+    conn.executemany(
+        "INSERT INTO item (payload) VALUES (?)", [("x" * 500,) for _ in range(400)]
+    )
+    conn.commit()
+    yield instance, conn
+    conn.close()
+
+
+def _rows(path):
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("SELECT count(*) FROM item").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _objects(backup_dir):
+    return {p for p in (backup_dir / OBJECTS_DIRNAME).glob("*/*")}
+
+
+def test_copy_mode_includes_wal_changes(live_db, tmp_path):
+    instance, _ = live_db
+    assert (instance / "app.db-wal").stat().st_size > 0
+
+    dest = run_backup(instance, tmp_path / "backups", mode=MODE_COPY)
+
+    assert _rows(dest / "app.db") == 400
+    assert not list(dest.glob("*.partial"))
+
+
+def test_gzip_mode(live_db, tmp_path):
+    instance, _ = live_db
+
+    dest = run_backup(instance, tmp_path / "backups", mode=MODE_GZIP)
+
+    restored = tmp_path / "restored.db"
+    restored.write_bytes(gzip.decompress((dest / "app.db.gz").read_bytes()))
+    assert _rows(restored) == 400
+
+
+def test_page_store_round_trip_and_dedup(live_db, tmp_path):
+    instance, conn = live_db
+    backup_dir = tmp_path / "backups"
+
+    dest = run_backup(instance, backup_dir, mode=MODE_PAGES)
+    manifest_path = dest / f"app.db{MANIFEST_SUFFIX}"
+    first_objects = _objects(backup_dir)
+    assert len(json.loads(manifest_path.read_text())["chunks"]) > 1
+
+    restored = restore_backup(manifest_path, tmp_path / "restored.db")
+    assert _rows(restored) == 400
+
+    # A small change only adds the chunks holding the changed pages
+    conn.execute("UPDATE item SET payload = 'changed' WHERE id = 1")
+    conn.commit()
+    run_backup(instance, backup_dir, mode=MODE_PAGES)
+    new_objects = _objects(backup_dir) - first_objects
+    assert 0 < len(new_objects) < len(first_objects)
+
+    restore_backup(manifest_path, tmp_path / "restored2.db")
+    check = sqlite3.connect(str(tmp_path / "restored2.db"))
+    assert check.execute("SELECT payload FROM item WHERE id = 1").fetchone() == (
+        "changed",
+    )
+    check.close()
+
+
+def test_restore_rejects_corrupt_manifest(live_db, tmp_path):
+    instance, _ = live_db
+    dest = run_backup(instance, tmp_path / "backups", mode=MODE_PAGES)
+    manifest_path = dest / f"app.db{MANIFEST_SUFFIX}"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["chunks"] = manifest["chunks"][:-1]
+    manifest_path.write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        restore_backup(manifest_path, tmp_path / "restored.db")
+    assert not (tmp_path / "restored.db").exists()
+
+
+def test_prune_removes_expired_backups_and_chunks(live_db, tmp_path):
+    instance, _ = live_db
+    backup_dir = tmp_path / "backups"
+    old_stamp = (datetime.now() - timedelta(days=45)).strftime(TIMESTAMP_FORMAT)
+    old_dir = backup_dir / old_stamp
+    old_dir.mkdir(parents=True)
+    orphan = backup_dir / OBJECTS_DIRNAME / "ab" / ("c" * 62)
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"old chunk")
+    (old_dir / f"old.db{MANIFEST_SUFFIX}").write_text(
+        json.dumps({"chunks": ["ab" + "c" * 62]})
+    )
+
+    dest = run_backup(instance, backup_dir, retention_days=30, mode=MODE_PAGES)
+
+    assert not old_dir.exists()
+    assert not orphan.exists()
+    assert restore_backup(dest / f"app.db{MANIFEST_SUFFIX}", tmp_path / "r.db")
+
+
+def test_no_databases(tmp_path):
+    assert run_backup(tmp_path, tmp_path / "backups") is None
+
+
+def test_unknown_mode(tmp_path):
+    with pytest.raises(ValueError, match="Unknown backup mode"):
+        run_backup(tmp_path, tmp_path / "backups", mode="tar")
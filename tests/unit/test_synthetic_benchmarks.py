@@ -0,0 +1,45 @@
+"""
+Unit tests for the bulk synthetic data loader and the benchmark runner
+(scripts/generate_synthetic_data.py, scripts/performance/run_benchmarks.py).
+"""
+
+import json
+
+from models.event import Event
+from models.volunteer import EventParticipation, Volunteer
+from scripts.generate_synthetic_data import BulkSyntheticLoader
+from scripts.performance.run_benchmarks import compare_results, run_benchmarks
+
+
+def test_bulk_loader_scales_counts_and_links_rows(app):
+    loaded = BulkSyntheticLoader(seed=7, scale=0.01).load(rebuild=False)
+
+    assert loaded["volunteer"] == Volunteer.query.count() == 250
+    assert loaded["event_participation"] == EventParticipation.query.count()
+    orphans = (
+        EventParticipation.query.outerjoin(Volunteer)
+        .outerjoin(Event, EventParticipation.event_id == Event.id)
+        .filter((Volunteer.id.is_(None)) | (Event.id.is_(None)))
+        .count()
+    )
+    assert orphans == 0
+
+
+def test_runner_writes_results_and_flags_regressions(tmp_path):
+    output = tmp_path / "results.json"
+
+    document = run_benchmarks(
+        [0.005], seed=1, repeat=1, only={"volunteers_list"}, output=str(output)
+    )
+
+    saved = json.loads(output.read_text())
+    stats = saved["results"][0]["benchmarks"]["volunteers_list"]
+    assert saved["seed"] == 1 and stats["runs"] == 1
+    assert document["results"][0]["rows"]["volunteer"] > 0
+
+    faster = json.loads(json.dumps(saved))
+    faster["results"][0]["benchmarks"]["volunteers_list"]["median"] = (
+        stats["median"] / 2
+    )
+    assert compare_results(saved, faster, threshold=1.25)
+    assert not compare_results(saved, saved, threshold=1.25)
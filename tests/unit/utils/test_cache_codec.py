@@ -0,0 +1,88 @@
+"""
+Unit tests for utils/cache_codec.py report cache payload codecs.
+"""
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+
+from models import db
+from models.reports import VirtualSessionReportCache
+from utils.cache_codec import (
+    COLUMNAR_ZLIB_CODEC,
+    JSON_CODEC,
+    decode_payload,
+    encode_payload,
+    get_payload_metrics,
+    reset_payload_metrics,
+)
+
+
+def _rows(count):
+    return [
+        {
+            "event_id": i,
+            "title": f"Session {i}",
+            "date": datetime(2024, 10, 1 + i % 28, 9, tzinfo=timezone.utc),
+            "day": date(2024, 10, 1 + i % 28) if i % 3 else None,
+            "presenter_data": [{"id": i, "name": "Ada", "is_local": True}] * (i % 3),
+        }
+        for i in range(count)
+    ]
+
+
+def test_columnar_round_trip_keeps_types_and_shapes():
+    payload = {
+        "rows": _rows(50),
+        "ragged": [{"a": 1}, {"a": 2, "b": 3}, "text"],
+        "single": [{"when": datetime(2025, 1, 2, 3, 4)}],
+        "empty": [],
+    }
+
+    encoded = encode_payload(payload, COLUMNAR_ZLIB_CODEC)
+
+    assert set(encoded) == {"__cache_codec__", "data"}
+    assert decode_payload(encoded) == payload
+    assert encode_payload(payload, JSON_CODEC)["rows"][0]["date"] == (
+        "2024-10-01T09:00:00+00:00"
+    )
+
+
+def test_cache_column_reads_legacy_json_and_selected_codec(app):
+    reset_payload_metrics()
+    rows = _rows(200)
+    common = {"date_from": None, "date_to": None}
+    db.session.add(
+        VirtualSessionReportCache(virtual_year="2024-2025", session_data=rows, **common)
+    )
+    db.session.flush()
+    app.config["REPORT_CACHE_CODECS"] = {"virtual_session_report_cache": JSON_CODEC}
+    try:
+        db.session.add(
+            VirtualSessionReportCache(
+                virtual_year="2023-2024", session_data=rows, **common
+            )
+        )
+        db.session.commit()
+    finally:
+        app.config["REPORT_CACHE_CODECS"] = {}
+    db.session.expire_all()
+
+    stored = dict(
+        db.session.execute(
+            text(
+                "SELECT virtual_year, length(session_data) "
+                "FROM virtual_session_report_cache"
+            )
+        ).all()
+    )
+    compact = VirtualSessionReportCache.query.filter_by(virtual_year="2024-2025").one()
+    legacy = VirtualSessionReportCache.query.filter_by(virtual_year="2023-2024").one()
+
+    assert compact.session_data == rows
+    assert legacy.session_data[0]["date"] == "2024-10-01T09:00:00+00:00"
+    assert stored["2024-2025"] * 4 < stored["2023-2024"]
+
+    metrics = get_payload_metrics()["virtual_session_report_cache"]
+    assert metrics["reads"] == 2 and metrics["writes"] == 2
+    assert metrics["avg_stored_bytes"] > 0 and metrics["avg_read_ms"] is not None
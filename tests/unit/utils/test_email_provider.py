@@ -0,0 +1,140 @@
+"""
+Unit tests for utils/email_provider.py
+
+Tests cover SMTP delivery against an in-process SMTP sink, connection reuse,
+the pool's concurrency bound, and dropping connections after
+connection-level errors.
+"""
+
+import smtplib
+import threading
+import time
+
+import pytest
+
+from utils.email_provider import OutgoingEmail, ProviderPool, get_provider_factory
+
+
+def _outgoing(index, recipient=None):
+    return OutgoingEmail(
+        message_id=index,
+        recipients=[recipient or f"teacher{index}@example.com"],
+        subject=f"Reminder {index}",
+        html_body=f"<p>Hello {index}</p>",
+        text_body=f"Hello {index}",
+    )
+
+
+class TestSMTPProvider:
+
+    def test_sends_multipart_message_and_reuses_connection(self, smtp_sink):
+        provider = get_provider_factory()()
+        try:
+            responses = [provider.send(_outgoing(i)) for i in range(3)]
+        finally:
+            provider.close()
+
+        assert smtp_sink.connections == 1
+        assert [r["status"] for r in responses] == ["sent"] * 3
+        recipients, message = smtp_sink.messages[0]
+        assert recipients == ["teacher0@example.com"]
+        assert message["Subject"] == "Reminder 0"
+        assert message["Message-ID"] == responses[0]["message_id"]
+        assert {part.get_content_type() for part in message.walk()} >= {
+            "text/plain",
+            "text/html",
+        }
+
+    def test_no_factory_without_host(self, monkeypatch):
+        monkeypatch.delenv("SMTP_HOST", raising=False)
+
+        assert get_provider_factory() is None
+
+
+class _FakeProvider:
+    """Records concurrency across all instances of one pool."""
+
+    def __init__(self, state, fail_with=None):
+        self.state = state
+        self.fail_with = fail_with
+        self.closed = False
+
+    def send(self, outgoing):
+        with self.state["lock"]:
+            self.state["active"] += 1
+            self.state["peak"] = max(self.state["peak"], self.state["active"])
+        time.sleep(0.01)
+        with self.state["lock"]:
+            self.state["active"] -= 1
+        if self.fail_with and outgoing.message_id in self.fail_with:
+            raise self.fail_with[outgoing.message_id]
+        return {"status": "sent", "message_id": f"<{outgoing.message_id}@fake>"}
+
+    def close(self):
+        self.closed = True
+
+
+class TestProviderPool:
+
+    @pytest.fixture
+    def state(self):
+        return {"lock": threading.Lock(), "active": 0, "peak": 0, "created": []}
+
+    def _factory(self, state, fail_with=None):
+        def factory():
+            provider = _FakeProvider(state, fail_with)
+            state["created"].append(provider)
+            return provider
+
+        return factory
+
+    def test_deliver_all_is_bounded_and_ordered(self, state):
+        with ProviderPool(self._factory(state), size=3) as pool:
+            results = pool.deliver_all([_outgoing(i) for i in range(20)])
+
+        assert [r.outgoing.message_id for r in results] == list(range(20))
+        assert all(r.success for r in results)
+        assert 1 < state["peak"] <= 3
+        assert len(state["created"]) <= 3
+        assert all(p.closed for p in state["created"])
+
+    def test_connection_errors_drop_the_connection(self, state):
+        failures = {
+            1: smtplib.SMTPServerDisconnected("gone"),
+            2: smtplib.SMTPRecipientsRefused({"x@example.com": (550, b"no")}),
+        }
+        pool = ProviderPool(self._factory(state, failures), size=1)
+
+        results = [pool.deliver(_outgoing(i)) for i in range(4)]
+        pool.close()
+
+        assert [r.success for r in results] == [True, False, False, True]
+        assert results[1].response["error"] == "SMTPServerDisconnected"
+        # Only the disconnect forced a new connection
+        assert len(state["created"]) == 2
+
+    def test_unexpected_errors_fail_only_that_message(self, state):
+        failures = {1: UnicodeEncodeError("ascii", "é", 0, 1, "bad header")}
+        with ProviderPool(self._factory(state, failures), size=2) as pool:
+            results = pool.deliver_all([_outgoing(i) for i in range(4)])
+
+        assert [r.success for r in results] == [True, False, True, True]
+        assert results[1].response["error"] == "UnicodeEncodeError"
+
+    def test_refused_recipient_against_sink(self, smtp_sink):
+        smtp_sink.refuse.add("bounce@example.com")
+        with ProviderPool(get_provider_factory(), size=2) as pool:
+            results = pool.deliver_all(
+                [_outgoing(0), _outgoing(1, "bounce@example.com"), _outgoing(2)]
+            )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert len(smtp_sink.messages) == 2
+
+    def test_closed_pool_rejects_checkout(self, state):
+        pool = ProviderPool(self._factory(state), size=1)
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            with pool.connection():
+                pass
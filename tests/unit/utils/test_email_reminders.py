@@ -281,3 +281,136 @@ class TestTemplateRendering:
             # Login URL and contact info should be rendered
             assert "/login" in html_body
             assert "Log in to the VMS portal" in html_body
+
+
+class TestExecuteBatchSend:
+    """Tests for the batched, concurrent BatchEmailJob send."""
+
+    @pytest.fixture
+    def confirmed_job(self, app, upcoming_sessions, monkeypatch):
+        """A CONFIRMED job for seven active teachers (plus one inactive)."""
+        from models.email import BatchEmailJob, BatchEmailJobStatus
+        from models.user import SecurityLevel, User
+        from utils.template_sync import sync_file_templates
+
+        monkeypatch.setenv("EMAIL_DELIVERY_ENABLED", "true")
+        monkeypatch.delenv("EMAIL_ALLOWLIST", raising=False)
+        sync_file_templates()
+        template = EmailTemplate.query.filter_by(
+            purpose_key="teacher_session_reminder", is_active=True
+        ).first()
+        admin = User(
+            username="batchadmin",
+            email="batchadmin@example.com",
+            password_hash="x",
+            security_level=SecurityLevel.ADMIN,
+        )
+        db.session.add(admin)
+        for index in range(8):
+            teacher = TeacherProgress(
+                academic_year="2025-2026",
+                virtual_year="2025-2026",
+                building="Banneker Elementary",
+                name=f"Teacher {index}",
+                email=f"teacher{index}@kckps.org",
+            )
+            teacher.is_active = index < 7
+            db.session.add(teacher)
+        db.session.flush()
+        job = BatchEmailJob(
+            template_id=template.id,
+            status=BatchEmailJobStatus.CONFIRMED,
+            confirmation_code="ABC234",
+            canary_email="canary@example.com",
+            total_recipients=7,
+            created_by_id=admin.id,
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def test_sends_every_teacher_through_smtp_sink(self, confirmed_job, smtp_sink):
+        from models.email import (
+            DeliveryAttemptStatus,
+            EmailDeliveryAttempt,
+            EmailMessage,
+            EmailMessageStatus,
+        )
+        from utils.email_reminders import execute_batch_send
+
+        result = execute_batch_send(confirmed_job, batch_size=3, concurrency=2)
+
+        assert result == {
+            "sent_count": 7,
+            "skipped_count": 0,
+            "error_count": 0,
+            "status": "COMPLETED",
+        }
+        # Two pooled connections served all seven messages
+        assert smtp_sink.connections <= 2
+        delivered = sorted(rcpts[0] for rcpts, _ in smtp_sink.messages)
+        assert delivered == [f"teacher{i}@kckps.org" for i in range(7)]
+        subjects = {msg["Subject"] for _, msg in smtp_sink.messages}
+        assert all("{{" not in subject for subject in subjects)
+
+        messages = EmailMessage.query.all()
+        assert len(messages) == 7
+        assert {m.status for m in messages} == {EmailMessageStatus.SENT}
+        assert all(m.queued_at and m.sent_at for m in messages)
+        assert "Teacher 3" in next(
+            m.html_body for m in messages if m.recipients == ["teacher3@kckps.org"]
+        )
+        attempts = EmailDeliveryAttempt.query.all()
+        assert {a.status for a in attempts} == {DeliveryAttemptStatus.SUCCESS}
+        assert all(a.provider_message_id for a in attempts)
+
+    def test_cancellation_checked_between_batches(self, confirmed_job, monkeypatch):
+        from models.email import BatchEmailJob, BatchEmailJobStatus
+        from utils import email_reminders
+
+        sent = []
+
+        class FakeProvider:
+            def send(self, outgoing):
+                sent.append(outgoing.recipients[0])
+                return {"status": "sent", "message_id": f"<{outgoing.message_id}>"}
+
+            def close(self):
+                pass
+
+        original = email_reminders._send_batch
+
+        def send_then_cancel(*args, **kwargs):
+            reported = original(*args, **kwargs)
+            # Another request cancels the job while the first batch is out
+            BatchEmailJob.query.filter_by(id=confirmed_job.id).update(
+                {"status": BatchEmailJobStatus.CANCELLED}
+            )
+            db.session.commit()
+            return reported
+
+        monkeypatch.setattr(email_reminders, "_send_batch", send_then_cancel)
+
+        result = email_reminders.execute_batch_send(
+            confirmed_job, provider_factory=FakeProvider, batch_size=3
+        )
+
+        assert len(sent) == 3
+        assert result["sent_count"] == 3
+        assert result["status"] == "CANCELLED"
+
+    def test_without_provider_counts_errors_and_reports_once(self, confirmed_job):
+        from models.bug_report import BugReport
+        from models.email import EmailMessage, EmailMessageStatus
+        from utils.email_reminders import execute_batch_send
+
+        with patch("utils.email_reminders.get_provider_factory", return_value=None):
+            result = execute_batch_send(confirmed_job, batch_size=4)
+
+        assert result["sent_count"] == 0
+        assert result["error_count"] == 7
+        assert result["status"] == "COMPLETED"
+        assert {m.status for m in EmailMessage.query.all()} == {
+            EmailMessageStatus.FAILED
+        }
+        assert BugReport.query.count() == 1
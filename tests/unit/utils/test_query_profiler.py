@@ -0,0 +1,117 @@
+"""
+Unit tests for utils/query_profiler.py per-request SQL profiler.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from models import db
+from models.organization import Organization
+from utils.query_profiler import (
+    QueryBudgetExceeded,
+    fingerprint,
+    get_query_stats,
+    profile_queries,
+    query_budget,
+    reset_query_stats,
+)
+
+
+def _add_organizations(count):
+    db.session.add_all([Organization(name=f"Org {i}") for i in range(count)])
+    db.session.commit()
+
+
+def _n_plus_one(count):
+    for org_id in range(1, count + 1):
+        db.session.get(Organization, org_id)
+
+
+def test_fingerprint_ignores_literals_and_in_list_length():
+    assert fingerprint("SELECT * FROM t WHERE id = 5 AND name = 'a''b'") == (
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    )
+    assert fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == fingerprint(
+        "SELECT  *\n FROM t WHERE id IN (?, ?)"
+    )
+    assert fingerprint("SELECT * FROM t2 WHERE a = :a") == (
+        "SELECT * FROM t2 WHERE a = ?"
+    )
+
+
+class TestQueryBudget:
+    """Test profile_queries() and query_budget()."""
+
+    def test_profile_counts_statements_and_repeats(self, app):
+        _add_organizations(6)
+        db.session.expunge_all()
+
+        with profile_queries() as stats:
+            _n_plus_one(6)
+
+        assert stats.statements == 6
+        assert stats.db_time > 0
+        [(shape, count)] = stats.repeated(5)
+        assert count == 6 and "FROM organization" in shape
+
+    def test_budget_fails_on_too_many_statements_or_repeats(self, app):
+        _add_organizations(6)
+        db.session.expunge_all()
+
+        with query_budget(2):
+            Organization.query.all()
+
+        with pytest.raises(QueryBudgetExceeded, match="budget of 3 exceeded"):
+            with query_budget(3):
+                _n_plus_one(6)
+
+        db.session.expunge_all()
+        with pytest.raises(QueryBudgetExceeded, match="repeated more than 2"):
+            with query_budget(50, max_repeats=2):
+                _n_plus_one(3)
+
+    def test_failed_statement_leaves_no_start_time(self, app):
+        with profile_queries() as stats:
+            with pytest.raises(OperationalError):
+                db.session.execute(text("SELECT * FROM no_such_table"))
+            db.session.rollback()
+            db.session.execute(text("SELECT 1"))
+
+        assert stats.statements == 1
+        assert not db.session.connection().info.get("query_profiler_start")
+
+
+def test_request_profiling_aggregates_per_endpoint(app, client, caplog):
+    reset_query_stats()
+    app.config.update(QUERY_PROFILER_ENABLED=True, QUERY_PROFILER_LOG_THRESHOLD=0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="utils.query_profiler"):
+            client.get("/login")
+            client.get("/login")
+    finally:
+        app.config.update(QUERY_PROFILER_ENABLED=False)
+
+    [stats] = [s for s in get_query_stats() if s["endpoint"] == "auth.login"]
+    assert stats["requests"] == 2
+    assert "Query profile GET /login" in caplog.text
+
+    reset_query_stats()
+    assert get_query_stats() == []
+
+
+def test_management_page_lists_endpoints(app, client, test_admin):
+    reset_query_stats()
+    app.config.update(QUERY_PROFILER_ENABLED=True)
+    try:
+        client.post("/login", data={"username": "admin", "password": "admin123"})
+        response = client.get("/management/queries")
+    finally:
+        app.config.update(QUERY_PROFILER_ENABLED=False)
+        reset_query_stats()
+
+    assert response.status_code == 200
+    assert b"auth.login" in response.data
+    assert b"QUERY_PROFILER_ENABLED" not in response.data
@@ -2,11 +2,18 @@
 Unit tests for utils/salesforce_client.py focusing on connection, counts, samples, and health.
 """
 
+import time
 import types
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from utils.salesforce_client import SalesforceClient, get_entity_count
+from utils.salesforce_client import (
+    SalesforceClient,
+    SalesforceClientError,
+    SalesforceQueryCache,
+    get_entity_count,
+)
 
 
 class DummySF:
@@ -81,3 +88,104 @@ def test_get_entity_count_dispatch(monkeypatch):
 
     with pytest.raises(ValueError):
         get_entity_count("unknown")
+
+
+class CountingSF(DummySF):
+    def __init__(self, delay=0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.queries = []
+
+    def query(self, q):
+        self.queries.append(q)
+        time.sleep(self.delay)
+        return super().query(q)
+
+
+def _client(sf, cache=None):
+    c = SalesforceClient(username="u", password="p", security_token="t", cache=cache)
+    c._rate_limit = lambda: None
+    c.sf = sf
+    return c
+
+
+def test_shared_cache_reuses_results_across_clients():
+    sf = CountingSF()
+    cache = SalesforceQueryCache()
+    first, second = _client(sf, cache), _client(sf, cache)
+
+    assert first.get_volunteer_count() == second.get_volunteer_count() == 123
+    first.get_event_sample(5)
+    second.get_event_sample(limit=5)
+    second.get_event_sample(limit=6)
+
+    assert len(sf.queries) == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+    assert first.clear_cache("sf:event_sample*") == 2
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    sf = CountingSF(delay=0.2)
+    cache = SalesforceQueryCache()
+    clients = [_client(sf, cache) for _ in range(5)]
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        counts = list(pool.map(lambda c: c.get_teacher_count(), clients))
+
+    assert counts == [123] * 5
+    assert len(sf.queries) == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_failed_query_is_not_cached(client):
+    client.sf = None
+    client._ensure_connection = lambda: None
+
+    with pytest.raises(SalesforceClientError):
+        client.get_student_count()
+
+    client.sf = DummySF(result_total=7)
+    assert client.get_student_count() == 7
+
+
+def test_cache_persists_entries_between_instances(tmp_path):
+    path = str(tmp_path / "sf_cache.json")
+    _client(CountingSF(result_total=42), SalesforceQueryCache(path)).get_event_count()
+
+    sf = CountingSF()
+    assert _client(sf, SalesforceQueryCache(path)).get_event_count() == 42
+    assert sf.queries == []
+
+
+def test_cache_file_writes_are_batched_until_flush(tmp_path):
+    path = str(tmp_path / "sf_cache.json")
+    cache = SalesforceQueryCache(path, persist_interval=3600)
+    cache.set("sf:first", 1, ttl=60)
+    cache.set("sf:second", 2, ttl=60)
+
+    # The first change is written at once, later ones wait for the interval
+    assert SalesforceQueryCache(path).get("sf:second") is None
+
+    cache.flush()
+    assert SalesforceQueryCache(path).get("sf:second") == 2
+
+
+def test_local_counts_and_samples_are_cached(app):
+    from models import db
+    from models.school_model import School
+
+    with app.app_context():
+        c = _client(CountingSF(), SalesforceQueryCache())
+        db.session.add(School(id="SCHOOL-1", name="First School"))
+        db.session.commit()
+
+        assert c.get_school_count() == 1
+        assert len(c.get_school_sample(limit=5)) == 1
+        db.session.add(School(id="SCHOOL-2", name="Second School"))
+        db.session.commit()
+
+        assert c.get_school_count() == 1
+        assert len(c.get_school_sample(limit=5)) == 1
+        assert c.get_district_count() == c.get_district_count() == 0
+        assert c.cache.stats()["hits"] == 3
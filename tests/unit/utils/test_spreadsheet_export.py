@@ -0,0 +1,106 @@
+"""
+Unit tests for utils/spreadsheet_export.py shared report export layer.
+"""
+
+import io
+from datetime import date
+
+import openpyxl
+
+from models import db
+from models.organization import Organization
+from utils.spreadsheet_export import (
+    Column,
+    Sheet,
+    export_response,
+    iter_csv,
+    stream_query,
+    write_xlsx,
+)
+
+
+def _sheet(rows, **kwargs):
+    return Sheet("People", [Column("Name", 20), Column("Hours", 10)], rows, **kwargs)
+
+
+class TestWriteXlsx:
+    """Test write_xlsx with constant-memory workbooks."""
+
+    def test_rows_and_trailer_round_trip(self):
+        totals = {"hours": 0}
+
+        def rows():
+            for name, hours in [("Ada", 1.5), ("=SUM(A1)", 2), ("Grace", None)]:
+                totals["hours"] += hours or 0
+                yield (name, hours)
+
+        output = io.BytesIO()
+        write_xlsx(
+            [
+                _sheet(
+                    rows(), trailer=lambda: [("Totals",), ("Hours", totals["hours"])]
+                ),
+                Sheet("Dates", [Column("Day")], [(date(2024, 3, 1),)]),
+            ],
+            output,
+        )
+
+        workbook = openpyxl.load_workbook(io.BytesIO(output.getvalue()))
+        people = [list(row) for row in workbook["People"].iter_rows(values_only=True)]
+        assert people[:4] == [
+            ["Name", "Hours"],
+            ["Ada", 1.5],
+            ["=SUM(A1)", 2],  # user text is never turned into a formula
+            ["Grace", None],
+        ]
+        assert people[6:] == [["Totals", None], ["Hours", 3.5]]
+        assert workbook["People"]["A1"].font.bold
+        assert workbook["Dates"]["A2"].value.date() == date(2024, 3, 1)
+
+
+class TestCsv:
+    """Test streamed CSV output."""
+
+    def test_iter_csv_yields_chunks(self):
+        rows = ((f"Volunteer {i}", i) for i in range(200))
+
+        chunks = list(iter_csv(_sheet(rows), chunk_size=256))
+
+        assert len(chunks) > 1
+        lines = "".join(chunks).splitlines()
+        assert lines[0] == "Name,Hours"
+        assert lines[-1] == "Volunteer 199,199"
+
+    def test_export_response_honours_format_argument(self, app):
+        with app.test_request_context("/export?format=csv"):
+            response = export_response(
+                [_sheet([("Ignored", 0)]), _sheet([("Ada", 1)])],
+                "Report.xlsx",
+                csv_sheet=1,
+            )
+            assert response.is_streamed
+            assert "Report.csv" in response.headers["Content-Disposition"]
+            assert response.get_data(as_text=True).splitlines()[1] == "Ada,1"
+
+        with app.test_request_context("/export"):
+            response = export_response([_sheet([("Ada", 1)])], "Report.xlsx")
+            response.direct_passthrough = False
+            assert response.get_data()[:2] == b"PK"
+            response.close()
+
+
+def test_stream_query_reads_in_batches(app):
+    with app.app_context():
+        db.session.add_all([Organization(name=f"Org {i}") for i in range(5)])
+        db.session.commit()
+
+        names = [
+            org.name
+            for org in stream_query(Organization.query.order_by(Organization.id), 2)
+        ]
+        selected = list(
+            stream_query(db.select(Organization.name).order_by(Organization.id), 2)
+        )
+
+        assert names == [f"Org {i}" for i in range(5)]
+        assert [row.name for row in selected] == names
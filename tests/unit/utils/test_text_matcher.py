@@ -0,0 +1,93 @@
+"""
+Unit tests for utils/text_matcher.py and the year-end matchers built on it
+(routes/reports/district_year_end/computation.py).
+"""
+
+import random
+from types import SimpleNamespace
+
+from models import db
+from models.district_model import District, DistrictAlias
+from routes.reports.district_year_end.computation import (
+    SchoolTextMatcher,
+    build_district_matchers,
+)
+from utils.text_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+
+    def test_finds_overlapping_and_nested_patterns(self):
+        matcher = KeywordMatcher()
+        for value, pattern in enumerate(["he", "she", "his", "hers", "kc"]):
+            matcher.add(pattern, value)
+
+        assert matcher.matches("ushers") == {0, 1, 3}
+        assert matcher.matches("nothing here") == {0}
+        assert matcher.matches("") == set()
+
+    def test_same_pattern_multiple_values(self):
+        matcher = KeywordMatcher()
+        matcher.add("grandview", 1)
+        matcher.add("grandview", 2)
+        matcher.add("", 3)
+
+        assert matcher.matches("grandview high") == {1, 2}
+        assert len(matcher) == 2
+
+    def test_adding_after_matching_rebuilds(self):
+        matcher = KeywordMatcher()
+        matcher.add("abc", 1)
+        assert matcher.matches("xabcx") == {1}
+
+        matcher.add("bcx", 2)
+        assert matcher.matches("xabcx") == {1, 2}
+
+    def test_agrees_with_substring_checks(self):
+        rng = random.Random(3)
+        patterns = [
+            "".join(rng.choice("abc ") for _ in range(rng.randint(1, 5)))
+            for _ in range(60)
+        ]
+        matcher = KeywordMatcher()
+        for value, pattern in enumerate(patterns):
+            matcher.add(pattern, value)
+
+        for _ in range(200):
+            text = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 30)))
+            expected = {v for v, pattern in enumerate(patterns) if pattern in text}
+            assert matcher.matches(text) == expected
+
+
+class TestYearEndMatchers:
+
+    def test_school_matcher_prefers_full_names_then_list_order(self):
+        schools = [
+            SimpleNamespace(name="Central Academy"),
+            SimpleNamespace(name="Ruskin High"),
+            SimpleNamespace(name="Central High"),
+        ]
+        matcher = SchoolTextMatcher(schools)
+
+        assert matcher.match("career day at ruskin high") is schools[1]
+        # No full name: first school with a matching word wins
+        assert matcher.match("central campus tour") is schools[0]
+        assert matcher.match("science fair") is None
+
+    def test_district_matchers_include_alias_rows(self, app):
+        with app.app_context():
+            district = District(name="Hickman Mills School District")
+            db.session.add(district)
+            db.session.flush()
+            db.session.add(DistrictAlias(alias="HMSD", district_id=district.id))
+            db.session.commit()
+            school = SimpleNamespace(name="Ruskin High")
+
+            district_terms, school_terms = build_district_matchers(
+                [(district, {"aliases": ["Hickman Mills"]})], {district.id: [school]}
+            )
+
+            assert district_terms.matches("hmsd stem night") == {district.id}
+            assert district_terms.matches("hickman mills c-1") == {district.id}
+            assert district_terms.matches("ruskin high") == set()
+            assert school_terms.matches("ruskin high") == {district.id}
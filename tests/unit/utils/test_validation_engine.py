@@ -0,0 +1,132 @@
+"""
+Unit tests for utils/validation_engine.py validator execution.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from models.validation.metric import ValidationMetric
+from models.validation.result import ValidationResult
+from utils.salesforce_client import SalesforceClient
+from utils.validation_base import DataValidator
+from utils.validation_engine import ValidationEngine
+
+
+class CountingSF:
+    def __init__(self):
+        self.queries = []
+
+    def query(self, q):
+        self.queries.append(q)
+        return {"totalSize": 10, "records": []}
+
+
+class VolunteerCountCheck(DataValidator):
+    def __init__(self, sf):
+        super().__init__(config={})
+        self.sf = sf
+
+    def validate(self):
+        client = SalesforceClient(cache=self.salesforce_cache)
+        client.sf = self.sf
+        client._rate_limit = lambda: None
+        count = client.get_volunteer_count()
+        self.add_result(
+            self.create_result(
+                "volunteer", "info", f"{count} volunteers", validation_type="count"
+            )
+        )
+        return self.results
+
+
+def test_validators_in_a_run_share_salesforce_query_cache(app):
+    sf = CountingSF()
+    engine = ValidationEngine(config={})
+    try:
+        run = engine.run_custom_validation(
+            [VolunteerCountCheck(sf), VolunteerCountCheck(sf)]
+        )
+    finally:
+        engine.shutdown()
+
+    assert len(sf.queries) == 1
+    metrics = {
+        m.metric_name: float(m.metric_value)
+        for m in ValidationMetric.query.filter_by(run_id=run.id)
+        if m.metric_name.startswith("salesforce_cache_")
+    }
+    assert metrics["salesforce_cache_hits"] == 1
+    assert metrics["salesforce_cache_misses"] == 1
+    assert metrics["salesforce_cache_hit_rate"] == 50
+
+
+class SleepyCheck(DataValidator):
+    def __init__(self, name, delay=0.0, action=None):
+        super().__init__(config={})
+        self.name = name
+        self.delay = delay
+        self.action = action
+        self.saw_cancel = False
+
+    def validate(self):
+        if self.action:
+            self.action(self)
+        deadline = time.monotonic() + self.delay
+        while time.monotonic() < deadline:
+            if self.is_cancelled():
+                self.saw_cancel = True
+                break
+            time.sleep(0.01)
+        self.add_result(
+            self.create_result("all", "info", self.name, validation_type="custom")
+        )
+        return self.results
+
+
+def _messages(run):
+    return [
+        r.message
+        for r in ValidationResult.query.filter_by(run_id=run.id).order_by(
+            ValidationResult.id
+        )
+    ]
+
+
+def test_validators_run_concurrently_and_keep_result_order(app):
+    engine = ValidationEngine(config={})
+    # Every validator waits for the other three, so the run only completes
+    # if all four are running at the same time
+    barrier = threading.Barrier(4, timeout=10)
+    validators = [
+        SleepyCheck(f"check-{i}", delay=0.05 * (4 - i), action=lambda v: barrier.wait())
+        for i in range(4)
+    ]
+    try:
+        run = engine.run_custom_validation(validators)
+    finally:
+        engine.shutdown()
+
+    assert not barrier.broken
+    assert run.status == "completed"
+    assert run.progress_percentage == 100
+    assert _messages(run) == ["check-0", "check-1", "check-2", "check-3"]
+
+
+def test_cancel_run_stops_running_and_pending_validators(app):
+    engine = ValidationEngine(config={})
+    engine.executor.shutdown()
+    engine.executor = ThreadPoolExecutor(max_workers=2)
+    validators = [
+        SleepyCheck("long", delay=5),
+        SleepyCheck("canceller", action=lambda v: engine.cancel_run(v.run_id)),
+        SleepyCheck("pending", delay=5),
+    ]
+    try:
+        run = engine.run_custom_validation(validators)
+    finally:
+        engine.shutdown()
+
+    assert validators[0].saw_cancel
+    assert run.status == "cancelled"
+    assert _messages(run) == ["long", "canceller"]
@@ -0,0 +1,323 @@
+# utils/cache_codec.py
+"""
+Report Cache Payload Codecs
+
+Large report cache columns (full session/event/volunteer row lists) are
+stored through the CachePayload column type, which encodes the value with a
+codec selected per cache table:
+
+- ``json``: the value as plain JSON (the original storage format)
+- ``columnar-zlib``: lists of same-shaped dicts are stored column by column
+  (keys once per list instead of once per row), datetime/date values keep
+  their type, and the result is zlib-compressed. Stored in the JSON column
+  as a small envelope: {"__cache_codec__": "columnar-zlib", "data": <base64>}
+
+Rows without an envelope are read as plain JSON, so caches written before a
+codec change keep working until they are refreshed. More codecs (e.g.
+msgpack or Arrow IPC, if those become dependencies) can be added with
+register_codec().
+
+Configuration:
+    REPORT_CACHE_CODEC: Default codec (default: columnar-zlib)
+    REPORT_CACHE_CODECS: Per-table overrides, e.g.
+        "virtual_session_report_cache=json,recent_volunteers_report_cache=columnar-zlib"
+
+Read latency and stored bytes per cache table are counted in process and
+shown on the cache management page (get_payload_metrics()).
+"""
+
+import base64
+import json
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import date, datetime
+
+from flask import current_app, has_app_context
+from sqlalchemy.types import JSON, TypeDecorator
+
+JSON_CODEC = "json"
+COLUMNAR_ZLIB_CODEC = "columnar-zlib"
+DEFAULT_CODEC = COLUMNAR_ZLIB_CODEC
+
+ENVELOPE_KEY = "__cache_codec__"
+ZLIB_LEVEL = 6
+
+# Tags for encoded structures; NUL-prefixed so they cannot clash with report keys
+_TABLE = "\x00table"
+_DATETIME = "\x00dt"
+_DATE = "\x00d"
+_NESTED = (dict, list, tuple, date)  # values that need per-cell encoding
+
+_metrics_lock = threading.Lock()
+_metrics = defaultdict(
+    lambda: {
+        "reads": 0,
+        "read_seconds": 0.0,
+        "max_read_seconds": 0.0,
+        "writes": 0,
+        "stored_bytes": 0,
+        "sized_rows": 0,
+        "codec": None,
+    }
+)
+
+
+# --- Columnar encoding -----------------------------------------------------
+
+
+def _column(values):
+    """Encode one column; all-datetime or all-date columns are tagged once."""
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, datetime) for value in present):
+        return {_DATETIME: [v.isoformat() if v is not None else None for v in values]}
+    if present and all(
+        isinstance(value, date) and not isinstance(value, datetime) for value in present
+    ):
+        return {_DATE: [v.isoformat() if v is not None else None for v in values]}
+    if any(isinstance(value, _NESTED) for value in present):
+        return [_to_columnar(value) for value in values]
+    return values
+
+
+def _to_columnar(value):
+    if isinstance(value, dict):
+        return {key: _to_columnar(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if len(value) > 1 and all(isinstance(item, dict) for item in value):
+            keys = list(value[0])
+            key_set = set(keys)
+            if all(isinstance(key, str) for key in keys) and all(
+                len(item) == len(keys) and key_set.issuperset(item) for item in value
+            ):
+                return {
+                    _TABLE: keys,
+                    "columns": [_column([item[key] for item in value]) for key in keys],
+                }
+        return [_to_columnar(item) for item in value]
+    if isinstance(value, datetime):
+        return {_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE: value.isoformat()}
+    return value
+
+
+def _decode_column(column):
+    if isinstance(column, dict):
+        if _DATETIME in column:
+            parse = datetime.fromisoformat
+            return [parse(v) if v is not None else None for v in column[_DATETIME]]
+        parse = date.fromisoformat
+        return [parse(v) if v is not None else None for v in column[_DATE]]
+    if any(isinstance(value, (dict, list)) for value in column):
+        return [_from_columnar(value) for value in column]
+    return column
+
+
+def _from_columnar(value):
+    if isinstance(value, dict):
+        if _TABLE in value:
+            columns = [_decode_column(column) for column in value["columns"]]
+            keys = value[_TABLE]
+            return [dict(zip(keys, row)) for row in zip(*columns)]
+        if len(value) == 1:
+            if _DATETIME in value:
+                return datetime.fromisoformat(value[_DATETIME])
+            if _DATE in value:
+                return date.fromisoformat(value[_DATE])
+        return {key: _from_columnar(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_from_columnar(item) for item in value]
+    return value
+
+
+def _json_safe(value):
+    """Plain JSON form of a payload: datetime/date values become ISO strings."""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+# --- Codec registry --------------------------------------------------------
+
+
+def _encode_columnar_zlib(value):
+    text = json.dumps(_to_columnar(value), separators=(",", ":"))
+    return base64.b64encode(zlib.compress(text.encode("utf-8"), ZLIB_LEVEL)).decode(
+        "ascii"
+    )
+
+
+def _decode_columnar_zlib(data):
+    text = zlib.decompress(base64.b64decode(data)).decode("utf-8")
+    return _from_columnar(json.loads(text))
+
+
+_codecs = {COLUMNAR_ZLIB_CODEC: (_encode_columnar_zlib, _decode_columnar_zlib)}
+
+
+def register_codec(name, encode, decode):
+    """
+    Register a payload codec.
+
+    Args:
+        name: Codec name used in configuration and stored envelopes
+        encode: Callable turning a payload into a JSON-safe string
+        decode: Callable turning that string back into the payload
+    """
+    _codecs[name] = (encode, decode)
+
+
+def codec_for(cache_name):
+    """Codec configured for a cache table (falls back to the default)."""
+    if not has_app_context():
+        return DEFAULT_CODEC
+    overrides = current_app.config.get("REPORT_CACHE_CODECS") or {}
+    return overrides.get(
+        cache_name, current_app.config.get("REPORT_CACHE_CODEC", DEFAULT_CODEC)
+    )
+
+
+def encode_payload(value, codec=DEFAULT_CODEC):
+    """Encode a payload for storage in a JSON column."""
+    if value is None:
+        return None
+    if codec == JSON_CODEC:
+        return _json_safe(value)
+    if codec not in _codecs:
+        raise ValueError(f"Unknown report cache codec: {codec}")
+    encode, _ = _codecs[codec]
+    return {ENVELOPE_KEY: codec, "data": encode(value)}
+
+
+def decode_payload(value):
+    """Decode a stored payload; values without an envelope are plain JSON."""
+    if isinstance(value, dict) and ENVELOPE_KEY in value and len(value) == 2:
+        _, decode = _codecs[value[ENVELOPE_KEY]]
+        return decode(value["data"])
+    return value
+
+
+def _payload_codec(value):
+    if isinstance(value, dict) and ENVELOPE_KEY in value:
+        return value[ENVELOPE_KEY]
+    return JSON_CODEC
+
+
+# --- Column type -----------------------------------------------------------
+
+
+class CachePayload(TypeDecorator):
+    """
+    JSON column storing a report cache payload through the table's codec.
+
+    The database column stays JSON, so no migration is needed to switch
+    codecs and existing rows remain readable.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def __init__(self, cache_name, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_name = cache_name
+
+    def bind_processor(self, dialect):
+        impl_processor = self.impl_instance.bind_processor(dialect)
+        cache_name = self.cache_name
+
+        def process(value):
+            value = encode_payload(value, codec_for(cache_name))
+            codec = _payload_codec(value)
+            if impl_processor is not None:
+                value = impl_processor(value)
+            if isinstance(value, str):
+                _record_write(cache_name, codec, len(value))
+            return value
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        impl_processor = self.impl_instance.result_processor(dialect, coltype)
+        cache_name = self.cache_name
+
+        def process(value):
+            if value is None:
+                return None
+            started = time.perf_counter()
+            size = len(value) if isinstance(value, (str, bytes)) else None
+            if impl_processor is not None:
+                value = impl_processor(value)
+            codec = _payload_codec(value)
+            value = decode_payload(value)
+            _record_read(cache_name, codec, time.perf_counter() - started, size)
+            return value
+
+        return process
+
+
+# --- Metrics ---------------------------------------------------------------
+
+
+def _record_write(cache_name, codec, size):
+    with _metrics_lock:
+        entry = _metrics[cache_name]
+        entry["writes"] += 1
+        entry["stored_bytes"] += size
+        entry["sized_rows"] += 1
+        entry["codec"] = codec
+
+
+def _record_read(cache_name, codec, seconds, size):
+    with _metrics_lock:
+        entry = _metrics[cache_name]
+        entry["reads"] += 1
+        entry["read_seconds"] += seconds
+        entry["max_read_seconds"] = max(entry["max_read_seconds"], seconds)
+        if size is not None:
+            entry["stored_bytes"] += size
+            entry["sized_rows"] += 1
+        entry["codec"] = codec
+
+
+def get_payload_metrics():
+    """
+    Get in-process payload read latency and size for each cache table.
+
+    Returns:
+        dict: cache table -> {"codec", "reads", "avg_read_ms", "max_read_ms",
+        "writes", "avg_stored_bytes"}
+    """
+    with _metrics_lock:
+        snapshot = {name: dict(entry) for name, entry in _metrics.items()}
+
+    metrics = {}
+    for name, entry in sorted(snapshot.items()):
+        metrics[name] = {
+            "codec": entry["codec"],
+            "reads": entry["reads"],
+            "avg_read_ms": (
+                round(entry["read_seconds"] / entry["reads"] * 1000, 2)
+                if entry["reads"]
+                else None
+            ),
+            "max_read_ms": round(entry["max_read_seconds"] * 1000, 2),
+            "writes": entry["writes"],
+            "avg_stored_bytes": (
+                round(entry["stored_bytes"] / entry["sized_rows"])
+                if entry["sized_rows"]
+                else None
+            ),
+        }
+    return metrics
+
+
+def reset_payload_metrics():
+    """Reset all in-process payload counters."""
+    with _metrics_lock:
+        _metrics.clear()
@@ -55,7 +55,9 @@ from models.reports import (
     OrganizationSummaryCache,
     RecentVolunteersReportCache,
     RecruitmentCandidatesCache,
+    VirtualSessionAggregate,
     VirtualSessionDistrictCache,
+    VirtualSessionEventRows,
     VirtualSessionReportCache,
 )
 from models.volunteer import Volunteer
@@ -318,22 +320,34 @@ def get_cache_status() -> Dict:
     return scheduler.get_status()
 
 
-def invalidate_report_caches(school_year: str = None, reason: str = "import") -> dict:
+def invalidate_report_caches(
+    school_year: str = None,
+    reason: str = "import",
+    keep_virtual_aggregates: bool = False,
+) -> dict:
     """
-    Invalidate all report caches for a school year.
+    Invalidate report caches for a school year after an import.
 
     Called post-import by both the Salesforce daily import script and the
-    Pathful import route. The district year-end cache is also regenerated
-    proactively since users cannot trigger it without a manual Refresh.
+    Pathful import route. Cache rows with registered dependencies are already
+    invalidated precisely by the after_flush hooks in
+    services/cache_dependency_service.py, so only untracked rows (legacy rows
+    and caches without dependency registration) are deleted here. The
+    district year-end cache is regenerated only if rows for the year are
+    missing, untracked or were marked stale by a dependency change, since
+    users cannot trigger it without a manual Refresh.
 
     Args:
         school_year: 4-char year string (e.g. "2526"). Defaults to current year.
         reason: Human-readable trigger source for logging.
+        keep_virtual_aggregates: True if the caller already applied its event
+            changes to the virtual session aggregate store as deltas.
 
     Returns:
         dict with counts of deleted records per cache type.
     """
     from routes.reports.common import get_current_school_year
+    from services.cache_dependency_service import is_invalidated, untracked_filter
 
     if school_year is None:
         school_year = get_current_school_year()
@@ -343,25 +357,29 @@ def invalidate_report_caches(school_year: str = None, reason: str = "import") ->
     )
     results = {}
 
+    def delete_untracked(model, **filters):
+        query = model.query.filter_by(**filters).filter(untracked_filter(model))
+        return query.delete(synchronize_session=False)
+
     try:
         # --- Caches that self-heal via write-through on next route access ---
-        results["org_summary"] = OrganizationSummaryCache.query.filter_by(
-            school_year=school_year
-        ).delete()
-        results["org_report"] = OrganizationReport.query.filter_by(
-            school_year=school_year
-        ).delete()
-        results["org_detail"] = OrganizationDetailCache.query.filter_by(
-            school_year=school_year
-        ).delete()
-        results["recent_volunteers"] = RecentVolunteersReportCache.query.filter_by(
-            school_year=school_year
-        ).delete()
-        results["first_time_volunteers"] = (
-            FirstTimeVolunteerReportCache.query.filter_by(
-                school_year=school_year
-            ).delete()
+        results["org_summary"] = delete_untracked(
+            OrganizationSummaryCache, school_year=school_year
+        )
+        results["org_report"] = delete_untracked(
+            OrganizationReport, school_year=school_year
+        )
+        results["org_detail"] = delete_untracked(
+            OrganizationDetailCache, school_year=school_year
         )
+        results["recent_volunteers"] = delete_untracked(
+            RecentVolunteersReportCache, school_year=school_year
+        )
+        results["first_time_volunteers"] = delete_untracked(
+            FirstTimeVolunteerReportCache, school_year=school_year
+        )
+        # Recruitment rows depend on every volunteer's history, not just the
+        # event they are keyed on, so they are still cleared wholesale.
         results["recruitment"] = RecruitmentCandidatesCache.query.delete()
         # DIA events cache has no school_year key — clear all (small table, upcoming events only)
         results["dia_events"] = DIAEventsReportCache.query.delete()
@@ -370,26 +388,41 @@ def invalidate_report_caches(school_year: str = None, reason: str = "import") ->
         year_start = f"20{school_year[:2]}"
         year_end = f"20{school_year[2:]}"
         virtual_year = f"{year_start}-{year_end}"
-        results["virtual_report"] = VirtualSessionReportCache.query.filter_by(
-            virtual_year=virtual_year
-        ).delete()
-        results["virtual_district"] = VirtualSessionDistrictCache.query.filter_by(
-            virtual_year=virtual_year
-        ).delete()
+        results["virtual_report"] = delete_untracked(
+            VirtualSessionReportCache, virtual_year=virtual_year
+        )
+        results["virtual_district"] = delete_untracked(
+            VirtualSessionDistrictCache, virtual_year=virtual_year
+        )
+        if not keep_virtual_aggregates:
+            results["virtual_aggregates"] = VirtualSessionAggregate.query.filter_by(
+                virtual_year=virtual_year
+            ).delete()
+            VirtualSessionEventRows.query.filter_by(virtual_year=virtual_year).delete()
 
         db.session.commit()
         logger.info("Invalidated caches: %s", results)
 
-        # --- District year-end: proactively regenerate (cannot self-heal) ---
+        # --- District year-end: regenerate only when needed (cannot self-heal) ---
         try:
             from routes.reports.district_year_end import refresh_district_cache
 
-            DistrictYearEndReport.query.filter_by(school_year=school_year).delete()
-            db.session.commit()
-
-            refresh_district_cache(school_year, host_filter="all")
-            results["district_year_end"] = "regenerated"
-            logger.info("District year-end cache regenerated for %s", school_year)
+            reports = DistrictYearEndReport.query.filter_by(
+                school_year=school_year, host_filter="all"
+            ).all()
+            untracked = (
+                DistrictYearEndReport.query.filter_by(
+                    school_year=school_year, host_filter="all"
+                )
+                .filter(untracked_filter(DistrictYearEndReport))
+                .count()
+            )
+            if reports and not untracked and not any(map(is_invalidated, reports)):
+                results["district_year_end"] = "unchanged"
+            else:
+                refresh_district_cache(school_year, host_filter="all")
+                results["district_year_end"] = "regenerated"
+                logger.info("District year-end cache regenerated for %s", school_year)
         except Exception as e:
             logger.exception("District cache regeneration failed: %s", str(e))
             results["district_year_end"] = f"failed: {str(e)}"
@@ -33,6 +33,7 @@ from models.email import (
     EmailMessageStatus,
     EmailTemplate,
 )
+from utils.email_provider import OutgoingEmail, ProviderPool, get_provider_factory
 
 
 class EmailSafetyError(Exception):
@@ -251,6 +252,55 @@ def render_template(template: EmailTemplate, context: Dict) -> Tuple[str, str, s
     return subject, html_body, text_body
 
 
+class CompiledTemplate:
+    """
+    EmailTemplate split once into literal and placeholder segments.
+
+    Renders the same output as render_template() for {{key}} placeholders
+    in a single join per field, for bulk senders rendering one template for
+    many contexts.
+    """
+
+    _PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+    def __init__(self, template: EmailTemplate):
+        self.template = template
+        self._fields = [
+            self._PLACEHOLDER.split(content)
+            for content in (
+                template.subject_template,
+                template.html_template,
+                template.text_template,
+            )
+        ]
+        self.placeholders = {key for parts in self._fields for key in parts[1::2]}
+
+    def render(self, context: Dict) -> Tuple[str, str, str]:
+        """Render (subject, html_body, text_body) for one context."""
+        rendered = []
+        for parts in self._fields:
+            pieces = list(parts)
+            for index in range(1, len(pieces), 2):
+                key = pieces[index]
+                if key in context:
+                    value = context[key]
+                    pieces[index] = str(value) if value is not None else ""
+                else:
+                    pieces[index] = f"{{{{{key}}}}}"
+            rendered.append("".join(pieces))
+        return tuple(rendered)
+
+    def missing(self, context: Dict) -> List[str]:
+        """Placeholders the context leaves unfilled (as field:key)."""
+        names = ("subject", "html_body", "text_body")
+        return [
+            f"{name}:{key}"
+            for name, parts in zip(names, self._fields)
+            for key in parts[1::2]
+            if key not in context
+        ]
+
+
 def validate_template_rendering(
     template: EmailTemplate, context: Dict
 ) -> Tuple[bool, List[str]]:
@@ -355,15 +405,17 @@ def run_quality_checks(message: EmailMessage) -> Dict:
     return checks
 
 
-def create_email_message(
+def build_email_message(
     template: EmailTemplate,
     recipients: List[str],
     context: Dict,
     created_by_id: int,
     status: EmailMessageStatus = EmailMessageStatus.DRAFT,
+    compiled: Optional[CompiledTemplate] = None,
 ) -> EmailMessage:
     """
-    Create an email message with quality checks.
+    Build an email message with quality checks, without adding it to the
+    session (bulk senders add a batch at a time).
 
     Args:
         template: EmailTemplate instance
@@ -371,9 +423,10 @@ def create_email_message(
         context: Template context dictionary
         created_by_id: User ID who created the message
         status: Initial status (default: DRAFT)
+        compiled: Pre-compiled template to render with (bulk sends)
 
     Returns:
-        EmailMessage instance
+        Unsaved EmailMessage instance
 
     Raises:
         EmailQualityError: If quality checks fail
@@ -381,12 +434,14 @@ def create_email_message(
     # Validate and deduplicate recipients
     valid_recipients, excluded = validate_recipients(recipients)
 
-    # Render template
-    subject, html_body, text_body = render_template(template, context)
-
-    # Validate template rendering
-    is_valid, missing = validate_template_rendering(template, context)
-    if not is_valid:
+    # Render template and check for unfilled placeholders
+    if compiled is not None:
+        subject, html_body, text_body = compiled.render(context)
+        missing = compiled.missing(context)
+    else:
+        subject, html_body, text_body = render_template(template, context)
+        _, missing = validate_template_rendering(template, context)
+    if missing:
         raise EmailQualityError(
             f"Template has missing placeholders: {', '.join(missing)}"
         )
@@ -414,6 +469,36 @@ def create_email_message(
     if message.quality_score < 50 and status == EmailMessageStatus.QUEUED:
         message.status = EmailMessageStatus.BLOCKED
 
+    return message
+
+
+def create_email_message(
+    template: EmailTemplate,
+    recipients: List[str],
+    context: Dict,
+    created_by_id: int,
+    status: EmailMessageStatus = EmailMessageStatus.DRAFT,
+) -> EmailMessage:
+    """
+    Create an email message with quality checks.
+
+    Args:
+        template: EmailTemplate instance
+        recipients: List of recipient email addresses
+        context: Template context dictionary
+        created_by_id: User ID who created the message
+        status: Initial status (default: DRAFT)
+
+    Returns:
+        EmailMessage instance
+
+    Raises:
+        EmailQualityError: If quality checks fail
+    """
+    message = build_email_message(
+        template, recipients, context, created_by_id, status=status
+    )
+
     db.session.add(message)
     db.session.flush()  # Get message ID
 
@@ -424,8 +509,7 @@ def send_email(
     message: EmailMessage, is_dry_run: bool = False
 ) -> Tuple[bool, Optional[str], Optional[Dict]]:
     """
-    Send email via configured provider.
-    Currently a stub awaiting a new email provider integration.
+    Send email via the configured SMTP provider (utils/email_provider.py).
 
     Args:
         message: EmailMessage instance
@@ -448,8 +532,27 @@ def send_email(
     if not is_allowed:
         return False, error_msg, None
 
-    # TODO: Implement new email provider logic here
-    return False, "No email provider configured", {"status": "not_implemented"}
+    factory = get_provider_factory()
+    if factory is None:
+        return False, "No email provider configured", {"status": "not_implemented"}
+
+    with ProviderPool(factory, size=1) as pool:
+        result = pool.deliver(outgoing_for(message, excluded))
+    return result.success, result.error, result.response
+
+
+def outgoing_for(
+    message: EmailMessage, excluded: Optional[List[Dict[str, str]]] = None
+) -> OutgoingEmail:
+    """Delivery payload for a message, minus recipients blocked by the gates."""
+    blocked = {entry["email"] for entry in excluded or ()}
+    return OutgoingEmail(
+        message_id=message.id,
+        recipients=[r for r in message.recipients if r not in blocked],
+        subject=message.subject,
+        html_body=message.html_body,
+        text_body=message.text_body,
+    )
 
 
 def create_delivery_attempt(
@@ -479,7 +582,36 @@ def create_delivery_attempt(
         message, is_dry_run=is_dry_run
     )
 
-    # Update attempt status
+    record_delivery_result(
+        message, attempt, success, error_message, provider_response, is_dry_run
+    )
+    if not success:
+        # Create BugReport for delivery failure
+        create_delivery_failure_bug_report(message, attempt)
+
+    db.session.commit()
+    return attempt
+
+
+def record_delivery_result(
+    message: EmailMessage,
+    attempt: EmailDeliveryAttempt,
+    success: bool,
+    error_message: Optional[str],
+    provider_response: Optional[Dict],
+    is_dry_run: bool = False,
+) -> None:
+    """
+    Record a provider outcome on the attempt and the message (no commit).
+
+    Args:
+        message: EmailMessage instance
+        attempt: EmailDeliveryAttempt for this send
+        success: Whether the provider accepted the message
+        error_message: Provider error when not successful
+        provider_response: Provider response payload
+        is_dry_run: Whether this was a dry-run
+    """
     if success:
         attempt.status = (
             DeliveryAttemptStatus.DRY_RUN
@@ -511,14 +643,9 @@ def create_delivery_attempt(
         message.sent_at = datetime.now(timezone.utc)
     elif not success:
         message.status = EmailMessageStatus.FAILED
-        # Create BugReport for delivery failure
-        create_delivery_failure_bug_report(message, attempt)
 
     message.status_updated_at = datetime.now(timezone.utc)
 
-    db.session.commit()
-    return attempt
-
 
 def create_delivery_failure_bug_report(
     message: EmailMessage, attempt: EmailDeliveryAttempt
@@ -0,0 +1,299 @@
+"""
+Email Provider Connections
+==========================
+
+SMTP delivery for outgoing email, with a pool of reusable connections so
+bulk senders (batch reminder jobs) pay the connect/EHLO/login cost once per
+connection instead of once per message.
+
+Configuration (environment):
+    SMTP_HOST: SMTP server host; delivery is disabled when unset
+    SMTP_PORT: Server port (default 587)
+    SMTP_USERNAME / SMTP_PASSWORD: Optional login credentials
+    SMTP_USE_TLS: 'true' to upgrade the connection with STARTTLS
+    SMTP_TIMEOUT: Socket timeout in seconds (default 30)
+    MAIL_FROM / MAIL_FROM_NAME: Sender address and display name
+
+Usage:
+    from utils.email_provider import ProviderPool, get_provider_factory
+
+    factory = get_provider_factory()
+    if factory:
+        with ProviderPool(factory, size=4) as pool:
+            with pool.connection() as provider:
+                response = provider.send(outgoing)
+"""
+
+import logging
+import os
+import queue
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.message import EmailMessage as MIMEMessage
+from email.utils import formataddr, make_msgid
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """
+    Whether *exc* left the connection unusable.
+
+    smtplib.SMTPException subclasses OSError, but refused senders or
+    recipients leave the session open; only disconnects and socket-level
+    errors mean the connection must be dropped.
+    """
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+
+class OutgoingEmail(NamedTuple):
+    """Plain delivery payload (safe to hand to worker threads)."""
+
+    message_id: int
+    recipients: List[str]
+    subject: str
+    html_body: str
+    text_body: str
+    # Overrides of the configured MAIL_FROM / MAIL_FROM_NAME
+    sender: Optional[str] = None
+    sender_name: Optional[str] = None
+    # (filename, content_type, bytes) tuples
+    attachments: Tuple[Tuple[str, str, bytes], ...] = ()
+
+
+class DeliveryResult(NamedTuple):
+    """Outcome of delivering one payload."""
+
+    outgoing: OutgoingEmail
+    success: bool
+    error: Optional[str]
+    response: Optional[Dict]
+
+
+def _failed(outgoing: OutgoingEmail, exc: Exception) -> DeliveryResult:
+    return DeliveryResult(
+        outgoing, False, str(exc), {"status": "error", "error": type(exc).__name__}
+    )
+
+
+class SMTPProvider:
+    """One SMTP connection, opened lazily and reused across sends."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        sender: str = "",
+        sender_name: str = "",
+        timeout: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.sender = sender
+        self.sender_name = sender_name
+        self.timeout = timeout
+        self._smtp = None
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        smtp.ehlo()
+        if self.use_tls:
+            smtp.starttls()
+            smtp.ehlo()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        self._smtp = smtp
+
+    def build_mime(self, outgoing: OutgoingEmail) -> MIMEMessage:
+        """Build the multipart/alternative MIME message for a payload."""
+        sender = outgoing.sender or self.sender
+        sender_name = outgoing.sender_name or self.sender_name
+        mime = MIMEMessage()
+        mime["From"] = formataddr((sender_name, sender)) if sender_name else sender
+        mime["To"] = ", ".join(outgoing.recipients)
+        mime["Subject"] = outgoing.subject
+        mime["Message-ID"] = make_msgid()
+        mime.set_content(outgoing.text_body)
+        mime.add_alternative(outgoing.html_body, subtype="html")
+        for filename, content_type, content in outgoing.attachments:
+            maintype, _, subtype = content_type.partition("/")
+            mime.add_attachment(
+                content, maintype=maintype, subtype=subtype, filename=filename
+            )
+        return mime
+
+    def send(self, outgoing: OutgoingEmail) -> Dict:
+        """
+        Send one payload over this connection.
+
+        Returns:
+            Provider response dict with the generated message_id
+
+        Raises:
+            smtplib.SMTPException / OSError: If delivery fails
+        """
+        mime = self.build_mime(outgoing)
+        sender = outgoing.sender or self.sender
+        reused = self._smtp is not None
+        if not reused:
+            self._connect()
+        try:
+            refused = self._smtp.send_message(mime, sender, outgoing.recipients)
+        except smtplib.SMTPServerDisconnected:
+            # An idle connection may have been closed by the server; retry
+            # once on a fresh connection.
+            self.close()
+            if not reused:
+                raise
+            self._connect()
+            refused = self._smtp.send_message(mime, sender, outgoing.recipients)
+        return {
+            "status": "sent",
+            "message_id": mime["Message-ID"],
+            "refused": sorted(refused) if refused else [],
+        }
+
+    def close(self):
+        """Close the connection (safe to call more than once)."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+
+def get_provider_factory() -> Optional[Callable[[], SMTPProvider]]:
+    """
+    Factory for provider connections from environment config.
+
+    Returns:
+        Zero-argument callable returning a new SMTPProvider, or None when
+        SMTP_HOST is not configured
+    """
+    host = os.environ.get("SMTP_HOST", "").strip()
+    if not host:
+        return None
+
+    settings = {
+        "host": host,
+        "port": int(os.environ.get("SMTP_PORT", "587")),
+        "username": os.environ.get("SMTP_USERNAME") or None,
+        "password": os.environ.get("SMTP_PASSWORD") or None,
+        "use_tls": os.environ.get("SMTP_USE_TLS", "").lower() == "true",
+        "sender": os.environ.get("MAIL_FROM", ""),
+        "sender_name": os.environ.get("MAIL_FROM_NAME", ""),
+        "timeout": float(os.environ.get("SMTP_TIMEOUT", "30")),
+    }
+    return lambda: SMTPProvider(**settings)
+
+
+class ProviderPool:
+    """
+    Bounded pool of reusable provider connections.
+
+    At most ``size`` connections exist at once; callers block in
+    connection() until one is free. Connections are created on first use
+    and dropped (then recreated on demand) after a connection-level error.
+    deliver_all() sends payloads concurrently, one worker per connection.
+    """
+
+    def __init__(self, factory: Callable[[], SMTPProvider], size: int = 4):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._all = []
+        self._closed = False
+        self._executor = None
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of the block."""
+        if self._closed:
+            raise RuntimeError("Provider pool is closed")
+        self._slots.acquire()
+        try:
+            try:
+                provider = self._idle.get_nowait()
+            except queue.Empty:
+                provider = self.factory()
+                with self._lock:
+                    self._all.append(provider)
+            try:
+                yield provider
+            except BaseException as exc:
+                if is_connection_error(exc):
+                    self._discard(provider)
+                else:
+                    self._idle.put(provider)
+                raise
+            self._idle.put(provider)
+        finally:
+            self._slots.release()
+
+    def deliver(self, outgoing: OutgoingEmail) -> DeliveryResult:
+        """
+        Send one payload on a pooled connection; failures are returned.
+
+        Any exception is recorded as a failed delivery so that one bad
+        message (or provider bug) does not abort the rest of the batch.
+        """
+        try:
+            with self.connection() as provider:
+                response = provider.send(outgoing)
+        except OSError as e:  # smtplib.SMTPException subclasses OSError
+            logger.warning("Delivery of message %s failed: %s", outgoing.message_id, e)
+            return _failed(outgoing, e)
+        except Exception as e:
+            logger.exception("Delivery of message %s failed", outgoing.message_id)
+            return _failed(outgoing, e)
+        return DeliveryResult(outgoing, True, None, response)
+
+    def deliver_all(self, outgoings: List[OutgoingEmail]) -> List[DeliveryResult]:
+        """Send payloads concurrently (up to ``size`` at once), in order."""
+        if self.size == 1 or len(outgoings) <= 1:
+            return [self.deliver(outgoing) for outgoing in outgoings]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.size, thread_name_prefix="email-provider"
+            )
+        return list(self._executor.map(self.deliver, outgoings))
+
+    def _discard(self, provider):
+        with self._lock:
+            if provider in self._all:
+                self._all.remove(provider)
+        provider.close()
+
+    def close(self):
+        """Close every connection the pool opened."""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            providers, self._all = self._all, []
+        for provider in providers:
+            provider.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
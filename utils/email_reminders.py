@@ -12,6 +12,7 @@ Key Functions:
     - build_session_list_text: Format sessions as plain text
     - build_teacher_reminder_context: Build full placeholder context per teacher
     - send_session_reminders: Orchestrate sending reminders to all teachers
+    - execute_batch_send: Batched, concurrent send for a confirmed BatchEmailJob
 """
 
 import logging
@@ -19,13 +20,30 @@ import os
 import secrets
 import string
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from models import db
-from models.email import BatchEmailJob, BatchEmailJobStatus, EmailTemplate
-from models.event import Event, EventStatus, EventType
+from models.email import (
+    BatchEmailJob,
+    BatchEmailJobStatus,
+    DeliveryAttemptStatus,
+    EmailDeliveryAttempt,
+    EmailMessageStatus,
+    EmailTemplate,
+)
+from models.event import Event, EventEducator, EventStatus, EventType
 from models.teacher_progress import TeacherProgress
-from utils.email import create_delivery_attempt, create_email_message
+from utils.email import (
+    CompiledTemplate,
+    build_email_message,
+    check_safety_gates,
+    create_delivery_attempt,
+    create_delivery_failure_bug_report,
+    create_email_message,
+    outgoing_for,
+    record_delivery_result,
+)
+from utils.email_provider import ProviderPool, get_provider_factory
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +57,11 @@ ACTIVE_SESSION_STATUSES = [
     EventStatus.REQUESTED,
 ]
 
+# Batch sends: messages per insert/delivery batch (cancellation and progress
+# are checked once per batch) and concurrent provider connections
+BATCH_SEND_SIZE = 50
+BATCH_SEND_CONCURRENCY = 4
+
 # Status badge styling for HTML emails
 STATUS_STYLES = {
     EventStatus.CONFIRMED: ("background: #d4edda; color: #155724;", "Confirmed"),
@@ -183,8 +206,8 @@ def get_completed_session_count(teacher: TeacherProgress) -> int:
     """
     Count completed virtual sessions for a teacher.
 
-    Counts events where the teacher's email appears in the educators field
-    and the event status is Completed.
+    Counts events where the teacher's name or email appears in the educators
+    field and the event status is Completed.
 
     Args:
         teacher: TeacherProgress record
@@ -192,30 +215,62 @@ def get_completed_session_count(teacher: TeacherProgress) -> int:
     Returns:
         Number of completed sessions
     """
-    if not teacher.email:
-        return 0
+    return get_completed_session_counts([teacher]).get(teacher.id, 0)
 
-    query = Event.query.filter(
-        Event.type == EventType.VIRTUAL_SESSION,
-        Event.status == EventStatus.COMPLETED,
-    )
 
-    if teacher.tenant_id is not None:
-        query = query.filter(Event.tenant_id == teacher.tenant_id)
+def get_completed_session_counts(teachers: List[TeacherProgress]) -> Dict[int, int]:
+    """
+    Completed virtual session counts for many teachers in one query.
+
+    Matches teacher names and emails against the normalized educator links
+    (EventEducator) of completed virtual sessions in each teacher's tenant.
+
+    Args:
+        teachers: TeacherProgress records
+
+    Returns:
+        Dict of TeacherProgress id -> completed session count (teachers
+        without an email are omitted)
+    """
+    from services.teacher_matching_service import normalize_name
 
-    # Check if teacher email or name appears in the educators field
-    completed_events = query.all()
-    count = 0
-    for event in completed_events:
-        if event.educators:
-            educator_list = [e.strip().lower() for e in event.educators.split(";")]
-            if (
-                teacher.name.lower() in educator_list
-                or teacher.email.lower() in educator_list
-            ):
-                count += 1
+    keys_by_teacher = {}
+    for teacher in teachers:
+        if teacher.email:
+            keys = {normalize_name(teacher.name), normalize_name(teacher.email)}
+            keys.discard("")
+            keys_by_teacher[teacher] = keys
+    if not keys_by_teacher:
+        return {}
+
+    all_keys = sorted(set().union(*keys_by_teacher.values()))
+    events_by_key = {}
+    for start in range(0, len(all_keys), 500):
+        chunk = all_keys[start : start + 500]
+        rows = (
+            db.session.query(
+                EventEducator.normalized_name, Event.tenant_id, EventEducator.event_id
+            )
+            .join(Event, Event.id == EventEducator.event_id)
+            .filter(
+                Event.type == EventType.VIRTUAL_SESSION,
+                Event.status == EventStatus.COMPLETED,
+                EventEducator.normalized_name.in_(chunk),
+            )
+        )
+        for key, tenant_id, event_id in rows:
+            events_by_key.setdefault(key, []).append((tenant_id, event_id))
 
-    return count
+    counts = {}
+    for teacher, keys in keys_by_teacher.items():
+        event_ids = {
+            event_id
+            for key in keys
+            for tenant_id, event_id in events_by_key.get(key, ())
+            if teacher.tenant_id is None or tenant_id == teacher.tenant_id
+        }
+        counts[teacher.id] = len(event_ids)
+    return counts
 
 
 def build_teacher_reminder_context(
@@ -240,6 +295,29 @@ def build_teacher_reminder_context(
     Returns:
         Dictionary of placeholder values for template rendering
     """
+    return {
+        "teacher_name": teacher.name,
+        "building_name": teacher.building or "",
+        **build_shared_reminder_context(
+            sessions, district_name, login_url, contact_email
+        ),
+    }
+
+
+def build_shared_reminder_context(
+    sessions: List[Event],
+    district_name: str = DEFAULT_DISTRICT_NAME,
+    login_url: Optional[str] = None,
+    contact_email: Optional[str] = None,
+) -> Dict:
+    """
+    Build the placeholder values that are the same for every teacher.
+
+    Batch sends build this once and add the per-teacher name and building.
+
+    Returns:
+        Dictionary of shared placeholder values
+    """
     if login_url is None:
         login_url = (
             os.environ.get("APP_BASE_URL", "http://localhost:5050").rstrip("/")
@@ -252,8 +330,6 @@ def build_teacher_reminder_context(
         )
 
     return {
-        "teacher_name": teacher.name,
-        "building_name": teacher.building or "",
         "district_name": district_name,
         "session_list": build_session_list_html(sessions),
         "session_list_text": build_session_list_text(sessions),
@@ -336,6 +412,7 @@ def send_session_reminders(
     )
 
     sender_id = created_by_id or 1
+    completed_counts = get_completed_session_counts(teachers)
 
     for teacher in teachers:
         try:
@@ -346,7 +423,7 @@ def send_session_reminders(
                 continue
 
             # Get completed count for this teacher
-            completed = get_completed_session_count(teacher)
+            completed = completed_counts.get(teacher.id, 0)
 
             # Build context
             context = build_teacher_reminder_context(
@@ -634,15 +711,27 @@ def confirm_batch_job(job: BatchEmailJob, code: str) -> bool:
     return True
 
 
-def execute_batch_send(job: BatchEmailJob) -> Dict:
+def execute_batch_send(
+    job: BatchEmailJob,
+    provider_factory: Optional[Callable] = None,
+    batch_size: int = BATCH_SEND_SIZE,
+    concurrency: int = BATCH_SEND_CONCURRENCY,
+) -> Dict:
     """
     Execute the batch send for a confirmed job.
 
-    Iterates through all active teachers and sends personalized reminder
-    emails. Updates progress counters as it goes.
+    Sends personalized reminder emails to all active teachers, a batch at a
+    time: each batch's messages are rendered from the pre-compiled template
+    and inserted together, then delivered concurrently over a pool of
+    reusable provider connections. Cancellation is checked and the job's
+    progress counters are committed once per batch.
 
     Args:
         job: BatchEmailJob in CONFIRMED status
+        provider_factory: Callable returning provider connections (defaults
+            to the configured SMTP provider)
+        batch_size: Messages per insert/delivery batch
+        concurrency: Provider connections (and concurrent sends)
 
     Returns:
         Summary dict with final counts
@@ -659,6 +748,10 @@ def execute_batch_send(job: BatchEmailJob) -> Dict:
 
     sessions = get_upcoming_virtual_sessions(tenant_id=job.tenant_id)
     teachers = get_active_teachers(tenant_id=job.tenant_id)
+    shared_context = build_shared_reminder_context(
+        sessions, district_name=job.district_name
+    )
+    compiled = CompiledTemplate(template)
 
     logger.info(
         "Batch job %s: starting send to %s teachers",
@@ -666,51 +759,39 @@ def execute_batch_send(job: BatchEmailJob) -> Dict:
         len(teachers),
     )
 
-    for teacher in teachers:
-        # Check if job was cancelled mid-send
-        db.session.refresh(job)
-        if job.status == BatchEmailJobStatus.CANCELLED:
-            logger.info("Batch job %s cancelled mid-send", job.id)
-            break
-
-        try:
-            completed = get_completed_session_count(teacher)
-            context = build_teacher_reminder_context(
-                teacher=teacher,
-                sessions=sessions,
-                completed_count=completed,
-                district_name=job.district_name,
-            )
-
-            message = create_email_message(
-                template=template,
-                recipients=[teacher.email],
-                context=context,
-                created_by_id=job.created_by_id,
+    if provider_factory is None:
+        provider_factory = get_provider_factory()
+    pool = (
+        ProviderPool(provider_factory, size=concurrency) if provider_factory else None
+    )
+    failure_reported = False
+    try:
+        for start in range(0, len(teachers), batch_size):
+            # Check if job was cancelled mid-send
+            if _is_batch_job_cancelled(job):
+                logger.info("Batch job %s cancelled mid-send", job.id)
+                break
+
+            failure_reported |= _send_batch(
+                job,
+                teachers[start : start + batch_size],
+                template,
+                compiled,
+                shared_context,
+                pool,
+                report_failure=not failure_reported,
             )
-            db.session.commit()
-            create_delivery_attempt(message)
-
-            job.sent_count += 1
-            db.session.commit()
-
             logger.info(
-                "Batch job %s: sent %s/%s (%s)",
+                "Batch job %s: sent %s/%s (skipped=%s, errors=%s)",
                 job.id,
                 job.sent_count,
                 job.total_recipients,
-                teacher.email,
-            )
-
-        except Exception as e:
-            job.error_count += 1
-            db.session.commit()
-            logger.error(
-                "Batch job %s: error for %s: %s",
-                job.id,
-                teacher.email,
-                e,
+                job.skipped_count,
+                job.error_count,
             )
+    finally:
+        if pool is not None:
+            pool.close()
 
     # Mark completed (unless cancelled mid-send)
     db.session.refresh(job)
@@ -735,6 +816,128 @@ def execute_batch_send(job: BatchEmailJob) -> Dict:
     }
 
 
+def _is_batch_job_cancelled(job: BatchEmailJob) -> bool:
+    """Read the job's committed status (it is cancelled from another request)."""
+    status = db.session.query(BatchEmailJob.status).filter_by(id=job.id).scalar()
+    return status == BatchEmailJobStatus.CANCELLED
+
+
+def _send_batch(
+    job: BatchEmailJob,
+    teachers: List[TeacherProgress],
+    template: EmailTemplate,
+    compiled: CompiledTemplate,
+    shared_context: Dict,
+    pool: Optional[ProviderPool],
+    report_failure: bool = True,
+) -> bool:
+    """
+    Render, insert and deliver one batch of reminder emails, then commit the
+    messages' outcomes and the job's progress counters.
+
+    Returns:
+        True if a delivery failure bug report was filed for this batch
+    """
+    now = datetime.now(timezone.utc)
+    errors = 0
+    messages = []
+    for teacher in teachers:
+        context = {
+            "teacher_name": teacher.name,
+            "building_name": teacher.building or "",
+            **shared_context,
+        }
+        try:
+            message = build_email_message(
+                template,
+                [teacher.email],
+                context,
+                job.created_by_id,
+                status=EmailMessageStatus.QUEUED,
+                compiled=compiled,
+            )
+        except Exception as e:
+            errors += 1
+            logger.error("Batch job %s: error for %s: %s", job.id, teacher.email, e)
+            continue
+        message.queued_at = now
+        message.status_updated_at = now
+        messages.append(message)
+
+    # One batched INSERT for the whole batch
+    db.session.add_all(messages)
+    db.session.commit()
+
+    skipped = 0
+    results = {}
+    outgoing = []
+    for message in messages:
+        if message.status == EmailMessageStatus.BLOCKED:
+            skipped += 1
+            continue
+        is_allowed, error_msg, excluded = check_safety_gates(message.recipients)
+        if not is_allowed:
+            results[message.id] = (False, error_msg, None)
+        elif pool is None:
+            results[message.id] = (
+                False,
+                "No email provider configured",
+                {"status": "not_implemented"},
+            )
+        else:
+            outgoing.append(outgoing_for(message, excluded))
+
+    attempted_at = datetime.now(timezone.utc)
+    if outgoing:
+        for result in pool.deliver_all(outgoing):
+            results[result.outgoing.message_id] = (
+                result.success,
+                result.error,
+                result.response,
+            )
+
+    sent = 0
+    failed = []
+    attempts = []
+    for message in messages:
+        if message.id not in results:
+            continue
+        success, error_message, provider_response = results[message.id]
+        attempt = EmailDeliveryAttempt(
+            message_id=message.id,
+            status=DeliveryAttemptStatus.PENDING,
+            attempted_at=attempted_at,
+        )
+        record_delivery_result(
+            message, attempt, success, error_message, provider_response
+        )
+        attempts.append(attempt)
+        if success:
+            sent += 1
+        else:
+            failed.append((message, attempt))
+            logger.error(
+                "Batch job %s: delivery failed for %s: %s",
+                job.id,
+                ", ".join(message.recipients),
+                error_message,
+            )
+    db.session.add_all(attempts)
+
+    # One bug report per job run rather than one per failed message
+    reported = False
+    if failed and report_failure:
+        db.session.flush()
+        create_delivery_failure_bug_report(*failed[0])
+        reported = True
+
+    job.sent_count += sent
+    job.skipped_count += skipped
+    job.error_count += errors + len(failed)
+    db.session.commit()
+    return reported
+
+
 def cancel_batch_job(job: BatchEmailJob, reason: str = "manual") -> bool:
     """
     Cancel a batch job at any stage before completion.
@@ -0,0 +1,308 @@
+# utils/query_profiler.py
+"""
+Per-Request SQL Profiler and N+1 Detector
+
+Opt-in instrumentation built on SQLAlchemy's ``before_cursor_execute`` and
+``after_cursor_execute`` engine events. While a profile is active every
+statement is counted, timed and reduced to a fingerprint (literals and bound
+parameters replaced, IN lists collapsed), so the same query issued once per
+row of a result - the N+1 pattern - shows up as one fingerprint with a high
+count.
+
+Request profiling is enabled with ``QUERY_PROFILER_ENABLED=true``. Each
+request then records its statement count, database time and repeated
+fingerprints; requests over ``QUERY_PROFILER_LOG_THRESHOLD`` statements or
+with a fingerprint repeated ``QUERY_PROFILER_REPEAT_THRESHOLD`` times are
+logged, and per-endpoint aggregates are shown on /management/queries.
+
+Tests can enforce a query budget whether or not request profiling is on:
+
+    from utils.query_profiler import query_budget
+
+    with query_budget(20, max_repeats=3):
+        client.get("/volunteers")
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from flask import current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_THRESHOLD = 50  # statements per request
+DEFAULT_REPEAT_THRESHOLD = 5  # executions of one fingerprint per request
+TOP_FINGERPRINTS = 5  # repeated fingerprints kept per endpoint
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_START_TIMES_KEY = "query_profiler_start"
+
+_local = threading.local()
+_listeners_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_endpoint_stats = {}
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by query_budget() when a block runs too many statements."""
+
+
+def fingerprint(statement):
+    """
+    Reduce a SQL statement to its shape.
+
+    Literals and bound parameters become ``?`` and IN lists of any length
+    become ``(?...)``, so per-row repeats of one query share a fingerprint.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NAMED_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("(?...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statements executed while a profile is active."""
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+
+    def record(self, statement, duration):
+        self.statements += 1
+        self.db_time += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold):
+        """(fingerprint, count) pairs executed at least ``threshold`` times."""
+        return [
+            (shape, count)
+            for shape, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self, threshold=DEFAULT_REPEAT_THRESHOLD, limit=3):
+        text = f"{self.statements} statements, {self.db_time * 1000:.1f} ms in database"
+        repeats = self.repeated(threshold)[:limit]
+        if repeats:
+            text += "; repeated: " + "; ".join(
+                f"{count}x {shape[:200]}" for shape, count in repeats
+            )
+        return text
+
+
+# --- Engine events ---------------------------------------------------------
+
+
+def _active_profiles():
+    return getattr(_local, "profiles", ())
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active_profiles():
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get(_START_TIMES_KEY)
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    for stats in _active_profiles():
+        stats.record(statement, duration)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for a failed statement; drop its
+    # start time so the next statement on this connection is timed correctly
+    conn = exception_context.connection
+    if conn is None or exception_context.execution_context is None:
+        return
+    started = conn.info.get(_START_TIMES_KEY)
+    if started:
+        started.pop()
+
+
+def _install_listeners():
+    """Attach the cursor listeners to every engine (once per process)."""
+    with _listeners_lock:
+        if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            event.listen(Engine, "handle_error", _handle_error)
+
+
+def _push(stats):
+    _install_listeners()
+    _local.profiles = _active_profiles() + (stats,)
+
+
+def _pop(stats):
+    _local.profiles = tuple(p for p in _active_profiles() if p is not stats)
+
+
+@contextmanager
+def profile_queries():
+    """Record the statements executed by this thread inside the block."""
+    stats = QueryStats()
+    _push(stats)
+    try:
+        yield stats
+    finally:
+        _pop(stats)
+
+
+@contextmanager
+def query_budget(max_statements, max_repeats=None):
+    """
+    Fail when the block executes more than ``max_statements`` statements, or
+    any one fingerprint more than ``max_repeats`` times.
+
+    Raises:
+        QueryBudgetExceeded: With the statement count and worst repeats
+    """
+    with profile_queries() as stats:
+        yield stats
+
+    threshold = (max_repeats or 0) + 1
+    if stats.statements > max_statements:
+        raise QueryBudgetExceeded(
+            f"Query budget of {max_statements} exceeded: "
+            f"{stats.summary(threshold=min(threshold, DEFAULT_REPEAT_THRESHOLD))}"
+        )
+    if max_repeats is not None and stats.repeated(threshold):
+        raise QueryBudgetExceeded(
+            f"Statement repeated more than {max_repeats} times: "
+            f"{stats.summary(threshold=threshold)}"
+        )
+
+
+# --- Request profiling -----------------------------------------------------
+
+
+def _start_request_profile():
+    if current_app.config.get("QUERY_PROFILER_ENABLED"):
+        g._query_profile = (QueryStats(), time.perf_counter())
+        _push(g._query_profile[0])
+
+
+def _finish_request_profile(exc=None):
+    profile = g.pop("_query_profile", None)
+    if profile is None:
+        return
+    stats, started = profile
+    _pop(stats)
+
+    repeat_threshold = current_app.config.get(
+        "QUERY_PROFILER_REPEAT_THRESHOLD", DEFAULT_REPEAT_THRESHOLD
+    )
+    endpoint = request.endpoint or "<unmatched>"
+    repeats = stats.repeated(repeat_threshold)
+    _record_request(endpoint, stats, time.perf_counter() - started, repeats)
+
+    log_threshold = current_app.config.get(
+        "QUERY_PROFILER_LOG_THRESHOLD", DEFAULT_LOG_THRESHOLD
+    )
+    if repeats or stats.statements >= log_threshold:
+        logger.warning(
+            "Query profile %s %s (%s): %s",
+            request.method,
+            request.path,
+            endpoint,
+            stats.summary(threshold=repeat_threshold),
+        )
+
+
+def _record_request(endpoint, stats, duration, repeats):
+    with _stats_lock:
+        entry = _endpoint_stats.setdefault(
+            endpoint,
+            {
+                "requests": 0,
+                "statements": 0,
+                "max_statements": 0,
+                "db_time": 0.0,
+                "max_db_time": 0.0,
+                "request_time": 0.0,
+                "n_plus_one_requests": 0,
+                "repeated": defaultdict(int),
+            },
+        )
+        entry["requests"] += 1
+        entry["statements"] += stats.statements
+        entry["max_statements"] = max(entry["max_statements"], stats.statements)
+        entry["db_time"] += stats.db_time
+        entry["max_db_time"] = max(entry["max_db_time"], stats.db_time)
+        entry["request_time"] += duration
+        if repeats:
+            entry["n_plus_one_requests"] += 1
+        for shape, count in repeats:
+            entry["repeated"][shape] = max(entry["repeated"][shape], count)
+        if len(entry["repeated"]) > TOP_FINGERPRINTS:
+            worst = sorted(entry["repeated"].items(), key=lambda item: -item[1])
+            entry["repeated"] = defaultdict(int, worst[:TOP_FINGERPRINTS])
+
+
+def init_query_profiler(app):
+    """
+    Register the request hooks.
+
+    The hooks are always registered but only profile while
+    ``QUERY_PROFILER_ENABLED`` is set; the engine listeners are attached on
+    first use.
+    """
+    app.before_request(_start_request_profile)
+    app.teardown_request(_finish_request_profile)
+
+
+def get_query_stats():
+    """
+    Get aggregated per-endpoint query statistics.
+
+    Returns:
+        list: One dict per endpoint, worst total database time first, with
+        request/statement counts, average and max statements, database time
+        in milliseconds, and the most repeated fingerprints
+    """
+    with _stats_lock:
+        snapshot = [
+            (endpoint, dict(entry), dict(entry["repeated"]))
+            for endpoint, entry in _endpoint_stats.items()
+        ]
+
+    results = []
+    for endpoint, entry, repeated in snapshot:
+        requests = entry["requests"]
+        results.append(
+            {
+                "endpoint": endpoint,
+                "requests": requests,
+                "avg_statements": round(entry["statements"] / requests, 1),
+                "max_statements": entry["max_statements"],
+                "avg_db_ms": round(entry["db_time"] / requests * 1000, 1),
+                "max_db_ms": round(entry["max_db_time"] * 1000, 1),
+                "total_db_ms": round(entry["db_time"] * 1000, 1),
+                "avg_request_ms": round(entry["request_time"] / requests * 1000, 1),
+                "n_plus_one_requests": entry["n_plus_one_requests"],
+                "repeated": sorted(repeated.items(), key=lambda item: -item[1]),
+            }
+        )
+    return sorted(results, key=lambda item: -item["total_db_ms"])
+
+
+def reset_query_stats():
+    """Clear the aggregated per-endpoint statistics."""
+    with _stats_lock:
+        _endpoint_stats.clear()
@@ -1,13 +1,26 @@
 # utils/salesforce_client.py
 """
 Enhanced Salesforce client for data validation with caching and error handling.
+
+Count and sample queries are cached in a SalesforceQueryCache: an in-process
+TTL cache that coalesces concurrent identical requests and can optionally
+persist entries to a JSON file. The validation engine shares one cache across
+all validators of a run, so each SOQL query runs (and pays the rate-limit
+delay) at most once per run.
 """
 
+import atexit
+import fnmatch
+import inspect
+import json
 import logging
 import os
+import threading
 import time
+import weakref
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Flask-Caching is used instead of Redis for this project
 REDIS_AVAILABLE = False
@@ -25,6 +38,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Persisted caches with unsaved entries, flushed at interpreter exit
+_unsaved_caches = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unsaved_caches():
+    for cache in list(_unsaved_caches):
+        cache.flush()
+
 
 class SalesforceClientError(Exception):
     """Base exception for Salesforce client errors."""
@@ -44,12 +66,247 @@ class SalesforceConnectionError(SalesforceClientError):
     pass
 
 
+class SalesforceQueryCache:
+    """
+    Thread-safe in-process TTL cache for Salesforce query results.
+
+    One instance can be shared by several clients. Concurrent requests for
+    the same key are coalesced: the first caller runs the query and the
+    others wait for its result instead of issuing the same query. When
+    persist_path is set, entries are also written to that JSON file and
+    loaded by the next cache created with the same path. The file is
+    rewritten at most once per persist_interval; later changes are written
+    by flush(), which also runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        persist_path: str = None,
+        wait_timeout: float = 60.0,
+        persist_interval: float = 30.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            persist_path: Optional JSON file used to persist entries
+            wait_timeout: Seconds to wait for an in-flight identical query
+            persist_interval: Minimum seconds between writes of the file
+        """
+        self.persist_path = persist_path
+        self.wait_timeout = wait_timeout
+        self.persist_interval = persist_interval
+        self._entries: Dict[str, tuple] = {}  # key -> (expires_at, value)
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = None  # time.monotonic() of the last write
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        if persist_path:
+            self._load()
+
+    def _lookup(self, key: str):
+        """Return (found, value) for a live entry; caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.time():
+            del self._entries[key]
+            return False, None
+        return True, entry[1]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None when missing or expired."""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int):
+        """Cache a value for ttl seconds."""
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+        self._changed()
+
+    def get_or_load(self, key: str, load: Callable[[], Any], ttl: int) -> Any:
+        """
+        Get a cached value, running load() at most once for concurrent callers.
+
+        Args:
+            key: Cache key
+            load: Callable that runs the query
+            ttl: Seconds to keep the loaded value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        waited = False
+        while True:
+            with self._lock:
+                found, value = self._lookup(key)
+                if found:
+                    if not waited:
+                        self.hits += 1
+                    return value
+                event = self._inflight.get(key)
+                is_owner = event is None
+                if is_owner:
+                    event = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                elif not waited:
+                    self.coalesced += 1
+
+            if is_owner:
+                try:
+                    value = load()
+                    self.set(key, value, ttl)
+                    return value
+                finally:
+                    with self._lock:
+                        self._inflight.pop(key, None)
+                    event.set()
+
+            # Another caller is running this query; if it fails, retry ourselves
+            if not event.wait(self.wait_timeout):
+                logger.warning("Timed out waiting for in-flight query %s", key)
+                return load()
+            waited = True
+
+    def clear(self, pattern: str = "sf:*") -> int:
+        """Remove entries whose key matches a glob pattern."""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            self._changed()
+        return len(keys)
+
+    def flush(self):
+        """Write pending changes to the persistence file, if any."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+        self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and coalesced request counts."""
+        with self._lock:
+            requests = self.hits + self.misses + self.coalesced
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "entries": len(self._entries),
+                "hit_rate": (
+                    round((self.hits + self.coalesced) / requests * 100, 2)
+                    if requests
+                    else 0.0
+                ),
+            }
+
+    def _load(self):
+        """Load unexpired entries from the persistence file."""
+        try:
+            with open(self.persist_path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Could not load Salesforce query cache %s: %s", self.persist_path, e
+            )
+            return
+
+        now = time.time()
+        with self._lock:
+            for key, (expires_at, value) in stored.items():
+                if expires_at > now:
+                    self._entries[key] = (expires_at, value)
+
+    def _changed(self):
+        """Mark entries as unsaved; write them if the interval has passed."""
+        if not self.persist_path:
+            return
+        with self._lock:
+            self._dirty = True
+            due = (
+                self._saved_at is None
+                or time.monotonic() - self._saved_at >= self.persist_interval
+            )
+        _unsaved_caches.add(self)
+        if due:
+            self.flush()
+
+    def _save(self):
+        """Write unexpired entries to the persistence file."""
+        now = time.time()
+        with self._lock:
+            self._saved_at = time.monotonic()
+            snapshot = {
+                key: [expires_at, value]
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at > now
+            }
+
+        with self._persist_lock:
+            tmp_path = f"{self.persist_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.persist_path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(
+                    "Could not persist Salesforce query cache %s: %s",
+                    self.persist_path,
+                    e,
+                )
+
+
+def _cached_query(query_type: str, ttl: int = None):
+    """
+    Cache a client query method in the client's SalesforceQueryCache.
+
+    The cache key is built by _get_cache_key from query_type and the method's
+    arguments; ttl defaults to the client's cache_ttl.
+    """
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "self"}
+            cache_key = self._get_cache_key(query_type, **params)
+            return self.cache.get_or_load(
+                cache_key,
+                lambda: method(self, *args, **kwargs),
+                ttl or self.cache_ttl,
+            )
+
+        return wrapper
+
+    return decorator
+
+
 class SalesforceClient:
     """
     Enhanced Salesforce client with caching, rate limiting, and error handling.
 
     This client provides methods to fetch record counts and samples for various
-    Salesforce objects, with Redis caching for improved performance.
+    Salesforce objects, cached in a SalesforceQueryCache that can be shared
+    between clients.
     """
 
     def __init__(
@@ -58,6 +315,7 @@ class SalesforceClient:
         password: str = None,
         security_token: str = None,
         domain: str = "login",
+        cache: Optional[SalesforceQueryCache] = None,
     ):
         """
         Initialize the Salesforce client.
@@ -67,14 +325,16 @@ class SalesforceClient:
             password: Salesforce password
             security_token: Salesforce security token
             domain: Salesforce domain (login or test)
+            cache: Shared query cache (a private one is created if omitted)
         """
         self.username = username or os.environ.get("SF_USERNAME")
         self.password = password or os.environ.get("SF_PASSWORD")
         self.security_token = security_token or os.environ.get("SF_SECURITY_TOKEN")
         self.domain = domain
 
-        # Caching is handled by Flask-Caching, not Redis
+        # Query results are cached in process, not in Redis
         self.redis_client = None
+        self.cache = cache or SalesforceQueryCache()
 
         # Initialize Salesforce connection
         self.sf = None
@@ -157,25 +417,15 @@ class SalesforceClient:
 
     def _get_from_cache(self, cache_key: str) -> Optional[Any]:
         """Get data from cache if available."""
-        # Caching is handled by Flask-Caching decorators
-        # This method is kept for compatibility but doesn't use Redis
-        return None
+        return self.cache.get(cache_key)
 
     def _set_cache(self, cache_key: str, data: Any, ttl: int = None):
         """Set data in cache."""
-        # Caching is handled by Flask-Caching decorators
-        # This method is kept for compatibility but doesn't use Redis
-        pass
+        self.cache.set(cache_key, data, ttl or self.cache_ttl)
 
+    @_cached_query("volunteer_count")
     def get_volunteer_count(self) -> int:
         """Get the total count of volunteers in Salesforce."""
-        cache_key = self._get_cache_key("volunteer_count")
-        cached_count = self._get_from_cache(cache_key)
-
-        if cached_count is not None:
-            logger.debug("Returning cached volunteer count: %s", cached_count)
-            return cached_count
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -189,7 +439,6 @@ class SalesforceClient:
             count = result["totalSize"]
 
             logger.info("Volunteer count query successful: %s volunteers found", count)
-            self._set_cache(cache_key, count)
             return count
 
         except Exception as e:
@@ -199,14 +448,9 @@ class SalesforceClient:
             )
             raise SalesforceClientError(f"Failed to get volunteer count: {e}")
 
+    @_cached_query("organization_count")
     def get_organization_count(self) -> int:
         """Get the total count of organizations in Salesforce."""
-        cache_key = self._get_cache_key("organization_count")
-        cached_count = self._get_from_cache(cache_key)
-
-        if cached_count is not None:
-            return cached_count
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -217,21 +461,15 @@ class SalesforceClient:
             )
             count = result["totalSize"]
 
-            self._set_cache(cache_key, count)
             return count
 
         except Exception as e:
             logger.exception("Failed to get organization count: %s", e)
             raise SalesforceClientError(f"Failed to get organization count: {e}")
 
+    @_cached_query("event_count")
     def get_event_count(self) -> int:
         """Get the total count of events in Salesforce."""
-        cache_key = self._get_cache_key("event_count")
-        cached_count = self._get_from_cache(cache_key)
-
-        if cached_count is not None:
-            return cached_count
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -240,21 +478,15 @@ class SalesforceClient:
             result = self.sf.query("SELECT COUNT() FROM Event")
             count = result["totalSize"]
 
-            self._set_cache(cache_key, count)
             return count
 
         except Exception as e:
             logger.exception("Failed to get event count: %s", e)
             raise SalesforceClientError(f"Failed to get event count: {e}")
 
+    @_cached_query("student_count")
     def get_student_count(self) -> int:
         """Get the total count of students in Salesforce."""
-        cache_key = self._get_cache_key("student_count")
-        cached_count = self._get_from_cache(cache_key)
-
-        if cached_count is not None:
-            return cached_count
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -265,21 +497,15 @@ class SalesforceClient:
             )
             count = result["totalSize"]
 
-            self._set_cache(cache_key, count)
             return count
 
         except Exception as e:
             logger.exception("Failed to get student count: %s", e)
             raise SalesforceClientError(f"Failed to get student count: {e}")
 
+    @_cached_query("teacher_count")
     def get_teacher_count(self) -> int:
         """Get the total count of teachers in Salesforce."""
-        cache_key = self._get_cache_key("teacher_count")
-        cached_count = self._get_from_cache(cache_key)
-
-        if cached_count is not None:
-            return cached_count
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -290,13 +516,13 @@ class SalesforceClient:
             )
             count = result["totalSize"]
 
-            self._set_cache(cache_key, count)
             return count
 
         except Exception as e:
             logger.exception("Failed to get teacher count: %s", e)
             raise SalesforceClientError(f"Failed to get teacher count: {e}")
 
+    @_cached_query("school_count")
     def get_school_count(self) -> int:
         """
         Get the count of schools from the local database.
@@ -314,6 +540,7 @@ class SalesforceClient:
             logger.exception("Failed to get school count: %s", e)
             raise SalesforceClientError(f"Failed to get school count: {e}")
 
+    @_cached_query("district_count")
     def get_district_count(self) -> int:
         """
         Get the count of districts from the local database.
@@ -331,6 +558,7 @@ class SalesforceClient:
             logger.exception("Failed to get district count: %s", e)
             raise SalesforceClientError(f"Failed to get district count: {e}")
 
+    @_cached_query("school_sample", ttl=60)  # Shorter TTL for samples
     def get_school_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get a sample of school records from the local database.
@@ -366,6 +594,7 @@ class SalesforceClient:
             logger.exception("Failed to get school sample: %s", e)
             raise SalesforceClientError(f"Failed to get school sample: {e}")
 
+    @_cached_query("district_sample", ttl=60)  # Shorter TTL for samples
     def get_district_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get a sample of district records from the local database.
@@ -400,14 +629,9 @@ class SalesforceClient:
             logger.exception("Failed to get district sample: %s", e)
             raise SalesforceClientError(f"Failed to get district sample: {e}")
 
+    @_cached_query("volunteer_sample", ttl=60)  # Shorter TTL for samples
     def get_volunteer_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get a sample of volunteer records from Salesforce."""
-        cache_key = self._get_cache_key("volunteer_sample", limit=limit)
-        cached_sample = self._get_from_cache(cache_key)
-
-        if cached_sample is not None:
-            return cached_sample
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -431,21 +655,15 @@ class SalesforceClient:
                 }
                 clean_records.append(clean_record)
 
-            self._set_cache(cache_key, clean_records, ttl=60)  # Shorter TTL for samples
             return clean_records
 
         except Exception as e:
             logger.exception("Failed to get volunteer sample: %s", e)
             raise SalesforceClientError(f"Failed to get volunteer sample: {e}")
 
+    @_cached_query("organization_sample", ttl=60)  # Shorter TTL for samples
     def get_organization_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get a sample of organization records from Salesforce."""
-        cache_key = self._get_cache_key("organization_sample", limit=limit)
-        cached_sample = self._get_from_cache(cache_key)
-
-        if cached_sample is not None:
-            return cached_sample
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -463,21 +681,15 @@ class SalesforceClient:
                 }
                 clean_records.append(clean_record)
 
-            self._set_cache(cache_key, clean_records, ttl=60)  # Shorter TTL for samples
             return clean_records
 
         except Exception as e:
             logger.exception("Failed to get organization sample: %s", e)
             raise SalesforceClientError(f"Failed to get organization sample: {e}")
 
+    @_cached_query("event_sample", ttl=60)  # Shorter TTL for samples
     def get_event_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get a sample of event records from Salesforce."""
-        cache_key = self._get_cache_key("event_sample", limit=limit)
-        cached_sample = self._get_from_cache(cache_key)
-
-        if cached_sample is not None:
-            return cached_sample
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -495,21 +707,15 @@ class SalesforceClient:
                 }
                 clean_records.append(clean_record)
 
-            self._set_cache(cache_key, clean_records, ttl=60)  # Shorter TTL for samples
             return clean_records
 
         except Exception as e:
             logger.exception("Failed to get event sample: %s", e)
             raise SalesforceClientError(f"Failed to get event sample: {e}")
 
+    @_cached_query("student_sample", ttl=60)  # Shorter TTL for samples
     def get_student_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get a sample of student records from Salesforce."""
-        cache_key = self._get_cache_key("student_sample", limit=limit)
-        cached_sample = self._get_from_cache(cache_key)
-
-        if cached_sample is not None:
-            return cached_sample
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -527,21 +733,15 @@ class SalesforceClient:
                 }
                 clean_records.append(clean_record)
 
-            self._set_cache(cache_key, clean_records, ttl=60)  # Shorter TTL for samples
             return clean_records
 
         except Exception as e:
             logger.exception("Failed to get student sample: %s", e)
             raise SalesforceClientError(f"Failed to get student sample: {e}")
 
+    @_cached_query("teacher_sample", ttl=60)  # Shorter TTL for samples
     def get_teacher_sample(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get a sample of teacher records from Salesforce."""
-        cache_key = self._get_cache_key("teacher_sample", limit=limit)
-        cached_sample = self._get_from_cache(cache_key)
-
-        if cached_sample is not None:
-            return cached_sample
-
         try:
             self._ensure_connection()
             self._rate_limit()
@@ -559,7 +759,6 @@ class SalesforceClient:
                 }
                 clean_records.append(clean_record)
 
-            self._set_cache(cache_key, clean_records, ttl=60)  # Shorter TTL for samples
             return clean_records
 
         except Exception as e:
@@ -570,7 +769,8 @@ class SalesforceClient:
         """Get the health status of the Salesforce connection."""
         status = {
             "connected": False,
-            "cache_available": True,  # Flask-Caching is always available
+            "cache_available": True,  # In-process cache is always available
+            "cache": self.cache.stats(),
             "salesforce_available": SALESFORCE_AVAILABLE,
             "connection_attempts": self._connection_attempts,
             "last_connection_attempt": (
@@ -597,10 +797,11 @@ class SalesforceClient:
 
     def clear_cache(self, pattern: str = "sf:*"):
         """Clear cached data matching the given pattern."""
-        # Caching is handled by Flask-Caching decorators
-        # This method is kept for compatibility but doesn't use Redis
-        logger.info("Cache clearing requested - handled by Flask-Caching")
-        return 0
+        cleared = self.cache.clear(pattern)
+        logger.info(
+            "Cleared %s cached Salesforce queries matching %s", cleared, pattern
+        )
+        return cleared
 
     def close(self):
         """Close the Salesforce connection and cleanup resources."""
@@ -613,7 +814,7 @@ class SalesforceClient:
             except Exception as e:
                 logger.warning("Error releasing Salesforce connection: %s", e)
 
-        # Redis connection cleanup not needed - using Flask-Caching
+        # The query cache may be shared, so it is left intact
 
 
 # Convenience functions for quick access
@@ -36,6 +36,10 @@ from models.school_model import School
 from models.teacher import Teacher
 from models.volunteer import EventParticipation, Volunteer
 from routes.reports.common import get_current_school_year, get_school_year_date_range
+from services.cache_dependency_service import (
+    record_cache_lookup,
+    register_cache_dependencies,
+)
 
 
 class OrganizationService:
@@ -132,7 +136,9 @@ class OrganizationService:
                 organization_id=org_id, school_year=school_year
             ).first()
             if cache and self._is_cache_fresh(cache):
+                record_cache_lookup(OrganizationDetailCache.__tablename__, hit=True)
                 return self._format_cached_data(organization, cache, school_year)
+            record_cache_lookup(OrganizationDetailCache.__tablename__, hit=False)
 
         # Get date range for the school year
         if school_year == "all_time":
@@ -769,6 +775,9 @@ class OrganizationService:
                 detail_cache.volunteers_data = volunteers_data
                 detail_cache.summary_stats = summary_stats
 
+            register_cache_dependencies(
+                detail_cache, school_year=school_year, organization_ids=[org_id]
+            )
             db.session.commit()
         except Exception:
             db.session.rollback()
@@ -0,0 +1,267 @@
+"""
+Spreadsheet Exports
+===================
+
+Shared export layer for report downloads. A report describes its sheets as
+columns plus an iterable of rows; rows are consumed lazily and written one
+at a time, so exports do not hold a DataFrame or an openpyxl object model of
+the whole report.
+
+- XLSX: written by xlsxwriter in ``constant_memory`` mode, which flushes
+  each row to a temporary file as soon as the next row starts. The finished
+  workbook lives in a temporary file and is sent in chunks.
+- CSV (``?format=csv``): one sheet streamed as it is generated, so the first
+  bytes reach the browser before the last row is read.
+
+Row sources that query the database should iterate with stream_query(),
+which reads through a server-side cursor in batches instead of loading
+every row up front.
+
+Usage:
+    from utils.spreadsheet_export import Column, Sheet, export_response
+
+    sheet = Sheet(
+        "Volunteers",
+        [Column("Name", 28), Column("Hours", 12)],
+        ((v.name, v.hours) for v in stream_query(query)),
+    )
+    return export_response([sheet], "Volunteers.xlsx")
+"""
+
+import csv
+import io
+import tempfile
+from datetime import date, datetime
+from typing import Callable, Iterable, NamedTuple, Optional, Sequence
+
+import xlsxwriter
+from flask import Response, request, send_file, stream_with_context
+
+from models import db
+
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_MIMETYPE = "text/csv; charset=utf-8"
+
+EXPORT_BATCH_SIZE = 1000  # rows fetched per server-side cursor batch
+CHUNK_SIZE = 64 * 1024  # bytes per response chunk
+
+HEADER_FORMAT = {
+    "bold": True,
+    "bg_color": "#467599",
+    "font_color": "white",
+    "border": 1,
+}
+DATE_FORMAT = "mm/dd/yy"
+
+
+class Column(NamedTuple):
+    """
+    A sheet column.
+
+    Attributes:
+        header: Header cell text
+        width: Column width in characters (default: Excel's)
+        format: xlsxwriter format properties for the column's data cells
+    """
+
+    header: str
+    width: Optional[float] = None
+    format: Optional[dict] = None
+
+
+class Sheet(NamedTuple):
+    """
+    A worksheet to export.
+
+    Attributes:
+        name: Worksheet name
+        columns: Column definitions, in row order
+        rows: Iterable of row sequences, consumed once
+        trailer: Optional callable returning rows written after the data
+            (two blank rows below it), e.g. totals accumulated while the rows
+            were streamed. Its first row is a section title and gets the
+            header format.
+        header_format: xlsxwriter format properties for the header row
+            (default: HEADER_FORMAT)
+    """
+
+    name: str
+    columns: Sequence[Column]
+    rows: Iterable[Sequence]
+    trailer: Optional[Callable[[], Sequence[Sequence]]] = None
+    header_format: Optional[dict] = None
+
+
+def stream_query(query, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Iterate an ORM query or a select() through a server-side cursor.
+
+    Rows are fetched ``batch_size`` at a time; the full result is never
+    materialized. Must be consumed inside the app context that runs it.
+    """
+    if hasattr(query, "yield_per"):
+        return query.yield_per(batch_size)
+    return db.session.execute(query, execution_options={"yield_per": batch_size})
+
+
+# ── XLSX ──────────────────────────────────────────────────────────────
+
+
+class _Formats:
+    """Workbook formats, created once per distinct property set."""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._formats = {}
+
+    def get(self, properties):
+        if not properties:
+            return None
+        key = tuple(sorted(properties.items()))
+        if key not in self._formats:
+            self._formats[key] = self.workbook.add_format(properties)
+        return self._formats[key]
+
+
+def _write_cell(worksheet, row, col, value, cell_format, formats):
+    if isinstance(value, (datetime, date)):
+        properties = {"num_format": DATE_FORMAT}
+        if cell_format is not None:
+            properties = {**cell_format, **properties}
+        worksheet.write_datetime(row, col, value, formats.get(properties))
+    elif value is None:
+        if cell_format is not None:
+            worksheet.write_blank(row, col, None, formats.get(cell_format))
+    else:
+        worksheet.write(row, col, value, formats.get(cell_format))
+
+
+def _write_sheet(workbook, sheet, formats):
+    worksheet = workbook.add_worksheet(sheet.name)
+    header_format = formats.get(sheet.header_format or HEADER_FORMAT)
+
+    for col, column in enumerate(sheet.columns):
+        if column.width is not None:
+            worksheet.set_column(col, col, column.width)
+        worksheet.write_string(0, col, column.header, header_format)
+
+    row_index = 0
+    cell_formats = [column.format for column in sheet.columns]
+    for row_index, row in enumerate(sheet.rows, start=1):
+        for col, value in enumerate(row):
+            cell_format = cell_formats[col] if col < len(cell_formats) else None
+            _write_cell(worksheet, row_index, col, value, cell_format, formats)
+
+    if sheet.trailer is not None:
+        for offset, row in enumerate(sheet.trailer()):
+            trailer_row = row_index + 3 + offset
+            for col, value in enumerate(row):
+                cell_format = sheet.header_format or HEADER_FORMAT
+                if offset or col:
+                    cell_format = None
+                _write_cell(worksheet, trailer_row, col, value, cell_format, formats)
+
+
+def write_xlsx(sheets, fileobj):
+    """
+    Write sheets to a binary file object as an XLSX workbook.
+
+    Rows are written in order and flushed as they go (constant_memory), so
+    memory use does not grow with the number of rows.
+    """
+    workbook = xlsxwriter.Workbook(
+        fileobj,
+        {
+            "constant_memory": True,
+            "remove_timezone": True,
+            # Report cells hold user data; never interpret it
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+        },
+    )
+    formats = _Formats(workbook)
+    for sheet in sheets:
+        _write_sheet(workbook, sheet, formats)
+    workbook.close()
+
+
+def xlsx_response(sheets, filename):
+    """
+    Build an XLSX download for the given sheets.
+
+    The workbook is assembled in a temporary file (XLSX is a zip archive and
+    is only complete once every sheet is written) and sent in chunks.
+    """
+    spool = tempfile.TemporaryFile()
+    try:
+        write_xlsx(sheets, spool)
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+    return send_file(
+        spool,
+        mimetype=XLSX_MIMETYPE,
+        download_name=filename,
+        as_attachment=True,
+    )
+
+
+# ── CSV ───────────────────────────────────────────────────────────────
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%m/%d/%y %H:%M")
+    if isinstance(value, date):
+        return value.strftime("%m/%d/%y")
+    return value
+
+
+def iter_csv(sheet, chunk_size=CHUNK_SIZE):
+    """Yield a sheet as CSV text in chunks of about ``chunk_size`` bytes."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.header for column in sheet.columns])
+    for row in sheet.rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if sheet.trailer is not None:
+        writer.writerows([[], []])
+        for row in sheet.trailer():
+            writer.writerow([_csv_value(value) for value in row])
+    yield buffer.getvalue()
+
+
+def csv_response(sheet, filename):
+    """Stream one sheet as a CSV download."""
+    return Response(
+        stream_with_context(iter_csv(sheet)),
+        headers={
+            "Content-Type": CSV_MIMETYPE,
+            "Content-Disposition": f"attachment; filename={filename}",
+        },
+    )
+
+
+def export_response(sheets, filename, csv_sheet=0):
+    """
+    Download response for a report export.
+
+    Sends XLSX by default, or ``sheets[csv_sheet]`` as streamed CSV when the
+    request asks for ``?format=csv``.
+
+    Args:
+        sheets: Sheets to export, in workbook order
+        filename: XLSX download name (".csv" is substituted for CSV)
+        csv_sheet: Index of the sheet exported as CSV
+    """
+    if request.args.get("format", "").lower() == "csv":
+        csv_name = filename.rsplit(".", 1)[0] + ".csv"
+        return csv_response(sheets[csv_sheet], csv_name)
+    return xlsx_response(sheets, filename)
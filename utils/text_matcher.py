@@ -0,0 +1,89 @@
+"""
+Multi-pattern substring matching.
+
+KeywordMatcher is an Aho-Corasick automaton: register any number of
+patterns, then find every pattern occurring in a text in one pass over the
+text, instead of testing ``pattern in text`` for each pattern.
+
+Usage:
+    from utils.text_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher()
+    matcher.add("grandview", district_id)
+    matcher.add("kckps", other_district_id)
+    district_ids = matcher.matches("Grandview HS career day".lower())
+
+Matching is case-sensitive; lowercase patterns and texts for
+case-insensitive matching.
+"""
+
+from collections import deque
+from typing import Any, Hashable, List, Set
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton mapping patterns to values."""
+
+    def __init__(self):
+        self._goto: List[dict] = [{}]  # node -> {char: node}
+        self._values: List[list] = [[]]  # values of patterns ending at node
+        self._fail: List[int] = [0]
+        self._outputs: List[list] = [[]]  # values reachable via failure links
+        self._built = True
+        self._pattern_count = 0
+
+    def __len__(self) -> int:
+        return self._pattern_count
+
+    def add(self, pattern: str, value: Hashable) -> None:
+        """Register a pattern; empty patterns are ignored."""
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto.append({})
+                self._values.append([])
+                self._goto[node][char] = child
+            node = child
+        self._values[node].append(value)
+        self._pattern_count += 1
+        self._built = False
+
+    def _build(self) -> None:
+        node_count = len(self._goto)
+        self._fail = [0] * node_count
+        self._outputs = [list(values) for values in self._values]
+
+        # Breadth-first so a node's failure target is finished before it
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child].extend(self._outputs[self._fail[child]])
+                queue.append(child)
+        self._built = True
+
+    def matches(self, text: str) -> Set[Any]:
+        """Values of every registered pattern that occurs in *text*."""
+        if not self._built:
+            self._build()
+        found = set()
+        if not text or not self._pattern_count:
+            return found
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+        return found
@@ -49,6 +49,12 @@ class DataValidator(ABC):
         self.start_time = None
         self.end_time = None
 
+        # Salesforce query cache shared by the validators of a run
+        self.salesforce_cache = None
+
+        # Set by the validation engine when the run is cancelled
+        self.cancel_event = None
+
         # Performance monitoring
         self.initial_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
         self.peak_memory = self.initial_memory
@@ -83,6 +89,22 @@ class DataValidator(ABC):
             f"Added validation metric: {metric.metric_name} = {metric.metric_value}"
         )
 
+    def is_cancelled(self) -> bool:
+        """Check whether the validation run has been cancelled."""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def use_salesforce_cache(self, cache):
+        """
+        Share a Salesforce query cache with this validator.
+
+        Args:
+            cache: SalesforceQueryCache used by this validator's client
+        """
+        self.salesforce_cache = cache
+        client = getattr(self, "salesforce_client", None)
+        if client is not None:
+            client.cache = cache
+
     def create_result(
         self, entity_type: str, severity: str, message: str, **kwargs
     ) -> ValidationResult:
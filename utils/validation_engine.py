@@ -10,10 +10,13 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 
+from flask import current_app, has_app_context
+
 from config.validation import get_config_section
 from models.validation.metric import ValidationMetric
 from models.validation.result import ValidationResult
 from models.validation.run import ValidationRun
+from utils.salesforce_client import SalesforceQueryCache
 from utils.validation_base import DataValidator, ValidationContext
 from utils.validators.business_rule_validator import BusinessRuleValidator
 from utils.validators.count_validator import CountValidator
@@ -30,7 +33,7 @@ class ValidationEngine:
 
     This engine provides:
     - Validation run management
-    - Parallel validation execution
+    - Parallel validation execution on a bounded thread pool
     - Progress tracking
     - Result aggregation
     - Error handling and recovery
@@ -44,8 +47,14 @@ class ValidationEngine:
             config: Validation configuration
         """
         self.config = config or get_config_section("validation_rules")
-        self.executor = ThreadPoolExecutor(max_workers=4)  # Configurable
+
+        performance_config = get_config_section("performance")
+        self.parallel = performance_config.get("parallel_validators", True)
+        self.executor = ThreadPoolExecutor(
+            max_workers=performance_config.get("max_parallel_validators", 4)
+        )
         self.active_runs: Dict[int, ValidationRun] = {}
+        self._cancel_events: Dict[int, threading.Event] = {}
         self.run_lock = threading.Lock()
 
         logger.info("Validation engine initialized")
@@ -279,62 +288,73 @@ class ValidationEngine:
         """
         Execute a list of validators and collect results.
 
+        With parallel execution enabled, validators run concurrently on the
+        engine's bounded thread pool, each in its own app context (and so its
+        own database session). Results are collected in validator order and
+        progress is updated as each validator finishes. cancel_run() stops
+        validators that have not started and asks running ones to stop.
+
         Args:
             run: Validation run instance
             validators: List of validators to execute
         """
+        cancel_event = threading.Event()
+        with self.run_lock:
+            self._cancel_events[run.id] = cancel_event
+
         try:
             total_validators = len(validators)
             completed_validators = 0
+            continue_on_error = self._should_continue_on_error()
 
-            # Execute validators (can be parallel in the future)
-            all_results = []
-            all_metrics = []
-
+            # One Salesforce query cache per run, shared by all validators
+            query_cache = self._create_query_cache()
             for validator in validators:
-                try:
-                    logger.info("Executing validator: %s", validator.__class__.__name__)
+                validator.use_salesforce_cache(query_cache)
+                validator.cancel_event = cancel_event
 
-                    # Execute validation
-                    results = validator.validate_with_timing()
-                    metrics = validator.metrics
+            outcomes = [None] * total_validators
+            first_error = None
 
-                    # Collect results and metrics
-                    all_results.extend(results)
-                    all_metrics.extend(metrics)
+            for index, outcome in self._run_validators(validators, cancel_event):
+                outcomes[index] = outcome
+                if isinstance(outcome, Exception) and first_error is None:
+                    first_error = outcome
+                    # Stop the remaining validators unless configured to go on
+                    if not continue_on_error:
+                        cancel_event.set()
 
-                    # Update progress
-                    completed_validators += 1
-                    run.update_progress(completed_validators, total_validators)
+                # Update progress
+                completed_validators += 1
+                self._publish_progress(run, completed_validators, total_validators)
 
-                    logger.info(
-                        f"Completed validator {validator.__class__.__name__}: "
-                        f"{len(results)} results, {len(metrics)} metrics"
-                    )
+            # Write the run's queries to the persisted cache, if configured
+            query_cache.flush()
 
-                except Exception as e:
-                    logger.exception(
-                        f"Validator {validator.__class__.__name__} failed: {e}"
-                    )
+            all_results = []
+            all_metrics = []
 
+            for validator, outcome in zip(validators, outcomes):
+                if isinstance(outcome, Exception):
                     # Add error result
                     error_result = ValidationResult.create_result(
                         run_id=run.id,
                         entity_type=validator.get_entity_type(),
                         severity="error",
-                        message=f"Validator {validator.__class__.__name__} failed: {str(e)}",
+                        message=f"Validator {validator.__class__.__name__} failed: {str(outcome)}",
                         validation_type="system",
                         rule_name=validator.__class__.__name__,
                     )
                     all_results.append(error_result)
+                elif outcome is not None:
+                    results, metrics = outcome
+                    all_results.extend(results)
+                    all_metrics.extend(metrics)
 
-                    # Continue with other validators if configured
-                    if not self._should_continue_on_error():
-                        raise
+            if first_error is not None and not continue_on_error:
+                raise first_error
 
-                finally:
-                    # Clean up validator resources
-                    validator.cleanup()
+            all_metrics.extend(self._query_cache_metrics(run, query_cache))
 
             # Save all results and metrics
             self._save_validation_data(run, all_results, all_metrics)
@@ -343,6 +363,14 @@ class ValidationEngine:
             run.total_checks = len(all_results)
             self._update_run_statistics(run, all_results)
 
+            if cancel_event.is_set():
+                run.mark_cancelled()
+                logger.info(
+                    f"Validation run {run.id} cancelled: kept {len(all_results)} "
+                    f"results from finished validators"
+                )
+                return
+
             # Mark run as completed
             run.mark_completed()
 
@@ -356,8 +384,121 @@ class ValidationEngine:
             run.mark_failed(str(e))
             raise
         finally:
+            with self.run_lock:
+                self._cancel_events.pop(run.id, None)
             self._finalize_run(run)
 
+    def _run_validators(
+        self, validators: List[DataValidator], cancel_event: threading.Event
+    ):
+        """
+        Run validators, yielding (index, outcome) pairs as each one finishes.
+
+        See _run_validator for the outcome values.
+        """
+        if not (self.parallel and len(validators) > 1 and has_app_context()):
+            for index, validator in enumerate(validators):
+                yield index, self._run_validator(validator, cancel_event)
+            return
+
+        app = current_app._get_current_object()
+        futures = {
+            self.executor.submit(
+                self._run_validator_in_app_context, app, validator, cancel_event
+            ): index
+            for index, validator in enumerate(validators)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def _run_validator_in_app_context(
+        self, app, validator: DataValidator, cancel_event: threading.Event
+    ):
+        """Run a validator on a worker thread with its own app context."""
+        with app.app_context():
+            return self._run_validator(validator, cancel_event)
+
+    def _run_validator(self, validator: DataValidator, cancel_event: threading.Event):
+        """
+        Run one validator.
+
+        Returns:
+            (results, metrics) on success, the exception if the validator
+            failed, or None if the run was cancelled before it started
+        """
+        name = validator.__class__.__name__
+        if cancel_event.is_set():
+            logger.info("Skipping validator %s: run cancelled", name)
+            return None
+
+        try:
+            logger.info("Executing validator: %s", name)
+
+            # Execute validation (copy before cleanup clears the lists)
+            results = list(validator.validate_with_timing())
+            metrics = list(validator.metrics)
+
+            logger.info(
+                f"Completed validator {name}: "
+                f"{len(results)} results, {len(metrics)} metrics"
+            )
+            return results, metrics
+
+        except Exception as e:
+            logger.exception(f"Validator {name} failed: {e}")
+            return e
+
+        finally:
+            # Clean up validator resources
+            validator.cleanup()
+
+    def _publish_progress(self, run: ValidationRun, completed: int, total: int):
+        """Record run progress and commit it so status polling sees it."""
+        run.update_progress(completed, total)
+        try:
+            from models import db
+
+            db.session.commit()
+        except Exception as e:
+            logger.warning("Failed to save progress for run %s: %s", run.id, e)
+            db.session.rollback()
+
+    def _create_query_cache(self) -> SalesforceQueryCache:
+        """Create the Salesforce query cache shared by a run's validators."""
+        cache_config = get_config_section("cache")
+        return SalesforceQueryCache(
+            persist_path=cache_config.get("salesforce_persist_path")
+        )
+
+    def _query_cache_metrics(
+        self, run: ValidationRun, query_cache: SalesforceQueryCache
+    ) -> List[ValidationMetric]:
+        """Build hit/miss metrics for the run's Salesforce query cache."""
+        stats = query_cache.stats()
+        logger.info(
+            f"Salesforce query cache for run {run.id}: {stats['hits']} hits, "
+            f"{stats['misses']} misses, {stats['coalesced']} coalesced"
+        )
+
+        metrics = []
+        for name, unit in (
+            ("hits", "count"),
+            ("misses", "count"),
+            ("coalesced", "count"),
+            ("hit_rate", "percentage"),
+        ):
+            metrics.append(
+                ValidationMetric.create_metric(
+                    metric_name=f"salesforce_cache_{name}",
+                    metric_value=stats[name],
+                    metric_category=ValidationMetric.CATEGORY_PERFORMANCE,
+                    metric_unit=unit,
+                    entity_type="all",
+                    run_id=run.id,
+                )
+            )
+        return metrics
+
     def _save_validation_data(
         self,
         run: ValidationRun,
@@ -459,6 +600,11 @@ class ValidationEngine:
         """Cancel a running validation run."""
         try:
             with self.run_lock:
+                # Stop validators of the run cooperatively
+                cancel_event = self._cancel_events.get(run_id)
+                if cancel_event is not None:
+                    cancel_event.set()
+
                 if run_id in self.active_runs:
                     run = self.active_runs[run_id]
                     run.mark_cancelled()
@@ -59,7 +59,7 @@ class BusinessRuleValidator(DataValidator):
         """Run business rule validation."""
         try:
             if not self.salesforce_client:
-                self.salesforce_client = SalesforceClient()
+                self.salesforce_client = SalesforceClient(cache=self.salesforce_cache)
 
             results = []
             entity_types = (
@@ -77,6 +77,8 @@ class BusinessRuleValidator(DataValidator):
             )
 
             for entity_type in entity_types:
+                if self.is_cancelled():
+                    break
                 if entity_type in self.business_rules:
                     logger.info("Validating business rules for %s...", entity_type)
                     entity_results = self._validate_entity_business_rules(entity_type)
@@ -35,7 +35,7 @@ class CountValidator(DataValidator):
         self.entity_type = entity_type
 
         # Initialize Salesforce client immediately
-        self.salesforce_client = SalesforceClient()
+        self.salesforce_client = SalesforceClient(cache=self.salesforce_cache)
 
         # Get count validation configuration
         self.count_config = get_config_section("validation_rules").get(
@@ -74,6 +74,8 @@ class CountValidator(DataValidator):
 
             # Validate each entity type
             for entity in entities_to_validate:
+                if self.is_cancelled():
+                    break
                 self._validate_count_with_context(entity)
 
             # Add summary metrics
@@ -66,7 +66,7 @@ class DataTypeValidator(DataValidator):
         """
         try:
             # Initialize Salesforce client
-            self.salesforce_client = SalesforceClient()
+            self.salesforce_client = SalesforceClient(cache=self.salesforce_cache)
 
             # Determine which entities to validate
             if self.entity_type == "all":
@@ -84,6 +84,8 @@ class DataTypeValidator(DataValidator):
 
             # Validate each entity type
             for entity in entities_to_validate:
+                if self.is_cancelled():
+                    break
                 self._validate_entity_data_types(entity)
 
             # Add summary metrics
@@ -68,7 +68,7 @@ class FieldCompletenessValidator(DataValidator):
         """
         try:
             # Initialize Salesforce client
-            self.salesforce_client = SalesforceClient()
+            self.salesforce_client = SalesforceClient(cache=self.salesforce_cache)
 
             # Determine which entities to validate
             if self.entity_type == "all":
@@ -86,6 +86,8 @@ class FieldCompletenessValidator(DataValidator):
 
             # Validate each entity type
             for entity in entities_to_validate:
+                if self.is_cancelled():
+                    break
                 self._validate_entity_completeness(entity)
 
             # Add summary metrics
@@ -54,7 +54,7 @@ class RelationshipValidator(DataValidator):
         """Run relationship integrity validation."""
         try:
             if not self.salesforce_client:
-                self.salesforce_client = SalesforceClient()
+                self.salesforce_client = SalesforceClient(cache=self.salesforce_cache)
 
             results = []
             entity_types = (
@@ -64,6 +64,8 @@ class RelationshipValidator(DataValidator):
             )
 
             for entity_type in entity_types:
+                if self.is_cancelled():
+                    break
                 if entity_type in self.entity_relationships:
                     logger.info("Validating relationships for %s...", entity_type)
                     entity_results = self._validate_entity_relationships(entity_type)